@@ -0,0 +1,173 @@
+"""
+Monaco Salle Blanche Lab - Job API
+==================================
+REST endpoints for running simulations from scripts and notebooks, without
+holding a browser tab open. Same authentication as the main page: the
+session must have app.storage.user['authenticated'] set, either by logging in
+on /login or with POST /api/login.
+
+    POST   /api/login                 {"username", "password"} -> session cookie
+    POST   /api/jobs                  submit (see utils/jobs.parse_job_request)
+    GET    /api/jobs                  your jobs
+    GET    /api/jobs/{id}             status + summary (+ per-phase timings when submitted with "instrument": true)
+    GET    /api/jobs/{id}/events      progress stream (Server-Sent Events)
+    GET    /api/jobs/{id}/result      ?format=json|npz (&trajectories=1 for json)
+    GET    /api/jobs/{id}/profile     ?format=json|csv|prof, for jobs submitted with "profile" (engine/profiling.py)
+    DELETE /api/jobs/{id}             cancel a queued or running job / forget a finished one
+    GET    /api/exports/{token}       streamed CSV/JSON download registered by a page (utils/exports.py)
+
+Jobs share the server-wide scheduler with the lab pages (utils/scheduler.py);
+a job over the admission limits is refused with 429.
+
+main.py registers these routes at startup, so this module stays light: the
+job manager, the exports store and the profiler (which pull in the whole
+simulation stack) are imported by the handlers on the first API call, like
+the labs are on their first click (ui/module_registry.py).
+
+Example (python requests):
+    s = requests.Session()
+    s.post(f'{url}/api/login', json={'username': ..., 'password': ...})
+    job = s.post(f'{url}/api/jobs', json={'lab': 'roulette', 'strategy': 'My Strat', 'universes': 2000}).json()
+    s.get(f"{url}/api/jobs/{job['id']}/result?format=npz").content  # -> np.load(io.BytesIO(...))
+"""
+
+import asyncio
+import json
+
+from fastapi import HTTPException, Request
+from fastapi.responses import Response, StreamingResponse
+from nicegui import app
+
+import auth
+from utils.scheduler import AdmissionError
+
+PROGRESS_POLL_SEC = 0.5
+
+
+def _require_auth() -> str:
+    """Same gate as main_page. Returns the session id that owns the caller's jobs."""
+    if not app.storage.user.get('authenticated', False):
+        raise HTTPException(status_code=401, detail='Not authenticated')
+    return app.storage.browser['id']
+
+
+def _job_manager():
+    from utils.jobs import get_job_manager  # Simulation stack, loaded on the first API call
+    return get_job_manager()
+
+
+def _get_job(job_id: str):
+    job = _job_manager().get(job_id, owner=_require_auth())
+    if job is None:
+        raise HTTPException(status_code=404, detail='Job not found')
+    return job
+
+
+def setup_api():
+    """Registers the /api routes on the NiceGUI app."""
+
+    @app.post('/api/login')
+    async def api_login(request: Request):
+        try:
+            body = await request.json()
+        except ValueError:
+            raise HTTPException(status_code=400, detail='Invalid JSON')
+        if body.get('username') != auth.USERNAME or body.get('password') != auth.PASSWORD:
+            raise HTTPException(status_code=401, detail='Access Denied')
+        app.storage.user['authenticated'] = True
+        return {'authenticated': True}
+
+    @app.post('/api/jobs', status_code=202)
+    async def submit_job(request: Request):
+        from utils.jobs import parse_job_request
+        owner = _require_auth()
+        try:
+            body = await request.json()
+        except ValueError:
+            raise HTTPException(status_code=400, detail='Invalid JSON')
+        try:
+            spec = await asyncio.to_thread(parse_job_request, body)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        try:
+            return _job_manager().submit(owner, spec).to_dict()
+        except AdmissionError as e:
+            raise HTTPException(status_code=429, detail=str(e))
+
+    @app.get('/api/jobs')
+    def list_jobs():
+        owner = _require_auth()
+        return [job.to_dict() for job in _job_manager().jobs(owner)]
+
+    @app.get('/api/jobs/{job_id}')
+    def job_status(job_id: str):
+        return _get_job(job_id).to_dict()
+
+    @app.get('/api/jobs/{job_id}/events')
+    async def job_events(job_id: str, request: Request):
+        job = _get_job(job_id)
+
+        async def stream():
+            last = -1
+            while not await request.is_disconnected():
+                if job.version != last:
+                    last = job.version
+                    yield f"data: {json.dumps(job.to_dict(), default=str)}\n\n"
+                if job.is_final:
+                    break
+                await asyncio.sleep(PROGRESS_POLL_SEC)
+
+        return StreamingResponse(stream(), media_type='text/event-stream', headers={'Cache-Control': 'no-cache'})
+
+    @app.get('/api/jobs/{job_id}/result')
+    async def job_result(job_id: str, format: str = 'json', trajectories: bool = False):
+        from utils.jobs import DONE
+        job = _get_job(job_id)
+        if job.status != DONE:
+            raise HTTPException(status_code=409, detail=f'Job is {job.status}')
+        if format not in ('json', 'npz'):
+            raise HTTPException(status_code=400, detail="format must be 'json' or 'npz'")
+        try:
+            if format == 'npz':
+                data = await asyncio.to_thread(job.result_npz)
+                return Response(content=data, media_type='application/octet-stream',
+                                headers={'Content-Disposition': f'attachment; filename="job_{job.id}.npz"'})
+            return await asyncio.to_thread(job.result_json, trajectories)
+        except LookupError as e:  # Spilled results evicted from the result cache
+            raise HTTPException(status_code=410, detail=str(e))
+
+    @app.get('/api/jobs/{job_id}/profile')
+    def job_profile(job_id: str, format: str = 'json'):
+        from engine import profiling
+        from utils.exports import csv_chunks
+        job = _get_job(job_id)
+        if job.profile is None:
+            raise HTTPException(status_code=404 if job.is_final else 409,
+                                detail='Job was not profiled' if job.is_final else f'Job is {job.status}')
+        filename = f'profile_{job.id}.{format}'
+        if format == 'json':
+            return job.profile
+        if format == 'csv':
+            return StreamingResponse(csv_chunks(profiling.FUNCTION_FIELDS, job.profile['functions']), media_type='text/csv',
+                                     headers={'Content-Disposition': f'attachment; filename="{filename}"'})
+        if format == 'prof':
+            return Response(content=profiling.profile_stats_bytes(job.profile_stats), media_type='application/octet-stream',
+                            headers={'Content-Disposition': f'attachment; filename="{filename}"'})
+        raise HTTPException(status_code=400, detail="format must be 'json', 'csv' or 'prof'")
+
+    @app.delete('/api/jobs/{job_id}')
+    def delete_job(job_id: str):
+        job = _get_job(job_id)
+        manager = _job_manager()
+        if manager.cancel(job.id) or manager.remove(job.id):
+            return {'id': job.id, 'status': job.status}
+        raise HTTPException(status_code=409, detail=f'Job is {job.status}')
+
+    @app.get('/api/exports/{token}')
+    def download_export(token: str):
+        from utils.exports import get_export_store
+        export = get_export_store().get(token, owner=_require_auth())
+        if export is None:
+            raise HTTPException(status_code=404, detail='Export not found or expired: click the download button on the page again')
+        return StreamingResponse(export.make_chunks(), media_type=export.media_type,
+                                 headers={'Content-Disposition': f'attachment; filename="{export.filename}"'})
@@ -1,2 +1,16 @@
-from .tier_params import TierConfig, generate_tier_map, get_tier_for_ga
+# Tier helpers are resolved on first access so that importing one light engine
+# module (e.g. engine.cancellation, used by the scheduler at startup) does not
+# drag in numpy with engine.tier_params.
+_EXPORTS = {
+    'TierConfig': '.tier_params',
+    'TierIndex': '.tier_params',
+    'generate_tier_map': '.tier_params',
+    'get_tier_for_ga': '.tier_params',
+}
 # TIER_MAP removed as it is now dynamically generated
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        from importlib import import_module
+        return getattr(import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,321 @@
+"""
+Monaco Salle Blanche Lab - Baccarat Worker
+==========================================
+Session and career simulation for Baccarat, shared by the lab pages,
+Career Sim, Sessions Sim and the headless runner (no UI imports).
+"""
+
+import random
+from dataclasses import replace
+from time import perf_counter_ns
+
+import numpy as np
+
+from engine import instrumentation
+from engine.baccarat_rules import BaccaratSessionState, BaccaratStrategist
+from engine.cancellation import check_cancelled
+from engine.seeding import seed_session
+from engine.session_histograms import SessionHistograms, results_hist
+from engine.strategy_rules import StrategyOverrides
+from engine.tier_params import TierConfig, generate_tier_map, get_tier_for_ga
+
+SBM_TIERS = {'Silver': 5000, 'Gold': 22500, 'Platinum': 175000}
+
+class BaccaratWorker:
+    @staticmethod
+    def run_session(current_ga: float, overrides: StrategyOverrides, tier_map: dict, use_ratchet: bool, penalty_mode: bool, active_level: int, mode: str, base_bet: float = 10.0, track_hands: bool = False,
+                    hist: SessionHistograms = None):
+        prof = instrumentation.current()
+        if prof: t = perf_counter_ns()
+        tier = get_tier_for_ga(current_ga, tier_map, active_level, mode, game_type='Baccarat')
+        if prof: prof.lap('baccarat.tier_lookup', t)
+        
+        hand_log = []
+        session_peak_profit = 0
+        max_press_streak = 0
+        
+        is_active_penalty = penalty_mode and overrides.penalty_box_enabled
+        if is_active_penalty:
+            flat_bet = base_bet 
+            tier = TierConfig(level=tier.level, min_ga=0, max_ga=9999999, base_unit=flat_bet, press_unit=flat_bet, stop_loss=tier.stop_loss, profit_lock=tier.profit_lock, catastrophic_cap=tier.catastrophic_cap)
+            session_overrides = StrategyOverrides(
+                iron_gate_limit=overrides.iron_gate_limit, stop_loss_units=overrides.stop_loss_units,
+                profit_lock_units=overrides.profit_lock_units, shoes_per_session=overrides.shoes_per_session,
+                bet_strategy=overrides.bet_strategy, press_trigger_wins=999, press_depth=0, ratchet_enabled=False 
+            )
+        else:
+            session_overrides = overrides
+
+        if use_ratchet and not is_active_penalty:
+            # Copy-on-write: overrides may be a shared compiled strategy
+            if not session_overrides.ratchet_enabled or session_overrides.profit_lock_units <= 0:
+                session_overrides = replace(
+                    session_overrides, ratchet_enabled=True,
+                    profit_lock_units=1000 if session_overrides.profit_lock_units <= 0 else session_overrides.profit_lock_units
+                )
+
+        state = BaccaratSessionState(tier=tier, overrides=session_overrides)
+        state.current_shoe = 1
+        volume = 0
+        
+        while state.current_shoe <= overrides.shoes_per_session and state.mode.name != 'STOPPED':
+            if prof: t = perf_counter_ns()
+            decision = BaccaratStrategist.get_next_decision(state)
+            if prof: t = prof.lap('baccarat.decision', t)
+            if decision['mode'].name == 'STOPPED': break
+            
+            amt = decision['bet_amount']
+            volume += amt
+            
+            # Check if we should place a tie bet this hand (1 unit after a tie)
+            tie_bet_amt = 0
+            if state.place_tie_bet_this_hand and amt > 0 and session_overrides.tie_bet_enabled:
+                tie_bet_amt = tier.base_unit  # Always 1 base unit
+                volume += tie_bet_amt
+                state.tie_bets_placed += 1
+            
+            # Simulation Physics - Realistic Baccarat Probabilities
+            # Determine actual bet target from decision (handles FOLLOW_WINNER)
+            bet_target = decision.get('bet_target', 'BANKER')
+            is_banker = (bet_target == 'BANKER')
+            rng = random.random()
+            
+            # Probabilities: Banker 45.86%, Player 44.62%, Tie 9.52%
+            if rng < 0.4586:  # Banker wins
+                outcome = 'BANKER'
+            elif rng < 0.9048:  # Player wins (0.4586 + 0.4462)
+                outcome = 'PLAYER'
+            else:  # Tie
+                outcome = 'TIE'
+            
+            pnl = 0
+            is_tie = False
+            tie_bet_pnl = 0
+            
+            if outcome == 'TIE':
+                # Tie: Main bet pushes (no win/loss), tie bet wins 8:1
+                is_tie = True
+                state.tie_count += 1
+                if tie_bet_amt > 0:
+                    tie_bet_pnl = tie_bet_amt * 8  # Win 8:1 on tie bet
+                    pnl = tie_bet_pnl
+            else:
+                # Main bet resolution
+                main_bet_won = (outcome == 'BANKER' and is_banker) or (outcome == 'PLAYER' and not is_banker)
+                
+                if main_bet_won:
+                    pnl = amt * 0.95 if is_banker else amt
+                else:
+                    pnl = -amt
+                
+                # Tie bet loses if placed
+                if tie_bet_amt > 0:
+                    tie_bet_pnl = -tie_bet_amt
+                    pnl += tie_bet_pnl
+            
+            # Track tie bet P&L separately
+            state.tie_bets_pnl += tie_bet_pnl
+            if prof: t = prof.lap('baccarat.resolve', t)
+            
+            # Track hand-by-hand bankroll evolution
+            if track_hands:
+                hand_log.append({
+                    'hand': state.hands_played_total + 1,
+                    'shoe': state.current_shoe,
+                    'bankroll': current_ga + state.session_pnl + pnl,
+                    'session_pl': state.session_pnl + pnl,
+                    'bet_size': amt,
+                    'outcome': outcome,
+                    'won': main_bet_won if outcome != 'TIE' else None,
+                    'tie_bet_placed': tie_bet_amt > 0,
+                    'tie_bet_pnl': tie_bet_pnl,
+                    'press_level': state.current_press_streak,
+                    'in_virtual': state.is_in_virtual_mode
+                })
+                if prof: t = prof.lap('baccarat.log', t)
+            
+            # Update peak profit
+            if state.session_pnl + pnl > session_peak_profit:
+                session_peak_profit = state.session_pnl + pnl
+            
+            # Update state with outcome
+            main_bet_won = (outcome == 'BANKER' and is_banker) or (outcome == 'PLAYER' and not is_banker)
+            BaccaratStrategist.update_state_after_hand(state, main_bet_won, pnl, is_tie, outcome)
+            if state.current_press_streak > max_press_streak:
+                max_press_streak = state.current_press_streak
+            if prof: prof.lap('baccarat.update', t)
+            
+            if state.hands_played_in_shoe >= 70:
+                state.current_shoe += 1
+                state.hands_played_in_shoe = 0
+
+        # Determine exit reason
+        exit_reason = 'TIME_LIMIT'
+        if state.mode.name == 'STOPPED':
+            stop_val = -(overrides.stop_loss_units * tier.base_unit)
+            target_val = overrides.profit_lock_units * tier.base_unit
+            if state.session_pnl <= stop_val:
+                exit_reason = 'STOP_LOSS'
+            elif state.session_pnl >= target_val:
+                exit_reason = 'TARGET'
+            elif state.session_pnl <= state.locked_profit:
+                exit_reason = 'RATCHET'
+
+        if hist is not None:
+            hist.add(tier.level, exit_reason, state.hands_played_total, session_peak_profit / tier.base_unit,
+                     max_press_streak, state.tie_count, state.tie_bets_placed)
+
+        return state.session_pnl, volume, tier.level, state.hands_played_total, exit_reason, state.current_press_streak, state.tie_count, state.tie_bets_placed, state.tie_bets_pnl, hand_log, session_peak_profit
+
+    @staticmethod
+    def run_full_career(start_ga, total_months, sessions_per_year, 
+                        contrib_win, contrib_loss, overrides, use_ratchet,
+                        use_tax, use_holiday, safety_factor, target_points, earn_rate,
+                        holiday_ceiling, insolvency_floor, strategy_mode, base_bet_val,
+                        track_y1_details=False, tier_map=None, detail_months=12, trace_session=0,
+                        session_seed=None):
+        """
+        One universe. track_y1_details logs every session of the first
+        detail_months months under 'y1_log'; trace_session=n (1-based, counting
+        every session played) also returns session #n hand by hand under
+        'session_trace'. Neither draws from the RNG, so a universe replayed
+        from its seed with tracing plays exactly the same hands. With
+        session_seed (a universe seed) every session is dealt from its own
+        stream (engine/seeding.seed_session), for strategy comparisons.
+        """
+        if tier_map is None:
+            tier_map = generate_tier_map(safety_factor, mode=strategy_mode, game_type='Baccarat', base_bet=base_bet_val)
+        trajectory = []
+        current_ga = start_ga
+        running_play_pnl = 0
+        
+        initial_tier = get_tier_for_ga(current_ga, tier_map, 1, strategy_mode, game_type='Baccarat')
+        active_level = initial_tier.level
+
+        m_insolvent_months = 0; failed_year_one = False
+        m_tax = 0 
+        m_contrib = 0
+        gold_hit_year = -1
+        current_year_points = 0
+        
+        y1_log = []
+        last_session_won = False
+        session_no = 0
+        session_trace = None
+        hist = SessionHistograms()
+
+        for m in range(total_months):
+            if m > 0 and m % 12 == 0: current_year_points = 0
+
+            if use_tax and current_ga > overrides.tax_threshold:
+                surplus = current_ga - overrides.tax_threshold
+                tax_amt = surplus * (overrides.tax_rate / 100.0)
+                current_ga -= tax_amt
+                m_tax += tax_amt
+
+            should_contribute = True
+            if use_holiday and current_ga >= holiday_ceiling: should_contribute = False
+            
+            if should_contribute:
+                amount = contrib_win if last_session_won else contrib_loss
+                current_ga += amount
+                m_contrib += amount
+            
+            can_play = (current_ga >= insolvency_floor)
+            if not can_play:
+                m_insolvent_months += 1
+                if m < 12: failed_year_one = True
+            
+            if can_play:
+                sessions_this_month = sessions_per_year // 12
+                if m % 12 < (sessions_per_year % 12): sessions_this_month += 1
+
+                for sess_idx in range(sessions_this_month):
+                    check_cancelled()
+                    session_no += 1
+                    if session_seed is not None: seed_session(session_seed, m, 2 * sess_idx)
+                    traced = (session_no == trace_session)
+                    pnl, vol, used_level, hands, exit_reason, final_streak, tie_count, tie_bets, tie_pnl, hand_log, peak_profit = BaccaratWorker.run_session(
+                        current_ga, overrides, tier_map, use_ratchet, 
+                        False, active_level, strategy_mode, base_bet_val, traced, hist=hist
+                    )
+                    if traced:
+                        session_trace = {'session': session_no, 'month': m + 1, 'start_ga': current_ga, 'pnl': pnl,
+                                         'hands': hands, 'exit_reason': exit_reason, 'peak_profit': peak_profit, 'hand_log': hand_log}
+                    active_level = used_level 
+                    current_ga += pnl
+                    running_play_pnl += pnl
+                    current_year_points += vol * (earn_rate / 100)
+                    last_session_won = (pnl > 0)
+                    
+                    if track_y1_details and m < detail_months:
+                        y1_log.append({
+                            'month': m + 1,
+                            'session': session_no,
+                            'result': pnl,
+                            'balance': current_ga,
+                            'game_bal': start_ga + running_play_pnl,
+                            'hands': hands,
+                            'volume': vol,
+                            'tier': used_level,
+                            'exit': exit_reason,
+                            'streak_max': final_streak,
+                            'tie_count': tie_count,
+                            'tie_bets': tie_bets,
+                            'tie_pnl': tie_pnl
+                        })
+            else:
+                 if track_y1_details and m < detail_months:
+                        y1_log.append({
+                            'month': m + 1,
+                            'session': 0,
+                            'result': 0,
+                            'balance': current_ga,
+                            'game_bal': start_ga + running_play_pnl,
+                            'hands': 0,
+                            'volume': 0,
+                            'tier': 0,
+                            'exit': 'INSOLVENT',
+                            'streak_max': 0,
+                            'tie_count': 0,
+                            'tie_bets': 0,
+                            'tie_pnl': 0
+                        })
+
+            if gold_hit_year == -1 and current_year_points >= target_points:
+                gold_hit_year = (m // 12) + 1
+
+            trajectory.append(current_ga)
+            
+        result = {
+            'trajectory': trajectory, 'final_ga': current_ga, 'insolvent_months': m_insolvent_months, 
+            'failed_y1': failed_year_one, 'tax': m_tax, 'contrib': m_contrib, 'gold_year': gold_hit_year,
+            'y1_log': y1_log, 'session_hist': hist.to_array()
+        }
+        if trace_session:
+            result['session_trace'] = session_trace
+        return result
+
+def calculate_stats(results, config, start_ga, total_months):
+    if not results: return None
+    trajectories = np.array([r['trajectory'] for r in results])
+    months = list(range(trajectories.shape[1]))
+    
+    stats = {
+        'months': months,
+        'min_band': np.min(trajectories, axis=0),
+        'max_band': np.max(trajectories, axis=0),
+        'p25_band': np.percentile(trajectories, 25, axis=0),
+        'p75_band': np.percentile(trajectories, 75, axis=0),
+        'mean_line': np.mean(trajectories, axis=0),
+        'median_line': np.median(trajectories, axis=0),
+        'avg_final_ga': np.mean([r['final_ga'] for r in results]),
+        'avg_tax': np.mean([r['tax'] for r in results]),
+        'avg_insolvent': np.mean([r['insolvent_months'] for r in results]),
+        'gold_hits': [r['gold_year'] for r in results if r['gold_year'] != -1],
+        'y1_failures': len([r for r in results if r['failed_y1']]),
+        'total_input': start_ga + np.mean([r['contrib'] for r in results]),
+        'survivor_count': len([r for r in results if r['final_ga'] >= 100]),
+        'session_hist': results_hist(results)
+    }
+    return stats
@@ -0,0 +1,284 @@
+"""
+Monaco Salle Blanche Lab - Batch Runs
+=====================================
+Multiverse runs without the UI: the same per-universe loops the lab pages
+play (same workers, same settings, same seeding), split into chunks that can
+be spread over every core.
+
+Universe i is always played from seed (seed, i), so results do not depend
+on how the universes are chunked or on how many processes play them.
+"""
+
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from engine import career_log as clog
+from engine import instrumentation
+from engine.baccarat_worker import BaccaratWorker, SBM_TIERS, calculate_stats as baccarat_stats
+from engine.cancellation import Cancelled, current_token, install_process_token
+from engine.career_log import CareerEventLog
+from engine.career_manager import CareerManager
+from engine.roulette_worker import RouletteWorker, calculate_stats as roulette_stats
+from engine.seeding import DEFAULT_SEED, seed_universe, universe_seed
+from engine.session_histograms import summarize as summarize_sessions
+from engine.sessions_worker import SessionsWorker, calculate_ensemble_stats
+from engine.strategy_compiler import base_bet_of, compile_strategy
+
+LAB_WORKERS = {'Baccarat': BaccaratWorker, 'Roulette': RouletteWorker}
+LAB_STATS = {'Baccarat': baccarat_stats, 'Roulette': roulette_stats}
+
+BATCH_CHUNK_SIZE = 25
+
+logger = logging.getLogger(__name__)
+
+# Career page defaults (percentages, as on the sliders)
+CAREER_DEFAULTS = {
+    'start_ga': 2000, 'years': 5, 'sessions': 20,
+    'fallback': 80, 'promotion_buffer': 120, 'trailing_fallback': 90,
+    'retention': clog.RETAIN_SAMPLED
+}
+
+
+def _get(config, keys, default):
+    for k in keys:
+        if config.get(k) is not None:
+            return config[k]
+    return default
+
+
+def lab_settings(strategy_config: dict, game_type: str) -> dict:
+    """
+    Ecosystem settings of a saved strategy, as the lab page builds them after
+    loading it (same keys and defaults; the labs save years/freq under different names).
+    """
+    c = strategy_config
+    year_keys = ('years', 'sim_years') if game_type == 'Baccarat' else ('sim_years', 'years')
+    freq_keys = ('freq', 'sim_freq') if game_type == 'Baccarat' else ('sim_freq', 'freq')
+    return {
+        'years': int(_get(c, year_keys, 10)), 'freq': int(_get(c, freq_keys, 10)),
+        'contrib_win': int(c.get('eco_win', 300)), 'contrib_loss': int(c.get('eco_loss', 300)),
+        'status_target_pts': SBM_TIERS[c.get('gold_stat', 'Gold')], 'earn_rate': float(c.get('gold_earn', 10)),
+        'use_ratchet': bool(c.get('risk_ratch', False)), 'ratchet_mode': c.get('risk_ratch_mode', 'Standard'),
+        'use_tax': bool(c.get('eco_tax', False)), 'use_holiday': bool(c.get('eco_hol', False)),
+        'hol_ceil': int(c.get('eco_hol_ceil', 10000)), 'insolvency': int(c.get('eco_insolvency', 1000)),
+        'safety': int(c.get('tac_safety', 25)), 'start_ga': int(c.get('start_ga', 2000)),
+        'press_depth': int(c.get('tac_depth', 3)), 'tax_thresh': int(c.get('eco_tax_thresh', 12500)),
+        'tax_rate': int(c.get('eco_tax_rate', 25)), 'strategy_mode': c.get('tac_mode', 'Standard'),
+        'base_bet': base_bet_of(c, game_type)
+    }
+
+
+# --- PER-UNIVERSE LOOPS (shared with the lab pages) ---
+
+def run_lab_universes(game_type, config, compiled, seed, start, count, detail_months=None, trace_session=0, crn=False):
+    """
+    Universes start..start+count-1 of a Baccarat/Roulette multiverse (universe 0
+    tracks Y1 details). Each result records its index under 'universe'. With
+    detail_months (replays, engine/replay.py) every universe logs its sessions
+    for that many months and traces session #trace_session. With crn
+    (comparisons, engine/comparison.py) every session is dealt from its own
+    seeded stream.
+    """
+    worker = LAB_WORKERS[game_type]
+    results = []
+    for i in range(start, start + count):
+        seed_universe(seed, i)
+        result = worker.run_full_career(
+            config['start_ga'], config['years']*12, config['freq'],
+            config['contrib_win'], config['contrib_loss'], compiled.overrides,
+            config['use_ratchet'], config['use_tax'], config['use_holiday'],
+            config['safety'], config['status_target_pts'], config['earn_rate'],
+            config['hol_ceil'], config['insolvency'], config['strategy_mode'],
+            config['base_bet'],
+            track_y1_details=(detail_months is not None or i == 0), tier_map=compiled.tier_map,
+            detail_months=detail_months or 12, trace_session=trace_session,
+            session_seed=universe_seed(seed, i) if crn else None
+        )
+        result['universe'] = i
+        results.append(result)
+    return results
+
+
+def run_career_universe(sequence_config, settings, seed, index):
+    """One Career Sim universe, as the Career page records it (errors are kept as a result row)."""
+    try:
+        seed_universe(seed, index)
+        traj, log, final_ga, total_in, doctrine_summary = CareerManager.run_compound_career(
+            sequence_config, settings['start_ga'], settings['years'], settings['sessions'],
+            settings['fallback'] / 100.0, settings['promotion_buffer'] / 100.0,
+            settings['trailing_fallback'] / 100.0,
+            event_detail=clog.keeps_detail(settings['retention'], index)
+        )
+        return {
+            'universe': index,
+            'trajectory': traj,
+            'log': log,
+            'final': final_ga,
+            'monthly_cost': (total_in - final_ga) / (settings['years'] * 12),
+            'doctrine_summary': doctrine_summary
+        }
+    except Cancelled:
+        raise
+    except Exception as e:
+        logger.exception("Career universe %d failed", index)
+        error_log = CareerEventLog()
+        error_log.add(0, clog.ERROR, str(e))
+        return {'universe': index, 'trajectory': [], 'log': error_log, 'final': 0, 'monthly_cost': 0,
+                'doctrine_summary': None, 'error': str(e)}
+
+
+# --- CHUNKED / PARALLEL RUNS ---
+
+def plan_universes(num_universes, start=0, chunk_size=BATCH_CHUNK_SIZE):
+    """(start, count) chunks covering universes start..num_universes-1."""
+    return [(s, min(chunk_size, num_universes - s)) for s in range(start, num_universes, chunk_size)]
+
+
+def run_lab_chunk(game_type, strategy_config, config, seed, start, count):
+    """Process-pool entry point: compiles (once per process, cached) and plays a chunk of universes."""
+    compiled = compile_strategy(strategy_config, game_type=game_type)
+    return run_lab_universes(game_type, config, compiled, seed, start, count)
+
+
+def run_career_chunk(sequence_config, settings, seed, start, count):
+    """Process-pool entry point for a chunk of Career Sim universes."""
+    return [run_career_universe(sequence_config, settings, seed, i) for i in range(start, start + count)]
+
+
+def _init_worker(token, initializer, initargs):
+    install_process_token(token)
+    if initializer:
+        initializer(*initargs)
+
+
+def run_tasks(tasks, max_workers=None, on_done=None, initializer=None, initargs=()):
+    """
+    Runs (func, args) tasks, in a process pool when more than one core is
+    available, and returns their results in task order. on_done(index, result)
+    is called as each task finishes.
+
+    A run started under a cancel token (see engine/cancellation.py) passes the
+    token to its worker processes and raises Cancelled once it is set; tasks
+    that have not started are dropped.
+    """
+    workers = min(max_workers or os.cpu_count() or 1, len(tasks))
+    results = [None] * len(tasks)
+    if workers <= 1:
+        if initializer:
+            initializer(*initargs)
+        for j, (func, args) in enumerate(tasks):
+            results[j] = func(*args)
+            if on_done: on_done(j, results[j])
+    else:
+        token = current_token()
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(token, initializer, initargs))
+        try:
+            futures = {pool.submit(func, *args): j for j, (func, args) in enumerate(tasks)}
+            for f in as_completed(futures):
+                j = futures[f]
+                results[j] = f.result()
+                if on_done: on_done(j, results[j])
+                if token is not None and token.cancelled:
+                    raise Cancelled()
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+    return results
+
+
+def run_chunks(func, args, plan, max_workers=None, on_chunk=None, on_results=None, instrument=None):
+    """
+    Runs func(*args, start, count) for every chunk of the plan and concatenates
+    the results in plan order. on_chunk(done, total) is called as chunks finish,
+    after on_results(start, results) hands over that chunk's results (live previews).
+    With instrument (an instrumentation.Accumulator), every chunk is timed per
+    phase in its worker and the counters are merged into it as chunks finish.
+    """
+    done = [0]
+    tasks = [(func, (*args, start, count)) for start, count in plan]
+    if instrument is not None:
+        tasks = [(instrumentation.run_instrumented, task) for task in tasks]
+    def chunk_done(j, result):
+        if instrument is not None:
+            result, counters = result
+            instrument.merge(counters)
+        done[0] += 1
+        if on_results: on_results(plan[j][0], result)
+        if on_chunk: on_chunk(done[0], len(plan))
+    results = run_tasks(tasks, max_workers, chunk_done)
+    if instrument is not None:
+        results = [chunk for chunk, _ in results]
+    return [r for chunk in results for r in chunk]
+
+
+def run_lab(game_type, strategy_config, num_universes, seed=DEFAULT_SEED, config=None, max_workers=None, on_chunk=None, start=0,
+            on_results=None, instrument=None):
+    """
+    Baccarat/Roulette multiverse of a saved strategy. Returns (results, settings).
+    With start > 0 only universes start..num_universes-1 are played (extending a run).
+    """
+    config = config or lab_settings(strategy_config, game_type)
+    plan = plan_universes(num_universes, start)
+    results = run_chunks(run_lab_chunk, (game_type, strategy_config, config, seed), plan, max_workers, on_chunk, on_results,
+                         instrument)
+    return results, config
+
+
+def run_career(sequence_config, num_universes, seed=DEFAULT_SEED, settings=None, max_workers=None, on_chunk=None, start=0,
+               on_results=None, instrument=None):
+    """
+    Career Sim multiverse. sequence_config is the Career page's leg list
+    ({'strategy_name', 'target_ga', 'config'}). Returns (results, settings).
+    """
+    settings = dict(CAREER_DEFAULTS, **(settings or {}))
+    plan = plan_universes(num_universes, start)
+    results = run_chunks(run_career_chunk, (sequence_config, settings, seed), plan, max_workers, on_chunk, on_results,
+                         instrument)
+    return results, settings
+
+
+def run_sessions(session_strategies, saved_strats, num_paths, num_sessions, start_bankroll,
+                 use_contributions=False, contrib_win=300, contrib_loss=300, seed=DEFAULT_SEED, max_workers=None):
+    """Sessions Sim ensemble (the page's ensemble mode). Returns (store, stats)."""
+    legs = SessionsWorker.compile_legs(session_strategies, saved_strats)
+    store = SessionsWorker.run_ensemble(legs, num_paths, num_sessions, start_bankroll, use_contributions,
+                                        contrib_win, contrib_loss, seed=seed, max_workers=max_workers)
+    return store, calculate_ensemble_stats(store, start_bankroll)
+
+
+def career_stats(results, settings):
+    """Headline Career Sim figures over the universes that ran without error."""
+    valid = [r for r in results if 'error' not in r]
+    if not valid:
+        return {'universes': len(results), 'errors': len(results)}
+    finals = np.array([r['final'] for r in valid], dtype=np.float64)
+    return {
+        'universes': len(results), 'errors': len(results) - len(valid),
+        'final_ga_mean': float(np.mean(finals)), 'final_ga_median': float(np.median(finals)),
+        'final_ga_p10': float(np.percentile(finals, 10)), 'final_ga_p90': float(np.percentile(finals, 90)),
+        'avg_monthly_cost': float(np.mean([r['monthly_cost'] for r in valid])),
+        'prob_above_start': float(np.mean(finals > settings['start_ga']) * 100),
+        'event_counts': clog.merge_counts(r['log'] for r in valid)
+    }
+
+
+def scalars(d: dict) -> dict:
+    """JSON-safe scalar entries of a stats dict (bands and trajectories are left out)."""
+    out = {}
+    for k, v in d.items():
+        if isinstance(v, (bool, int, float, str, np.number, np.bool_)):
+            out[k] = v.item() if isinstance(v, (np.number, np.bool_)) else v
+    return out
+
+
+def lab_stats(game_type, results, settings):
+    """Headline lab figures: the page's KPIs plus final GA percentiles."""
+    stats = LAB_STATS[game_type](results, settings, settings['start_ga'], settings['years'] * 12)
+    summary = scalars(stats)
+    summary['gold_hits'] = len(stats['gold_hits'])
+    finals = np.array([r['final_ga'] for r in results], dtype=np.float64)
+    summary.update({f'final_ga_p{p}': float(np.percentile(finals, p)) for p in (10, 50, 90)})
+    summary['session_shape'] = summarize_sessions(stats['session_hist'])
+    return summary
@@ -0,0 +1,185 @@
+"""
+Monaco Salle Blanche Lab - Engine Benchmarks
+============================================
+Timings of the simulation hot paths, with fixed seeds so every run plays
+exactly the same hands and spins (the work count doubles as a check that the
+engines still play the same game).
+
+Each benchmark is a setup function that compiles its strategy once and
+returns run() -> units of work played (hands, spins, careers, calls); the
+timed part is run() only, repeated, best repeat reported as units/sec.
+
+Baselines are plain JSON ({name: {rate, unit, work, ...}}). compare() flags a
+benchmark whose rate fell more than the threshold below its baseline, and a
+changed work count (different hands played for the same seed) separately.
+run_benchmarks.py is the command line front end.
+"""
+
+import platform
+import random
+import statistics
+import time
+from datetime import datetime
+
+from engine import batch
+from engine.baccarat_worker import BaccaratWorker
+from engine.career_manager import CareerManager
+from engine.roulette_worker import RouletteWorker
+from engine.spice_system import SpiceType, create_default_engine
+from engine.strategy_compiler import compile_strategy
+from engine.tier_params import get_tier_for_ga
+
+BENCH_SEED = 1234
+REGRESSION_THRESHOLD = 0.15  # Rate drop (fraction of baseline) flagged as a regression
+
+# --- STRATEGIES (saved-config schema) ---
+BACCARAT_CONFIG = {'tac_bet': 'BANKER', 'tac_press': 1, 'tac_depth': 3, 'tac_shoes': 3, 'tac_safety': 25,
+                   'tac_base_bet': 10.0, 'sim_years': 10, 'sim_freq': 10}
+# Wide stop/target so sessions play most of their spins (the lab default stops after one tier-sized loss)
+ROULETTE_CONFIG = {'tac_bet': 'Red', 'tac_press': 1, 'tac_depth': 3, 'tac_shoes': 3, 'tac_safety': 25, 'tac_base_bet': 5.0,
+                   'risk_stop': 400, 'risk_prof': 400, 'sim_years': 10, 'sim_freq': 10}
+ROULETTE_SPICE_CONFIG = dict(ROULETTE_CONFIG, spice_zero_en=True, spice_tiers_en=True, spice_voisins_en=True,
+                             spice_disable_neg_pl=False)
+ROULETTE_DUAL_CONFIG = dict(ROULETTE_CONFIG, tac_bet_2='Column 1')
+DOCTRINE_CONFIG = dict(BACCARAT_CONFIG, doctrine_en=True, doctrine_enabled=True)
+
+SESSIONS_PER_RUN = 200
+CAREERS_PER_RUN = 5
+SPICE_CALLS_PER_RUN = 20000
+TIER_LOOKUPS_PER_RUN = 50000
+
+
+def _sessions(worker, config, game_type):
+    def setup():
+        compiled = compile_strategy(config, game_type)
+        def run():
+            work = 0
+            for i in range(SESSIONS_PER_RUN):
+                ga = 2000 + (i % 20) * 500  # Walks through the lower tiers
+                result = worker.run_session(ga, compiled.overrides, compiled.tier_map, compiled.use_ratchet, False,
+                                            1, compiled.mode, compiled.base_bet)
+                work += result[3]  # Hands / spins played
+            return work
+        return run
+    return setup
+
+
+def _full_career(game_type, config):
+    def setup():
+        compiled = compile_strategy(config, game_type)
+        settings = batch.lab_settings(config, game_type)
+        def run():
+            results = batch.run_lab_universes(game_type, settings, compiled, BENCH_SEED, 1, CAREERS_PER_RUN)
+            return len(results)
+        return run
+    return setup
+
+
+def _compound_career():
+    sequence = [
+        {'strategy_name': 'Doctrine Baccarat', 'config': DOCTRINE_CONFIG, 'target_ga': 10000},
+        {'strategy_name': 'Roulette', 'config': ROULETTE_CONFIG, 'target_ga': 30000},
+    ]
+    def run():
+        for _ in range(CAREERS_PER_RUN):
+            CareerManager.run_compound_career(sequence, 2000, 5, 20, event_detail=False)
+        return CAREERS_PER_RUN
+    return run
+
+
+def _spices():
+    engine = create_default_engine()
+    def run():
+        for i in range(SPICE_CALLS_PER_RUN):
+            if i % 50 == 0:
+                engine.reset_session()
+            engine.reset_spin()
+            spice = engine.evaluate_and_fire_spice(session_pl_units=(i % 40) - 5, spin_index=i % 50,
+                                                   caroline_at_step4=False, session_start_bankroll=1000.0,
+                                                   current_bankroll=1000.0 + (i % 40) * 5, stop_loss=500.0)
+            engine.resolve_spice(spice or SpiceType.TIERS, random.randint(0, 36), 5.0)
+        return SPICE_CALLS_PER_RUN
+    return run
+
+
+def _tier_lookups(mode):
+    def setup():
+        tier_map = compile_strategy(dict(BACCARAT_CONFIG, tac_mode=mode), 'Baccarat').tier_map
+        gas = [random.uniform(500, 200000) for _ in range(TIER_LOOKUPS_PER_RUN)]
+        def run():
+            level = 1
+            for ga in gas:
+                level = get_tier_for_ga(ga, tier_map, level, mode).level
+            return len(gas)
+        return run
+    return setup
+
+
+# name -> (unit, setup)
+BENCHMARKS = {
+    'baccarat_session': ('hands', _sessions(BaccaratWorker, BACCARAT_CONFIG, 'Baccarat')),
+    'roulette_session': ('spins', _sessions(RouletteWorker, ROULETTE_CONFIG, 'Roulette')),
+    'roulette_session_spices': ('spins', _sessions(RouletteWorker, ROULETTE_SPICE_CONFIG, 'Roulette')),
+    'roulette_session_dual_bet': ('spins', _sessions(RouletteWorker, ROULETTE_DUAL_CONFIG, 'Roulette')),
+    'baccarat_full_career': ('careers', _full_career('Baccarat', BACCARAT_CONFIG)),
+    'roulette_full_career': ('careers', _full_career('Roulette', ROULETTE_CONFIG)),
+    'compound_career_doctrine': ('careers', _compound_career),
+    'spice_evaluate_resolve': ('calls', _spices),
+    'tier_lookup_standard': ('lookups', _tier_lookups('Standard')),
+    'tier_lookup_titan': ('lookups', _tier_lookups('Titan')),
+}
+
+
+def run_benchmark(name: str, repeats: int = 5) -> dict:
+    """Times one benchmark (fixed seed before setup and before every repeat)."""
+    unit, setup = BENCHMARKS[name]
+    random.seed(BENCH_SEED)
+    run = setup()
+    times, works = [], set()
+    for _ in range(repeats):
+        random.seed(BENCH_SEED)
+        start = time.perf_counter()
+        work = run()
+        times.append(time.perf_counter() - start)
+        works.add(work)
+    if len(works) != 1:
+        raise RuntimeError(f'{name}: work differs between repeats with the same seed ({sorted(works)})')
+    work = works.pop()
+    best = min(times)
+    return {'unit': unit, 'work': work, 'repeats': repeats, 'best_sec': round(best, 6),
+            'median_sec': round(statistics.median(times), 6), 'rate': round(work / best, 2) if best else None}
+
+
+def run_all(names=None, repeats: int = 5, on_result=None) -> dict:
+    """{name: result} for the given benchmarks (default: all), plus a '_meta' entry describing the machine."""
+    results = {'_meta': {'created': datetime.now().isoformat(timespec='seconds'), 'python': platform.python_version(),
+                         'machine': platform.machine(), 'processor': platform.processor() or platform.machine(),
+                         'seed': BENCH_SEED, 'repeats': repeats}}
+    for name in names or BENCHMARKS:
+        results[name] = run_benchmark(name, repeats)
+        if on_result:
+            on_result(name, results[name])
+    return results
+
+
+def compare(results: dict, baseline: dict, threshold: float = REGRESSION_THRESHOLD) -> list:
+    """Rows of {name, unit, rate, baseline, change, status}; status is ok, faster, REGRESSION, WORK CHANGED or new."""
+    rows = []
+    for name, res in results.items():
+        if name.startswith('_'):
+            continue
+        base = baseline.get(name)
+        row = {'name': name, 'unit': res['unit'], 'rate': res['rate'], 'baseline': None, 'change': None, 'status': 'new'}
+        if base:
+            row['baseline'] = base['rate']
+            row['change'] = (res['rate'] - base['rate']) / base['rate'] if base['rate'] else None
+            if base.get('work') != res['work']:
+                row['status'] = 'WORK CHANGED'
+            elif row['change'] is not None and row['change'] < -threshold:
+                row['status'] = 'REGRESSION'
+            elif row['change'] is not None and row['change'] > threshold:
+                row['status'] = 'faster'
+            else:
+                row['status'] = 'ok'
+        rows.append(row)
+    return rows
@@ -0,0 +1,68 @@
+"""
+Monaco Salle Blanche Lab - Cancellation
+=======================================
+Cooperative cancellation for long simulation runs.
+
+A CancelToken is handed to a run by whoever started it (the job scheduler,
+see utils/scheduler.py). The session loops of the workers call
+check_cancelled() once per session, which raises Cancelled as soon as the
+token is set, so a run stops within one session instead of playing out.
+
+The token is found without threading it through every call: the scheduler
+installs it for its worker thread (cancel_scope), and batch.run_tasks hands
+it to its worker processes (install_process_token). The token is backed by a
+multiprocessing.Event so setting it in the server is seen by those processes.
+"""
+
+import multiprocessing
+import threading
+from contextlib import contextmanager
+
+
+class Cancelled(Exception):
+    """Raised inside a run whose token was cancelled."""
+
+
+class CancelToken:
+    def __init__(self):
+        self._event = multiprocessing.Event()
+
+    def cancel(self):
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+
+_local = threading.local()
+_process_token = None
+
+
+def current_token():
+    """Token of the run on this thread (or in this worker process), if any."""
+    return getattr(_local, 'token', None) or _process_token
+
+
+@contextmanager
+def cancel_scope(token: CancelToken):
+    """Makes token the current token of this thread for the duration of the block."""
+    previous = getattr(_local, 'token', None)
+    _local.token = token
+    try:
+        yield token
+    finally:
+        _local.token = previous
+
+
+def install_process_token(token: CancelToken):
+    """Process-pool initializer: every run in this worker process checks token."""
+    global _process_token
+    _process_token = token
+
+
+def check_cancelled():
+    """Raises Cancelled if the current run was cancelled (no-op outside a scope)."""
+    token = getattr(_local, 'token', None) or _process_token
+    if token is not None and token.cancelled:
+        raise Cancelled()
@@ -0,0 +1,207 @@
+"""
+Monaco Salle Blanche Lab - Career Event Log
+===========================================
+Compact, structured event log for Career Sim.
+
+Events are stored as (month, integer code, numeric payload) and only turned
+into the familiar {'month', 'event', 'details'} dicts when somebody reads
+them, so 1000-universe runs no longer pay for f-strings nobody looks at.
+
+Retention levels:
+- counts:  per-event counters only (no entries kept)
+- sampled: full detail for the first N universes, counts for the rest
+- full:    full detail for every universe
+"""
+
+from array import array
+
+# --- EVENT CODES ---
+PEAK_UPDATE = 1
+FALLBACK = 2
+PROMOTION = 3
+INSOLVENT = 4
+DOCTRINE = 5
+STATUS = 6
+ERROR = 7
+
+EVENT_NAMES = {
+    PEAK_UPDATE: 'PEAK_UPDATE',
+    FALLBACK: 'FALLBACK',
+    PROMOTION: 'PROMOTION',
+    INSOLVENT: 'INSOLVENT',
+    DOCTRINE: 'DOCTRINE',
+    STATUS: 'STATUS',
+    ERROR: 'ERROR',
+}
+
+# --- PAYLOAD CODES ---
+# Fallback phase (where in the month the check fired)
+PHASE_MONTH_START = 0
+PHASE_PRE_SESSION = 1
+PHASE_INTRA_MONTH = 2
+PHASE_LABELS = ('', ' (pre-session)', ' (intra-month)')
+
+GAME_TYPES = ('Baccarat', 'Roulette')
+DOCTRINE_STATES = ('PLATINUM', 'TIGHT', 'COOL_OFF')
+
+# Doctrine transition reasons
+REASON_UNKNOWN = 0
+REASON_BIG_LOSS = 1
+REASON_DRAWDOWN = 2
+REASON_INSOLVENCY = 3
+REASON_TIGHT_EXHAUSTED = 4
+REASON_RECOVERED = 5
+
+# --- RETENTION LEVELS ---
+RETAIN_COUNTS = 'counts'
+RETAIN_SAMPLED = 'sampled'
+RETAIN_FULL = 'full'
+
+DEFAULT_SAMPLE_SIZE = 10
+
+
+def keeps_detail(retention: str, universe_idx: int, sample_size: int = DEFAULT_SAMPLE_SIZE) -> bool:
+    """Whether universe #universe_idx keeps a detailed log under this retention level."""
+    if retention == RETAIN_FULL:
+        return True
+    if retention == RETAIN_SAMPLED:
+        return universe_idx < sample_size
+    return False
+
+
+def format_doctrine_reason(reason, a=0.0, b=0.0):
+    """Human-readable Doctrine transition reason."""
+    if reason == REASON_BIG_LOSS:
+        return f"Big loss: -{abs(a):.1f}u"
+    if reason == REASON_DRAWDOWN:
+        return f"Drawdown: {a*100:.1f}%"
+    if reason == REASON_INSOLVENCY:
+        return f"Insolvency: €{a:,.0f} < €{b:,.0f}"
+    if reason == REASON_TIGHT_EXHAUSTED:
+        return "Max TIGHT sessions exhausted"
+    if reason == REASON_RECOVERED:
+        return "Recovered from drawdown"
+    return "Unknown"
+
+
+def format_details(code, payload, labels=()):
+    """Render one event's details string (same wording the eager log used)."""
+    if code == PEAK_UPDATE:
+        ga, old_peak, threshold = payload
+        return f"New Peak: €{ga:,.0f} (was €{old_peak:,.0f}), Trailing FB @ €{threshold:,.0f}"
+    if code == FALLBACK:
+        phase, trailing, from_leg, to_leg, ga, threshold = payload
+        mechanism = "🔄 TRAILING" if trailing else "STANDARD"
+        return (f"{mechanism} DEMOTED{PHASE_LABELS[phase]}: {labels[from_leg]} -> {labels[to_leg]} "
+                f"(Bal: €{ga:,.0f}, fell below €{threshold:,.0f})")
+    if code == PROMOTION:
+        from_leg, to_leg, ga, threshold = payload
+        return (f"GRADUATED: {labels[from_leg]} -> {labels[to_leg]} "
+                f"(Bal: €{ga:,.0f}, Trailing FB will trigger @ €{threshold:,.0f})")
+    if code == INSOLVENT:
+        floor, = payload
+        return f'Bankroll < €{floor}. Game Over.'
+    if code == DOCTRINE:
+        old_state, new_state, reason, a, b = payload
+        return f"Doctrine: {DOCTRINE_STATES[old_state]} → {DOCTRINE_STATES[new_state]} ({format_doctrine_reason(reason, a, b)})"
+    if code == STATUS:
+        year, ga, leg, game, doctrine_state = payload
+        detail = f"Year {year} | €{ga:,.0f} | {labels[leg]} ({GAME_TYPES[game]})"
+        if doctrine_state >= 0:
+            detail += f" | Doctrine: {DOCTRINE_STATES[doctrine_state]}"
+        return detail
+    if code == ERROR:
+        return str(payload[0])
+    return ''
+
+
+class CareerEventLog:
+    """
+    Event log for one Career Sim universe.
+
+    Reading it (iteration, indexing, slicing) yields the same
+    {'month', 'event', 'details'} dicts the UI has always consumed; the
+    strings are built on access. With detail=False only `counts` is kept.
+    """
+
+    __slots__ = ('labels', 'detail', 'counts', 'last_code', '_months', '_codes', '_payloads')
+
+    def __init__(self, labels=(), detail=True):
+        self.labels = tuple(labels)  # Strategy names, indexed by leg
+        self.detail = detail
+        self.counts = [0] * (max(EVENT_NAMES) + 1)
+        self.last_code = 0
+        self._months = array('H')
+        self._codes = array('B')
+        self._payloads = []
+
+    def add(self, month, code, *payload):
+        self.counts[code] += 1
+        self.last_code = code
+        if self.detail:
+            self._months.append(month)
+            self._codes.append(code)
+            self._payloads.append(payload)
+
+    def count(self, code) -> int:
+        return self.counts[code]
+
+    def count_summary(self) -> dict:
+        """{event name: count} for events that occurred."""
+        return {EVENT_NAMES[c]: n for c, n in enumerate(self.counts) if n}
+
+    def _entry(self, i):
+        code = self._codes[i]
+        return {
+            'month': self._months[i],
+            'event': EVENT_NAMES[code],
+            'details': format_details(code, self._payloads[i], self.labels)
+        }
+
+    def raw(self):
+        """Iterate (month, code, payload) without formatting."""
+        return zip(self._months, self._codes, self._payloads)
+
+    def to_dict(self) -> dict:
+        """JSON-safe form (used by the result cache)."""
+        return {
+            'labels': list(self.labels), 'detail': self.detail, 'counts': list(self.counts),
+            'last_code': self.last_code,
+            'events': [[m, c, list(p)] for m, c, p in self.raw()]
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'CareerEventLog':
+        log = cls(data['labels'], detail=data['detail'])
+        log.counts = list(data['counts'])
+        log.last_code = data['last_code']
+        for m, c, p in data['events']:
+            log._months.append(m)
+            log._codes.append(c)
+            log._payloads.append(tuple(p))
+        return log
+
+    def __len__(self):
+        return len(self._codes)
+
+    def __iter__(self):
+        for i in range(len(self._codes)):
+            yield self._entry(i)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._entry(i) for i in range(*index.indices(len(self._codes)))]
+        if index < 0:
+            index += len(self._codes)
+        if not 0 <= index < len(self._codes):
+            raise IndexError('event index out of range')
+        return self._entry(index)
+
+
+def merge_counts(logs) -> dict:
+    """Total {event name: count} across universes."""
+    totals = [0] * (max(EVENT_NAMES) + 1)
+    for log in logs:
+        for c, n in enumerate(log.counts):
+            totals[c] += n
+    return {EVENT_NAMES[c]: n for c, n in enumerate(totals) if n}
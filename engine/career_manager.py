@@ -0,0 +1,409 @@
+"""
+Monaco Salle Blanche Lab - Career Manager
+=========================================
+Multi-year Career Sim (compound strategy sequences, trailing fallback,
+Doctrine). Used by the Career page and the headless runner (no UI imports).
+"""
+
+from time import perf_counter_ns
+
+from engine import instrumentation
+from engine.baccarat_worker import BaccaratWorker
+from engine.roulette_worker import RouletteWorker
+from engine.strategy_rules import build_doctrine_configs_from_overrides
+from engine.tier_params import get_tier_for_ga
+from engine.cancellation import check_cancelled
+from engine.doctrine_engine import (
+    DoctrineContext, choose_state_for_next_session, update_after_session,
+    update_after_month, get_doctrine_config, log_state_transition
+)
+from engine.strategy_compiler import compile_strategy
+from engine import career_log as clog
+from engine.career_log import CareerEventLog
+
+class CareerManager:
+    @staticmethod
+    def run_compound_career(sequence_config, start_ga, total_years, sessions_per_year, fallback_threshold_pct=0.80, promotion_buffer_pct=1.20, trailing_fallback_pct=0.90, event_detail=True):
+        """event_detail=False keeps only per-event counts in the returned CareerEventLog."""
+        prof = instrumentation.current()
+        current_ga = start_ga
+        current_leg_idx = 0
+        
+        # Load Initial Strategy
+        active_config = sequence_config[0]['config']
+        active_strategy_name = sequence_config[0]['strategy_name']
+        active_target = sequence_config[0]['target_ga']
+        
+        # Extract Params & Detect Game Type
+        overrides, tier_map, safety, mode, use_ratch, use_penalty, game_type, base_bet = CareerManager._extract_params(active_config)
+        
+        # === DOCTRINE ENGINE INITIALIZATION ===
+        doctrine_enabled = active_config.get('doctrine_en', False)
+        doctrine_ctx = None
+        platinum_cfg = None
+        tight_cfg = None
+        state_rules = None
+        
+        if doctrine_enabled:
+            # Build doctrine configurations from overrides
+            platinum_cfg, tight_cfg, state_rules = build_doctrine_configs_from_overrides(overrides)
+            
+            # Initialize doctrine context
+            doctrine_ctx = DoctrineContext(
+                state="PLATINUM",
+                GA_current=current_ga,
+                GA_peak=current_ga,
+                last_result_u=0.0,
+                tight_sessions_done=0,
+                cooloff_months_done=0
+            )
+        
+        trajectory = []
+        log = CareerEventLog([leg['strategy_name'] for leg in sequence_config], detail=event_detail)
+        months = total_years * 12
+        active_level = 1
+        last_session_won = False
+        
+        total_input = start_ga
+        
+        # Track thresholds for fallback mechanism
+        promotion_thresholds = [0]  # Track threshold that triggered each leg promotion
+        trailing_active = [False] * len(sequence_config)  # Track if trailing fallback is active for each leg
+        trailing_peak = [start_ga]  # Track peak GA reached in each leg for trailing calculation
+        
+        for m in range(months):
+            if prof: t = perf_counter_ns()
+            # 1. CHECK FOR DEMOTION (Fallback to previous strategy if bankroll drops too low)
+            if current_leg_idx > 0:
+                # Update trailing peak if we've reached new high in current leg
+                old_peak = trailing_peak[current_leg_idx]
+                if current_ga > trailing_peak[current_leg_idx]:
+                    trailing_peak[current_leg_idx] = current_ga
+                    trailing_active[current_leg_idx] = True  # Activate trailing once we exceed promotion threshold
+                    
+                    # Log peak update
+                    new_threshold = current_ga * trailing_fallback_pct
+                    log.add(m+1, clog.PEAK_UPDATE, current_ga, old_peak, new_threshold)
+                
+                # Standard fallback check
+                fallback_threshold = promotion_thresholds[current_leg_idx] * fallback_threshold_pct
+                
+                # Trailing fallback check - if enabled and we drop X% from peak
+                trailing_threshold = trailing_peak[current_leg_idx] * trailing_fallback_pct if trailing_active[current_leg_idx] else 0
+                
+                # Use MAX to trigger on whichever threshold is MORE protective (higher)
+                if current_ga < max(fallback_threshold, trailing_threshold):
+                    # Determine which mechanism triggered
+                    is_trailing = False
+                    threshold_value = fallback_threshold
+                    if trailing_active[current_leg_idx] and trailing_threshold > fallback_threshold:
+                        is_trailing = True
+                        threshold_value = trailing_threshold
+                    
+                    # Demote to previous strategy
+                    current_leg_idx -= 1
+                    prev_leg = sequence_config[current_leg_idx]
+                    
+                    # Reset trailing for demoted leg (we're dropping back)
+                    if current_leg_idx + 1 < len(trailing_active):
+                        trailing_active[current_leg_idx + 1] = False
+                    if current_leg_idx + 1 < len(trailing_peak):
+                        trailing_peak[current_leg_idx + 1] = 0
+                    
+                    log.add(m+1, clog.FALLBACK, clog.PHASE_MONTH_START, is_trailing,
+                            current_leg_idx + 1, current_leg_idx, current_ga, threshold_value)
+                    
+                    active_strategy_name = prev_leg['strategy_name']
+                    active_config = prev_leg['config']
+                    active_target = prev_leg['target_ga']
+                    
+                    # Refresh Params for previous Leg
+                    overrides, tier_map, safety, mode, use_ratch, use_penalty, game_type, base_bet = CareerManager._extract_params(active_config)
+                    
+                    # Reset Tier Level based on old map
+                    temp_tier = get_tier_for_ga(current_ga, tier_map, 1, mode, game_type=game_type)
+                    active_level = temp_tier.level
+            
+            # 2. CHECK FOR PROMOTION (with buffer to avoid flip-flopping)
+            if current_leg_idx < len(sequence_config) - 1:
+                promotion_target = active_target * promotion_buffer_pct
+                if current_ga >= promotion_target:
+                    current_leg_idx += 1
+                    new_leg = sequence_config[current_leg_idx]
+                    
+                    # Store the threshold that triggered this promotion
+                    promotion_thresholds.append(promotion_target)
+                    
+                    # Initialize trailing tracking for this new leg
+                    while len(trailing_peak) <= current_leg_idx:
+                        trailing_peak.append(0)
+                        trailing_active.append(False)
+                    trailing_peak[current_leg_idx] = current_ga
+                    trailing_active[current_leg_idx] = True
+                    
+                    # Calculate what the trailing threshold will be
+                    trailing_threshold_value = current_ga * trailing_fallback_pct
+                    
+                    log.add(m+1, clog.PROMOTION, current_leg_idx - 1, current_leg_idx, current_ga, trailing_threshold_value)
+                    
+                    active_strategy_name = new_leg['strategy_name']
+                    active_config = new_leg['config']
+                    active_target = new_leg['target_ga']
+                    
+                    # Refresh Params for new Leg
+                    overrides, tier_map, safety, mode, use_ratch, use_penalty, game_type, base_bet = CareerManager._extract_params(active_config)
+                    
+                    # Reset Tier Level based on new map
+                    temp_tier = get_tier_for_ga(current_ga, tier_map, 1, mode, game_type=game_type)
+                    active_level = temp_tier.level
+
+            # 3. ECOSYSTEM (Tax/Contrib)
+            tax_rate = active_config.get('eco_tax_rate', 25)
+            tax_thresh = active_config.get('eco_tax_thresh', 12500)
+            use_tax = active_config.get('eco_tax', False)
+            
+            if use_tax and current_ga > tax_thresh:
+                tax = (current_ga - tax_thresh) * (tax_rate / 100.0)
+                current_ga -= tax
+
+            contrib_win = active_config.get('eco_win', 300)
+            contrib_loss = active_config.get('eco_loss', 300)
+            hol_ceil = active_config.get('eco_hol_ceil', 10000)
+            use_hol = active_config.get('eco_hol', False)
+            
+            should_contribute = True
+            if use_hol and current_ga >= hol_ceil:
+                should_contribute = False
+            
+            if should_contribute:
+                amount = contrib_win if last_session_won else contrib_loss
+                current_ga += amount
+                total_input += amount 
+            
+            # 4. INSOLVENCY CHECK
+            insolvency_floor = active_config.get('eco_insolvency', 1000)
+            if current_ga < insolvency_floor:
+                if log.last_code != clog.INSOLVENT:
+                    log.add(m+1, clog.INSOLVENT, insolvency_floor)
+                trajectory.append(current_ga)
+                if prof: prof.lap('career.month', t)
+                continue 
+
+            # === DOCTRINE STATE MACHINE ===
+            if doctrine_enabled and doctrine_ctx:
+                # Update context with current GA
+                doctrine_ctx.GA_current = current_ga
+                
+                # Determine next state
+                old_state = doctrine_ctx.state
+                new_state = choose_state_for_next_session(doctrine_ctx, state_rules)
+                
+                # Log state transition if changed
+                if new_state != old_state:
+                    reason_code, reason_a, reason_b = clog.REASON_UNKNOWN, 0.0, 0.0
+                    if new_state == "TIGHT":
+                        if doctrine_ctx.last_result_u <= -state_rules.loss_trigger_pl_u:
+                            reason_code, reason_a = clog.REASON_BIG_LOSS, doctrine_ctx.last_result_u
+                        else:
+                            dd_pct = (doctrine_ctx.GA_peak - current_ga) / doctrine_ctx.GA_peak if doctrine_ctx.GA_peak > 0 else 0
+                            reason_code, reason_a = clog.REASON_DRAWDOWN, dd_pct
+                    elif new_state == "COOL_OFF":
+                        if current_ga < state_rules.cooloff_ga_floor:
+                            reason_code, reason_a, reason_b = clog.REASON_INSOLVENCY, current_ga, state_rules.cooloff_ga_floor
+                        else:
+                            reason_code = clog.REASON_TIGHT_EXHAUSTED
+                    elif new_state == "PLATINUM":
+                        reason_code = clog.REASON_RECOVERED
+                    
+                    reason = clog.format_doctrine_reason(reason_code, reason_a, reason_b)
+                    log_state_transition(doctrine_ctx, old_state, new_state, reason)
+                    log.add(m+1, clog.DOCTRINE, clog.DOCTRINE_STATES.index(old_state),
+                            clog.DOCTRINE_STATES.index(new_state), reason_code, reason_a, reason_b)
+                    doctrine_ctx.state = new_state
+                
+                # Get active doctrine config
+                active_doctrine_cfg = get_doctrine_config(doctrine_ctx.state, platinum_cfg, tight_cfg)
+                
+                # Override session parameters with doctrine config
+                overrides.stop_loss_units = int(active_doctrine_cfg.stop_loss_u)
+                overrides.profit_lock_units = int(active_doctrine_cfg.target_u)
+                overrides.press_trigger_wins = active_doctrine_cfg.press_wins
+                overrides.press_depth = active_doctrine_cfg.press_depth
+                overrides.iron_gate_limit = active_doctrine_cfg.iron_gate
+
+            if prof: prof.lap('career.month', t)
+
+            # 5. PLAY SESSIONS (DYNAMIC ENGINE SELECTION)
+            sessions_this_month = sessions_per_year // 12
+            if m % 12 < (sessions_per_year % 12): 
+                sessions_this_month += 1
+            
+            month_pnl = 0.0  # Track monthly P&L for doctrine
+            for _ in range(sessions_this_month):
+                check_cancelled()
+                if prof: t = perf_counter_ns()
+                # === PRE-SESSION TRAILING FALLBACK CHECK ===
+                # Check BEFORE playing to prevent entering a session already below threshold
+                if current_leg_idx > 0:
+                    # Update trailing peak if we've reached new high
+                    if current_ga > trailing_peak[current_leg_idx]:
+                        trailing_peak[current_leg_idx] = current_ga
+                        trailing_active[current_leg_idx] = True
+                    
+                    # Check both fallback mechanisms BEFORE session starts
+                    fallback_threshold = promotion_thresholds[current_leg_idx] * fallback_threshold_pct
+                    trailing_threshold = trailing_peak[current_leg_idx] * trailing_fallback_pct if trailing_active[current_leg_idx] else 0
+                    
+                    # Use MAX to trigger on whichever threshold is MORE protective (higher)
+                    if current_ga < max(fallback_threshold, trailing_threshold):
+                        # Determine which mechanism triggered
+                        is_trailing = False
+                        threshold_value = fallback_threshold
+                        if trailing_active[current_leg_idx] and trailing_threshold > fallback_threshold:
+                            is_trailing = True
+                            threshold_value = trailing_threshold
+                        
+                        # Demote to previous strategy
+                        current_leg_idx -= 1
+                        prev_leg = sequence_config[current_leg_idx]
+                        
+                        # Reset trailing for demoted leg
+                        if current_leg_idx + 1 < len(trailing_active):
+                            trailing_active[current_leg_idx + 1] = False
+                        if current_leg_idx + 1 < len(trailing_peak):
+                            trailing_peak[current_leg_idx + 1] = 0
+                        
+                        log.add(m+1, clog.FALLBACK, clog.PHASE_PRE_SESSION, is_trailing,
+                                current_leg_idx + 1, current_leg_idx, current_ga, threshold_value)
+                        
+                        active_strategy_name = prev_leg['strategy_name']
+                        active_config = prev_leg['config']
+                        active_target = prev_leg['target_ga']
+                        
+                        # Refresh Params for previous Leg
+                        overrides, tier_map, safety, mode, use_ratch, use_penalty, game_type, base_bet = CareerManager._extract_params(active_config)
+                        
+                        # Reset Tier Level based on old map
+                        temp_tier = get_tier_for_ga(current_ga, tier_map, 1, mode, game_type=game_type)
+                        active_level = temp_tier.level
+                        
+                        # Break out of remaining sessions this month to apply new strategy
+                        break
+                
+                session_ga_before = current_ga
+                if prof: prof.lap('career.ladder', t)
+                
+                if game_type == 'Roulette':
+                    # --- ROULETTE ENGINE (returns 10 values) ---
+                    pnl, vol, used_lvl, spins, spice_stats, exit_reason, max_caroline, max_dalembert, press_streak, peak_profit = RouletteWorker.run_session(
+                        current_ga, overrides, tier_map, use_ratch, use_penalty, active_level, mode, base_bet
+                    )
+                else:
+                    # --- BACCARAT ENGINE (returns 9 values) ---
+                    pnl, vol, used_lvl, hands, exit_reason, press_streak, tie_count, tie_bets, tie_pnl, _, _ = BaccaratWorker.run_session(
+                        current_ga, overrides, tier_map, use_ratch, use_penalty, active_level, mode, base_bet
+                    )
+                if prof: t = perf_counter_ns()
+                
+                current_ga += pnl
+                month_pnl += pnl
+                active_level = used_lvl 
+                last_session_won = (pnl > 0)
+                
+                # === INTRA-SESSION TRAILING FALLBACK CHECK ===
+                # Check after each session to prevent large drawdowns within a month
+                if current_leg_idx > 0:
+                    # Update trailing peak if we've reached new high
+                    if current_ga > trailing_peak[current_leg_idx]:
+                        old_peak = trailing_peak[current_leg_idx]
+                        trailing_peak[current_leg_idx] = current_ga
+                        trailing_active[current_leg_idx] = True
+                        
+                        # Log significant peak updates (only if increase is meaningful, e.g., >1%)
+                        if (current_ga - old_peak) / old_peak > 0.01:
+                            new_threshold = current_ga * trailing_fallback_pct
+                            log.add(m+1, clog.PEAK_UPDATE, current_ga, old_peak, new_threshold)
+                    
+                    # Check both fallback mechanisms
+                    fallback_threshold = promotion_thresholds[current_leg_idx] * fallback_threshold_pct
+                    trailing_threshold = trailing_peak[current_leg_idx] * trailing_fallback_pct if trailing_active[current_leg_idx] else 0
+                    
+                    # Use MAX to trigger on whichever threshold is MORE protective (higher)
+                    if current_ga < max(fallback_threshold, trailing_threshold):
+                        # Determine which mechanism triggered
+                        is_trailing = False
+                        threshold_value = fallback_threshold
+                        if trailing_active[current_leg_idx] and trailing_threshold > fallback_threshold:
+                            is_trailing = True
+                            threshold_value = trailing_threshold
+                        
+                        # Demote to previous strategy
+                        current_leg_idx -= 1
+                        prev_leg = sequence_config[current_leg_idx]
+                        
+                        # Reset trailing for demoted leg
+                        if current_leg_idx + 1 < len(trailing_active):
+                            trailing_active[current_leg_idx + 1] = False
+                        if current_leg_idx + 1 < len(trailing_peak):
+                            trailing_peak[current_leg_idx + 1] = 0
+                        
+                        log.add(m+1, clog.FALLBACK, clog.PHASE_INTRA_MONTH, is_trailing,
+                                current_leg_idx + 1, current_leg_idx, current_ga, threshold_value)
+                        
+                        active_strategy_name = prev_leg['strategy_name']
+                        active_config = prev_leg['config']
+                        active_target = prev_leg['target_ga']
+                        
+                        # Refresh Params for previous Leg
+                        overrides, tier_map, safety, mode, use_ratch, use_penalty, game_type, base_bet = CareerManager._extract_params(active_config)
+                        
+                        # Reset Tier Level based on old map
+                        temp_tier = get_tier_for_ga(current_ga, tier_map, 1, mode, game_type=game_type)
+                        active_level = temp_tier.level
+                        
+                        # Break out of remaining sessions this month to apply new strategy
+                        break
+                
+                if prof: t = prof.lap('career.ladder', t)
+                
+                # Update doctrine after each session
+                if doctrine_enabled and doctrine_ctx:
+                    result_u = pnl / base_bet
+                    update_after_session(doctrine_ctx, result_u, current_ga, doctrine_ctx.state)
+                    if prof: prof.lap('career.doctrine', t)
+            
+            # Update doctrine after month (for cool-off tracking)
+            if doctrine_enabled and doctrine_ctx:
+                update_after_month(doctrine_ctx)
+            
+            trajectory.append(current_ga)
+            
+            if m % 12 == 0:
+                year_num = (m // 12) + 1
+                
+                # Add doctrine state to status if enabled
+                doctrine_code = clog.DOCTRINE_STATES.index(doctrine_ctx.state) if doctrine_enabled and doctrine_ctx else -1
+                
+                log.add(m+1, clog.STATUS, year_num, current_ga, current_leg_idx,
+                        clog.GAME_TYPES.index(game_type), doctrine_code)
+
+        # Prepare doctrine summary if enabled
+        doctrine_summary = None
+        if doctrine_enabled and doctrine_ctx:
+            doctrine_summary = {
+                'final_state': doctrine_ctx.state,
+                'platinum_sessions': doctrine_ctx.platinum_sessions,
+                'tight_sessions': doctrine_ctx.tight_sessions,
+                'cooloff_months': doctrine_ctx.cooloff_months,
+                'transitions': doctrine_ctx.transitions,
+                'peak_ga': doctrine_ctx.GA_peak
+            }
+
+        return trajectory, log, current_ga, total_input, doctrine_summary
+
+    @staticmethod
+    def _extract_params(config):
+        """Leg parameters from the shared compile cache. Overrides are a private copy (Doctrine mutates them)."""
+        compiled = compile_strategy(config, profile='career')
+        return (compiled.fresh_overrides(), compiled.tier_map, compiled.safety, compiled.mode,
+                compiled.use_ratchet, compiled.penalty_mode, compiled.game_type, compiled.base_bet)
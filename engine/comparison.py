@@ -0,0 +1,133 @@
+"""
+Monaco Salle Blanche Lab - Strategy Comparison
+==============================================
+K saved strategies, Baccarat, Roulette or a mix of both, played over the
+same universes with common random numbers, and their paired differences.
+
+Universe i of a comparison is played by every strategy, with every session
+dealt from its own stream seeded from (seed, i, month, slot in the month)
+(engine/seeding.seed_session). Two strategies therefore see the same hands
+(or spins) in the same sessions, however their earlier sessions went, and
+the difference of their results in one universe is mostly the difference of
+the strategies, not of their luck. Confidence intervals are built on those
+per-universe differences: the luck the strategies share cancels out, so a
+real difference shows up with far fewer universes than two independent lab
+runs need. compare_stats() reports both intervals, and the number of
+universes independent runs would need for the paired interval's width.
+
+Strategies of different games share the same streams but draw from them
+differently, so their pairing is weaker (the intervals stay valid).
+
+Runs are chunked and spread over the cores like the lab runs (engine/batch.py).
+"""
+
+import numpy as np
+
+from engine import batch
+from engine.seeding import DEFAULT_SEED
+from engine.strategy_compiler import compile_strategy
+
+# metric -> label; gold_year counts universes that never reach the status as years + 1
+COMPARE_METRICS = {
+    'final_ga': 'Final GA (€)',
+    'insolvent_months': 'Insolvent Months',
+    'monthly_cost': 'Monthly Cost (€)',
+    'gold_year': 'Gold Year',
+}
+Z95 = 1.96  # Normal quantile of the 95% intervals (comparisons run hundreds of universes)
+
+# Ecosystem settings a comparison can impose on every strategy (same horizon, same bankroll)
+COMMON_SETTINGS = ('years', 'freq', 'start_ga')
+
+
+def compare_settings(entries, common=None) -> list:
+    """
+    Lab settings of each entry ({'game', 'name', 'config'}: a saved strategy
+    and the lab it is played in), with the common settings applied to all.
+    """
+    common = {k: v for k, v in (common or {}).items() if k in COMMON_SETTINGS and v is not None}
+    return [dict(batch.lab_settings(e['config'], e['game']), **common) for e in entries]
+
+
+def universe_metrics(result: dict, config: dict) -> tuple:
+    """COMPARE_METRICS of one universe of one strategy."""
+    months = config['years'] * 12
+    # What the universe cost its player per month: money put in minus money left (tax paid out counts as taken out)
+    monthly_cost = (config['start_ga'] + result['contrib'] - result['final_ga'] - result['tax']) / months
+    gold_year = result['gold_year'] if result['gold_year'] != -1 else config['years'] + 1
+    return result['final_ga'], result['insolvent_months'], monthly_cost, gold_year
+
+
+def run_compare_universes(entries, configs, compiled, seed, start, count) -> list:
+    """
+    Universes start..start+count-1 played by every strategy. One row per
+    universe: {'universe': i, metric: float64 array of the K strategies' values}.
+    """
+    rows = []
+    for i in range(start, start + count):
+        values = np.empty((len(entries), len(COMPARE_METRICS)), dtype=np.float64)
+        for k, (entry, config, strategy) in enumerate(zip(entries, configs, compiled)):
+            result = batch.run_lab_universes(entry['game'], config, strategy, seed, i, 1, crn=True)[0]
+            values[k] = universe_metrics(result, config)
+        rows.append(dict({'universe': i}, **{m: values[:, j] for j, m in enumerate(COMPARE_METRICS)}))
+    return rows
+
+
+def run_compare_chunk(entries, configs, seed, start, count):
+    """Process-pool entry point: compiles the strategies (cached per process) and plays a chunk of universes."""
+    compiled = [compile_strategy(e['config'], game_type=e['game']) for e in entries]
+    return run_compare_universes(entries, configs, compiled, seed, start, count)
+
+
+def run_comparison(entries, num_universes, seed=DEFAULT_SEED, common=None, max_workers=None, on_chunk=None, start=0,
+                   on_results=None, instrument=None):
+    """K-strategy comparison (entries as for compare_settings). Returns (rows, per-strategy settings)."""
+    configs = compare_settings(entries, common)
+    plan = batch.plan_universes(num_universes, start)
+    rows = batch.run_chunks(run_compare_chunk, (entries, configs, seed), plan, max_workers, on_chunk, on_results,
+                            instrument)
+    return rows, configs
+
+
+def metric_matrix(rows, metric: str) -> np.ndarray:
+    """universes x strategies values of one metric."""
+    return np.array([r[metric] for r in rows], dtype=np.float64)
+
+
+def compare_stats(rows, names, baseline: int = 0) -> dict:
+    """
+    {'universes', 'strategies': [{'name', metric: mean}], 'diffs': [...]}:
+    one diff per other strategy and metric, strategy minus baseline, with
+    the paired 95% interval, the interval two independent runs of the same
+    size would give, and 'efficiency', how many times more universes those
+    independent runs would need for the paired interval's width.
+    """
+    n = len(rows)
+    out = {'universes': n, 'baseline': names[baseline], 'strategies': [{'name': name} for name in names], 'diffs': []}
+    if not n:
+        return out
+    for metric in COMPARE_METRICS:
+        values = metric_matrix(rows, metric)
+        for k, name in enumerate(names):
+            out['strategies'][k][metric] = float(values[:, k].mean())
+        if n < 2:
+            continue
+        base = values[:, baseline]
+        for k, name in enumerate(names):
+            if k == baseline:
+                continue
+            diff = values[:, k] - base
+            mean = float(diff.mean())
+            paired_se = float(diff.std(ddof=1) / np.sqrt(n))
+            unpaired_se = float(np.sqrt((values[:, k].var(ddof=1) + base.var(ddof=1)) / n))
+            if paired_se > 0:
+                efficiency = (unpaired_se / paired_se) ** 2
+            else:
+                efficiency = float('inf') if unpaired_se > 0 else 1.0
+            out['diffs'].append({
+                'strategy': name, 'metric': metric, 'mean_diff': mean,
+                'ci_low': mean - Z95 * paired_se, 'ci_high': mean + Z95 * paired_se,
+                'unpaired_low': mean - Z95 * unpaired_se, 'unpaired_high': mean + Z95 * unpaired_se,
+                'significant': abs(mean) > Z95 * paired_se, 'efficiency': efficiency,
+            })
+    return out
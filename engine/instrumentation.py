@@ -0,0 +1,129 @@
+"""
+Monaco Salle Blanche Lab - Instrumentation
+==========================================
+Opt-in per-phase timing and call counts for the simulation hot paths
+(BaccaratWorker, RouletteWorker, the spice engine calls and CareerManager).
+
+The engines ask for the current accumulator once per session:
+
+    prof = instrumentation.current()      # None unless this run is instrumented
+    ...
+    if prof: t = perf_counter_ns()
+    decision = Strategist.get_next_decision(state)
+    if prof: t = prof.lap('roulette.decision', t)
+
+so a run that is not instrumented pays one thread-local lookup per session
+and a truth test per phase boundary.
+
+Accumulators are plain dicts owned by one thread of one process (no locks).
+batch.run_chunks runs each chunk through run_instrumented(), which collects
+into a fresh accumulator in the worker and returns its snapshot with the
+chunk's results; the parent merges the snapshots as chunks finish.
+Finished reports are kept in a small in-memory ring (recent_reports) for the
+admin panel; the job API returns a job's report with its status.
+"""
+
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from time import perf_counter_ns
+
+MAX_REPORTS = 20  # Instrumented runs kept for the admin panel
+
+
+class Accumulator:
+    """Per-phase call counts and nanoseconds. Not thread-safe: one per worker thread."""
+
+    __slots__ = ('calls', 'ns')
+
+    def __init__(self):
+        self.calls = {}
+        self.ns = {}
+
+    def lap(self, phase: str, t0: int) -> int:
+        """Adds the time since t0 to phase and returns now (the start of the next phase)."""
+        now = perf_counter_ns()
+        self.calls[phase] = self.calls.get(phase, 0) + 1
+        self.ns[phase] = self.ns.get(phase, 0) + now - t0
+        return now
+
+    def add(self, phase: str, ns: int, calls: int = 1):
+        self.calls[phase] = self.calls.get(phase, 0) + calls
+        self.ns[phase] = self.ns.get(phase, 0) + ns
+
+    def snapshot(self) -> dict:
+        """{phase: [calls, ns]} (picklable, JSON-safe)."""
+        return {p: [self.calls[p], self.ns[p]] for p in self.calls}
+
+    def merge(self, snapshot: dict):
+        for phase, (calls, ns) in snapshot.items():
+            self.add(phase, ns, calls)
+
+    def report(self) -> list:
+        """Rows {phase, calls, total_ms, mean_us, share} by total time, share of the instrumented time."""
+        total = sum(self.ns.values()) or 1
+        rows = [{'phase': p, 'calls': self.calls[p], 'total_ms': round(self.ns[p] / 1e6, 3),
+                 'mean_us': round(self.ns[p] / self.calls[p] / 1e3, 3) if self.calls[p] else 0.0,
+                 'share': round(self.ns[p] / total, 4)} for p in self.ns]
+        return sorted(rows, key=lambda r: -r['total_ms'])
+
+
+_local = threading.local()
+
+
+def current():
+    """Accumulator of the run on this thread, or None when the run is not instrumented."""
+    return getattr(_local, 'acc', None)
+
+
+@contextmanager
+def collecting(acc: Accumulator):
+    """Makes acc the current accumulator of this thread for the duration of the block."""
+    previous = getattr(_local, 'acc', None)
+    _local.acc = acc
+    try:
+        yield acc
+    finally:
+        _local.acc = previous
+
+
+@contextmanager
+def phase(acc, name: str):
+    """Times a coarse phase (stats aggregation, ...) into acc; no-op when acc is None."""
+    if acc is None:
+        yield
+        return
+    t0 = perf_counter_ns()
+    try:
+        yield
+    finally:
+        acc.lap(name, t0)
+
+
+def run_instrumented(func, args):
+    """Task wrapper for batch.run_tasks: (func(*args), snapshot of what it collected)."""
+    acc = Accumulator()
+    with collecting(acc):
+        result = func(*args)
+    return result, acc.snapshot()
+
+
+# --- RECENT REPORTS (admin panel) ---
+
+_reports = deque(maxlen=MAX_REPORTS)
+_reports_lock = threading.Lock()
+
+
+def record_report(name: str, acc: Accumulator, **info) -> dict:
+    """Keeps an instrumented run's report for the admin panel and returns it."""
+    report = dict(info, name=name, finished=time.time(), phases=acc.report())
+    with _reports_lock:
+        _reports.appendleft(report)
+    return report
+
+
+def recent_reports() -> list:
+    with _reports_lock:
+        return list(_reports)
+
@@ -0,0 +1,126 @@
+"""
+Monaco Salle Blanche Lab - Run Profiling
+========================================
+Deterministic (cProfile) profile of a sample of a run's universes, for
+finding out why one strategy is much slower than the others (heavy spice
+use, long recovery sessions, ...) on the server it runs on.
+
+The sampled universes are replayed inline, on the calling thread, from the
+same per-universe seeds as the run itself, so they play exactly the hands
+and spins the run played. The report aggregates self time by function and
+groups the functions by source file: project modules by their path in the
+repo (engine/roulette_rules.py, engine/spice_system.py, ...), the rest as
+'python: <file>' or 'built-ins'.
+
+Reports are JSON-safe dicts; profile_stats_bytes() gives the raw stats in
+the pstats file format (python -m pstats / snakeviz). The last few profiles
+are kept in memory for the admin panel.
+"""
+
+import cProfile
+import marshal
+import os
+import threading
+import time
+from collections import deque
+
+from engine import batch
+from engine.seeding import DEFAULT_SEED
+from engine.strategy_compiler import compile_strategy
+
+PROFILE_SAMPLE = 10      # Universes profiled per run
+MAX_FUNCTIONS = 300      # Functions kept in a report (by self time)
+MAX_PROFILES = 10        # Profiles kept for the admin panel
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+FUNCTION_FIELDS = ['module', 'function', 'line', 'calls', 'self_ms', 'cum_ms', 'self_share']
+
+
+def sample_universes(num_universes: int, sample: int = PROFILE_SAMPLE) -> list:
+    """Evenly spread universe indices (always including universe 0, which also tracks the Year 1 log)."""
+    sample = max(1, min(sample, num_universes))
+    return sorted({i * num_universes // sample for i in range(sample)})
+
+
+def module_of(filename: str) -> str:
+    """Report group of a profiled function's source file."""
+    if filename == '~':
+        return 'built-ins'
+    path = os.path.abspath(filename)
+    if path.startswith(PROJECT_ROOT + os.sep):
+        return os.path.relpath(path, PROJECT_ROOT).replace(os.sep, '/')
+    return f'python: {os.path.basename(filename)}'
+
+
+def _profile(play, indices):
+    profiler = cProfile.Profile()
+    start = time.perf_counter()
+    profiler.enable()
+    try:
+        for i in indices:
+            play(i)
+    finally:
+        profiler.disable()
+    elapsed = time.perf_counter() - start
+    profiler.create_stats()
+    return profiler.stats, elapsed
+
+
+def build_report(stats: dict, **info) -> dict:
+    """{..info, total_ms, modules: [{module, self_ms, share, functions}], functions: [FUNCTION_FIELDS rows]}."""
+    total = sum(tt for _, _, tt, _, _ in stats.values()) or 1e-12
+    functions, modules = [], {}
+    for (filename, line, name), (_, calls, tt, ct, _) in stats.items():
+        module = module_of(filename)
+        functions.append({'module': module, 'function': name, 'line': line, 'calls': calls,
+                          'self_ms': round(tt * 1e3, 3), 'cum_ms': round(ct * 1e3, 3), 'self_share': round(tt / total, 4)})
+        m = modules.setdefault(module, {'module': module, 'self_ms': 0.0, 'share': 0.0, 'functions': 0})
+        m['self_ms'] += tt * 1e3
+        m['share'] += tt / total
+        m['functions'] += 1
+    for m in modules.values():
+        m['self_ms'], m['share'] = round(m['self_ms'], 3), round(m['share'], 4)
+    functions.sort(key=lambda f: -f['self_ms'])
+    return dict(info, total_ms=round(total * 1e3, 3), modules=sorted(modules.values(), key=lambda m: -m['self_ms']),
+                functions=functions[:MAX_FUNCTIONS])
+
+
+def profile_stats_bytes(stats: dict) -> bytes:
+    """Raw stats in the format cProfile.Profile.dump_stats writes (pstats.Stats(path) reads it)."""
+    return marshal.dumps(stats)
+
+
+def profile_lab(game_type, strategy_config, num_universes, seed=DEFAULT_SEED, config=None, sample=PROFILE_SAMPLE):
+    """(report, raw stats) for a sample of a Baccarat/Roulette multiverse's universes."""
+    config = config or batch.lab_settings(strategy_config, game_type)
+    compiled = compile_strategy(strategy_config, game_type=game_type)
+    indices = sample_universes(num_universes, sample)
+    stats, elapsed = _profile(lambda i: batch.run_lab_universes(game_type, config, compiled, seed, i, 1), indices)
+    return build_report(stats, lab=game_type.lower(), seed=seed, universes=indices, elapsed_sec=round(elapsed, 3)), stats
+
+
+def profile_career(sequence_config, num_universes, seed=DEFAULT_SEED, settings=None, sample=PROFILE_SAMPLE):
+    """(report, raw stats) for a sample of a Career Sim multiverse's universes."""
+    settings = dict(batch.CAREER_DEFAULTS, **(settings or {}))
+    indices = sample_universes(num_universes, sample)
+    stats, elapsed = _profile(lambda i: batch.run_career_universe(sequence_config, settings, seed, i), indices)
+    return build_report(stats, lab='career', seed=seed, universes=indices, elapsed_sec=round(elapsed, 3)), stats
+
+
+# --- RECENT PROFILES (admin panel) ---
+
+_profiles = deque(maxlen=MAX_PROFILES)
+_profiles_lock = threading.Lock()
+
+
+def record_profile(name: str, report: dict, stats: dict) -> dict:
+    """Keeps a profile for the admin panel and returns its entry {name, finished, report, stats}."""
+    entry = {'name': name, 'finished': time.time(), 'report': report, 'stats': stats}
+    with _profiles_lock:
+        _profiles.appendleft(entry)
+    return entry
+
+
+def recent_profiles() -> list:
+    with _profiles_lock:
+        return list(_profiles)
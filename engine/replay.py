@@ -0,0 +1,57 @@
+"""
+Monaco Salle Blanche Lab - Universe Replay
+==========================================
+Drill-down into single universes of a multiverse run that has already been
+played.
+
+Multiverse runs are played untraced (only universe 0 keeps its Year 1
+session log), but universe i is always played from seed (seed, i) and every
+result records its index under 'universe', so any universe of a run can be
+replayed on demand with full tracing: its whole session log, and one session
+hand by hand (Baccarat) or spin by spin (Roulette). Tracing does not draw
+from the RNG, so the replay is the very universe the run played (same
+trajectory, same final GA). Only the universes someone looks at pay for the
+tracing.
+
+pick_universes() finds the worst / P10 / median / P90 / best universe of a
+run's results to replay.
+"""
+
+from engine import batch
+from engine import career_log as clog
+from engine.seeding import DEFAULT_SEED
+from engine.strategy_compiler import compile_strategy
+
+# label -> quantile of the ranked universes
+PICKS = (('WORST', 0.0), ('P10', 0.1), ('MEDIAN', 0.5), ('P90', 0.9), ('BEST', 1.0))
+
+
+def pick_universes(results, key='final_ga') -> dict:
+    """
+    {label: universe index} of the PICKS universes, ranked by key (final_ga
+    for the labs, final for Career Sim). Failed universes are left out.
+    """
+    ranked = sorted((float(r[key]), int(r['universe'])) for r in results if 'error' not in r)
+    if not ranked:
+        return {}
+    last = len(ranked) - 1
+    return {label: ranked[round(q * last)][1] for label, q in PICKS}
+
+
+def replay_lab_universe(game_type, strategy_config, index, seed=DEFAULT_SEED, config=None, trace_session=1):
+    """
+    Universe #index of a Baccarat/Roulette multiverse, replayed with every
+    session logged under 'y1_log' (all months, not just Year 1) and session
+    #trace_session traced under 'session_trace' (None when the universe
+    played fewer sessions).
+    """
+    config = config or batch.lab_settings(strategy_config, game_type)
+    compiled = compile_strategy(strategy_config, game_type=game_type)
+    return batch.run_lab_universes(game_type, config, compiled, seed, index, 1,
+                                   detail_months=config['years'] * 12, trace_session=trace_session)[0]
+
+
+def replay_career_universe(sequence_config, index, seed=DEFAULT_SEED, settings=None):
+    """Universe #index of a Career Sim multiverse, replayed with its detailed event log."""
+    settings = {**batch.CAREER_DEFAULTS, **(settings or {}), 'retention': clog.RETAIN_FULL}
+    return batch.run_career_universe(sequence_config, settings, seed, index)
@@ -0,0 +1,680 @@
+"""
+Monaco Salle Blanche Lab - Roulette Worker
+==========================================
+Session and career simulation for Roulette (including spices), shared by the
+lab pages, Career Sim, Sessions Sim and the headless runner (no UI imports).
+"""
+
+from dataclasses import replace
+from time import perf_counter_ns
+
+import numpy as np
+
+from engine import instrumentation
+from engine.cancellation import check_cancelled
+from engine.seeding import seed_session
+from engine.roulette_rules import (
+    RouletteSessionState, RouletteStrategist, RouletteBet,
+    create_spice_engine_from_overrides
+)
+from engine.session_histograms import SessionHistograms, results_hist
+from engine.spice_system import SpiceType, SPICE_PATTERNS
+from engine.tier_params import TierConfig, generate_tier_map, get_tier_for_ga
+from engine.strategy_rules import StrategyOverrides
+
+# SBM LOYALTY TIERS
+SBM_TIERS = {'Silver': 5000, 'Gold': 22500, 'Platinum': 175000}
+
+# MAP
+BET_MAP = {
+    'Red': RouletteBet.RED,
+    'Black': RouletteBet.BLACK,
+    'Even': RouletteBet.EVEN,
+    'Odd': RouletteBet.ODD,
+    '1-18': RouletteBet.LOW,
+    '19-36': RouletteBet.HIGH,
+    'Column 1': RouletteBet.COLUMN1,
+    'Strategy 1: Salon Privé Lite': RouletteBet.STRAT_SALON_LITE,
+    'Strategy 2: French Main Game': RouletteBet.STRAT_FRENCH_LITE
+}
+
+# run_session(track_spins=True) dict keys, in the order of its tuple result
+SESSION_KEYS = ('pnl', 'volume', 'tier', 'spins', 'spice_stats', 'exit_reason', 'max_caroline', 'max_dalembert',
+                'press_streak', 'peak_profit')
+
+
+def _traced_session(res: dict, session_no: int, month: int, start_ga: float):
+    """(session trace, usual tuple result) of a run_session(track_spins=True) result."""
+    return dict(res, session=session_no, month=month, start_ga=start_ga), tuple(res[k] for k in SESSION_KEYS)
+
+
+class RouletteWorker:
+    @staticmethod
+    def run_session(current_ga: float, overrides: StrategyOverrides, tier_map: dict, use_ratchet: bool, penalty_mode: bool, active_level: int, mode: str, base_bet: float = 5.0, track_spins: bool = False,
+                    hist: SessionHistograms = None):
+        prof = instrumentation.current()
+        if prof: t = perf_counter_ns()
+        tier = get_tier_for_ga(current_ga, tier_map, active_level, mode, game_type='Roulette')
+        if prof: prof.lap('roulette.tier_lookup', t)
+        
+        is_active_penalty = penalty_mode and overrides.penalty_box_enabled
+        if is_active_penalty:
+            flat_bet = base_bet 
+            tier = TierConfig(level=tier.level, min_ga=0, max_ga=9999999, base_unit=flat_bet, press_unit=flat_bet, stop_loss=tier.stop_loss, profit_lock=tier.profit_lock, catastrophic_cap=tier.catastrophic_cap)
+            session_overrides = overrides  # Copy over all overrides including spice config
+        else:
+            session_overrides = overrides
+
+        if use_ratchet and not is_active_penalty:
+            # Copy-on-write: overrides may be a shared compiled strategy
+            if not session_overrides.ratchet_enabled or session_overrides.profit_lock_units <= 0:
+                session_overrides = replace(
+                    session_overrides, ratchet_enabled=True,
+                    profit_lock_units=1000 if session_overrides.profit_lock_units <= 0 else session_overrides.profit_lock_units
+                )
+
+        # === SPICE ENGINE v5.0 INITIALIZATION ===
+        spice_engine = create_spice_engine_from_overrides(session_overrides, base_bet)
+        spice_engine.reset_session()
+        
+        state = RouletteSessionState(tier=tier, overrides=session_overrides)
+        state.spice_engine = spice_engine
+        state.session_start_bankroll = current_ga
+        state.current_spin = 1
+        spins_limit = overrides.shoes_per_session * 60 
+        volume = 0
+        
+        # Smart Trailing Stop tracking
+        session_peak_profit = 0.0
+        max_press_streak = 0
+        
+        # Initialize dynamic TP (can be boosted by spice wins during session)
+        original_tp_units = session_overrides.profit_lock_units
+        state.dynamic_tp_eur = original_tp_units * base_bet if original_tp_units > 0 else 0
+        
+        # Spin-by-spin tracking for detailed session analysis
+        spin_log = [] if track_spins else None
+        
+        active_main_bets = []
+        b1 = BET_MAP.get(overrides.bet_strategy, RouletteBet.RED)
+        active_main_bets.append(b1)
+        if overrides.bet_strategy_2 and overrides.bet_strategy_2 in BET_MAP:
+            b2 = BET_MAP.get(overrides.bet_strategy_2)
+            active_main_bets.append(b2)
+        
+        # For Negatif Snap-Back and The Gentle Surgeon: track individual bet results
+        use_snapback_halt = (session_overrides.press_trigger_wins in [7, 8] and len(active_main_bets) == 2)
+        
+        while state.current_spin <= spins_limit and state.mode != 'STOPPED':
+            if prof: t = perf_counter_ns()
+            decision = RouletteStrategist.get_next_decision(state)
+            if prof: t = prof.lap('roulette.decision', t)
+            if decision['mode'] == 'STOPPED':
+                break
+
+            unit_amt = decision['bet']
+            current_bets = active_main_bets.copy()
+
+            # === NEGATIF SNAP-BACK: HALT SECOND BET WHEN FIRST IS IN PROGRESSION ===
+            if use_snapback_halt:
+                if state.bet_in_progression >= 0:
+                    current_bets = [active_main_bets[state.bet_in_progression]]
+
+            # === SPICE SYSTEM v5.0: EVALUATE AND FIRE ===
+            if prof: t = perf_counter_ns()
+            spice_engine.reset_spin()
+
+            session_pl_units = state.session_pnl / base_bet
+            caroline_at_step4 = (state.caroline_level >= 4)
+            stop_loss_eur = session_overrides.stop_loss_units * base_bet if session_overrides.stop_loss_units > 0 else 999999
+
+            fired_spice_type = spice_engine.evaluate_and_fire_spice(
+                session_pl_units=session_pl_units,
+                spin_index=state.current_spin,
+                caroline_at_step4=caroline_at_step4,
+                session_start_bankroll=state.session_start_bankroll,
+                current_bankroll=state.session_start_bankroll + state.session_pnl,
+                stop_loss=stop_loss_eur
+            )
+            if prof: t = prof.lap('spice.evaluate', t)
+
+            if fired_spice_type:
+                pattern = SPICE_PATTERNS[spice_engine.spice_config[fired_spice_type].pattern_id]
+                spice_cost = pattern.unit_cost * base_bet * spice_engine.unit_ratio
+                volume += spice_cost
+
+            total_main_units = 0
+            for b in active_main_bets:
+                if b == RouletteBet.STRAT_SALON_LITE:
+                    total_main_units += 5
+                elif b == RouletteBet.STRAT_FRENCH_LITE:
+                    total_main_units += 7
+                else:
+                    total_main_units += 1
+
+            volume += (unit_amt * total_main_units)
+
+            if use_snapback_halt:
+                number, won_main, pnl_main, individual_results = RouletteStrategist.resolve_spin_with_individual_tracking(state, current_bets, unit_amt)
+                prog_type = session_overrides.press_trigger_wins
+                if prog_type == 7:
+                    max_level = 3
+                    level_attr = 'neg_snapback_level'
+                elif prog_type == 8:
+                    max_level = 2
+                    level_attr = 'gentle_surgeon_level'
+                if state.bet_in_progression == -1:
+                    for idx, (bet_type, pnl, won) in enumerate(individual_results):
+                        if not won:
+                            for j, active_bet in enumerate(active_main_bets):
+                                if active_bet == bet_type:
+                                    state.bet_in_progression = j
+                                    setattr(state, level_attr, 1)
+                                    break
+                            break
+                else:
+                    if individual_results:
+                        bet_result = individual_results[0]
+                        if bet_result[2]:
+                            setattr(state, level_attr, 0)
+                            state.bet_in_progression = -1
+                        else:
+                            current_level = getattr(state, level_attr)
+                            current_level += 1
+                            if current_level > max_level:
+                                setattr(state, level_attr, 0)
+                                state.bet_in_progression = -1
+                            else:
+                                setattr(state, level_attr, current_level)
+            else:
+                number, won_main, pnl_main = RouletteStrategist.resolve_spin(state, current_bets, unit_amt)
+            if state.current_press_streak > max_press_streak:
+                max_press_streak = state.current_press_streak
+            if prof: t = prof.lap('roulette.resolve', t)
+
+            spice_pnl = 0
+            spice_won = False
+            if fired_spice_type:
+                spice_pnl, spice_won = spice_engine.resolve_spice(fired_spice_type, number, base_bet)
+                state.session_pnl += spice_pnl
+                if spice_won and state.dynamic_tp_eur > 0:
+                    state.dynamic_tp_eur = spice_engine.apply_momentum_tp_boost(fired_spice_type, state.dynamic_tp_eur, base_bet)
+                if prof: t = prof.lap('spice.resolve', t)
+
+            if track_spins:
+                spin_log.append({
+                    'spin': state.current_spin,
+                    'bankroll': current_ga + state.session_pnl,
+                    'session_pl': state.session_pnl,
+                    'bet_size': unit_amt,
+                    'spice_fired': fired_spice_type.value if fired_spice_type else None,
+                    'spice_won': spice_won,
+                    'caroline_level': state.caroline_level,
+                    'dalembert_level': state.dalembert_level
+                })
+                if prof: t = prof.lap('roulette.log', t)
+
+            # === ENFORCE STOP LOSS IMMEDIATELY AFTER SPIN ===
+            if state.session_pnl <= -(session_overrides.stop_loss_units * base_bet):
+                state.mode = 'STOPPED'
+                exit_reason = 'STOP_LOSS'
+                break
+
+            # === SMART TRAILING STOP LOGIC ===
+            current_profit = state.session_pnl
+            if current_profit > session_peak_profit:
+                session_peak_profit = current_profit
+            if (session_overrides.smart_exit_enabled and state.current_spin >= session_overrides.smart_window_start):
+                min_lock_threshold = session_overrides.min_profit_to_lock * base_bet
+                if current_profit >= min_lock_threshold:
+                    dynamic_floor = session_peak_profit * (1.0 - session_overrides.trailing_drop_pct)
+                    if current_profit <= dynamic_floor:
+                        state.mode = 'STOPPED'
+                        exit_reason = 'SMART_TRAILING'
+                        break
+
+            state.current_spin += 1
+
+        # Get comprehensive spice statistics
+        spice_stats = spice_engine.get_statistics()
+        
+        # Determine exit reason (check if already set by Smart Trailing)
+        if 'exit_reason' not in locals():
+            exit_reason = 'TIME_LIMIT'
+            if state.mode == 'STOPPED':
+                if state.session_pnl <= -(session_overrides.stop_loss_units * base_bet):
+                    exit_reason = 'STOP_LOSS'
+                elif state.session_pnl >= (session_overrides.profit_lock_units * base_bet):
+                    exit_reason = 'TARGET'
+                elif state.session_pnl <= state.locked_profit:
+                    exit_reason = 'RATCHET'
+        
+        if hist is not None:
+            hist.add(tier.level, exit_reason, state.current_spin, session_peak_profit / base_bet, max_press_streak)
+
+        # Calculate peak progression levels
+        max_caroline = state.caroline_level
+        max_dalembert = state.dalembert_level
+        
+        # Return session results + spice stats + detailed tracking + peak profit + spin log
+        result = (
+            state.session_pnl, 
+            volume, 
+            tier.level, 
+            state.current_spin, 
+            spice_stats,
+            exit_reason,
+            max_caroline,
+            max_dalembert,
+            state.current_press_streak,
+            session_peak_profit
+        )
+        
+        # If tracking spins, return as dict with spin_log
+        if track_spins:
+            return {
+                'pnl': result[0],
+                'volume': result[1],
+                'tier': result[2],
+                'spins': result[3],
+                'spice_stats': result[4],
+                'exit_reason': result[5],
+                'max_caroline': result[6],
+                'max_dalembert': result[7],
+                'press_streak': result[8],
+                'peak_profit': result[9],
+                'spin_log': spin_log
+            }
+        else:
+            return result
+
+    @staticmethod
+    def run_full_career(start_ga, total_months, sessions_per_year, 
+                        contrib_win, contrib_loss, overrides, use_ratchet,
+                        use_tax, use_holiday, safety_factor, target_points, earn_rate,
+                        holiday_ceiling, insolvency_floor, strategy_mode,
+                        base_bet_val,
+                        track_y1_details=False, tier_map=None, detail_months=12, trace_session=0,
+                        session_seed=None):
+        """
+        One universe. track_y1_details logs every session (recovery sessions
+        included) of the first detail_months months under 'y1_log';
+        trace_session=n (1-based, counting every session played) also returns
+        session #n spin by spin under 'session_trace'. Neither draws from the
+        RNG, so a universe replayed from its seed with tracing plays exactly
+        the same spins. With session_seed (a universe seed) every session is
+        dealt from its own stream (engine/seeding.seed_session), recovery
+        sessions from a stream of their own, for strategy comparisons.
+        """
+        if tier_map is None:
+            tier_map = generate_tier_map(safety_factor, mode=strategy_mode, game_type='Roulette', base_bet=base_bet_val)
+        trajectory = []
+        current_ga = start_ga
+        running_play_pnl = 0  
+        
+        initial_tier = get_tier_for_ga(current_ga, tier_map, 1, strategy_mode, game_type='Roulette')
+        active_level = initial_tier.level
+
+        m_insolvent_months = 0; failed_year_one = False
+        m_tax = 0 
+        m_contrib = 0
+        gold_hit_year = -1
+        current_year_points = 0
+        
+        y1_log = []
+        last_session_won = False
+        
+        # Tracking Spice v5.0 - Comprehensive Statistics
+        all_spice_stats = {
+            'total_spices_used': 0,
+            'spice_wins': 0,
+            'spice_losses': 0,
+            'total_cost': 0.0,
+            'total_payout': 0.0,
+            'momentum_tp_gains': 0.0,
+            'distribution': {st.value: 0 for st in SpiceType},
+            'sessions_with_spices': 0
+        }
+        
+        # Enhanced Y1 tracking
+        session_no = 0
+        session_trace = None
+        hist = SessionHistograms()
+
+        for m in range(total_months):
+            if m > 0 and m % 12 == 0:
+                current_year_points = 0
+
+            if use_tax and current_ga > overrides.tax_threshold:
+                surplus = current_ga - overrides.tax_threshold
+                tax_amt = surplus * (overrides.tax_rate / 100.0)
+                current_ga -= tax_amt
+                m_tax += tax_amt
+
+            should_contribute = True
+            if use_holiday and current_ga >= holiday_ceiling: should_contribute = False
+            
+            if should_contribute:
+                amount = contrib_win if last_session_won else contrib_loss
+                current_ga += amount
+                m_contrib += amount
+            
+            can_play = (current_ga >= insolvency_floor)
+            if not can_play:
+                m_insolvent_months += 1
+                if m < 12: failed_year_one = True
+            
+            if can_play:
+                sessions_this_month = sessions_per_year // 12
+                if m % 12 < (sessions_per_year % 12): sessions_this_month += 1
+
+                for sess_idx in range(sessions_this_month):
+                    check_cancelled()
+                    session_no += 1
+                    if session_seed is not None: seed_session(session_seed, m, 2 * sess_idx)
+                    traced = (session_no == trace_session)
+                    res = RouletteWorker.run_session(
+                        current_ga, overrides, tier_map, use_ratchet, 
+                        False, active_level, strategy_mode, base_bet_val, traced, hist=hist
+                    )
+                    if traced:
+                        session_trace, res = _traced_session(res, session_no, m + 1, current_ga)
+                    pnl, vol, used_level, spins, spice_stats, exit_reason, max_caroline, max_dalembert, final_streak, peak_profit = res
+                    active_level = used_level 
+                    current_ga += pnl
+                    running_play_pnl += pnl 
+                    current_year_points += vol * (earn_rate / 100)
+                    last_session_won = (pnl > 0)
+                    
+                    # Aggregate spice statistics
+                    all_spice_stats['total_spices_used'] += spice_stats['total_spices_used']
+                    all_spice_stats['spice_wins'] += spice_stats['spice_wins']
+                    all_spice_stats['spice_losses'] += spice_stats['spice_losses']
+                    all_spice_stats['total_cost'] += spice_stats['total_cost']
+                    all_spice_stats['total_payout'] += spice_stats['total_payout']
+                    all_spice_stats['momentum_tp_gains'] += spice_stats['momentum_tp_gains']
+                    
+                    # Aggregate distribution
+                    for spice_name, count in spice_stats['distribution'].items():
+                        all_spice_stats['distribution'][spice_name] += count
+                    
+                    if spice_stats['total_spices_used'] > 0:
+                        all_spice_stats['sessions_with_spices'] += 1
+                    
+                    # Enhanced Year 1 tracking with comprehensive data
+                    if track_y1_details and m < detail_months:
+                        spice_net = spice_stats['total_payout'] - spice_stats['total_cost']
+                        tp_boosts = int(spice_stats['momentum_tp_gains'] / (20 * base_bet_val)) if spice_stats['momentum_tp_gains'] > 0 else 0
+                        
+                        y1_log.append({
+                            'month': m + 1,
+                            'session': session_no,
+                            'result': pnl,
+                            'balance': current_ga,
+                            'game_bal': start_ga + running_play_pnl,
+                            'spins': spins,
+                            'volume': vol,
+                            'tier': used_level,
+                            'exit': exit_reason,
+                            'spice_cnt': spice_stats['total_spices_used'],
+                            'spice_pl': spice_net,
+                            'tp_boosts': tp_boosts,
+                            'caroline_max': max_caroline,
+                            'dalembert_max': max_dalembert,
+                            'streak_max': final_streak,
+                            'peak_profit': peak_profit,
+                            'is_recovery': False
+                        })
+                    
+                    # === RECOVERY SESSION SYSTEM ===
+                    # If session was negative and recovery is enabled, play a recovery "bis" session
+                    if overrides.recovery_enabled and pnl < 0 and current_ga >= insolvency_floor:
+                        # Create modified overrides with recovery stop loss
+                        recovery_overrides = StrategyOverrides(
+                            iron_gate_limit=overrides.iron_gate_limit,
+                            stop_loss_units=overrides.recovery_stop_loss,  # Use recovery stop loss
+                            profit_lock_units=overrides.profit_lock_units,
+                            press_trigger_wins=overrides.press_trigger_wins,
+                            press_depth=overrides.press_depth,
+                            ratchet_lock_pct=overrides.ratchet_lock_pct,
+                            tax_threshold=overrides.tax_threshold,
+                            tax_rate=overrides.tax_rate,
+                            bet_strategy=overrides.bet_strategy,
+                            bet_strategy_2=overrides.bet_strategy_2,
+                            shoes_per_session=overrides.shoes_per_session,
+                            penalty_box_enabled=overrides.penalty_box_enabled,
+                            ratchet_enabled=overrides.ratchet_enabled,
+                            ratchet_mode=overrides.ratchet_mode,
+                            smart_exit_enabled=overrides.smart_exit_enabled,
+                            smart_window_start=overrides.smart_window_start,
+                            min_profit_to_lock=overrides.min_profit_to_lock,
+                            trailing_drop_pct=overrides.trailing_drop_pct,
+                            # Copy all spice settings
+                            spice_global_max_per_session=overrides.spice_global_max_per_session,
+                            spice_global_max_per_spin=overrides.spice_global_max_per_spin,
+                            spice_disable_if_caroline_step4=overrides.spice_disable_if_caroline_step4,
+                            spice_disable_if_pl_below_zero=overrides.spice_disable_if_pl_below_zero,
+                            spice_unit_ratio=overrides.spice_unit_ratio,
+                            spice_zero_leger_enabled=overrides.spice_zero_leger_enabled,
+                            spice_zero_leger_trigger=overrides.spice_zero_leger_trigger,
+                            spice_zero_leger_max=overrides.spice_zero_leger_max,
+                            spice_zero_leger_cooldown=overrides.spice_zero_leger_cooldown,
+                            spice_zero_leger_min_pl=overrides.spice_zero_leger_min_pl,
+                            spice_zero_leger_max_pl=overrides.spice_zero_leger_max_pl,
+                            spice_jeu_zero_enabled=overrides.spice_jeu_zero_enabled,
+                            spice_jeu_zero_trigger=overrides.spice_jeu_zero_trigger,
+                            spice_jeu_zero_max=overrides.spice_jeu_zero_max,
+                            spice_jeu_zero_cooldown=overrides.spice_jeu_zero_cooldown,
+                            spice_jeu_zero_min_pl=overrides.spice_jeu_zero_min_pl,
+                            spice_jeu_zero_max_pl=overrides.spice_jeu_zero_max_pl,
+                            spice_zero_crown_enabled=overrides.spice_zero_crown_enabled,
+                            spice_zero_crown_trigger=overrides.spice_zero_crown_trigger,
+                            spice_zero_crown_max=overrides.spice_zero_crown_max,
+                            spice_zero_crown_cooldown=overrides.spice_zero_crown_cooldown,
+                            spice_zero_crown_min_pl=overrides.spice_zero_crown_min_pl,
+                            spice_zero_crown_max_pl=overrides.spice_zero_crown_max_pl,
+                            spice_tiers_enabled=overrides.spice_tiers_enabled,
+                            spice_tiers_trigger=overrides.spice_tiers_trigger,
+                            spice_tiers_max=overrides.spice_tiers_max,
+                            spice_tiers_cooldown=overrides.spice_tiers_cooldown,
+                            spice_tiers_min_pl=overrides.spice_tiers_min_pl,
+                            spice_tiers_max_pl=overrides.spice_tiers_max_pl,
+                            spice_orphelins_enabled=overrides.spice_orphelins_enabled,
+                            spice_orphelins_trigger=overrides.spice_orphelins_trigger,
+                            spice_orphelins_max=overrides.spice_orphelins_max,
+                            spice_orphelins_cooldown=overrides.spice_orphelins_cooldown,
+                            spice_orphelins_min_pl=overrides.spice_orphelins_min_pl,
+                            spice_orphelins_max_pl=overrides.spice_orphelins_max_pl,
+                            spice_orphelins_plein_enabled=overrides.spice_orphelins_plein_enabled,
+                            spice_orphelins_plein_trigger=overrides.spice_orphelins_plein_trigger,
+                            spice_orphelins_plein_max=overrides.spice_orphelins_plein_max,
+                            spice_orphelins_plein_cooldown=overrides.spice_orphelins_plein_cooldown,
+                            spice_orphelins_plein_min_pl=overrides.spice_orphelins_plein_min_pl,
+                            spice_orphelins_plein_max_pl=overrides.spice_orphelins_plein_max_pl,
+                            spice_voisins_enabled=overrides.spice_voisins_enabled,
+                            spice_voisins_trigger=overrides.spice_voisins_trigger,
+                            spice_voisins_max=overrides.spice_voisins_max,
+                            spice_voisins_cooldown=overrides.spice_voisins_cooldown,
+                            spice_voisins_min_pl=overrides.spice_voisins_min_pl,
+                            spice_voisins_max_pl=overrides.spice_voisins_max_pl,
+                            # Copy doctrine settings
+                            doctrine_enabled=overrides.doctrine_enabled,
+                            doctrine_pl_stop=overrides.doctrine_pl_stop,
+                            doctrine_pl_target=overrides.doctrine_pl_target,
+                            doctrine_pl_press_wins=overrides.doctrine_pl_press_wins,
+                            doctrine_pl_press_depth=overrides.doctrine_pl_press_depth,
+                            doctrine_pl_iron=overrides.doctrine_pl_iron,
+                            doctrine_ti_stop=overrides.doctrine_ti_stop,
+                            doctrine_ti_target=overrides.doctrine_ti_target,
+                            doctrine_ti_press_wins=overrides.doctrine_ti_press_wins,
+                            doctrine_ti_press_depth=overrides.doctrine_ti_press_depth,
+                            doctrine_ti_iron=overrides.doctrine_ti_iron,
+                            doctrine_loss_trigger=overrides.doctrine_loss_trigger,
+                            doctrine_dd_pct_trigger=overrides.doctrine_dd_pct_trigger,
+                            doctrine_dd_eur_trigger=overrides.doctrine_dd_eur_trigger,
+                            doctrine_tight_min=overrides.doctrine_tight_min,
+                            doctrine_tight_max=overrides.doctrine_tight_max,
+                            doctrine_cooloff_enabled=overrides.doctrine_cooloff_enabled,
+                            doctrine_cooloff_floor=overrides.doctrine_cooloff_floor,
+                            doctrine_cooloff_min_months=overrides.doctrine_cooloff_min_months,
+                            doctrine_cooloff_recovery_pct=overrides.doctrine_cooloff_recovery_pct,
+                            doctrine_link_roulette=overrides.doctrine_link_roulette,
+                            doctrine_roulette_pl=overrides.doctrine_roulette_pl,
+                            doctrine_roulette_ti=overrides.doctrine_roulette_ti,
+                            doctrine_roulette_co=overrides.doctrine_roulette_co,
+                            recovery_enabled=False,  # Prevent recursive recovery sessions
+                            recovery_stop_loss=overrides.recovery_stop_loss
+                        )
+                        
+                        # Play recovery session
+                        session_no += 1
+                        if session_seed is not None: seed_session(session_seed, m, 2 * sess_idx + 1)
+                        traced = (session_no == trace_session)
+                        res = RouletteWorker.run_session(
+                            current_ga, recovery_overrides, tier_map, use_ratchet,
+                            False, active_level, strategy_mode, base_bet_val, traced, hist=hist
+                        )
+                        if traced:
+                            session_trace, res = _traced_session(res, session_no, m + 1, current_ga)
+                            session_trace['is_recovery'] = True
+                        rec_pnl, rec_vol, rec_level, rec_spins, rec_spice_stats, rec_exit, rec_caroline, rec_dalembert, rec_streak, rec_peak = res
+                        active_level = rec_level
+                        current_ga += rec_pnl
+                        running_play_pnl += rec_pnl
+                        current_year_points += rec_vol * (earn_rate / 100)
+                        last_session_won = (rec_pnl > 0)
+                        
+                        # Aggregate recovery session spice statistics
+                        all_spice_stats['total_spices_used'] += rec_spice_stats['total_spices_used']
+                        all_spice_stats['spice_wins'] += rec_spice_stats['spice_wins']
+                        all_spice_stats['spice_losses'] += rec_spice_stats['spice_losses']
+                        all_spice_stats['total_cost'] += rec_spice_stats['total_cost']
+                        all_spice_stats['total_payout'] += rec_spice_stats['total_payout']
+                        all_spice_stats['momentum_tp_gains'] += rec_spice_stats['momentum_tp_gains']
+                        
+                        for spice_name, count in rec_spice_stats['distribution'].items():
+                            all_spice_stats['distribution'][spice_name] += count
+                        
+                        if rec_spice_stats['total_spices_used'] > 0:
+                            all_spice_stats['sessions_with_spices'] += 1
+                        
+                        # Track recovery session in Y1 log with "bis" marker
+                        if track_y1_details and m < detail_months:
+                            rec_spice_net = rec_spice_stats['total_payout'] - rec_spice_stats['total_cost']
+                            rec_tp_boosts = int(rec_spice_stats['momentum_tp_gains'] / (20 * base_bet_val)) if rec_spice_stats['momentum_tp_gains'] > 0 else 0
+                            
+                            y1_log.append({
+                                'month': m + 1,
+                                'session': session_no,
+                                'result': rec_pnl,
+                                'balance': current_ga,
+                                'game_bal': start_ga + running_play_pnl,
+                                'spins': rec_spins,
+                                'volume': rec_vol,
+                                'tier': rec_level,
+                                'exit': rec_exit,
+                                'spice_cnt': rec_spice_stats['total_spices_used'],
+                                'spice_pl': rec_spice_net,
+                                'tp_boosts': rec_tp_boosts,
+                                'caroline_max': rec_caroline,
+                                'dalembert_max': rec_dalembert,
+                                'streak_max': rec_streak,
+                                'peak_profit': rec_peak,
+                                'is_recovery': True  # Mark as recovery session
+                            })
+            else:
+                 if track_y1_details and m < detail_months:
+                        y1_log.append({
+                            'month': m + 1, 
+                            'session': 0,
+                            'result': 0, 
+                            'balance': current_ga, 
+                            'game_bal': start_ga + running_play_pnl, 
+                            'spins': 0,
+                            'volume': 0,
+                            'tier': 0,
+                            'exit': 'INSOLVENT',
+                            'spice_cnt': 0,
+                            'spice_pl': 0,
+                            'tp_boosts': 0,
+                            'caroline_max': 0,
+                            'dalembert_max': 0,
+                            'streak_max': 0,
+                            'peak_profit': 0
+                        })
+
+            if gold_hit_year == -1 and current_year_points >= target_points:
+                gold_hit_year = (m // 12) + 1
+
+            trajectory.append(current_ga)
+            
+        result = {
+            'trajectory': trajectory, 'final_ga': current_ga, 'insolvent_months': m_insolvent_months, 
+            'failed_y1': failed_year_one, 'y1_log': y1_log, 'tax': m_tax, 'contrib': m_contrib, 
+            'gold_year': gold_hit_year, 
+            # Spice v5.0 comprehensive stats
+            'spice_stats': all_spice_stats, 'session_hist': hist.to_array()
+        }
+        if trace_session:
+            result['session_trace'] = session_trace
+        return result
+
+# --- STATS CALCULATOR ---
+def calculate_stats(results, config, start_ga, total_months):
+    if not results: return None
+    trajectories = np.array([r['trajectory'] for r in results])
+    months = list(range(trajectories.shape[1]))
+    
+    total_sims = len(results)
+    total_sessions_per_career = config['years'] * config['freq']
+    
+    # Aggregate spice stats across all runs
+    avg_spice_stats = {
+        'total_spices_used': np.mean([r['spice_stats']['total_spices_used'] for r in results]),
+        'sessions_with_spices': np.mean([r['spice_stats']['sessions_with_spices'] for r in results]),
+        'spice_wins': np.mean([r['spice_stats']['spice_wins'] for r in results]),
+        'spice_losses': np.mean([r['spice_stats']['spice_losses'] for r in results]),
+        'hit_rate': 0.0,
+        'total_cost': np.mean([r['spice_stats']['total_cost'] for r in results]),
+        'total_payout': np.mean([r['spice_stats']['total_payout'] for r in results]),
+        'net_pl': 0.0,
+        'momentum_tp_gains': np.mean([r['spice_stats']['momentum_tp_gains'] for r in results]),
+        'distribution': {}
+    }
+    
+    # Calculate hit rate
+    total_wins = sum([r['spice_stats']['spice_wins'] for r in results])
+    total_losses = sum([r['spice_stats']['spice_losses'] for r in results])
+    if (total_wins + total_losses) > 0:
+        avg_spice_stats['hit_rate'] = total_wins / (total_wins + total_losses)
+    
+    avg_spice_stats['net_pl'] = avg_spice_stats['total_payout'] - avg_spice_stats['total_cost']
+    
+    # Aggregate distribution
+    for spice_type in SpiceType:
+        spice_name = spice_type.value
+        avg_spice_stats['distribution'][spice_name] = np.mean([
+            r['spice_stats']['distribution'].get(spice_name, 0) for r in results
+        ])
+    
+    stats = {
+        'months': months,
+        'min_band': np.min(trajectories, axis=0),
+        'max_band': np.max(trajectories, axis=0),
+        'p25_band': np.percentile(trajectories, 25, axis=0),
+        'p75_band': np.percentile(trajectories, 75, axis=0),
+        'mean_line': np.mean(trajectories, axis=0),
+        'median_line': np.median(trajectories, axis=0),
+        'avg_final_ga': np.mean([r['final_ga'] for r in results]),
+        'avg_tax': np.mean([r['tax'] for r in results]),
+        'avg_insolvent': np.mean([r['insolvent_months'] for r in results]),
+        'gold_hits': [r['gold_year'] for r in results if r['gold_year'] != -1],
+        'y1_failures': len([r for r in results if r['failed_y1']]),
+        'total_input': start_ga + np.mean([r['contrib'] for r in results]),
+        'survivor_count': len([r for r in results if r['final_ga'] >= 100]),
+        
+        # Spice v5.0 comprehensive statistics
+        'spice_stats': avg_spice_stats,
+        'session_hist': results_hist(results)
+    }
+    return stats
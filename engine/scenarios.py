@@ -0,0 +1,223 @@
+"""
+Monaco Salle Blanche Lab - Scenario Manifests
+=============================================
+Runs a list of scenarios (saved strategies under several ecosystems, plus
+career ladders built from them) as one batch and returns a comparison table.
+
+Manifest (JSON):
+    {
+      "seed": 42, "universes": 200,
+      "ecosystems": {"base": {}, "rich": {"eco_win": 600, "eco_loss": 600},
+                     "taxed": {"eco_tax": true, "eco_tax_thresh": 20000}},
+      "career_settings": {"years": 5, "sessions": 20},
+      "scenarios": [
+        {"game": "Roulette", "strategies": ["Strat A", "Strat B"], "ecosystems": ["base", "rich"]},
+        {"name": "Ladder", "career": [["Strat A", 5000], ["Strat B", 20000]], "ecosystem": "taxed"}
+      ]
+    }
+
+Each entry expands to one scenario per (strategy, ecosystem). Shared work is
+done once:
+- identical scenarios (same configs, settings, seed, universes) run once;
+- strategies are compiled once per process, before any universe is played
+  (ecosystem fields do not affect the compile key, so every ecosystem of a
+  strategy shares one compiled strategy and tier map; career legs compile
+  under the 'career' profile, so every ladder using a strategy shares its
+  career compile);
+- the universe chunks of all scenarios go through one process pool, so the
+  cores stay busy until the last chunk instead of idling between scenarios.
+"""
+
+import hashlib
+import json
+
+import numpy as np
+
+from engine import batch
+from engine.seeding import DEFAULT_SEED
+from engine.strategy_compiler import compile_strategy
+
+GAMES = ('Baccarat', 'Roulette')
+
+COMPARISON_COLUMNS = [
+    'scenario', 'kind', 'ecosystem', 'universes', 'final_ga_mean', 'final_ga_p10',
+    'final_ga_median', 'final_ga_p90', 'survival_pct', 'total_input', 'net_result', 'monthly_cost'
+]
+
+
+def _spec_key(spec) -> str:
+    return hashlib.sha1(json.dumps(spec, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+
+def _as_list(entry, single, plural):
+    if plural in entry:
+        return list(entry[plural])
+    if single in entry:
+        return [entry[single]]
+    return None
+
+
+def expand_manifest(manifest: dict, saved_strats: dict) -> list:
+    """One scenario dict per (strategy or ladder, ecosystem). Raises ValueError on bad entries."""
+    ecosystems = manifest.get('ecosystems') or {'base': {}}
+    seed = int(manifest.get('seed', DEFAULT_SEED))
+    universes = int(manifest.get('universes', 100))
+    career_defaults = manifest.get('career_settings') or {}
+
+    def strategy(name, eco_name):
+        if name not in saved_strats:
+            raise ValueError(f"Unknown strategy '{name}'")
+        return dict(saved_strats[name], **ecosystems[eco_name])
+
+    scenarios = []
+    for n, entry in enumerate(manifest.get('scenarios') or []):
+        eco_names = _as_list(entry, 'ecosystem', 'ecosystems') or list(ecosystems)[:1]
+        for eco in eco_names:
+            if eco not in ecosystems:
+                raise ValueError(f"Scenario #{n+1}: unknown ecosystem '{eco}'")
+        sc_seed = int(entry.get('seed', seed))
+        sc_universes = int(entry.get('universes', universes))
+
+        if 'career' in entry:
+            legs = [(leg[0], float(leg[1])) for leg in entry['career']]
+            if not legs:
+                raise ValueError(f"Scenario #{n+1}: career needs at least one leg")
+            settings = dict(batch.CAREER_DEFAULTS, **career_defaults, **(entry.get('settings') or {}))
+            for eco in eco_names:
+                sequence = [{'strategy_name': name, 'target_ga': target, 'config': strategy(name, eco)} for name, target in legs]
+                base_name = entry.get('name') or ' -> '.join(name for name, _ in legs)
+                scenarios.append({
+                    'name': f"{base_name} @ {eco}",
+                    'kind': 'Career', 'ecosystem': eco, 'strategies': [name for name, _ in legs],
+                    'spec': {'kind': 'career', 'sequence': sequence, 'settings': settings,
+                             'seed': sc_seed, 'universes': sc_universes}
+                })
+            continue
+
+        game = entry.get('game')
+        if game not in GAMES:
+            raise ValueError(f"Scenario #{n+1}: 'game' must be one of {', '.join(GAMES)} (or use 'career')")
+        names = _as_list(entry, 'strategy', 'strategies')
+        if not names:
+            raise ValueError(f"Scenario #{n+1}: no strategy given")
+        for name in names:
+            for eco in eco_names:
+                config = strategy(name, eco)
+                base_name = entry.get('name') if len(names) == 1 and 'name' in entry else name
+                scenarios.append({
+                    'name': f"{base_name} @ {eco}",
+                    'kind': game, 'ecosystem': eco, 'strategies': [name],
+                    'spec': {'kind': 'lab', 'game': game, 'strategy': config,
+                             'settings': batch.lab_settings(config, game), 'seed': sc_seed, 'universes': sc_universes}
+                })
+    return scenarios
+
+
+def plan_manifest(scenarios: list) -> dict:
+    """Unique runs, the strategies to compile up front, and the chunk tasks of every run."""
+    runs = {}
+    for sc in scenarios:
+        sc['run_key'] = _spec_key(sc['spec'])
+        runs.setdefault(sc['run_key'], sc['spec'])
+
+    compiles = {}
+    for spec in runs.values():
+        if spec['kind'] == 'lab':
+            entries = [(spec['strategy'], spec['game'], 'lab')]
+        else:  # As CareerManager compiles its legs
+            entries = [(leg['config'], None, 'career') for leg in spec['sequence']]
+        for config, game, profile in entries:
+            compiled = compile_strategy(config, game_type=game, profile=profile)
+            compiles.setdefault(compiled.key, (config, game, profile))
+
+    tasks = []  # (run key, start, count); careers first, they are the longest chunks
+    for key, spec in sorted(runs.items(), key=lambda kv: kv[1]['kind'] != 'career'):
+        for start, count in batch.plan_universes(spec['universes']):
+            tasks.append((key, start, count))
+
+    return {
+        'runs': runs, 'compiles': list(compiles.values()), 'tasks': tasks,
+        'stats': {'scenarios': len(scenarios), 'unique_runs': len(runs),
+                  'unique_compiles': len(compiles), 'chunks': len(tasks)}
+    }
+
+
+def warm_caches(compiles):
+    """Pool initializer: compile every strategy of the manifest once in this process."""
+    for config, game, profile in compiles:
+        compile_strategy(config, game_type=game, profile=profile)
+
+
+def _task(spec, start, count):
+    if spec['kind'] == 'lab':
+        return (batch.run_lab_chunk, (spec['game'], spec['strategy'], spec['settings'], spec['seed'], start, count))
+    return (batch.run_career_chunk, (spec['sequence'], spec['settings'], spec['seed'], start, count))
+
+
+def comparison_row(scenario: dict, results: list) -> dict:
+    """One line of the comparison table."""
+    spec = scenario['spec']
+    row = {'scenario': scenario['name'], 'kind': scenario['kind'], 'ecosystem': scenario['ecosystem'],
+           'universes': len(results)}
+    if spec['kind'] == 'lab':
+        settings = spec['settings']
+        finals = np.array([r['final_ga'] for r in results], dtype=np.float64)
+        total_input = settings['start_ga'] + float(np.mean([r['contrib'] for r in results]))
+        months = settings['years'] * 12
+        row.update(survival_pct=float(np.mean(finals >= 100) * 100), total_input=total_input,
+                   monthly_cost=(total_input - float(np.mean(finals))) / months)
+    else:
+        valid = [r for r in results if 'error' not in r]
+        finals = np.array([r['final'] for r in valid], dtype=np.float64)
+        row['errors'] = len(results) - len(valid)
+        if not valid:
+            return row
+        stats = batch.career_stats(results, spec['settings'])
+        row.update(survival_pct=float(np.mean(finals >= 100) * 100), monthly_cost=stats['avg_monthly_cost'],
+                   total_input=float(np.mean(finals)) + stats['avg_monthly_cost'] * spec['settings']['years'] * 12)
+    row.update(final_ga_mean=float(np.mean(finals)), final_ga_p10=float(np.percentile(finals, 10)),
+               final_ga_median=float(np.median(finals)), final_ga_p90=float(np.percentile(finals, 90)))
+    row['net_result'] = row['final_ga_mean'] - row['total_input']
+    return row
+
+
+def run_manifest(manifest: dict, saved_strats: dict, max_workers=None, on_progress=None):
+    """
+    Runs every scenario of a manifest. Returns (rows, run_results, plan):
+    comparison rows in manifest order, {run key: per-universe results} and the
+    plan (with its dedup counters). on_progress(done_chunks, total_chunks).
+    """
+    scenarios = expand_manifest(manifest, saved_strats)
+    plan = plan_manifest(scenarios)
+    tasks = [_task(plan['runs'][key], start, count) for key, start, count in plan['tasks']]
+
+    done = [0]
+    def task_done(j, result):
+        done[0] += 1
+        if on_progress: on_progress(done[0], len(tasks))
+
+    chunk_results = batch.run_tasks(tasks, max_workers, task_done, initializer=warm_caches, initargs=(plan['compiles'],))
+
+    run_results = {key: [] for key in plan['runs']}
+    for (key, start, count), chunk in sorted(zip(plan['tasks'], chunk_results), key=lambda t: (t[0][0], t[0][1])):
+        run_results[key].extend(chunk)
+
+    rows = [dict(comparison_row(sc, run_results[sc['run_key']]), run=sc['run_key']) for sc in scenarios]
+    return rows, run_results, plan
+
+
+def format_table(rows: list) -> str:
+    """Plain-text comparison table (money columns in €)."""
+    header = ['Scenario', 'Kind', 'Univ', 'Mean GA', 'P10', 'Median', 'P90', 'Survive', 'Net', '€/Month']
+    lines = []
+    for r in rows:
+        if 'final_ga_mean' not in r:
+            lines.append([r['scenario'], r['kind'], str(r['universes'])] + ['-'] * 7)
+            continue
+        lines.append([r['scenario'], r['kind'], str(r['universes']),
+                      f"{r['final_ga_mean']:,.0f}", f"{r['final_ga_p10']:,.0f}", f"{r['final_ga_median']:,.0f}",
+                      f"{r['final_ga_p90']:,.0f}", f"{r['survival_pct']:.0f}%", f"{r['net_result']:+,.0f}",
+                      f"{r['monthly_cost']:,.0f}"])
+    widths = [max(len(str(c)) for c in col) for col in zip(header, *lines)]
+    fmt = lambda cells: '  '.join(c.ljust(w) if i < 2 else c.rjust(w) for i, (c, w) in enumerate(zip(cells, widths)))
+    return '\n'.join([fmt(header), fmt(['-' * w for w in widths])] + [fmt(l) for l in lines])
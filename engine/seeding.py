@@ -0,0 +1,57 @@
+"""
+Monaco Salle Blanche Lab - Seeding
+==================================
+Per-universe seeds for the multiverse runs.
+
+Universe i of a run with base seed S is always played from the same seed, no
+matter how many universes the run has or in which batch it is played. That is
+what makes runs cacheable and extendable: the first N universes of a larger
+run are exactly the N universes of the smaller one.
+
+The engines draw from the module-level `random` generator, so seeding is
+global to the process. Code that seeds it on behalf of a caller running in
+the same process (the Sessions Sim ensemble chunks) does so inside
+seeded_scope(), which puts the caller's generator state back afterwards.
+
+Strategy comparisons (engine/comparison.py) go one step further and reseed
+every session from (universe seed, month, slot in the month): a session then
+deals the same hands / spins to every strategy, however the earlier sessions
+went and whatever extra sessions (Roulette recovery "bis" sessions) the other
+strategies played (common random numbers).
+"""
+
+import random
+from contextlib import contextmanager
+
+DEFAULT_SEED = 42
+
+
+def universe_seed(base_seed: int, index: int) -> int:
+    """Unique seed for universe #index of a run (no overlap between base seeds)."""
+    return (int(base_seed) << 32) | int(index)
+
+
+def seed_universe(base_seed: int, index: int):
+    """Seed the engines' RNG for universe #index."""
+    random.seed(universe_seed(base_seed, index))
+
+
+def seed_session(universe_seed_value: int, month: int, slot: int):
+    """Seed the engines' RNG for session slot #slot of month #month of the universe with that seed."""
+    random.seed((int(universe_seed_value) << 32) | (int(month) << 16) | int(slot))
+
+
+def fresh_seed() -> int:
+    """New random base seed (from OS entropy, without touching the engines' RNG)."""
+    return random.Random().randrange(2**31)
+
+
+@contextmanager
+def seeded_scope(seed: int):
+    """Seed the engines' RNG for the block, then restore the state it had before."""
+    state = random.getstate()
+    random.seed(seed)
+    try:
+        yield
+    finally:
+        random.setstate(state)
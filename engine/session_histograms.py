@@ -0,0 +1,107 @@
+"""
+Monaco Salle Blanche Lab - Session Histograms
+=============================================
+Fixed-bin histograms of every session a lab universe plays, per tier:
+exit reason, hands/spins played, session peak profit (in stop-loss units),
+max press streak and, for Baccarat, ties seen and tie bets placed.
+
+Only Year 1 of universe #1 keeps per-session records (track_y1_details);
+these counts cover every session of every universe at the cost of a few
+list increments per session. run_session() adds its session to a
+SessionHistograms when given one, run_full_career() returns the universe's
+counts as an int32 matrix (MAX_TIER x BINS) under 'session_hist', and
+merge() sums universes (so chunked, parallel, cached and extended runs all
+merge the same way). summarize() turns a merged matrix into per-tier
+distributions for the labs.
+"""
+
+from bisect import bisect_right
+
+import numpy as np
+
+EXIT_REASONS = ('TIME_LIMIT', 'STOP_LOSS', 'TARGET', 'RATCHET', 'SMART_TRAILING')
+MAX_TIER = 6  # Tier levels 1..6 (deeper tiers are counted in the last one)
+
+# metric -> lower bin edges (the last bin is open ended)
+BIN_EDGES = {
+    'length': (0, 10, 20, 30, 40, 60, 80, 100, 120, 150, 180, 210, 240),
+    'peak_units': (0, 1, 2, 3, 4, 5, 6, 8, 10, 15, 20, 30),
+    'press_streak': (0, 1, 2, 3, 4, 5, 6, 7, 8, 10),
+    'ties': (0, 1, 2, 3, 4, 5, 6, 8, 10, 15),
+    'tie_bets': (0, 1, 2, 3, 4, 5, 6, 8, 10, 15),
+}
+METRICS = ('exit',) + tuple(BIN_EDGES)
+
+_offsets, _n = {}, 0
+for _metric in METRICS:
+    _offsets[_metric] = _n
+    _n += len(EXIT_REASONS) if _metric == 'exit' else len(BIN_EDGES[_metric])
+BINS = _n
+_EXIT_INDEX = {reason: i for i, reason in enumerate(EXIT_REASONS)}
+_LENGTH, _PEAK, _STREAK, _TIES, _TIE_BETS = (_offsets[m] for m in BIN_EDGES)
+_LENGTH_EDGES, _PEAK_EDGES, _STREAK_EDGES, _TIES_EDGES, _TIE_BETS_EDGES = BIN_EDGES.values()
+
+
+class SessionHistograms:
+    """Counts of one universe's sessions (flat list, MAX_TIER blocks of BINS)."""
+
+    __slots__ = ('counts',)
+
+    def __init__(self):
+        self.counts = [0] * (MAX_TIER * BINS)
+
+    def add(self, tier: int, exit_reason: str, length: int, peak_units: float, press_streak: int,
+            ties: int = 0, tie_bets: int = 0):
+        c = self.counts
+        base = (min(max(tier, 1), MAX_TIER) - 1) * BINS
+        c[base + _EXIT_INDEX.get(exit_reason, 0)] += 1
+        c[base + _LENGTH + bisect_right(_LENGTH_EDGES, length) - 1] += 1
+        c[base + _PEAK + max(bisect_right(_PEAK_EDGES, peak_units) - 1, 0)] += 1
+        c[base + _STREAK + bisect_right(_STREAK_EDGES, press_streak) - 1] += 1
+        c[base + _TIES + bisect_right(_TIES_EDGES, ties) - 1] += 1
+        c[base + _TIE_BETS + bisect_right(_TIE_BETS_EDGES, tie_bets) - 1] += 1
+
+    def to_array(self) -> np.ndarray:
+        return np.array(self.counts, dtype=np.int32).reshape(MAX_TIER, BINS)
+
+
+def merge(hists) -> np.ndarray:
+    """Sum of per-universe matrices (a list, or an already stacked universes x MAX_TIER x BINS array)."""
+    hists = np.asarray(hists, dtype=np.int64)
+    return hists.sum(axis=0) if hists.size else np.zeros((MAX_TIER, BINS), dtype=np.int64)
+
+
+def results_hist(results) -> np.ndarray:
+    """Merged session histograms of lab results."""
+    return merge([r['session_hist'] for r in results])
+
+
+def bin_labels(metric: str) -> list:
+    if metric == 'exit':
+        return list(EXIT_REASONS)
+    edges = BIN_EDGES[metric]
+    labels = []
+    for lo, hi in zip(edges, edges[1:]):
+        labels.append(str(lo) if hi - lo == 1 else f'{lo}-{hi - 1}')
+    labels.append(f'{edges[-1]}+')
+    return labels
+
+
+def metric_counts(merged: np.ndarray, metric: str, tier: int = None) -> np.ndarray:
+    """Counts of one metric for a tier (1..MAX_TIER), or summed over tiers."""
+    start = _offsets[metric]
+    stop = start + (len(EXIT_REASONS) if metric == 'exit' else len(BIN_EDGES[metric]))
+    rows = merged if tier is None else merged[tier - 1:tier]
+    return rows[:, start:stop].sum(axis=0)
+
+
+def summarize(merged: np.ndarray) -> dict:
+    """{'sessions', 'tiers': {level: sessions}, metric: {'labels', 'all', level: counts}} for the tiers that played."""
+    sessions_by_tier = {t: int(metric_counts(merged, 'exit', t).sum()) for t in range(1, MAX_TIER + 1)}
+    tiers = [t for t, n in sessions_by_tier.items() if n]
+    out = {'sessions': sum(sessions_by_tier.values()), 'tiers': {t: sessions_by_tier[t] for t in tiers}}
+    for metric in METRICS:
+        entry = {'labels': bin_labels(metric), 'all': metric_counts(merged, metric).tolist()}
+        entry.update({t: metric_counts(merged, metric, t).tolist() for t in tiers})
+        out[metric] = entry
+    return out
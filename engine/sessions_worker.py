@@ -0,0 +1,215 @@
+"""
+Monaco Salle Blanche Lab - Sessions Worker
+==========================================
+Multi-strategy evening simulation (single path or ensemble of paths), used by
+the Sessions page and the headless runner (no UI imports).
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from engine.cancellation import check_cancelled
+from engine.seeding import fresh_seed, seeded_scope, universe_seed
+from engine.strategy_compiler import compile_strategy
+from engine.baccarat_worker import BaccaratWorker
+from engine.roulette_worker import RouletteWorker
+
+ENSEMBLE_CHUNK_SIZE = 250
+ENSEMBLE_PERCENTILES = (5, 25, 50, 75, 95)
+
+class SessionsWorker:
+    """Runs the multi-strategy evening, either as one path or as an ensemble of paths."""
+
+    @staticmethod
+    def compile_legs(session_strategies, saved_strats):
+        """Resolves each leg to a cached CompiledStrategy so every session and path reuses it."""
+        legs = []
+        for strat in session_strategies:
+            strat_cfg = saved_strats.get(strat['strategy'])
+            if not strat_cfg:
+                legs.append({'game': strat['game'], 'strategy': strat['strategy'], 'compiled': None})
+                continue
+            legs.append({'game': strat['game'], 'strategy': strat['strategy'], 'compiled': compile_strategy(strat_cfg, game_type=strat['game'])})
+        return legs
+
+    @staticmethod
+    def run_path(legs, num_sessions, start_bankroll, use_contributions, contrib_win, contrib_loss, keep_log=True):
+        """Simulates one path of sessions. Returns (all_results, total_contributions)."""
+        all_results = []
+        game_bankroll = start_bankroll  # Money in casino wallet
+        game_account = start_bankroll   # GA = total wealth (savings + casino wallet)
+        total_contributions = 0
+        insolvency_floor = 0  # Cannot go below zero
+        target_bankroll = start_bankroll  # Target to maintain in casino wallet
+
+        for s in range(num_sessions):
+            check_cancelled()
+            # STEP 1: Add contribution to GA (total wealth increases)
+            contribution_this_session = 0
+            if use_contributions:
+                # Determine contribution based on PREVIOUS session result
+                if s == 0 or all_results[-1]['pure_session_pnl'] > 0:
+                    contribution_this_session = contrib_win
+                else:
+                    contribution_this_session = contrib_loss
+                game_account += contribution_this_session
+                total_contributions += contribution_this_session
+
+            # STEP 2: Top-up game_bankroll from GA savings if needed
+            available_savings = game_account - game_bankroll  # Money not in casino
+            if game_bankroll < target_bankroll and available_savings > 0:
+                # Transfer from savings to casino wallet
+                needed = target_bankroll - game_bankroll
+                topup = min(needed, available_savings)
+                game_bankroll += topup
+                # Note: GA total doesn't change (just moving money between accounts)
+
+            # STEP 3: INSOLVENCY CHECK - Cannot play if bankroll is at/below floor
+            if game_bankroll <= insolvency_floor:
+                # Record insolvent session
+                all_results.append({
+                    'session': s+1,
+                    'game_bankroll': game_bankroll,
+                    'pure_session_pnl': 0,
+                    'game_account': game_account,
+                    'contribution': contribution_this_session,
+                    'log': [{'game': 'INSOLVENT', 'strategy': 'NO PLAY', 'result': 0, 'bankroll': game_bankroll}] if keep_log else [],
+                    'total_contributions_so_far': total_contributions,
+                    'is_insolvent': True
+                })
+                continue
+
+            session_log = []
+            starting_bankroll_this_session = game_bankroll
+
+            for leg in legs:
+                compiled = leg['compiled']
+                if compiled is None:
+                    if keep_log:
+                        session_log.append({'game': leg['game'], 'strategy': leg['strategy'], 'result': 'NOT FOUND', 'bankroll': game_bankroll})
+                    continue
+
+                active_level = 1
+
+                # Simulate
+                if leg['game'] == 'Roulette':
+                    pnl, *_ = RouletteWorker.run_session(game_bankroll, compiled.overrides, compiled.tier_map, compiled.use_ratchet, compiled.penalty_mode, active_level, compiled.mode, compiled.base_bet)
+                else:
+                    pnl, *_ = BaccaratWorker.run_session(game_bankroll, compiled.overrides, compiled.tier_map, compiled.use_ratchet, compiled.penalty_mode, active_level, compiled.mode, compiled.base_bet)
+
+                # Update game bankroll with pure PnL
+                game_bankroll += pnl
+                # ENFORCE INSOLVENCY FLOOR - clamp at minimum
+                game_bankroll = max(game_bankroll, insolvency_floor)
+                if keep_log:
+                    session_log.append({'game': leg['game'], 'strategy': leg['strategy'], 'result': pnl, 'bankroll': game_bankroll})
+
+            # Calculate pure session PnL (no contributions)
+            session_pnl = game_bankroll - starting_bankroll_this_session
+
+            # STEP 4: Update GA with game profit/loss (total wealth changed due to casino results)
+            game_account += session_pnl
+            # Note: contribution was already added at start of session
+
+            all_results.append({
+                'session': s+1,
+                'game_bankroll': game_bankroll,  # Money in casino wallet (clamped at floor)
+                'pure_session_pnl': session_pnl,  # Pure game result
+                'game_account': game_account,  # GA = total wealth (SB + C + P)
+                'contribution': contribution_this_session,
+                'log': session_log,
+                'total_contributions_so_far': total_contributions,
+                'is_insolvent': False
+            })
+        return all_results, total_contributions
+
+    @staticmethod
+    def run_ensemble_chunk(legs, num_paths, seed, num_sessions, start_bankroll, use_contributions, contrib_win, contrib_loss):
+        """
+        Runs num_paths independent paths from one seed and keeps only compact arrays:
+        float32 bankroll/account matrices plus per-path scalars. Safe to run in a worker
+        process; run in-process, the caller's RNG state is left as it was.
+        """
+        with seeded_scope(seed):
+            return SessionsWorker._run_ensemble_paths(legs, num_paths, num_sessions, start_bankroll, use_contributions,
+                                                      contrib_win, contrib_loss)
+
+    @staticmethod
+    def _run_ensemble_paths(legs, num_paths, num_sessions, start_bankroll, use_contributions, contrib_win, contrib_loss):
+        bankrolls = np.empty((num_paths, num_sessions), dtype=np.float32)
+        accounts = np.empty((num_paths, num_sessions), dtype=np.float32)
+        game_profit = np.empty(num_paths, dtype=np.float64)
+        contributions = np.empty(num_paths, dtype=np.float64)
+        insolvent_sessions = np.empty(num_paths, dtype=np.int32)
+        win_sessions = np.empty(num_paths, dtype=np.int32)
+
+        for p in range(num_paths):
+            path, total_contrib = SessionsWorker.run_path(legs, num_sessions, start_bankroll, use_contributions, contrib_win, contrib_loss, keep_log=False)
+            bankrolls[p] = [r['game_bankroll'] for r in path]
+            accounts[p] = [r['game_account'] for r in path]
+            game_profit[p] = sum(r['pure_session_pnl'] for r in path)
+            contributions[p] = total_contrib
+            insolvent_sessions[p] = sum(1 for r in path if r['is_insolvent'])
+            win_sessions[p] = sum(1 for r in path if r['pure_session_pnl'] > 0)
+
+        return {
+            'bankrolls': bankrolls, 'accounts': accounts, 'game_profit': game_profit,
+            'contributions': contributions, 'insolvent_sessions': insolvent_sessions, 'win_sessions': win_sessions
+        }
+
+    @staticmethod
+    def plan_chunks(num_paths, seed, chunk_size=ENSEMBLE_CHUNK_SIZE):
+        """
+        Splits the ensemble into (path_count, seed) jobs with one deterministic seed per chunk
+        (mixed like universe seeds, so ensembles with adjacent base seeds share no chunk).
+        """
+        chunks = []
+        for i, start in enumerate(range(0, num_paths, chunk_size)):
+            chunks.append((min(chunk_size, num_paths - start), universe_seed(seed, i)))
+        return chunks
+
+    @staticmethod
+    def merge_chunks(chunks):
+        """Concatenates chunk stores in plan order."""
+        return {k: np.concatenate([c[k] for c in chunks]) for k in chunks[0]}
+
+    @staticmethod
+    def run_ensemble(legs, num_paths, num_sessions, start_bankroll, use_contributions, contrib_win, contrib_loss, seed=None, max_workers=None):
+        """Runs the whole ensemble, spreading chunks across processes when more than one core is available."""
+        if seed is None: seed = fresh_seed()
+        plan = SessionsWorker.plan_chunks(num_paths, seed)
+        args = (num_sessions, start_bankroll, use_contributions, contrib_win, contrib_loss)
+        workers = max_workers or os.cpu_count() or 1
+        if workers <= 1 or len(plan) == 1:
+            chunks = [SessionsWorker.run_ensemble_chunk(legs, n, s, *args) for n, s in plan]
+        else:
+            with ProcessPoolExecutor(max_workers=min(workers, len(plan))) as pool:
+                futures = [pool.submit(SessionsWorker.run_ensemble_chunk, legs, n, s, *args) for n, s in plan]
+                chunks = [f.result() for f in futures]
+        return SessionsWorker.merge_chunks(chunks)
+
+def calculate_ensemble_stats(store, start_bankroll):
+    """Percentile bands per session for game bankroll and game account, plus ensemble KPIs."""
+    bankrolls = store['bankrolls']
+    accounts = store['accounts']
+    num_paths, num_sessions = bankrolls.shape
+    final_ga = accounts[:, -1].astype(np.float64)
+
+    stats = {
+        'sessions': list(range(1, num_sessions + 1)),
+        'num_paths': num_paths,
+        'bankroll_bands': {p: np.percentile(bankrolls, p, axis=0) for p in ENSEMBLE_PERCENTILES},
+        'account_bands': {p: np.percentile(accounts, p, axis=0) for p in ENSEMBLE_PERCENTILES},
+        'final_ga_median': float(np.median(final_ga)),
+        'final_ga_p5': float(np.percentile(final_ga, 5)),
+        'final_ga_p95': float(np.percentile(final_ga, 95)),
+        'avg_game_profit': float(np.mean(store['game_profit'])),
+        'avg_contributions': float(np.mean(store['contributions'])),
+        'insolvency_rate': float(np.mean(store['insolvent_sessions'] > 0) * 100),
+        'win_rate': float(np.sum(store['win_sessions']) / (num_paths * num_sessions) * 100),
+        'monthly_cost': float(-np.mean(store['game_profit']) / num_sessions),
+        'prob_above_start': float(np.mean(final_ga > start_bankroll) * 100)
+    }
+    return stats
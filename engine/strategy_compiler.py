@@ -0,0 +1,275 @@
+"""
+Monaco Salle Blanche Lab - Strategy Compiler
+============================================
+Turns a saved-strategy config (profile.json entry or the lab sliders) into an
+immutable, ready-to-run CompiledStrategy: StrategyOverrides + tier map + the
+session flags the workers need.
+
+Compiled strategies are cached on a content hash of the config, so repeated
+runs, Sessions Sim sessions and Career Sim leg switches all reuse the same
+objects instead of rebuilding them per session.
+
+Career Sim compiles with profile='career': its legs have always played the
+core risk / progression settings only, with spices, Fibonacci Hunter, smart
+exit, recovery and the doctrine thresholds at their StrategyOverrides
+defaults. The labs and Sessions Sim use the full translation (profile='lab').
+
+The compiled overrides are shared. Callers that need to change them at run
+time (e.g. the Doctrine Engine in Career Sim) must take `fresh_overrides()`.
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+
+from engine.strategy_rules import StrategyOverrides, BetStrategy
+from engine.tier_params import TierIndex, generate_tier_map
+
+# List of Roulette-specific bets to detect Game Type
+ROULETTE_BETS = {'Red', 'Black', 'Even', 'Odd', '1-18', '19-36'}
+
+COMPILE_CACHE_SIZE = 256
+
+# Saved-config prefix -> StrategyOverrides field prefix of each spice
+# (config '<prefix>_en', '_trig', ... feed '<field>_enabled', '_trigger', ...)
+SPICE_FIELDS = (
+    ('spice_zero', 'spice_zero_leger'), ('spice_jeu_zero', 'spice_jeu_zero'),
+    ('spice_zero_crown', 'spice_zero_crown'), ('spice_tiers', 'spice_tiers'),
+    ('spice_orphelins', 'spice_orphelins'), ('spice_orphelins_plein', 'spice_orphelins_plein'),
+    ('spice_voisins', 'spice_voisins'),
+)
+
+# Ecosystem and run-length fields feed the career loop, not the compiled
+# strategy, so scenarios that only differ in these share one compile.
+NON_STRATEGY_KEYS = frozenset({
+    'sim_num', 'years', 'freq', 'sim_years', 'sim_freq', 'start_ga',
+    'eco_win', 'eco_loss', 'eco_tax', 'eco_hol', 'eco_hol_ceil', 'eco_insolvency',
+    'gold_stat', 'gold_earn'
+})
+
+# Defaults for keys a saved config may lack, as each lab page loads them
+LAB_DEFAULTS = {
+    'Baccarat': {'tac_base_bet': 5.0, 'smart_window_start': 190},
+    'Roulette': {'tac_base_bet': 5.0, 'smart_window_start': 90},
+}
+CAREER_BASE_BET = 10.0  # Career Sim's default (it has no base bet slider of its own)
+
+PROFILES = ('lab', 'career')
+
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class CompiledStrategy:
+    """Ready-to-run strategy. Treat `overrides` and `tier_map` as read-only."""
+    key: str
+    game_type: str
+    overrides: StrategyOverrides
+    tier_map: TierIndex
+    safety: int
+    mode: str
+    base_bet: float
+    use_ratchet: bool
+    penalty_mode: bool
+
+    def fresh_overrides(self) -> StrategyOverrides:
+        """Private copy for callers that mutate overrides during a run."""
+        return replace(self.overrides)
+
+
+def config_hash(config: dict, game_type: str = None, profile: str = 'lab') -> str:
+    """Canonical content hash of the parts of a strategy config that decide the compiled strategy."""
+    config = {k: v for k, v in config.items() if k not in NON_STRATEGY_KEYS}
+    payload = json.dumps({'game_type': game_type, 'profile': profile, 'config': config}, sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+def detect_game_type(config: dict) -> str:
+    """Career Sim convention: the main bet tells which table the strategy plays."""
+    return 'Roulette' if config.get('tac_bet', 'Banker') in ROULETTE_BETS else 'Baccarat'
+
+
+def _get(config, keys, default):
+    """First present key wins (the two labs save some fields under different names)."""
+    for k in keys:
+        if k in config and config[k] is not None:
+            return config[k]
+    return default
+
+
+def default_base_bet(game_type: str, profile: str = 'lab') -> float:
+    """Base bet of a config without tac_base_bet."""
+    return CAREER_BASE_BET if profile == 'career' else LAB_DEFAULTS[game_type]['tac_base_bet']
+
+
+def base_bet_of(config: dict, game_type: str, profile: str = 'lab') -> float:
+    return float(config.get('tac_base_bet', default_base_bet(game_type, profile)))
+
+
+def _bet_strategy(config, game_type):
+    raw_bet = config.get('tac_bet', 'BANKER')
+    if game_type == 'Baccarat':
+        return getattr(BetStrategy, str(raw_bet).upper(), BetStrategy.BANKER)
+    return raw_bet  # For roulette it's a string
+
+
+def build_career_overrides(config: dict, game_type: str) -> StrategyOverrides:
+    """Career Sim's translation: core risk / progression settings, everything else at its default."""
+    bet_strat = config.get('tac_bet', 'Banker')
+    if game_type == 'Baccarat':
+        bet_strat = BetStrategy[bet_strat] if bet_strat in BetStrategy.__members__ else BetStrategy.BANKER
+    return StrategyOverrides(
+        iron_gate_limit=config.get('tac_iron', 3),
+        stop_loss_units=config.get('risk_stop', 10),
+        profit_lock_units=config.get('risk_prof', 10),
+        press_trigger_wins=config.get('tac_press', 1),
+        press_depth=config.get('tac_depth', 3),
+        ratchet_enabled=config.get('risk_ratch', False),
+        ratchet_mode=config.get('risk_ratch_mode', 'Standard'),
+        shoes_per_session=config.get('tac_shoes', 3),
+        bet_strategy=bet_strat,
+        penalty_box_enabled=config.get('tac_penalty', True),
+        tie_bet_enabled=config.get('tie_bet_enabled', False),
+
+        # Spice globals only: the spices themselves stay disabled in Career Sim
+        spice_global_max_per_session=config.get('spice_global_max_session', 3),
+        spice_global_max_per_spin=config.get('spice_global_max_spin', 1),
+        spice_disable_if_caroline_step4=config.get('spice_disable_caroline', True),
+        spice_disable_if_pl_below_zero=config.get('spice_disable_below_zero', True),
+        spice_unit_ratio=0.5 if config.get('spice_hybrid_mode', False) else 1.0
+    )
+
+
+def build_overrides(config: dict, game_type: str, profile: str = 'lab') -> StrategyOverrides:
+    """Single translation from the saved-config schema to StrategyOverrides."""
+    if profile == 'career':
+        return build_career_overrides(config, game_type)
+    bet_strat = _bet_strategy(config, game_type)
+    lab = LAB_DEFAULTS[game_type]
+
+    d = StrategyOverrides.__dataclass_fields__
+    press = int(config.get('tac_press', 1))
+    spice_fields = {}
+    for prefix, field in SPICE_FIELDS:
+        spice_fields[f'{field}_enabled'] = bool(config.get(f'{prefix}_en', d[f'{field}_enabled'].default))
+        spice_fields[f'{field}_trigger'] = int(config.get(f'{prefix}_trig', d[f'{field}_trigger'].default))
+        spice_fields[f'{field}_max'] = int(config.get(f'{prefix}_max', d[f'{field}_max'].default))
+        spice_fields[f'{field}_cooldown'] = int(config.get(f'{prefix}_cool', d[f'{field}_cooldown'].default))
+        spice_fields[f'{field}_min_pl'] = int(config.get(f'{prefix}_min_pl', d[f'{field}_min_pl'].default))
+        spice_fields[f'{field}_max_pl'] = int(config.get(f'{prefix}_max_pl', d[f'{field}_max_pl'].default))
+
+    return StrategyOverrides(
+        # Core risk & progression
+        iron_gate_limit=int(config.get('tac_iron', 3)),
+        stop_loss_units=int(config.get('risk_stop', 10)),
+        profit_lock_units=int(config.get('risk_prof', 10)),
+        press_trigger_wins=press,
+        press_depth=int(config.get('tac_depth', 3)),
+        ratchet_lock_pct=0.0,
+        ratchet_enabled=bool(config.get('risk_ratch', False)),
+        ratchet_mode=config.get('risk_ratch_mode', 'Standard'),
+        shoes_per_session=config.get('tac_shoes', 3),
+        bet_strategy=bet_strat,
+        bet_strategy_2=config.get('tac_bet_2') if game_type == 'Roulette' else None,
+        penalty_box_enabled=bool(config.get('tac_penalty', True)),
+        tie_bet_enabled=bool(config.get('tie_bet_enabled', False)),
+        tax_threshold=float(config.get('eco_tax_thresh', d['tax_threshold'].default)),
+        tax_rate=float(config.get('eco_tax_rate', d['tax_rate'].default)),
+
+        # Fibonacci Hunter (press mode 11 or explicit switch)
+        fibonacci_hunter_enabled=(press == 11 or bool(config.get('fib_enabled', False))),
+        fibonacci_hunter_base_unit=int(config.get('fib_base', d['fibonacci_hunter_base_unit'].default)),
+        fibonacci_hunter_action_on_max_win=config.get('fib_mode', d['fibonacci_hunter_action_on_max_win'].default),
+
+        # Smart Trailing Stop
+        smart_exit_enabled=bool(_get(config, ('smart_exit_enabled', 'smart_exit_en'), True)),
+        smart_window_start=int(_get(config, ('smart_window_start', 'smart_window'), lab['smart_window_start'])),
+        min_profit_to_lock=int(_get(config, ('min_profit_to_lock', 'smart_min_lock'), 20)),
+        trailing_drop_pct=float(_get(config, ('trailing_drop_pct', 'smart_trail_pct'), 0.20)),
+
+        # Spice System v5.0
+        spice_global_max_per_session=int(config.get('spice_global_max_session', 3)),
+        spice_global_max_per_spin=int(config.get('spice_global_max_spin', 1)),
+        spice_disable_if_caroline_step4=bool(config.get('spice_disable_caroline', True)),
+        spice_disable_if_pl_below_zero=bool(_get(config, ('spice_disable_neg_pl', 'spice_disable_below_zero'), True)),
+        spice_unit_ratio=0.5 if config.get('spice_hybrid_mode', False) else 1.0,
+        **spice_fields,
+
+        # Doctrine Engine
+        doctrine_enabled=bool(_get(config, ('doctrine_enabled', 'doctrine_en'), False)),
+        doctrine_pl_stop=float(config.get('doctrine_pl_stop', d['doctrine_pl_stop'].default)),
+        doctrine_pl_target=float(config.get('doctrine_pl_target', d['doctrine_pl_target'].default)),
+        doctrine_pl_press_wins=int(config.get('doctrine_pl_press_wins', d['doctrine_pl_press_wins'].default)),
+        doctrine_pl_press_depth=int(config.get('doctrine_pl_press_depth', d['doctrine_pl_press_depth'].default)),
+        doctrine_pl_iron=int(config.get('doctrine_pl_iron', d['doctrine_pl_iron'].default)),
+        doctrine_ti_stop=float(config.get('doctrine_ti_stop', d['doctrine_ti_stop'].default)),
+        doctrine_ti_target=float(config.get('doctrine_ti_target', d['doctrine_ti_target'].default)),
+        doctrine_ti_press_wins=int(config.get('doctrine_ti_press_wins', d['doctrine_ti_press_wins'].default)),
+        doctrine_ti_press_depth=int(config.get('doctrine_ti_press_depth', d['doctrine_ti_press_depth'].default)),
+        doctrine_ti_iron=int(config.get('doctrine_ti_iron', d['doctrine_ti_iron'].default)),
+        doctrine_loss_trigger=float(_get(config, ('doctrine_loss_trigger', 'doctrine_loss_trig'), d['doctrine_loss_trigger'].default)),
+        doctrine_dd_pct_trigger=float(config.get('doctrine_dd_pct', d['doctrine_dd_pct_trigger'].default)),
+        doctrine_dd_eur_trigger=float(config.get('doctrine_dd_eur', d['doctrine_dd_eur_trigger'].default)),
+        doctrine_tight_min=int(config.get('doctrine_tight_min', d['doctrine_tight_min'].default)),
+        doctrine_tight_max=int(config.get('doctrine_tight_max', d['doctrine_tight_max'].default)),
+        doctrine_cooloff_enabled=bool(_get(config, ('doctrine_cooloff_enabled', 'doctrine_cooloff_en'), d['doctrine_cooloff_enabled'].default)),
+        doctrine_cooloff_floor=float(config.get('doctrine_cooloff_floor', d['doctrine_cooloff_floor'].default)),
+        doctrine_cooloff_min_months=int(config.get('doctrine_cooloff_months', d['doctrine_cooloff_min_months'].default)),
+        doctrine_cooloff_recovery_pct=float(config.get('doctrine_recovery_pct', d['doctrine_cooloff_recovery_pct'].default)),
+        doctrine_link_roulette=bool(config.get('doctrine_link_roulette', d['doctrine_link_roulette'].default)),
+        doctrine_roulette_pl=float(config.get('doctrine_roulette_pl', d['doctrine_roulette_pl'].default)),
+        doctrine_roulette_ti=float(config.get('doctrine_roulette_ti', d['doctrine_roulette_ti'].default)),
+        doctrine_roulette_co=float(config.get('doctrine_roulette_co', d['doctrine_roulette_co'].default)),
+
+        # Recovery Session System
+        recovery_enabled=bool(config.get('recovery_enabled', False)),
+        recovery_stop_loss=int(config.get('recovery_stop_loss', d['recovery_stop_loss'].default))
+    )
+
+
+def compile_strategy(config: dict, game_type: str = None, profile: str = 'lab') -> CompiledStrategy:
+    """
+    Compile (or fetch from cache) a saved-strategy config.
+    game_type=None detects the table from the main bet like Career Sim does.
+    profile is 'lab' (labs, Sessions Sim) or 'career' (Career Sim legs).
+    """
+    if profile not in PROFILES:
+        raise ValueError(f"Unknown compile profile '{profile}'")
+    if game_type is None:
+        game_type = detect_game_type(config)
+    key = config_hash(config, game_type, profile)
+
+    with _cache_lock:
+        compiled = _cache.get(key)
+        if compiled is not None:
+            _cache.move_to_end(key)
+            return compiled
+
+    mode = config.get('tac_mode', 'Standard')
+    safety = int(config.get('tac_safety', 25))
+    base_bet = base_bet_of(config, game_type, profile)
+    compiled = CompiledStrategy(
+        key=key,
+        game_type=game_type,
+        overrides=build_overrides(config, game_type, profile),
+        tier_map=generate_tier_map(safety, mode=mode, game_type=game_type, base_bet=base_bet),
+        safety=safety,
+        mode=mode,
+        base_bet=base_bet,
+        use_ratchet=bool(config.get('risk_ratch', False)),
+        penalty_mode=bool(config.get('tac_penalty', True))
+    )
+
+    with _cache_lock:
+        _cache[key] = compiled
+        while len(_cache) > COMPILE_CACHE_SIZE:
+            _cache.popitem(last=False)
+    return compiled
+
+
+def clear_compile_cache():
+    with _cache_lock:
+        _cache.clear()
@@ -0,0 +1,179 @@
+"""
+Monaco Salle Blanche Lab - Parameter Sweep
+==========================================
+A saved strategy played over a grid (or a random sample of the grid) of
+StrategyOverrides settings, one point per combination, to tune the sliders
+without changing them one at a time.
+
+Points are set in the saved-config schema (point_config), so a point is an
+ordinary strategy config: it compiles, caches and runs like any lab run. The
+swept fields never change the tier map, so every point shares the memoized
+TierIndex of the base strategy (engine/tier_params.py).
+
+Every point plays the same universes, with every session dealt from its own
+seeded stream like the strategy comparisons (engine/comparison.py): two
+neighbouring points see the same hands and spins, so the differences between
+points are the differences of the settings, not of their luck, and the
+heatmaps come out smooth with few universes per point.
+
+Points are spread over the cores like the lab runs (engine/batch.py).
+"""
+
+import itertools
+import random
+from collections import namedtuple
+
+import numpy as np
+
+from engine import batch
+from engine.comparison import compare_settings, universe_metrics
+from engine.seeding import DEFAULT_SEED
+from engine.strategy_compiler import SPICE_FIELDS, compile_strategy
+
+# label, saved-config keys (every alias the labs save it under), whole numbers?, labs, default (start, stop, step)
+SweepParam = namedtuple('SweepParam', 'label keys integer games default')
+
+BOTH = ('Baccarat', 'Roulette')
+
+SWEEP_PARAMS = {
+    'iron_gate_limit': SweepParam('Iron Gate', ('tac_iron',), True, BOTH, (2, 6, 1)),
+    'stop_loss_units': SweepParam('Stop Loss (u)', ('risk_stop',), True, BOTH, (5, 30, 5)),
+    'profit_lock_units': SweepParam('Profit Lock (u)', ('risk_prof',), True, BOTH, (5, 30, 5)),
+    'press_trigger_wins': SweepParam('Press Logic', ('tac_press',), True, BOTH, (0, 2, 1)),
+    'press_depth': SweepParam('Press Depth', ('tac_depth',), True, BOTH, (0, 5, 1)),
+    'shoes_per_session': SweepParam('Shoes / Session', ('tac_shoes',), False, BOTH, (1, 5, 1)),
+    'smart_window_start': SweepParam('Smart Window Start', ('smart_window_start', 'smart_window'), True, BOTH, (60, 240, 30)),
+    'min_profit_to_lock': SweepParam('Smart Min Lock (u)', ('min_profit_to_lock', 'smart_min_lock'), True, BOTH, (10, 50, 10)),
+    'trailing_drop_pct': SweepParam('Smart Trail Drop', ('trailing_drop_pct', 'smart_trail_pct'), False, BOTH, (0.1, 0.4, 0.05)),
+    **{f'{field}_trigger': SweepParam(field[len('spice_'):].replace('_', ' ').title() + ' Trigger', (f'{prefix}_trig',),
+                                      True, ('Roulette',), (5, 25, 5))
+       for prefix, field in SPICE_FIELDS},
+}
+
+# metric -> label
+SWEEP_METRICS = {
+    'final_ga_mean': 'Mean Final GA (€)',
+    'final_ga_p10': 'P10 Final GA (€)',
+    'monthly_cost': 'Monthly Cost (€)',
+    'insolvent_pct': 'Insolvency (%)',
+    'gold_pct': 'Gold (%)',
+}
+LOWER_IS_BETTER = frozenset({'monthly_cost', 'insolvent_pct'})
+
+SWEEP_CHUNK_POINTS = 1  # One point (all its universes) per pool task
+
+
+def params_for(game_type: str) -> dict:
+    """SWEEP_PARAMS that apply to a lab."""
+    return {name: p for name, p in SWEEP_PARAMS.items() if game_type in p.games}
+
+
+def value_range(start, stop, step) -> list:
+    """start, start+step, ... up to stop (inclusive). Whole numbers come back as ints."""
+    if step <= 0 or stop < start:
+        return [start]
+    n = int((stop - start) / step + 1e-9) + 1
+    values = [round(start + k * step, 6) for k in range(n)]
+    return [int(v) if float(v).is_integer() else v for v in values]
+
+
+def grid_size(ranges: dict) -> int:
+    return int(np.prod([len(values) for values in ranges.values()])) if ranges else 0
+
+
+def grid_points(ranges: dict) -> list:
+    """Every combination of {param: values}, last param varying fastest."""
+    names = list(ranges)
+    return [dict(zip(names, combo)) for combo in itertools.product(*ranges.values())]
+
+
+def random_points(ranges: dict, n: int, seed: int = DEFAULT_SEED) -> list:
+    """
+    n distinct combinations of {param: values} drawn at random (the whole grid
+    when it has no more than n points), in grid order. The grid is never built.
+    """
+    total = grid_size(ranges)
+    names = list(ranges)
+    points = []
+    for index in sorted(random.Random(seed).sample(range(total), min(n, total))):
+        point = {}
+        for name in reversed(names):
+            index, j = divmod(index, len(ranges[name]))
+            point[name] = ranges[name][j]
+        points.append({name: point[name] for name in names})
+    return points
+
+
+def point_config(base_config: dict, point: dict) -> dict:
+    """The base strategy config with a point's settings written under every key the labs read them from."""
+    config = dict(base_config)
+    for name, value in point.items():
+        param = SWEEP_PARAMS[name]
+        value = int(round(value)) if param.integer else float(value)
+        for key in param.keys:
+            config[key] = value
+    return config
+
+
+def point_summary(results, settings) -> dict:
+    """SWEEP_METRICS of one point's universes, plus their mean GA trajectory."""
+    values = np.array([universe_metrics(r, settings) for r in results], dtype=np.float64)
+    finals = values[:, 0]
+    return {
+        'final_ga_mean': float(finals.mean()),
+        'final_ga_p10': float(np.percentile(finals, 10)),
+        'monthly_cost': float(values[:, 2].mean()),
+        'insolvent_pct': float(np.mean(values[:, 1] > 0) * 100),
+        'gold_pct': float(np.mean([r['gold_year'] != -1 for r in results]) * 100),
+        'trajectory': np.mean([r['trajectory'] for r in results], axis=0),
+    }
+
+
+def run_sweep_points(game_type, base_config, points, common, num_universes, seed) -> list:
+    """One row per point: the point's settings and its point_summary over universes 0..num_universes-1."""
+    rows = []
+    for point in points:
+        config = point_config(base_config, point)
+        settings = compare_settings([{'game': game_type, 'config': config}], common)[0]
+        compiled = compile_strategy(config, game_type=game_type)
+        results = batch.run_lab_universes(game_type, settings, compiled, seed, 0, num_universes, crn=True)
+        rows.append(dict(point, **point_summary(results, settings)))
+    return rows
+
+
+def run_sweep_chunk(game_type, base_config, points, common, num_universes, seed, start, count):
+    """Process-pool entry point: points start..start+count-1."""
+    return run_sweep_points(game_type, base_config, points[start:start + count], common, num_universes, seed)
+
+
+def run_sweep(game_type, base_config, points, num_universes, seed=DEFAULT_SEED, common=None, max_workers=None,
+              on_chunk=None, on_results=None, instrument=None) -> list:
+    """
+    Sweep of a saved strategy over points ({param: value} dicts, see
+    grid_points / random_points). Rows come back in point order;
+    on_results(start, rows) hands over each finished chunk of points.
+    """
+    plan = batch.plan_universes(len(points), chunk_size=SWEEP_CHUNK_POINTS)
+    return batch.run_chunks(run_sweep_chunk, (game_type, base_config, points, common, num_universes, seed), plan,
+                            max_workers, on_chunk, on_results, instrument)
+
+
+def best_points(rows, metric: str, n: int = 5) -> list:
+    """The n best rows by a metric (lowest first for costs and insolvency, highest first otherwise)."""
+    return sorted(rows, key=lambda r: r[metric], reverse=metric not in LOWER_IS_BETTER)[:n]
+
+
+def heatmap_grid(rows, x: str, y: str, metric: str):
+    """
+    (x values, y values, len(y) x len(x) matrix) of a metric over two swept
+    params, averaged over the other params' values (NaN where no point was played).
+    """
+    xs = sorted({r[x] for r in rows})
+    ys = sorted({r[y] for r in rows})
+    total = np.zeros((len(ys), len(xs)))
+    count = np.zeros((len(ys), len(xs)))
+    for r in rows:
+        i, j = ys.index(r[y]), xs.index(r[x])
+        total[i, j] += r[metric]
+        count[i, j] += 1
+    return xs, ys, np.where(count > 0, total / np.maximum(count, 1), np.nan)
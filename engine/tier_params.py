@@ -1,6 +1,12 @@
+from bisect import bisect_right
+from collections.abc import Mapping
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import accumulate
 
-@dataclass
+import numpy as np
+
+@dataclass(frozen=True)
 class TierConfig:
     level: int
     min_ga: float
@@ -11,9 +17,24 @@ class TierConfig:
     profit_lock: float
     catastrophic_cap: float
 
+TIER_MAP_CACHE_SIZE = 128
+
 # --- TIER GENERATION (Supports Dynamic Base Bets) ---
 
-def generate_tier_map(safety_factor: int = 25, mode: str = 'Standard', game_type: str = 'Baccarat', base_bet: float = None) -> dict:
+def generate_tier_map(safety_factor: int = 25, mode: str = 'Standard', game_type: str = 'Baccarat', base_bet: float = None) -> 'TierIndex':
+    """
+    Memoized: identical (safety_factor, mode, game_type, base_bet) return the same
+    shared, immutable TierIndex of frozen TierConfigs. Never mutate the result.
+    """
+    if base_bet is not None and base_bet <= 0:
+        base_bet = None  # Same map as "use the table minimum"
+    return _cached_tier_map(safety_factor, mode, game_type, base_bet)
+
+@lru_cache(maxsize=TIER_MAP_CACHE_SIZE)
+def _cached_tier_map(safety_factor, mode, game_type, base_bet):
+    return TierIndex(_build_tier_map(safety_factor, mode, game_type, base_bet))
+
+def _build_tier_map(safety_factor: int, mode: str, game_type: str, base_bet: float) -> dict:
     tiers = {}
     
     # 1. DETERMINE BASE UNIT
@@ -103,10 +124,100 @@ def generate_tier_map(safety_factor: int = 25, mode: str = 'Standard', game_type
         )
     return tiers
 
+# --- TIER INDEX (Precomputed Lookup) ---
+
+TITAN_HYSTERESIS = 0.9  # Drop from Tier 3 only 10% below the Tier 3 threshold
+
+class TierIndex(Mapping):
+    """
+    Immutable lookup index over a tier map.
+    Behaves like the read-only tier_map dict it wraps, plus precomputed
+    threshold arrays: O(log n) scalar lookup (bisect) and vectorized lookup
+    (numpy searchsorted) for thousands of universes at once.
+    """
+
+    def __init__(self, tier_map):
+        self._tiers = dict(sorted(tier_map.items()))
+        self.levels = tuple(self._tiers)
+        self._ordered = tuple(self._tiers.values())
+
+        # Standard scan stops at the first tier it can't afford, so use the running max
+        self.thresholds = tuple(accumulate((t.min_ga for t in self._ordered), max))
+        self.level_array = np.array(self.levels, dtype=np.int64)
+        self.threshold_array = np.array(self.thresholds, dtype=np.float64)
+
+        # Titan hysteresis thresholds (Tier 2 / Tier 3 / Tier 3 drop)
+        t2, t3 = self._tiers.get(2), self._tiers.get(3)
+        self.titan_thresholds = (t2.min_ga, t3.min_ga, t3.min_ga * TITAN_HYSTERESIS) if (t2 and t3) else None
+        self.fortress_threshold = t2.min_ga if t2 else None
+
+    def __getitem__(self, level):
+        return self._tiers[level]
+
+    def __iter__(self):
+        return iter(self._tiers)
+
+    def __len__(self):
+        return len(self._tiers)
+
+    def __repr__(self):
+        return f"TierIndex({self._tiers!r})"
+
+    def lookup(self, current_ga: float, active_level: int = 1, mode: str = 'Standard') -> TierConfig:
+        """Scalar lookup, same rules as get_tier_for_ga."""
+        if mode == 'Safe Titan':
+            return self._tiers[1]
+
+        if mode == 'Titan':
+            if self.titan_thresholds is None: return self._tiers[active_level]
+            th_low, th_high, th_drop = self.titan_thresholds
+            if active_level < 3:
+                if current_ga >= th_high: return self._tiers[3]
+                if current_ga >= th_low: return self._tiers[2]
+                return self._tiers[1]
+            if active_level == 3:
+                return self._tiers[2] if current_ga < th_drop else self._tiers[3]
+            return self._tiers[active_level]
+
+        if mode == 'Fortress':
+            if self.fortress_threshold is not None and current_ga >= self.fortress_threshold: return self._tiers[2]
+            return self._tiers[1]
+
+        pos = bisect_right(self.thresholds, current_ga) - 1
+        return self._ordered[pos if pos > 0 else 0]
+
+    def lookup_levels(self, current_ga, active_level=1, mode: str = 'Standard') -> np.ndarray:
+        """
+        Vectorized lookup: GA array (+ optional per-universe active levels) -> tier level array.
+        Titan hysteresis is applied element-wise.
+        """
+        ga = np.asarray(current_ga, dtype=np.float64)
+        active = np.broadcast_to(np.asarray(active_level, dtype=np.int64), ga.shape)
+
+        if mode == 'Safe Titan':
+            return np.ones(ga.shape, dtype=np.int64)
+
+        if mode == 'Titan':
+            if self.titan_thresholds is None: return active.copy()
+            th_low, th_high, th_drop = self.titan_thresholds
+            climbing = np.where(ga >= th_high, 3, np.where(ga >= th_low, 2, 1))
+            holding = np.where(ga < th_drop, 2, 3)
+            return np.where(active < 3, climbing, np.where(active == 3, holding, active))
+
+        if mode == 'Fortress':
+            if self.fortress_threshold is None: return np.ones(ga.shape, dtype=np.int64)
+            return np.where(ga >= self.fortress_threshold, 2, 1)
+
+        pos = np.searchsorted(self.threshold_array, ga, side='right') - 1
+        return self.level_array[np.clip(pos, 0, None)]
+
 def get_tier_for_ga(current_ga: float, tier_map: dict = None, active_level: int = 1, mode: str = 'Standard', game_type: str = 'Baccarat') -> TierConfig:
     if tier_map is None:
         tier_map = generate_tier_map(mode=mode, game_type=game_type)
 
+    if isinstance(tier_map, TierIndex):
+        return tier_map.lookup(current_ga, active_level, mode)
+
     if mode == 'Safe Titan':
         return tier_map[1]
 
@@ -2,19 +2,21 @@ from nicegui import ui, app
 import traceback
 
 # MODULE IMPORTS
+# Labs are imported on first click (see ui/module_registry.py) to keep cold starts fast
 from auth import setup_auth
-from ui.tracker import render_page as show_tracker
-from ui.simulator import show_simulator
-from ui.career_mode import show_career_mode
-from ui.roulette_sim import show_roulette_sim
-from ui.docs_viewer import show_docs_viewer
-from ui.sessions_sim import show_sessions_sim
+from api import setup_api
+from ui.module_registry import get_page, prewarm_in_background
+
+# Import the remaining labs in the background once the first page is served
+PREWARM_MODULES = True
 
 # ==============================================================================
 # 1. SECURITY SETUP
 # ==============================================================================
 # Initialize the login pages
 setup_auth()
+# REST job API (same authentication as the main page)
+setup_api()
 
 # ==============================================================================
 # 2. MAIN APP PAGE
@@ -34,9 +36,10 @@ def main_page():
     content = ui.column().classes('w-full items-center')
 
     # --- Module Loader Logic ---
-    def load_module(module_func):
+    def load_module(module_key):
         content.clear()
         try:
+            module_func = get_page(module_key)
             with content:
                 module_func()
         except Exception as e:
@@ -58,35 +61,49 @@ def main_page():
             with ui.column().classes('gap-2 w-full'):
                 
                 ui.button("CAPTAIN'S LOG", icon='edit_note', 
-                          on_click=lambda: load_module(show_tracker)
+                          on_click=lambda: load_module('tracker')
                          ).props('flat align=left').classes('w-full text-amber-400 font-bold bg-slate-700/50 hover:bg-slate-700')
                 
                 ui.separator().classes('bg-slate-700 my-2 opacity-50')
                 
                 ui.button('BACCARAT LAB', icon='science', 
-                          on_click=lambda: load_module(show_simulator)
+                          on_click=lambda: load_module('baccarat')
                          ).props('flat align=left').classes('w-full text-slate-200 hover:bg-slate-700')
                 
                 ui.button('ROULETTE LAB', icon='donut_large', 
-                          on_click=lambda: load_module(show_roulette_sim)
+                          on_click=lambda: load_module('roulette')
                          ).props('flat align=left').classes('w-full text-slate-200 hover:bg-slate-700')
                 
                 ui.button('CAREER SIM', icon='route', 
-                          on_click=lambda: load_module(show_career_mode)
+                          on_click=lambda: load_module('career')
                          ).props('flat align=left').classes('w-full text-slate-200 hover:bg-slate-700')
                 
                 ui.button('SESSIONS SIM', icon='event_repeat', 
-                          on_click=lambda: load_module(show_sessions_sim)
+                          on_click=lambda: load_module('sessions')
                          ).props('flat align=left').classes('w-full text-orange-300 hover:bg-slate-700')
                 
+                ui.button('COMPARE', icon='compare_arrows',
+                          on_click=lambda: load_module('compare')
+                         ).props('flat align=left').classes('w-full text-cyan-300 hover:bg-slate-700')
+                
+                ui.button('SWEEP', icon='grid_on',
+                          on_click=lambda: load_module('sweep')
+                         ).props('flat align=left').classes('w-full text-cyan-300 hover:bg-slate-700')
+                
                 ui.separator().classes('bg-slate-700 my-2 opacity-50')
                 
                 ui.button('📚 DOCS', icon='menu_book', 
-                          on_click=lambda: load_module(show_docs_viewer)
+                          on_click=lambda: load_module('docs')
                          ).props('flat align=left').classes('w-full text-purple-400 hover:bg-slate-700')
 
+                ui.button('ADMIN', icon='admin_panel_settings',
+                          on_click=lambda: load_module('admin')
+                         ).props('flat align=left').classes('w-full text-slate-400 hover:bg-slate-700')
+
     # --- Initial Load ---
-    load_module(show_tracker)
+    load_module('tracker')
+    if PREWARM_MODULES:
+        prewarm_in_background()
 
 # ==============================================================================
 # 3. RUN
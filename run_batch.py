@@ -0,0 +1,238 @@
+"""
+Monaco Salle Blanche Lab - Headless Batch Runner
+================================================
+Runs saved strategies from the command line, without the UI (no NiceGUI
+imports), on every core. Numbers match the lab pages for the same settings
+and seed: the runs go through the same workers and per-universe loops.
+
+Examples:
+    python run_batch.py baccarat "My Strategy" --universes 1000
+    python run_batch.py roulette "Strat A" "Strat B" --seed 7 --workers 8
+    python run_batch.py career "Leg 1:5000" "Leg 2:20000" --years 5 --universes 500
+    python run_batch.py sessions "Roulette:Strat A" "Baccarat:Strat B" --paths 2000 --sessions 20
+    python run_batch.py manifest scenarios.json
+
+Manifests list many scenarios (strategies x ecosystems, career ladders) and
+produce one comparison table; see engine/scenarios.py for the format.
+
+Output (in --out): one compressed columnar .npz per run (same layout as the
+result cache, see utils/result_cache.py) plus summary.json (manifests also
+write comparison.csv).
+"""
+
+import argparse
+import csv
+import json
+import os
+import re
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+
+from engine import batch, scenarios
+from engine.seeding import DEFAULT_SEED
+from utils.persistence import get_saved_strategies
+from utils.result_cache import pack_results, write_packed
+
+
+def _file_name(*parts) -> str:
+    return re.sub(r'[^A-Za-z0-9_.-]+', '_', '_'.join(str(p) for p in parts)).strip('_') + '.npz'
+
+
+def run_lab_strategy(game_type, name, config, args, out_dir):
+    start = time.perf_counter()
+    results, settings = batch.run_lab(game_type, config, args.universes, seed=args.seed, max_workers=args.workers)
+    elapsed = time.perf_counter() - start
+
+    file_name = _file_name(game_type, name, args.seed)
+    write_packed(os.path.join(out_dir, file_name), pack_results(results),
+                 {'game': game_type, 'strategy': name, 'seed': args.seed, 'settings': settings})
+    summary = batch.lab_stats(game_type, results, settings)
+    return {'kind': game_type.lower(), 'strategy': name, 'universes': len(results), 'seed': args.seed,
+            'elapsed_sec': round(elapsed, 3), 'universes_per_sec': round(len(results) / elapsed, 2) if elapsed else None,
+            'settings': settings, 'stats': summary, 'file': file_name}
+
+
+def run_career(legs, saved, args, out_dir):
+    sequence_config = []
+    for name, target in legs:
+        sequence_config.append({'strategy_name': name, 'target_ga': target, 'config': saved[name]})
+    settings = {'start_ga': args.start_ga, 'years': args.years, 'sessions': args.sessions_per_year,
+                'fallback': args.fallback, 'promotion_buffer': args.promotion_buffer,
+                'trailing_fallback': args.trailing_fallback, 'retention': args.retention}
+
+    start = time.perf_counter()
+    results, settings = batch.run_career(sequence_config, args.universes, seed=args.seed, settings=settings, max_workers=args.workers)
+    elapsed = time.perf_counter() - start
+
+    file_name = _file_name('career', *(n for n, _ in legs), args.seed)
+    valid = [r for r in results if 'error' not in r]
+    if valid:
+        write_packed(os.path.join(out_dir, file_name), pack_results([dict(r, log=r['log'].to_dict()) for r in valid]),
+                     {'legs': [n for n, _ in legs], 'seed': args.seed, 'settings': settings})
+    return {'kind': 'career', 'legs': [{'strategy': n, 'target_ga': t} for n, t in legs], 'universes': len(results),
+            'seed': args.seed, 'elapsed_sec': round(elapsed, 3),
+            'universes_per_sec': round(len(results) / elapsed, 2) if elapsed else None,
+            'settings': settings, 'stats': batch.career_stats(results, settings),
+            'errors': sorted({r['error'] for r in results if 'error' in r}),
+            'file': file_name if valid else None}
+
+
+def run_sessions(legs, saved, args, out_dir):
+    session_strategies = [{'game': game, 'strategy': name, 'params': {}} for game, name in legs]
+    start = time.perf_counter()
+    store, stats = batch.run_sessions(session_strategies, saved, args.paths, args.sessions, args.bankroll,
+                                      args.contributions, args.contrib_win, args.contrib_loss,
+                                      seed=args.seed, max_workers=args.workers)
+    elapsed = time.perf_counter() - start
+
+    file_name = _file_name('sessions', *(n for _, n in legs), args.seed)
+    np.savez_compressed(os.path.join(out_dir, file_name), **store)
+    return {'kind': 'sessions', 'legs': [{'game': g, 'strategy': n} for g, n in legs], 'paths': args.paths,
+            'sessions': args.sessions, 'seed': args.seed, 'elapsed_sec': round(elapsed, 3),
+            'stats': batch.scalars(stats), 'file': file_name}
+
+
+def run_manifest(path, saved, args, out_dir):
+    with open(path, 'r') as f:
+        manifest = json.load(f)
+    # Command-line --seed / --universes override the manifest
+    if args.seed is not None:
+        manifest['seed'] = args.seed
+    if args.universes is not None:
+        manifest['universes'] = args.universes
+
+    start = time.perf_counter()
+    def progress(done, total):
+        print(f"\r  {done}/{total} chunks", end='', flush=True)
+    rows, run_results, plan = scenarios.run_manifest(manifest, saved, max_workers=args.workers, on_progress=progress)
+    elapsed = time.perf_counter() - start
+    print()
+
+    files = {}
+    for key, results in run_results.items():
+        spec = plan['runs'][key]
+        if spec['kind'] == 'career':
+            results = [dict(r, log=r['log'].to_dict()) for r in results if 'error' not in r]
+        if results:
+            files[key] = f'run_{key[:12]}.npz'
+            write_packed(os.path.join(out_dir, files[key]), pack_results(results), {'spec': spec})
+
+    with open(os.path.join(out_dir, 'comparison.csv'), 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=scenarios.COMPARISON_COLUMNS, extrasaction='ignore')
+        writer.writeheader()
+        writer.writerows(rows)
+    print(scenarios.format_table(rows))
+
+    for row in rows:
+        row['file'] = files.get(row['run'])
+    return {'kind': 'manifest', 'manifest': os.path.abspath(path), 'seed': manifest.get('seed', DEFAULT_SEED),
+            'elapsed_sec': round(elapsed, 3), 'dedup': plan['stats'], 'rows': rows, 'file': 'comparison.csv'}
+
+
+def parse_legs(values, kind):
+    """career: 'Name:target' (target in €); sessions: 'Game:Name'."""
+    legs = []
+    for v in values:
+        if kind == 'career':
+            name, sep, target = v.rpartition(':')
+            if not sep:
+                raise ValueError(f"Career leg '{v}' must be 'Strategy:TargetGA'")
+            legs.append((name, float(target)))
+        else:
+            game, sep, name = v.partition(':')
+            if not sep or game not in ('Roulette', 'Baccarat'):
+                raise ValueError(f"Sessions leg '{v}' must be 'Roulette:Strategy' or 'Baccarat:Strategy'")
+            legs.append((game, name))
+    return legs
+
+
+def build_parser():
+    p = argparse.ArgumentParser(description='Run saved strategies without the UI.')
+    p.add_argument('kind', choices=['baccarat', 'roulette', 'career', 'sessions', 'manifest'])
+    p.add_argument('items', nargs='+', help="Strategy names (career: 'Name:TargetGA', sessions: 'Game:Name', manifest: path)")
+    p.add_argument('--universes', type=int, default=None, help='Universes per run (default: 100)')
+    p.add_argument('--seed', type=int, default=None, help=f'Base seed (default: {DEFAULT_SEED})')
+    p.add_argument('--workers', type=int, default=None, help='Processes (default: every core)')
+    p.add_argument('--out', default=None, help='Output directory (default: batch_runs/<timestamp>)')
+    career = p.add_argument_group('career')
+    career.add_argument('--start-ga', type=float, default=batch.CAREER_DEFAULTS['start_ga'])
+    career.add_argument('--years', type=int, default=batch.CAREER_DEFAULTS['years'])
+    career.add_argument('--sessions-per-year', type=int, default=batch.CAREER_DEFAULTS['sessions'])
+    career.add_argument('--fallback', type=float, default=batch.CAREER_DEFAULTS['fallback'])
+    career.add_argument('--promotion-buffer', type=float, default=batch.CAREER_DEFAULTS['promotion_buffer'])
+    career.add_argument('--trailing-fallback', type=float, default=batch.CAREER_DEFAULTS['trailing_fallback'])
+    career.add_argument('--retention', choices=['counts', 'sampled', 'full'], default=batch.CAREER_DEFAULTS['retention'])
+    sessions = p.add_argument_group('sessions')
+    sessions.add_argument('--paths', type=int, default=1000)
+    sessions.add_argument('--sessions', type=int, default=20)
+    sessions.add_argument('--bankroll', type=float, default=1000)
+    sessions.add_argument('--contributions', action='store_true')
+    sessions.add_argument('--contrib-win', type=float, default=300)
+    sessions.add_argument('--contrib-loss', type=float, default=300)
+    return p
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.kind != 'manifest':
+        args.seed = DEFAULT_SEED if args.seed is None else args.seed
+        args.universes = 100 if args.universes is None else args.universes
+    saved = get_saved_strategies()
+    try:
+        if args.kind == 'career':
+            legs = parse_legs(args.items, 'career')
+            names = [n for n, _ in legs]
+        elif args.kind == 'sessions':
+            legs = parse_legs(args.items, 'sessions')
+            names = [n for _, n in legs]
+        elif args.kind == 'manifest':
+            names = []
+        else:
+            names = args.items
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    missing = [n for n in names if n not in saved]
+    if missing:
+        print(f"Error: unknown strategies: {', '.join(missing)}", file=sys.stderr)
+        return 2
+
+    out_dir = args.out or os.path.join('batch_runs', datetime.now().strftime('%Y%m%d_%H%M%S'))
+    os.makedirs(out_dir, exist_ok=True)
+
+    runs = []
+    if args.kind in ('baccarat', 'roulette'):
+        game_type = args.kind.capitalize()
+        for name in names:
+            print(f"{game_type}: {name} ({args.universes} universes)...")
+            runs.append(run_lab_strategy(game_type, name, saved[name], args, out_dir))
+    elif args.kind == 'career':
+        print(f"Career: {' -> '.join(names)} ({args.universes} universes)...")
+        runs.append(run_career(legs, saved, args, out_dir))
+    elif args.kind == 'sessions':
+        print(f"Sessions: {' + '.join(names)} ({args.paths} paths)...")
+        runs.append(run_sessions(legs, saved, args, out_dir))
+    else:
+        for path in args.items:
+            print(f"Manifest: {path}...")
+            try:
+                runs.append(run_manifest(path, saved, args, out_dir))
+            except (OSError, ValueError) as e:
+                print(f"Error: {e}", file=sys.stderr)
+                return 2
+
+    summary = {'created': datetime.now().strftime("%Y-%m-%d %H:%M:%S"), 'kind': args.kind,
+               'workers': args.workers or os.cpu_count(), 'runs': runs}
+    with open(os.path.join(out_dir, 'summary.json'), 'w') as f:
+        json.dump(summary, f, indent=2, default=str)
+    for run in runs:
+        print(f"  -> {run['file']} ({run['elapsed_sec']}s)")
+    print(f"Summary: {os.path.join(out_dir, 'summary.json')}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,86 @@
+"""
+Monaco Salle Blanche Lab - Engine Benchmarks
+============================================
+Times the simulation hot paths with fixed seeds (see engine/benchmarks.py)
+and compares them with a stored baseline.
+
+Examples:
+    python run_benchmarks.py                     # all benchmarks vs benchmarks_baseline.json
+    python run_benchmarks.py roulette_session_spices tier_lookup_titan --repeats 10
+    python run_benchmarks.py --save              # record this machine's numbers as the baseline
+    python run_benchmarks.py --list
+
+Exits with status 1 when a benchmark regressed by more than --threshold, or
+played a different number of hands/spins than its baseline for the same seed.
+Baselines are machine specific: record one on the machine you compare on.
+"""
+
+import argparse
+import json
+import os
+import sys
+
+from engine import benchmarks
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'benchmarks_baseline.json')
+
+
+def format_rows(rows) -> str:
+    lines = [f"{'BENCHMARK':<28} {'RATE':>20} {'BASELINE':>14} {'CHANGE':>8}  STATUS"]
+    for r in rows:
+        rate = f"{r['rate']:,.0f} {r['unit']}/s"
+        base = f"{r['baseline']:,.0f}" if r['baseline'] is not None else '-'
+        change = f"{r['change']:+.1%}" if r['change'] is not None else '-'
+        lines.append(f"{r['name']:<28} {rate:>20} {base:>14} {change:>8}  {r['status']}")
+    return '\n'.join(lines)
+
+
+def parse_args(argv=None):
+    p = argparse.ArgumentParser(description='Benchmark the simulation engines.')
+    p.add_argument('names', nargs='*', help='Benchmarks to run (default: all)')
+    p.add_argument('--repeats', type=int, default=5, help='Timed repeats per benchmark; the best one counts (default: 5)')
+    p.add_argument('--baseline', default=DEFAULT_BASELINE, help='Baseline JSON (default: benchmarks_baseline.json)')
+    p.add_argument('--threshold', type=float, default=benchmarks.REGRESSION_THRESHOLD,
+                   help=f'Rate drop flagged as a regression (default: {benchmarks.REGRESSION_THRESHOLD})')
+    p.add_argument('--save', action='store_true', help='Write the results as the new baseline')
+    p.add_argument('--out', default=None, help='Also write the results to this JSON file')
+    p.add_argument('--list', action='store_true', help='List the benchmarks and exit')
+    return p.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.list:
+        for name, (unit, _) in benchmarks.BENCHMARKS.items():
+            print(f"{name:<28} {unit}/s")
+        return 0
+    unknown = [n for n in args.names if n not in benchmarks.BENCHMARKS]
+    if unknown:
+        print(f"Error: unknown benchmarks: {', '.join(unknown)} (see --list)", file=sys.stderr)
+        return 2
+
+    results = benchmarks.run_all(args.names or None, args.repeats,
+                                 on_result=lambda name, r: print(f"  {name}: {r['rate']:,.0f} {r['unit']}/s", flush=True))
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    rows = benchmarks.compare(results, baseline, args.threshold)
+    print()
+    print(format_rows(rows))
+
+    if args.out:
+        with open(args.out, 'w') as f:
+            json.dump(results, f, indent=2)
+    if args.save:
+        merged = dict(baseline, **results)  # Saving a subset keeps the other baselines
+        with open(args.baseline, 'w') as f:
+            json.dump(merged, f, indent=2)
+        print(f"Baseline: {args.baseline}")
+        return 0
+    return 1 if any(r['status'] in ('REGRESSION', 'WORK CHANGED') for r in rows) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,78 @@
+"""
+TEST: Headless Batch Runner
+The CLI path (engine/batch.py, run_batch.py) must give the same numbers as
+the lab pages, whatever the number of processes, and import no UI code.
+"""
+
+import json
+import subprocess
+import sys
+
+from engine import batch
+from engine.strategy_compiler import compile_strategy
+from run_batch import parse_legs
+
+BAC = {'tac_bet': 'BANKER', 'tac_safety': 25, 'tac_mode': 'Standard', 'tac_base_bet': 10.0, 'tac_shoes': 1, 'years': 1, 'freq': 12}
+ROU = {'tac_bet': 'Red', 'tac_safety': 25, 'tac_mode': 'Standard', 'tac_base_bet': 5.0, 'sim_years': 1, 'sim_freq': 12}
+
+
+def test_lab_settings():
+    print("\n" + "="*60)
+    print("TEST: lab_settings reads each lab's field names")
+    print("="*60)
+    bac = batch.lab_settings(BAC, 'Baccarat')
+    rou = batch.lab_settings(ROU, 'Roulette')
+    assert (bac['years'], bac['freq']) == (1, 12)
+    assert (rou['years'], rou['freq']) == (1, 12)
+    assert bac['status_target_pts'] == 22500 and bac['insolvency'] == 1000
+    for game, strat in (('Baccarat', BAC), ('Roulette', ROU)):
+        # Without tac_base_bet, the tier map and the flat penalty bet still use the same base bet
+        bare = {k: v for k, v in strat.items() if k != 'tac_base_bet'}
+        assert batch.lab_settings(bare, game)['base_bet'] == compile_strategy(bare, game_type=game).base_bet
+    print("✅ Settings OK")
+
+
+def test_parallel_matches_page_loop():
+    print("\n" + "="*60)
+    print("TEST: Parallel batch == sequential page loop")
+    print("="*60)
+    for game, strat in (('Baccarat', BAC), ('Roulette', ROU)):
+        config = batch.lab_settings(strat, game)
+        page = batch.run_lab_universes(game, config, compile_strategy(strat, game_type=game), 7, 0, 30)
+        parallel, _ = batch.run_lab(game, strat, 30, seed=7, max_workers=2)
+        print(f"{game}: page {page[-1]['final_ga']:.0f} / batch {parallel[-1]['final_ga']:.0f}")
+        assert [r['final_ga'] for r in page] == [r['final_ga'] for r in parallel]
+
+
+def test_career_batch():
+    print("\n" + "="*60)
+    print("TEST: Career batch is independent of worker count")
+    print("="*60)
+    sequence = [{'strategy_name': 'Grinder', 'target_ga': 4000, 'config': BAC},
+                {'strategy_name': 'Wheel', 'target_ga': 100000, 'config': ROU}]
+    settings = {'years': 1, 'sessions': 24}
+    one, s = batch.run_career(sequence, 30, seed=3, settings=settings, max_workers=1)
+    two, _ = batch.run_career(sequence, 30, seed=3, settings=settings, max_workers=2)
+    assert [r['final'] for r in one] == [r['final'] for r in two]
+    stats = batch.career_stats(one, s)
+    print(f"Median final GA: €{stats['final_ga_median']:,.0f}")
+    assert stats['universes'] == 30 and stats['errors'] == 0
+
+
+def test_cli_has_no_ui_imports():
+    print("\n" + "="*60)
+    print("TEST: run_batch imports no UI code")
+    print("="*60)
+    code = "import sys, run_batch; print(json.dumps(sorted(m for m in sys.modules if m == 'nicegui' or m.startswith('ui'))))"
+    out = subprocess.run([sys.executable, '-c', 'import json; ' + code], capture_output=True, text=True, check=True).stdout
+    assert json.loads(out.strip().splitlines()[-1]) == []
+    assert parse_legs(['A:B:5000'], 'career') == [('A:B', 5000.0)]
+    assert parse_legs(['Roulette:My Strat'], 'sessions') == [('Roulette', 'My Strat')]
+    print("✅ CLI OK")
+
+
+if __name__ == '__main__':
+    test_lab_settings()
+    test_parallel_matches_page_loop()
+    test_career_batch()
+    test_cli_has_no_ui_imports()
@@ -0,0 +1,38 @@
+"""
+TEST: Engine Benchmarks
+Benchmarks play the same work for the same seed, and the baseline comparison
+flags slowdowns and changed games.
+"""
+
+from engine import benchmarks
+
+
+def test_benchmarks_are_deterministic():
+    print("\n" + "="*60)
+    print("TEST: Fixed-seed benchmarks repeat the same work")
+    print("="*60)
+    for name in ('roulette_session_spices', 'roulette_session_dual_bet', 'tier_lookup_titan'):
+        first = benchmarks.run_benchmark(name, repeats=2)
+        again = benchmarks.run_benchmark(name, repeats=1)
+        print(f"{name}: {first['work']} {first['unit']} at {first['rate']:,.0f}/s")
+        assert first['work'] == again['work'] > 0 and first['rate'] > 0
+    print("✅ Deterministic")
+
+
+def test_compare_flags_regressions():
+    print("\n" + "="*60)
+    print("TEST: Baseline comparison")
+    print("="*60)
+    def res(rate, work=1000):
+        return {'unit': 'spins', 'rate': rate, 'work': work}
+    results = {'_meta': {}, 'a': res(100), 'b': res(80), 'c': res(130), 'd': res(100, work=999), 'e': res(50)}
+    baseline = {'a': res(105), 'b': res(100), 'c': res(100), 'd': res(100)}
+    status = {r['name']: r['status'] for r in benchmarks.compare(results, baseline, threshold=0.15)}
+    print(status)
+    assert status == {'a': 'ok', 'b': 'REGRESSION', 'c': 'faster', 'd': 'WORK CHANGED', 'e': 'new'}
+    print("✅ Flags OK")
+
+
+if __name__ == '__main__':
+    test_benchmarks_are_deterministic()
+    test_compare_flags_regressions()
@@ -0,0 +1,104 @@
+"""
+TEST: Career Event Log
+Verifies the structured Career Sim log: lazy formatting reproduces the old
+detail strings, counts-only retention keeps counters but no entries, and a
+career run yields the same event counts under every retention level.
+"""
+
+import random
+from engine import career_log as clog
+from engine.career_log import CareerEventLog
+from ui.career_mode import CareerManager
+
+BAC = {'tac_bet': 'BANKER', 'tac_safety': 25, 'tac_mode': 'Standard', 'tac_base_bet': 10.0, 'tac_shoes': 1}
+ROU = {'tac_bet': 'Red', 'tac_safety': 25, 'tac_mode': 'Standard', 'tac_base_bet': 5.0}
+SEQUENCE = [
+    {'strategy_name': 'Grinder', 'target_ga': 3000, 'config': BAC},
+    {'strategy_name': 'Wheel', 'target_ga': 100000, 'config': ROU},
+]
+
+
+def test_lazy_formatting():
+    """Formatted entries match the strings the eager log produced"""
+    print("\n" + "="*60)
+    print("TEST: Lazy Formatting")
+    print("="*60)
+
+    log = CareerEventLog(['Grinder', 'Wheel'])
+    log.add(3, clog.PROMOTION, 0, 1, 3600.0, 3240.0)
+    log.add(5, clog.FALLBACK, clog.PHASE_PRE_SESSION, True, 1, 0, 3100.0, 3240.0)
+    log.add(7, clog.DOCTRINE, 0, 1, clog.REASON_BIG_LOSS, -12.0, 0.0)
+    log.add(13, clog.STATUS, 2, 2950.0, 0, 0, 1)
+    log.add(14, clog.INSOLVENT, 1000)
+
+    for entry in log:
+        print(f"M{entry['month']} | {entry['event']}: {entry['details']}")
+
+    assert log[0]['details'] == "GRADUATED: Grinder -> Wheel (Bal: €3,600, Trailing FB will trigger @ €3,240)"
+    assert log[1]['details'] == "🔄 TRAILING DEMOTED (pre-session): Wheel -> Grinder (Bal: €3,100, fell below €3,240)"
+    assert log[2]['details'] == "Doctrine: PLATINUM → TIGHT (Big loss: -12.0u)"
+    assert log[3]['details'] == "Year 2 | €2,950 | Grinder (Baccarat) | Doctrine: TIGHT"
+    assert log[-1] == {'month': 14, 'event': 'INSOLVENT', 'details': 'Bankroll < €1000. Game Over.'}
+    assert [e['event'] for e in log[:2]] == ['PROMOTION', 'FALLBACK']
+    print("✓ Details reproduced")
+
+
+def test_counts_only():
+    """Counts-only logs keep counters and the last code, nothing else"""
+    print("\n" + "="*60)
+    print("TEST: Counts-Only Retention")
+    print("="*60)
+
+    log = CareerEventLog(['Grinder'], detail=False)
+    for m in range(1, 4):
+        log.add(m, clog.PEAK_UPDATE, 1000.0, 900.0, 810.0)
+    log.add(4, clog.INSOLVENT, 1000)
+
+    assert len(log) == 0 and list(log) == []
+    assert log.count(clog.PEAK_UPDATE) == 3
+    assert log.last_code == clog.INSOLVENT
+    assert log.count_summary() == {'PEAK_UPDATE': 3, 'INSOLVENT': 1}
+
+    assert [clog.keeps_detail(clog.RETAIN_SAMPLED, i, 2) for i in range(3)] == [True, True, False]
+    assert not clog.keeps_detail(clog.RETAIN_COUNTS, 0)
+    print("✓ Counters kept without entries")
+
+
+def test_career_retention_levels():
+    """Same seed gives the same counts with and without detail"""
+    print("\n" + "="*60)
+    print("TEST: Career Run Retention Levels")
+    print("="*60)
+
+    random.seed(11)
+    _, full_log, full_ga, _, _ = CareerManager.run_compound_career(SEQUENCE, 2000, 2, 24)
+    random.seed(11)
+    _, count_log, count_ga, _, _ = CareerManager.run_compound_career(SEQUENCE, 2000, 2, 24, event_detail=False)
+
+    print(f"Full detail: {len(full_log)} events, counts: {full_log.count_summary()}")
+    assert full_ga == count_ga
+    assert full_log.counts == count_log.counts
+    assert len(count_log) == 0
+    assert len(full_log) == sum(full_log.counts)
+    assert full_log.count(clog.STATUS) == 2, "One STATUS event per year"
+    assert clog.merge_counts([full_log, count_log])['STATUS'] == 4
+    print("✓ Retention does not change the simulation")
+
+
+if __name__ == '__main__':
+    print("\n" + "="*70)
+    print("CAREER EVENT LOG TEST SUITE")
+    print("="*70)
+
+    try:
+        test_lazy_formatting()
+        test_counts_only()
+        test_career_retention_levels()
+
+        print("\n" + "="*70)
+        print("✓ ALL TESTS PASSED")
+        print("="*70)
+
+    except AssertionError as e:
+        print(f"\n✗ TEST FAILED: {e}")
+        raise
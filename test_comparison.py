@@ -0,0 +1,88 @@
+"""
+TEST: Strategy Comparison (common random numbers)
+Strategies compared over the same universes see the same hands and spins,
+so their paired differences are much tighter than independent runs give.
+"""
+
+import numpy as np
+
+from engine import batch
+from engine.comparison import COMPARE_METRICS, compare_stats, run_comparison
+from engine.strategy_compiler import compile_strategy
+
+BAC = {'tac_bet': 'BANKER', 'tac_safety': 25, 'tac_mode': 'Standard', 'tac_base_bet': 10.0, 'tac_shoes': 1, 'years': 2, 'freq': 12}
+ROU = {'tac_bet': 'Red', 'tac_safety': 25, 'tac_mode': 'Standard', 'tac_base_bet': 5.0, 'sim_years': 2, 'sim_freq': 12,
+       'recovery_enabled': True}
+COMMON = {'years': 2, 'freq': 12, 'start_ga': 2000}
+
+
+def test_compare_stats():
+    print("\n" + "="*60)
+    print("TEST: Paired differences and intervals")
+    print("="*60)
+    rng = np.random.default_rng(0)
+    luck = rng.normal(0, 100, 400)
+    rows = [{'universe': i, **{m: np.array([luck[i], luck[i] + 5 + rng.normal(0, 1)]) for m in COMPARE_METRICS}}
+            for i in range(400)]
+    stats = compare_stats(rows, ['A', 'B'])
+    assert stats['universes'] == 400 and stats['baseline'] == 'A' and len(stats['diffs']) == len(COMPARE_METRICS)
+    d = stats['diffs'][0]
+    assert d['strategy'] == 'B' and d['ci_low'] < 5 < d['ci_high'] and d['significant']
+    assert not d['unpaired_low'] > 0  # Independent runs could not tell them apart
+    assert d['efficiency'] > 1000
+    swapped = compare_stats(rows, ['A', 'B'], baseline=1)['diffs'][0]
+    assert swapped['strategy'] == 'A' and abs(swapped['mean_diff'] + d['mean_diff']) < 1e-9
+    print(f"Δ {d['mean_diff']:.2f} [{d['ci_low']:.2f}, {d['ci_high']:.2f}], ×{d['efficiency']:.0f} fewer universes")
+
+
+def test_same_streams_for_every_strategy():
+    print("\n" + "="*60)
+    print("TEST: A strategy compared with itself differs by exactly zero")
+    print("="*60)
+    entries = [{'game': 'Baccarat', 'name': 'A', 'config': BAC}, {'game': 'Baccarat', 'name': 'A again', 'config': dict(BAC)},
+               {'game': 'Roulette', 'name': 'R', 'config': ROU}, {'game': 'Roulette', 'name': 'R again', 'config': dict(ROU)}]
+    rows, configs = run_comparison(entries, 30, seed=9, common=COMMON, max_workers=2)
+    assert [r['universe'] for r in rows] == list(range(30)) and configs[2]['years'] == 2
+    for m in COMPARE_METRICS:
+        values = np.array([r[m] for r in rows])
+        assert np.array_equal(values[:, 0], values[:, 1]) and np.array_equal(values[:, 2], values[:, 3]), m
+    inline, _ = run_comparison(entries, 30, seed=9, common=COMMON, max_workers=1)
+    assert all(np.array_equal(a['final_ga'], b['final_ga']) for a, b in zip(rows, inline))
+    print("✅ Common streams OK")
+
+
+def test_sessions_dealt_from_their_own_streams():
+    print("\n" + "="*60)
+    print("TEST: Session 2 deals the same hands whatever session 1 did")
+    print("="*60)
+    tight = dict(BAC, risk_stop=3)  # Stops session 1 earlier: fewer hands drawn before session 2
+    def session2(config, crn):
+        settings = dict(batch.lab_settings(config, 'Baccarat'), **COMMON)
+        compiled = compile_strategy(config, game_type='Baccarat')
+        result = batch.run_lab_universes('Baccarat', settings, compiled, 9, 0, 1, detail_months=1, trace_session=2, crn=crn)[0]
+        return result['y1_log'][0]['hands'], [h['outcome'] for h in result['session_trace']['hand_log']]
+    (hands_a, a), (hands_b, b) = session2(BAC, True), session2(tight, True)
+    n = min(len(a), len(b))
+    assert hands_a != hands_b and a[:n] == b[:n]
+    (_, a), (_, b) = session2(BAC, False), session2(tight, False)
+    assert a[:n] != b[:n]  # One stream per universe: session 2 starts wherever session 1 stopped
+    print(f"Session 1: {hands_a} vs {hands_b} hands, session 2: same first {n} hands")
+
+
+def test_common_streams_tighten_intervals():
+    print("\n" + "="*60)
+    print("TEST: Paired intervals of close strategies are tighter than independent runs")
+    print("="*60)
+    entries = [{'game': 'Baccarat', 'name': 'Base 10', 'config': BAC},
+               {'game': 'Baccarat', 'name': 'Base 15', 'config': dict(BAC, tac_base_bet=15.0)}]
+    rows, _ = run_comparison(entries, 100, seed=4, common=COMMON, max_workers=2)
+    d = next(d for d in compare_stats(rows, ['Base 10', 'Base 15'])['diffs'] if d['metric'] == 'final_ga')
+    assert d['efficiency'] > 3, d
+    print(f"Final GA Δ {d['mean_diff']:+,.0f} [{d['ci_low']:+,.0f}, {d['ci_high']:+,.0f}], ×{d['efficiency']:.1f} fewer universes")
+
+
+if __name__ == '__main__':
+    test_compare_stats()
+    test_same_streams_for_every_strategy()
+    test_sessions_dealt_from_their_own_streams()
+    test_common_streams_tighten_intervals()
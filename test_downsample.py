@@ -0,0 +1,52 @@
+"""
+TEST: Chart Downsampling (LTTB)
+Long series are cut to the point budget without losing their shape, and a
+zoom window comes back at full resolution.
+"""
+
+import numpy as np
+
+from utils.downsample import lttb_indices, downsample
+from ui.chart_data import _x_window
+
+
+def test_lttb_keeps_shape():
+    print("\n" + "="*60)
+    print("TEST: LTTB keeps end points and extremes")
+    print("="*60)
+    rng = np.random.default_rng(1)
+    y = np.cumsum(rng.normal(0, 10, 20000)) + 2000
+    y[12345] = y.max() + 5000  # A single-spin spike
+    y[777] = y.min() - 5000    # ... and a crash
+    x = np.arange(len(y))
+    idx = lttb_indices(x, y, 500)
+    print(f"{len(y)} -> {len(idx)} points")
+    assert len(idx) == 500 and idx[0] == 0 and idx[-1] == len(y) - 1
+    assert np.all(np.diff(idx) > 0)
+    assert 12345 in idx and 777 in idx
+
+    assert len(lttb_indices(x[:300], y[:300], 500)) == 300  # Already small enough
+    print("✅ Shape OK")
+
+
+def test_zoom_window_full_resolution():
+    print("\n" + "="*60)
+    print("TEST: Zoom window at full resolution")
+    print("="*60)
+    x = np.arange(20000, dtype=np.float64)
+    y = np.sin(x / 50.0)
+    wx, wy = downsample(x, y, 500, 1000.5, 1200.5)
+    assert wx[0] == 1000 and wx[-1] == 1201 and len(wx) == 202  # Every point in view, plus one either side
+    assert np.array_equal(wy, y[1000:1202])
+    ox, _ = downsample(x, y, 500)
+    assert len(ox) == 500
+
+    assert _x_window({'xaxis.range[0]': 10, 'xaxis.range[1]': 20}) == (10.0, 20.0)
+    assert _x_window({'xaxis.autorange': True}) == (None, None)
+    assert _x_window({'yaxis.range[0]': 1, 'yaxis.range[1]': 2}) is None
+    print("✅ Zoom OK")
+
+
+if __name__ == '__main__':
+    test_lttb_keeps_shape()
+    test_zoom_window_full_resolution()
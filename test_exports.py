@@ -0,0 +1,76 @@
+"""
+TEST: Streamed Exports
+CSV/JSON downloads come out in chunks that join up to the same file the
+csv/json modules would write, and export links belong to their owner.
+"""
+
+import csv
+import io
+import json
+import time
+
+from engine import career_log as clog
+from engine.career_log import CareerEventLog
+from utils.exports import ExportStore, batched, csv_chunks, json_chunks
+
+
+def test_csv_and_json_chunks():
+    print("\n" + "="*60)
+    print("TEST: Chunked CSV/JSON round trip")
+    print("="*60)
+    header = ['Month', 'Event', 'Details']
+    rows = [{'Month': m, 'Event': 'FALLBACK', 'Details': f'Tier 3 → 2, GA €{m * 1000:,}'} for m in range(2500)]
+
+    chunks = list(csv_chunks(header, rows, size=1000))
+    print(f"CSV: {len(chunks)} chunks")
+    assert len(chunks) == 3  # Header + 999 rows, then 1000, then the rest
+    back = list(csv.DictReader(io.StringIO(''.join(chunks))))
+    assert len(back) == 2500 and back[1234]['Details'] == rows[1234]['Details']  # Commas quoted, not replaced
+
+    chunks = list(json_chunks(rows, size=1000))
+    assert json.loads(''.join(chunks)) == rows
+    assert json.loads(''.join(json_chunks([]))) == []
+
+    assert ''.join(batched((str(i) for i in range(5)), size=2)) == '0\n1\n2\n3\n4\n'
+    print("✅ Round trip OK")
+
+
+def test_event_log_export():
+    print("\n" + "="*60)
+    print("TEST: Career event log export")
+    print("="*60)
+    log = CareerEventLog(labels=('Wheel',))
+    for m in range(600):
+        log.add(m, clog.PEAK_UPDATE, 1000.0 + m, 999.0 + m, 800.0 + m)  # Details have commas
+    log.add(600, clog.INSOLVENT, 50.0)
+    text = ''.join(csv_chunks(['Month', 'Event', 'Details'], ({'Month': l['month'], 'Event': l['event'], 'Details': l['details']} for l in log)))
+    back = list(csv.DictReader(io.StringIO(text)))
+    assert len(back) == len(log) and back[-1]['Event'] == 'INSOLVENT' and back[-1]['Details'] == log[-1]['details']
+    print(f"✅ {len(back)} events exported")
+
+
+def test_export_store():
+    print("\n" + "="*60)
+    print("TEST: Export links per owner, expiry and tab close")
+    print("="*60)
+    store = ExportStore(ttl=60, max_per_owner=2)
+    a = store.register('me', 'a.csv', lambda: iter(['x\n']), client='tab1')
+    b = store.register('me', 'b.json', lambda: iter(['[]']), client='tab2')
+    assert a.media_type == 'text/csv' and b.media_type == 'application/json'
+    assert store.get(a.token, owner='someone else') is None
+    assert ''.join(store.get(a.token, owner='me').make_chunks()) == 'x\n'
+
+    c = store.register('me', 'c.csv', lambda: iter([]), client='tab1')
+    assert store.get(a.token) is None  # Oldest link dropped past max_per_owner
+    assert store.forget_client('tab1') == 1 and store.get(c.token) is None
+    assert store.get(b.token) is not None
+
+    b.created = time.time() - 61
+    assert store.get(b.token) is None  # Expired
+    print("✅ Store OK")
+
+
+if __name__ == '__main__':
+    test_csv_and_json_chunks()
+    test_event_log_export()
+    test_export_store()
@@ -0,0 +1,83 @@
+"""
+TEST: Incremental Universes
+Verifies that extending a run only needs the extra universes: with
+per-universe seeding, the first N universes of a larger run are exactly the
+universes of an N-universe run (Baccarat Lab, Roulette Lab, Career Sim).
+"""
+
+from engine.seeding import seed_universe
+from engine.strategy_compiler import compile_strategy
+from ui.simulator import BaccaratWorker
+from ui.roulette_sim import RouletteWorker
+from ui.career_mode import CareerManager
+
+BAC = {'tac_bet': 'BANKER', 'tac_safety': 25, 'tac_mode': 'Standard', 'tac_base_bet': 10.0, 'tac_shoes': 1}
+ROU = {'tac_bet': 'Red', 'tac_safety': 25, 'tac_mode': 'Standard', 'tac_base_bet': 5.0}
+
+
+def lab_universes(worker, strat, game, seed, start, stop):
+    compiled = compile_strategy(strat, game_type=game)
+    finals = []
+    for i in range(start, stop):
+        seed_universe(seed, i)
+        res = worker.run_full_career(
+            2000, 12, 20, 300, 300, compiled.overrides, False, False, False, 25, 22500, 1.0,
+            10000, 1000, 'Standard', compiled.base_bet, tier_map=compiled.tier_map)
+        finals.append(res['final_ga'])
+    return finals
+
+
+def career_universes(seed, start, stop):
+    sequence = [{'strategy_name': 'Grinder', 'target_ga': 4000, 'config': BAC},
+                {'strategy_name': 'Wheel', 'target_ga': 100000, 'config': ROU}]
+    finals = []
+    for i in range(start, stop):
+        seed_universe(seed, i)
+        finals.append(CareerManager.run_compound_career(sequence, 2000, 1, 24, event_detail=False)[2])
+    return finals
+
+
+def test_lab_extension():
+    """Baccarat and Roulette: base run + extra universes == one larger run"""
+    print("\n" + "="*60)
+    print("TEST: Lab Extension")
+    print("="*60)
+
+    for worker, strat, game in ((BaccaratWorker, BAC, 'Baccarat'), (RouletteWorker, ROU, 'Roulette')):
+        full = lab_universes(worker, strat, game, 3, 0, 8)
+        extended = lab_universes(worker, strat, game, 3, 0, 5) + lab_universes(worker, strat, game, 3, 5, 8)
+        print(f"{game}: {[round(f) for f in full]}")
+        assert full == extended, f"{game} extension must match a single run"
+    print("✓ Labs extend without recomputing")
+
+
+def test_career_extension():
+    """Career Sim: base run + extra universes == one larger run"""
+    print("\n" + "="*60)
+    print("TEST: Career Extension")
+    print("="*60)
+
+    full = career_universes(9, 0, 6)
+    extended = career_universes(9, 0, 4) + career_universes(9, 4, 6)
+    print(f"Finals: {[round(f) for f in full]}")
+    assert full == extended
+    assert career_universes(10, 0, 2) != full[:2], "Different seeds give different universes"
+    print("✓ Career extends without recomputing")
+
+
+if __name__ == '__main__':
+    print("\n" + "="*70)
+    print("INCREMENTAL UNIVERSES TEST SUITE")
+    print("="*70)
+
+    try:
+        test_lab_extension()
+        test_career_extension()
+
+        print("\n" + "="*70)
+        print("✓ ALL TESTS PASSED")
+        print("="*70)
+
+    except AssertionError as e:
+        print(f"\n✗ TEST FAILED: {e}")
+        raise
@@ -0,0 +1,74 @@
+"""
+TEST: Hot-Path Instrumentation
+Instrumented runs report per-phase counts and times merged across worker
+processes, and play exactly the same universes as uninstrumented ones.
+"""
+
+from engine import batch, instrumentation
+from engine.instrumentation import Accumulator
+from utils.jobs import execute_job, parse_job_request, Job, DONE
+
+BAC = {'tac_bet': 'BANKER', 'tac_safety': 25, 'tac_mode': 'Standard', 'tac_base_bet': 10.0, 'tac_shoes': 1, 'years': 1, 'freq': 12}
+ROU = {'tac_bet': 'Red', 'tac_safety': 25, 'tac_mode': 'Standard', 'tac_base_bet': 5.0, 'sim_years': 1, 'sim_freq': 12,
+       'spice_zero_en': True, 'spice_disable_neg_pl': False}
+
+
+def test_accumulator():
+    print("\n" + "="*60)
+    print("TEST: Accumulator merge and report")
+    print("="*60)
+    a, b = Accumulator(), Accumulator()
+    a.add('decision', 3000, calls=3)
+    b.add('decision', 1000)
+    b.add('resolve', 6000, calls=2)
+    a.merge(b.snapshot())
+    report = {r['phase']: r for r in a.report()}
+    assert report['decision']['calls'] == 4 and report['decision']['mean_us'] == 1.0
+    assert a.report()[0]['phase'] == 'resolve' and report['resolve']['share'] == 0.6
+    with instrumentation.phase(None, 'stats'):  # No accumulator: no-op
+        pass
+    assert instrumentation.current() is None
+    print("✅ Accumulator OK")
+
+
+def test_instrumented_lab_matches_plain():
+    print("\n" + "="*60)
+    print("TEST: Instrumented lab runs == plain runs, phases merged across processes")
+    print("="*60)
+    for game, strat, phases in (('Baccarat', BAC, ('baccarat.decision', 'baccarat.resolve', 'baccarat.tier_lookup')),
+                                ('Roulette', ROU, ('roulette.decision', 'roulette.resolve', 'spice.evaluate'))):
+        plain, _ = batch.run_lab(game, strat, 30, seed=7, max_workers=2)
+        acc = Accumulator()
+        timed, _ = batch.run_lab(game, strat, 30, seed=7, max_workers=2, instrument=acc)
+        assert [r['final_ga'] for r in plain] == [r['final_ga'] for r in timed]
+        report = {r['phase']: r for r in acc.report()}
+        for p in phases:
+            assert report[p]['calls'] > 0, p
+        print(f"{game}: " + ', '.join(f"{r['phase']} {r['share']:.0%}" for r in acc.report()))
+
+
+def test_instrumented_career_and_job():
+    print("\n" + "="*60)
+    print("TEST: Career phases and the job API report")
+    print("="*60)
+    sequence = [{'strategy_name': 'Grinder', 'target_ga': 4000, 'config': BAC}]
+    acc = Accumulator()
+    batch.run_career(sequence, 5, seed=3, settings={'years': 1, 'sessions': 12}, max_workers=1, instrument=acc)
+    phases = {r['phase'] for r in acc.report()}
+    assert {'career.month', 'career.ladder', 'baccarat.decision'} <= phases
+
+    job = Job('me', parse_job_request({'lab': 'baccarat', 'config': BAC, 'universes': 5, 'instrument': True}, {}))
+    execute_job(job, max_workers=1)
+    status = job.to_dict()
+    assert status['status'] == DONE and {r['phase'] for r in status['instrumentation']} >= {'baccarat.decision', 'stats'}
+    assert any(r['name'] == f'API baccarat job {job.id}' for r in instrumentation.recent_reports())
+    plain = Job('me', parse_job_request({'lab': 'baccarat', 'config': BAC, 'universes': 5}, {}))
+    execute_job(plain, max_workers=1)
+    assert 'instrumentation' not in plain.to_dict()
+    print("✅ Career and job reports OK")
+
+
+if __name__ == '__main__':
+    test_accumulator()
+    test_instrumented_lab_matches_plain()
+    test_instrumented_career_and_job()
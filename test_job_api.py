@@ -0,0 +1,118 @@
+"""
+TEST: Simulation Job API
+Job requests are validated, jobs run in the background and their results
+come back as JSON columns or the compact .npz form.
+"""
+
+import io
+import tempfile
+import time
+
+import pytest
+
+from utils import jobs, result_cache
+from utils.jobs import Job, JobManager, execute_job, parse_job_request, DONE, CANCELLED
+from utils.scheduler import Scheduler
+from utils.result_cache import read_packed, unpack_results
+
+SAVED = {
+    'Wheel': {'tac_bet': 'Red', 'tac_safety': 25, 'tac_base_bet': 5.0, 'sim_years': 1, 'sim_freq': 12},
+}
+
+
+def wait(job, timeout=60):
+    end = time.time() + timeout
+    while not job.is_final and time.time() < end:
+        time.sleep(0.05)
+    return job
+
+
+def test_parse_job_request():
+    print("\n" + "="*60)
+    print("TEST: Job request validation")
+    print("="*60)
+    spec = parse_job_request({'lab': 'Roulette', 'strategy': 'Wheel', 'universes': 10, 'seed': 5}, SAVED)
+    assert spec['game'] == 'Roulette' and spec['settings']['years'] == 1 and spec['seed'] == 5
+    inline = parse_job_request({'lab': 'baccarat', 'config': {'tac_bet': 'BANKER'}, 'settings': {'years': 2}}, SAVED)
+    assert inline['settings']['years'] == 2
+    career = parse_job_request({'lab': 'career', 'legs': [{'strategy': 'Wheel', 'target_ga': 5000}]}, SAVED)
+    assert career['sequence'][0]['config'] == SAVED['Wheel']
+
+    for bad in ({'lab': 'poker'}, {'lab': 'roulette', 'strategy': 'Nope'}, {'lab': 'roulette', 'strategy': 'Wheel', 'universes': 0},
+                {'lab': 'roulette', 'strategy': 'Wheel', 'settings': {'bogus': 1}}, {'lab': 'career', 'legs': []}):
+        with pytest.raises(ValueError):
+            parse_job_request(bad, SAVED)
+    print("✅ Validation OK")
+
+
+def test_job_lifecycle():
+    print("\n" + "="*60)
+    print("TEST: Submit, poll and fetch a job")
+    print("="*60)
+    manager = JobManager(process_workers=1, scheduler=Scheduler(slots=1))
+    try:
+        job = manager.submit('me', parse_job_request({'lab': 'roulette', 'strategy': 'Wheel', 'universes': 30}, SAVED))
+        queued = manager.submit('me', parse_job_request({'lab': 'roulette', 'strategy': 'Wheel', 'universes': 30}, SAVED))
+        assert manager.cancel(queued.id)
+        wait(job)
+        status = job.to_dict()
+        print(f"Status: {status['status']} | chunks {status['chunks_done']}/{status['chunks_total']}")
+        assert status['status'] == DONE and status['progress'] == 1.0
+        assert manager.get(job.id, owner='someone else') is None
+        assert [j.id for j in manager.jobs('me')][0] == job.id
+
+        data = job.result_json(trajectories=True)
+        assert len(data['columns']['final_ga']) == 30 and len(data['trajectories']) == 30
+        packed, meta = read_packed(io.BytesIO(job.result_npz()))
+        assert [r['final_ga'] for r in unpack_results(packed)] == data['columns']['final_ga']
+        assert meta['job']['id'] == job.id
+        wait(queued)
+        assert queued.status == CANCELLED
+        assert manager.remove(job.id) and manager.get(job.id) is None
+    finally:
+        manager.shutdown()
+        manager.scheduler.shutdown()
+    print("✅ Lifecycle OK")
+
+
+def test_result_memory_bounds():
+    print("\n" + "="*60)
+    print("TEST: Finished jobs are bounded by bytes, large results spill to the cache")
+    print("="*60)
+    spec = parse_job_request({'lab': 'roulette', 'strategy': 'Wheel', 'universes': 20}, SAVED)
+    job = Job('me', spec)
+    execute_job(job, max_workers=1)
+    assert not hasattr(job, 'results') and job.packed()['trajectories'].dtype.name == 'float32'
+    assert job.result_bytes == result_cache.packed_nbytes(job.packed()) > 0
+
+    manager = JobManager(process_workers=1, scheduler=Scheduler(slots=1), max_finished_bytes=2 * job.result_bytes)
+    try:
+        done = [wait(manager.submit('me', spec)) for _ in range(3)]
+        while not done[-1].task.is_final:  # Evicted once its scheduler task returns
+            time.sleep(0.05)
+        assert all(j.status == DONE for j in done)
+        finished = [j for j in manager.jobs('me') if j.is_final]
+        assert len(finished) <= 2 and done[0].id not in {j.id for j in finished}
+    finally:
+        manager.shutdown()
+        manager.scheduler.shutdown()
+
+    result_cache.CACHE_DIRNAME = tempfile.mkdtemp(prefix='msbl_cache_')
+    limit, jobs.MAX_JOB_RESULT_BYTES = jobs.MAX_JOB_RESULT_BYTES, job.result_bytes - 1
+    try:
+        spilled = Job('me', spec)
+        execute_job(spilled, max_workers=1)
+    finally:
+        jobs.MAX_JOB_RESULT_BYTES = limit
+    assert spilled.result_bytes == 0 and spilled._packed is None
+    assert spilled.result_json()['columns'] == job.result_json()['columns']
+    result_cache.clear_cache()
+    with pytest.raises(LookupError):
+        spilled.packed()
+    print(f"✅ {job.result_bytes:,} bytes per job, bounds OK")
+
+
+if __name__ == '__main__':
+    test_parse_job_request()
+    test_job_lifecycle()
+    test_result_memory_bounds()
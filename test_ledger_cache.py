@@ -0,0 +1,102 @@
+"""
+TEST: Ledger Cache
+Verifies the Captain's Log ledger cache: rows appended or deleted through
+the tracker keep the cached DataFrame identical to a fresh parse of the CSV,
+and an outside edit of the file is picked up through its mtime/size.
+"""
+
+import os
+import tempfile
+import pandas as pd
+
+from ui import tracker
+
+
+def use_temp_ledger():
+    tracker.DATA_FILE = os.path.join(tempfile.mkdtemp(), 'session_log.csv')
+    tracker._ledger = tracker.LedgerCache()
+
+
+def assert_matches_disk():
+    cached = tracker.load_data()
+    fresh = tracker._read_ledger()
+    pd.testing.assert_frame_equal(cached.reset_index(drop=True), fresh, check_dtype=False)
+    return cached
+
+
+def test_incremental_append():
+    """Appends update the cached frame without a re-parse"""
+    print("\n" + "="*60)
+    print("TEST: Incremental Append")
+    print("="*60)
+    use_temp_ledger()
+
+    tracker.save_session('2025-01-01', 2000.0, 0, 0, 0, 0, 100.0, 'Opening deposit')
+    first = tracker.load_data()
+    tracker.save_session('2025-01-08', 300.0, 500.0, 650.0, 1000.0, 900.0, 150.0, '')
+    tracker.save_session('2025-01-15', 0.0, 500.0, 400.0, 0, 0, 160.0, 'Cold wheel')
+    assert tracker.load_data() is first, "Cache is updated in place, not rebuilt"
+
+    df = assert_matches_disk()
+    print(df[['date', 'session_pnl', 'cum_contrib', 'invested_capital', 'total_wealth']])
+    assert list(df['session_pnl']) == [0.0, 50.0, -100.0]
+    assert list(df['invested_capital']) == [2000.0, 2300.0, 2300.0]
+    assert df.iloc[-1]['total_wealth'] == 2250.0
+    print("✓ Derived columns current")
+
+
+def test_delete_and_outside_edit():
+    """Deletes re-derive cumulative columns; external edits invalidate"""
+    print("\n" + "="*60)
+    print("TEST: Delete + Outside Edit")
+    print("="*60)
+    use_temp_ledger()
+
+    for i in range(4):
+        tracker.save_session(f'2025-02-0{i+1}', 100.0, 0, 0, 0, 10.0 * i, 0, f'S{i}')
+    parsed = []
+    read_ledger = tracker._read_ledger
+    tracker._read_ledger = lambda: parsed.append(1) or read_ledger()
+    try:
+        tracker.delete_session(1)
+        tracker.load_data()
+    finally:
+        tracker._read_ledger = read_ledger
+    assert not parsed, "Deletes drop the row from the cached frame instead of re-parsing the CSV"
+    df = assert_matches_disk()
+    assert list(df['notes']) == ['S0', 'S2', 'S3']
+    assert list(df['cum_contrib']) == [100.0, 200.0, 300.0]
+
+    with open(tracker.DATA_FILE, 'a') as f:
+        f.write('someday,n/a,0,0,0,0,0,999,typo\n')  # Unreadable values in an unrelated row
+    tracker.delete_session(0)
+    with open(tracker.DATA_FILE) as f:
+        assert f.read().splitlines()[-1] == 'someday,n/a,0,0,0,0,0,999,typo', "Other rows are kept as stored"
+    df = tracker.load_data()  # Not compared with a fresh parse: an unreadable date reads as 'now'
+    assert list(df['notes']) == ['S2', 'S3', 'typo'] and list(df['contribution']) == [100.0, 100.0, 0]
+    tracker.delete_session(2)
+
+    with open(tracker.DATA_FILE, 'a') as f:
+        f.write('2025-03-01,50,0,0,0,0,0,999,manual\n')
+    df = assert_matches_disk()
+    print(f"Rows after outside edit: {len(df)}")
+    assert df.iloc[-1]['notes'] == 'manual'
+    print("✓ Cache stays consistent with the CSV")
+
+
+if __name__ == '__main__':
+    print("\n" + "="*70)
+    print("LEDGER CACHE TEST SUITE")
+    print("="*70)
+
+    try:
+        test_incremental_append()
+        test_delete_and_outside_edit()
+
+        print("\n" + "="*70)
+        print("✓ ALL TESTS PASSED")
+        print("="*70)
+
+    except AssertionError as e:
+        print(f"\n✗ TEST FAILED: {e}")
+        raise
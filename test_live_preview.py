@@ -0,0 +1,62 @@
+"""
+TEST: Live Multiverse Preview
+Finished chunks are handed over as they complete, and the preview's bands
+and KPIs match the labs' final figures once every universe is in.
+"""
+
+import numpy as np
+
+from engine import batch
+from engine.roulette_worker import calculate_stats
+from ui.live_preview import trajectory_bands, lab_grade, lab_kpis, career_summary, _band_ys
+
+WHEEL = {'tac_bet': 'Red', 'tac_safety': 25, 'tac_base_bet': 5.0, 'sim_years': 1, 'sim_freq': 12}
+
+
+def run_wheel(chunks):
+    return batch.run_lab('Roulette', WHEEL, 60, seed=3, max_workers=2,
+                         on_results=lambda start, res: chunks.setdefault(start, res))
+
+
+def test_chunks_stream_in():
+    print("\n" + "="*60)
+    print("TEST: Chunk results handed over as they finish")
+    print("="*60)
+    chunks = {}
+    results, config = run_wheel(chunks)
+    assert sorted(chunks) == [0, 25, 50]
+    assert [r['final_ga'] for s in sorted(chunks) for r in chunks[s]] == [r['final_ga'] for r in results]
+
+    extended, _ = batch.run_lab('Roulette', WHEEL, 80, seed=3, max_workers=1, start=60)
+    assert len(extended) == 20
+    print("✅ Streaming OK")
+
+
+def test_preview_matches_final_figures():
+    print("\n" + "="*60)
+    print("TEST: Preview bands and KPIs == final analysis")
+    print("="*60)
+    results, config = run_wheel({})
+    months = config['years'] * 12
+    stats = calculate_stats(results, config, config['start_ga'], months)
+    bands = trajectory_bands([r['trajectory'] for r in results])
+    for key in ('min_band', 'max_band', 'p25_band', 'p75_band', 'mean_line', 'median_line'):
+        assert np.allclose(bands[key], stats[key])
+    assert bands['months'] == stats['months']
+
+    g = lab_grade(stats, months, len(results))
+    assert g['grade'] in 'ABCDF' and 0 <= g['survival'] <= 100
+    kpis = lab_kpis(stats, months, len(results))
+    print(f"KPIs: {kpis}")
+    assert kpis['GRADE'][0].startswith(g['grade'])
+
+    ys = _band_ys(stats)
+    assert len(ys) == 4 and len(ys[0]) == 2 * len(stats['months'])
+
+    assert career_summary([{'trajectory': [], 'final': 0, 'monthly_cost': 0}]) == (None, {})
+    print("✅ Preview OK")
+
+
+if __name__ == '__main__':
+    test_chunks_stream_in()
+    test_preview_matches_final_figures()
@@ -0,0 +1,55 @@
+"""
+TEST: Lazy Module Registry
+Labs are imported on first use, not when main.py / ui is imported.
+"""
+
+import subprocess
+import sys
+
+from ui import module_registry
+
+
+def test_ui_package_is_lazy():
+    print("\n" + "="*60)
+    print("TEST: Importing ui.tracker does not import the labs")
+    print("="*60)
+    code = ("import sys, ui.tracker; "
+            "print(any(m in sys.modules for m in ('ui.simulator', 'ui.career_mode', 'ui.roulette_sim')))")
+    out = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout.strip()
+    print(f"Labs imported: {out}")
+    assert out.endswith('False')
+
+
+def test_server_start_is_light():
+    print("\n" + "="*60)
+    print("TEST: Importing main / api does not import the simulation stack")
+    print("="*60)
+    for module in ('api', 'main'):
+        code = (f"import sys, {module}; "
+                "print([m for m in ('numpy', 'engine.batch', 'utils.jobs', 'engine.profiling') if m in sys.modules])")
+        out = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout.strip()
+        print(f"{module}: loaded {out.splitlines()[-1]}")
+        assert out.endswith('[]')
+
+
+def test_get_page_and_prewarm():
+    print("\n" + "="*60)
+    print("TEST: get_page resolves and caches page functions")
+    print("="*60)
+    page = module_registry.get_page('docs')
+    assert callable(page)
+    assert module_registry.get_page('docs') is page
+    assert module_registry.is_loaded('docs')
+
+    module_registry.prewarm(['tracker'])
+    assert module_registry.is_loaded('tracker')
+
+    from ui import show_simulator  # Lazy package re-export still works
+    assert callable(show_simulator)
+    print("✅ Registry OK")
+
+
+if __name__ == '__main__':
+    test_ui_package_is_lazy()
+    test_server_start_is_light()
+    test_get_page_and_prewarm()
@@ -0,0 +1,102 @@
+"""
+TEST: Profile Store
+Verifies the SQLite profile store: one-time profile.json migration,
+per-strategy writes, the read cache seeing writes from another connection,
+and the legacy whole-profile save touching only changed rows.
+"""
+
+import json
+import os
+import tempfile
+
+from utils.profile_store import ProfileStore
+
+
+def make_legacy(tmp):
+    path = os.path.join(tmp, 'profile.json')
+    with open(path, 'w') as f:
+        json.dump({'ga': 3500.0, 'saved_strategies': {'Alpha': {'tac_bet': 'BANKER'}, 'Beta': {'tac_bet': 'Red'}}}, f)
+    return path
+
+
+def test_migration():
+    """profile.json is imported once"""
+    print("\n" + "="*60)
+    print("TEST: Migration")
+    print("="*60)
+
+    tmp = tempfile.mkdtemp()
+    legacy = make_legacy(tmp)
+    db = os.path.join(tmp, 'profile.db')
+
+    store = ProfileStore(db, legacy)
+    print(f"Strategies: {store.strategy_names()}, GA: {store.get_setting('ga')}")
+    assert store.strategy_names() == ['Alpha', 'Beta']
+    assert store.get_setting('ga') == 3500.0
+    assert store.get_strategy('Beta') == {'tac_bet': 'Red'}
+    store.delete_strategy('Alpha')
+    store.close()
+
+    # Reopening does not re-import the JSON file
+    store = ProfileStore(db, legacy)
+    assert store.strategy_names() == ['Beta']
+    print("✓ Imported once")
+
+
+def test_concurrent_connections():
+    """A second connection's writes invalidate the read cache"""
+    print("\n" + "="*60)
+    print("TEST: Concurrent Connections")
+    print("="*60)
+
+    tmp = tempfile.mkdtemp()
+    db = os.path.join(tmp, 'profile.db')
+    a = ProfileStore(db)
+    b = ProfileStore(db)
+
+    a.save_strategy('Alpha', {'tac_bet': 'BANKER'})
+    assert b.get_strategy('Alpha') == {'tac_bet': 'BANKER'}
+    b.save_strategy('Gamma', {'tac_bet': 'PLAYER'})
+    a.set_setting('ga', 4200.0)
+    print(f"A sees: {a.strategy_names()}, B sees GA: {b.get_setting('ga')}")
+    assert a.strategy_names() == ['Alpha', 'Gamma'], "Neither write is lost"
+    assert b.get_setting('ga') == 4200.0
+
+    # Returned configs are copies
+    cfg = a.get_strategy('Alpha'); cfg['tac_bet'] = 'TIE'
+    assert a.get_strategy('Alpha') == {'tac_bet': 'BANKER'}
+    print("✓ Writes from both connections visible")
+
+
+def test_replace_profile():
+    """Legacy whole-profile save keeps working"""
+    print("\n" + "="*60)
+    print("TEST: Whole-Profile Save")
+    print("="*60)
+
+    tmp = tempfile.mkdtemp()
+    store = ProfileStore(os.path.join(tmp, 'profile.db'), make_legacy(tmp))
+    store.replace_profile({'ga': 1000.0, 'saved_strategies': {'Beta': {'tac_bet': 'Black'}, 'Delta': {}}})
+    assert store.strategy_names() == ['Beta', 'Delta']
+    assert store.get_strategy('Beta') == {'tac_bet': 'Black'}
+    assert store.get_setting('ga') == 1000.0
+    print("✓ Snapshot applied")
+
+
+if __name__ == '__main__':
+    print("\n" + "="*70)
+    print("PROFILE STORE TEST SUITE")
+    print("="*70)
+
+    try:
+        test_migration()
+        test_concurrent_connections()
+        test_replace_profile()
+
+        print("\n" + "="*70)
+        print("✓ ALL TESTS PASSED")
+        print("="*70)
+
+    except AssertionError as e:
+        print(f"\n✗ TEST FAILED: {e}")
+        raise
@@ -0,0 +1,78 @@
+"""
+TEST: Run Profiling
+A profiled sample replays the run's own universes, and the report groups the
+engine functions by project module (with raw stats pstats can read).
+"""
+
+import os
+import pstats
+import tempfile
+
+from engine import batch, profiling
+from utils.jobs import execute_job, parse_job_request, job_cost, Job, DONE
+
+ROU = {'tac_bet': 'Red', 'tac_safety': 25, 'tac_mode': 'Standard', 'tac_base_bet': 5.0, 'sim_years': 1, 'sim_freq': 12,
+       'spice_zero_en': True, 'spice_disable_neg_pl': False}
+
+
+def test_sample_universes():
+    print("\n" + "="*60)
+    print("TEST: Sampled universes")
+    print("="*60)
+    assert profiling.sample_universes(100, 4) == [0, 25, 50, 75]
+    assert profiling.sample_universes(3, 10) == [0, 1, 2]
+    assert profiling.module_of(os.path.join(profiling.PROJECT_ROOT, 'engine', 'spice_system.py')) == 'engine/spice_system.py'
+    assert profiling.module_of('~') == 'built-ins'
+    print("✅ Sampling OK")
+
+
+def test_profile_lab_report():
+    print("\n" + "="*60)
+    print("TEST: Lab profile grouped by module")
+    print("="*60)
+    report, stats = profiling.profile_lab('Roulette', ROU, 40, seed=7, sample=3)
+    modules = {m['module']: m for m in report['modules']}
+    for m in ('engine/roulette_worker.py', 'engine/spice_system.py'):
+        assert modules[m]['functions'] > 0, m
+    assert abs(sum(m['share'] for m in report['modules']) - 1) < 0.01
+    assert report['universes'] == [0, 13, 26]
+    for m in report['modules'][:5]:
+        print(f"{m['module']:<32} {m['share']:.1%}")
+
+    with tempfile.TemporaryDirectory() as d:
+        path = os.path.join(d, 'run.prof')
+        with open(path, 'wb') as f:
+            f.write(profiling.profile_stats_bytes(stats))
+        assert pstats.Stats(path).total_calls > 0
+    print("✅ Report OK")
+
+
+def test_profiled_job():
+    print("\n" + "="*60)
+    print("TEST: Profiled API job")
+    print("="*60)
+    plain = parse_job_request({'lab': 'roulette', 'config': ROU, 'universes': 20}, {})
+    spec = parse_job_request({'lab': 'roulette', 'config': ROU, 'universes': 20, 'profile': 2}, {})
+    assert plain['profile'] == 0 and spec['profile'] == 2 and job_cost(spec) > job_cost(plain)
+    job = Job('me', spec)
+    execute_job(job, max_workers=1)
+    status = job.to_dict()
+    assert status['status'] == DONE and status['profile']['universes'] == [0, 10]
+    assert 'functions' not in status['profile'] and job.profile['functions']
+    assert any(p['name'] == f'API roulette job {job.id}' for p in profiling.recent_profiles())
+    # Profiling replays universes, it does not change the run's results
+    results, _ = batch.run_lab('Roulette', ROU, 20, seed=spec['seed'], config=spec['settings'], max_workers=1)
+    assert [r['final_ga'] for r in results] == list(job.packed()['columns']['final_ga'])
+    for bad in ({'profile': 'yes'}, {'profile': 0}, {'profile': 10000}):
+        try:
+            parse_job_request(dict({'lab': 'roulette', 'config': ROU}, **bad), {})
+        except ValueError:
+            continue
+        raise AssertionError(f'accepted {bad}')
+    print("✅ Job profile OK")
+
+
+if __name__ == '__main__':
+    test_sample_universes()
+    test_profile_lab_report()
+    test_profiled_job()
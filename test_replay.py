@@ -0,0 +1,66 @@
+"""
+TEST: Universe Replay
+Any universe of a multiverse run can be replayed from its seed with full
+tracing, and the replay is the very universe the run played.
+"""
+
+from engine import batch
+from engine.replay import pick_universes, replay_career_universe, replay_lab_universe
+
+BAC = {'tac_bet': 'BANKER', 'tac_safety': 25, 'tac_mode': 'Standard', 'tac_base_bet': 10.0, 'tac_shoes': 1, 'years': 2, 'freq': 12}
+ROU = {'tac_bet': 'Red', 'tac_safety': 25, 'tac_mode': 'Standard', 'tac_base_bet': 5.0, 'sim_years': 2, 'sim_freq': 12,
+       'spice_zero_en': True, 'recovery_enabled': True}
+
+
+def test_pick_universes():
+    print("\n" + "="*60)
+    print("TEST: Worst / P10 / median / P90 / best picks")
+    print("="*60)
+    results = [{'final_ga': float(v), 'universe': i} for i, v in enumerate([50, 10, 90, 30, 70, 20, 60, 40, 80, 0, 100])]
+    picks = pick_universes(results)
+    assert picks == {'WORST': 9, 'P10': 1, 'MEDIAN': 0, 'P90': 2, 'BEST': 10}, picks
+    career = [{'final': 5.0, 'universe': 0}, {'final': 1.0, 'universe': 1, 'error': 'boom'}, {'final': 3.0, 'universe': 2}]
+    assert pick_universes(career, key='final') == {'WORST': 2, 'P10': 2, 'MEDIAN': 2, 'P90': 0, 'BEST': 0}
+    assert pick_universes([]) == {}
+    print("✅ Picks OK")
+
+
+def test_lab_replay_matches_run():
+    print("\n" + "="*60)
+    print("TEST: Replayed lab universes == the run's universes, fully traced")
+    print("="*60)
+    for game, strat, log_key in (('Baccarat', BAC, 'hand_log'), ('Roulette', ROU, 'spin_log')):
+        results, config = batch.run_lab(game, strat, 12, seed=5, max_workers=2)
+        assert [r['universe'] for r in results] == list(range(12))
+        assert results[0]['y1_log'] and not results[1]['y1_log']
+        for label, index in pick_universes(results).items():
+            replay = replay_lab_universe(game, strat, index, seed=5, config=config, trace_session=3)
+            assert replay['trajectory'] == results[index]['trajectory'], (game, label)
+            assert replay['final_ga'] == results[index]['final_ga']
+            log = replay['y1_log']
+            assert max(e['month'] for e in log) == config['years'] * 12  # Every month, not just Year 1
+            trace = replay['session_trace']
+            entry = next(e for e in log if e['session'] == 3)
+            assert trace['session'] == 3 and trace['pnl'] == entry['result'] and trace['month'] == entry['month']
+            assert trace[log_key] and abs(trace[log_key][-1]['session_pl'] - trace['pnl']) < 1e-6
+        print(f"{game}: {len(log)} sessions logged, session 3 traced ({len(trace[log_key])} rounds)")
+
+
+def test_career_replay_matches_run():
+    print("\n" + "="*60)
+    print("TEST: Replayed Career Sim universe keeps its full event log")
+    print("="*60)
+    sequence = [{'strategy_name': 'Grinder', 'target_ga': 4000, 'config': dict(BAC, years=1)}]
+    settings = {'years': 1, 'sessions': 12, 'retention': 'counts'}
+    results, settings = batch.run_career(sequence, 4, seed=3, settings=settings, max_workers=1)
+    assert not results[3]['log'].detail
+    replay = replay_career_universe(sequence, 3, seed=3, settings=settings)
+    assert replay['universe'] == 3 and replay['trajectory'] == results[3]['trajectory']
+    assert replay['log'].detail and replay['log'].counts == results[3]['log'].counts
+    print("✅ Career replay OK")
+
+
+if __name__ == '__main__':
+    test_pick_universes()
+    test_lab_replay_matches_run()
+    test_career_replay_matches_run()
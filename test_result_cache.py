@@ -0,0 +1,150 @@
+"""
+TEST: Result Cache
+Verifies the on-disk multiverse cache: pack/unpack round-trips nested result
+dicts, entries survive a reload from disk, LRU eviction keeps the newest
+entries, and per-universe seeding makes reruns reproducible.
+"""
+
+import os
+import tempfile
+import time
+import numpy as np
+
+from engine.seeding import seed_universe
+from engine.strategy_compiler import compile_strategy
+from engine import career_log as clog
+from engine.career_log import CareerEventLog
+from ui.simulator import BaccaratWorker
+from utils import result_cache
+
+STRAT = {'tac_bet': 'BANKER', 'tac_safety': 25, 'tac_mode': 'Standard', 'tac_base_bet': 10.0, 'tac_shoes': 1}
+
+
+def use_temp_cache():
+    result_cache.CACHE_DIRNAME = tempfile.mkdtemp(prefix='msbl_cache_')
+
+
+def run_universes(seed, n):
+    compiled = compile_strategy(STRAT, game_type='Baccarat')
+    results = []
+    for i in range(n):
+        seed_universe(seed, i)
+        results.append(BaccaratWorker.run_full_career(
+            2000, 12, 20, 300, 300, compiled.overrides, False, False, False, 25, 22500, 1.0,
+            10000, 1000, 'Standard', 10.0, track_y1_details=(i == 0), tier_map=compiled.tier_map))
+    return results
+
+
+def test_pack_round_trip():
+    """Scalar columns, nested dicts and JSON objects come back unchanged"""
+    print("\n" + "="*60)
+    print("TEST: Pack / Unpack Round Trip")
+    print("="*60)
+
+    results = [
+        {'trajectory': [1.0, 2.0], 'final_ga': 2.0, 'failed_y1': False, 'gold_year': -1,
+         'spice_stats': {'total_cost': 5.0, 'distribution': {'TIERS': 1}}, 'y1_log': [{'month': 1}]},
+        {'trajectory': [3.0, 4.0], 'final_ga': 4.0, 'failed_y1': True, 'gold_year': 2,
+         'spice_stats': {'total_cost': 0.0, 'distribution': {'TIERS': 0}}, 'y1_log': []},
+    ]
+    packed = result_cache.pack_results(results)
+    print(f"Columns: {sorted(packed['columns'])}")
+    assert packed['trajectories'].dtype == np.float32
+    assert 'spice_stats/distribution/TIERS' in packed['columns']
+
+    back = result_cache.unpack_results(packed)
+    assert back[1]['failed_y1'] is True and back[1]['gold_year'] == 2
+    assert back[0]['spice_stats'] == {'total_cost': 5.0, 'distribution': {'TIERS': 1}}
+    assert back[0]['y1_log'] == [{'month': 1}]
+    assert list(back[1]['trajectory']) == [3.0, 4.0]
+    print("✓ Round trip exact")
+
+
+def test_disk_cache_and_seeding():
+    """Seeded runs are reproducible and load back from disk"""
+    print("\n" + "="*60)
+    print("TEST: Disk Cache + Seeded Reruns")
+    print("="*60)
+    use_temp_cache()
+
+    first = run_universes(7, 5)
+    second = run_universes(7, 5)
+    assert [r['final_ga'] for r in first] == [r['final_ga'] for r in second], "Same seed, same multiverse"
+
+    key = result_cache.result_key('baccarat', strategy=STRAT, universes=5, seed=7)
+    assert key == result_cache.result_key('baccarat', seed=7, universes=5, strategy=dict(reversed(list(STRAT.items()))))
+    assert result_cache.load_result(key) is None
+
+    result_cache.save_result(key, result_cache.pack_results(first), {'seed': 7})
+    packed, meta = result_cache.load_result(key)
+    loaded = result_cache.unpack_results(packed)
+    print(f"Loaded {len(loaded)} universes, meta={meta}")
+    assert meta == {'seed': 7}
+    assert np.allclose([r['final_ga'] for r in loaded], [r['final_ga'] for r in first])
+    assert loaded[0]['y1_log'] == first[0]['y1_log']
+
+    # Results of older worker code are never served: every key carries the result version
+    version = result_cache.RESULT_VERSION
+    try:
+        result_cache.RESULT_VERSION = version + 1
+        assert result_cache.load_result(result_cache.result_key('baccarat', strategy=STRAT, universes=5, seed=7)) is None
+    finally:
+        result_cache.RESULT_VERSION = version
+    print("✓ Cache hit matches the computed run")
+
+
+def test_lru_eviction():
+    """Oldest entries go first when the cache is over budget"""
+    print("\n" + "="*60)
+    print("TEST: LRU Eviction")
+    print("="*60)
+    use_temp_cache()
+
+    packed = result_cache.pack_results([{'trajectory': list(np.random.rand(500)), 'final_ga': 1.0}])
+    for i, name in enumerate(('old', 'mid', 'new')):
+        result_cache.save_result(name, packed)
+        path = os.path.join(result_cache.cache_dir(), f'{name}.npz')
+        os.utime(path, (time.time() - 100 + i, time.time() - 100 + i))
+
+    size = os.path.getsize(os.path.join(result_cache.cache_dir(), 'new.npz'))
+    result_cache.load_result('old')  # Touch: 'old' becomes most recently used
+    result_cache.evict(max_bytes=size * 2)
+    remaining = sorted(f for f in os.listdir(result_cache.cache_dir()))
+    print(f"Remaining: {remaining}")
+    assert remaining == ['new.npz', 'old.npz']
+    print("✓ Least recently used entry evicted")
+
+
+def test_career_log_serialization():
+    """Career event logs survive the JSON side of the cache"""
+    print("\n" + "="*60)
+    print("TEST: Career Log Serialization")
+    print("="*60)
+
+    log = CareerEventLog(['A', 'B'])
+    log.add(2, clog.PROMOTION, 0, 1, 3600.0, 3240.0)
+    log.add(3, clog.INSOLVENT, 1000)
+    back = CareerEventLog.from_dict(log.to_dict())
+    assert list(back) == list(log)
+    assert back.counts == log.counts and back.last_code == clog.INSOLVENT
+    print("✓ Log restored")
+
+
+if __name__ == '__main__':
+    print("\n" + "="*70)
+    print("RESULT CACHE TEST SUITE")
+    print("="*70)
+
+    try:
+        test_pack_round_trip()
+        test_disk_cache_and_seeding()
+        test_lru_eviction()
+        test_career_log_serialization()
+
+        print("\n" + "="*70)
+        print("✓ ALL TESTS PASSED")
+        print("="*70)
+
+    except AssertionError as e:
+        print(f"\n✗ TEST FAILED: {e}")
+        raise
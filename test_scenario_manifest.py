@@ -0,0 +1,76 @@
+"""
+TEST: Scenario Manifest Runner
+Manifests expand to (strategy x ecosystem) scenarios and career ladders,
+shared work is done once, and every row matches a standalone batch run.
+"""
+
+import pytest
+
+from engine import batch, scenarios, strategy_compiler
+from engine.career_manager import CareerManager
+from engine.strategy_compiler import compile_strategy
+
+SAVED = {
+    'Grinder': {'tac_bet': 'BANKER', 'tac_safety': 25, 'tac_base_bet': 10.0, 'tac_shoes': 1, 'years': 1, 'freq': 12},
+    'Wheel': {'tac_bet': 'Red', 'tac_safety': 25, 'tac_base_bet': 5.0, 'sim_years': 1, 'sim_freq': 12},
+}
+
+MANIFEST = {
+    'seed': 11, 'universes': 20,
+    'ecosystems': {'base': {}, 'rich': {'eco_win': 600, 'eco_loss': 600}},
+    'career_settings': {'years': 1, 'sessions': 24},
+    'scenarios': [
+        {'game': 'Baccarat', 'strategy': 'Grinder', 'ecosystems': ['base', 'rich']},
+        {'game': 'Roulette', 'strategies': ['Wheel']},
+        {'game': 'Baccarat', 'strategy': 'Grinder', 'ecosystem': 'base', 'name': 'Grinder again'},
+        {'name': 'Ladder', 'career': [['Grinder', 4000], ['Wheel', 100000]]},
+    ]
+}
+
+
+def test_expand_and_dedup():
+    print("\n" + "="*60)
+    print("TEST: Manifest expansion and shared work")
+    print("="*60)
+    sc = scenarios.expand_manifest(MANIFEST, SAVED)
+    assert [s['name'] for s in sc] == ['Grinder @ base', 'Grinder @ rich', 'Wheel @ base', 'Grinder again @ base', 'Ladder @ base']
+    plan = scenarios.plan_manifest(sc)
+    print(f"Plan: {plan['stats']}")
+    assert plan['stats']['unique_runs'] == 4  # 'Grinder again' is the same run as 'Grinder @ base'
+    assert plan['stats']['unique_compiles'] == 4  # Ecosystems share the lab compiles, the ladder has its career ones
+    assert sorted(profile for _, _, profile in plan['compiles']) == ['career', 'career', 'lab', 'lab']
+    assert compile_strategy(sc[0]['spec']['strategy'], 'Baccarat') is compile_strategy(sc[1]['spec']['strategy'], 'Baccarat')
+    scenarios.warm_caches(plan['compiles'])
+    warmed = len(strategy_compiler._cache)
+    for leg in sc[4]['spec']['sequence']:  # The career legs hit the warmed entries
+        CareerManager._extract_params(leg['config'])
+    assert len(strategy_compiler._cache) == warmed
+
+    with pytest.raises(ValueError):
+        scenarios.expand_manifest({'scenarios': [{'game': 'Baccarat', 'strategy': 'Missing'}]}, SAVED)
+    with pytest.raises(ValueError):
+        scenarios.expand_manifest({'scenarios': [{'game': 'Baccarat', 'strategy': 'Grinder', 'ecosystem': 'nope'}]}, SAVED)
+
+
+def test_rows_match_standalone_runs():
+    print("\n" + "="*60)
+    print("TEST: Manifest rows == standalone batch runs")
+    print("="*60)
+    rows, run_results, plan = scenarios.run_manifest(MANIFEST, SAVED, max_workers=2)
+    print(scenarios.format_table(rows))
+    by_name = {r['scenario']: r for r in rows}
+    assert by_name['Grinder @ base']['final_ga_mean'] == by_name['Grinder again @ base']['final_ga_mean']
+
+    alone, _ = batch.run_lab('Roulette', SAVED['Wheel'], 20, seed=11, max_workers=1)
+    assert [r['final_ga'] for r in run_results[by_name['Wheel @ base']['run']]] == [r['final_ga'] for r in alone]
+
+    sequence = [{'strategy_name': 'Grinder', 'target_ga': 4000.0, 'config': dict(SAVED['Grinder'])},
+                {'strategy_name': 'Wheel', 'target_ga': 100000.0, 'config': dict(SAVED['Wheel'])}]
+    career, _ = batch.run_career(sequence, 20, seed=11, settings={'years': 1, 'sessions': 24}, max_workers=1)
+    assert [r['final'] for r in run_results[by_name['Ladder @ base']['run']]] == [r['final'] for r in career]
+    print("✅ Rows match")
+
+
+if __name__ == '__main__':
+    test_expand_and_dedup()
+    test_rows_match_standalone_runs()
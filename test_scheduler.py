@@ -0,0 +1,95 @@
+"""
+TEST: Simulation Scheduler
+Runs are admitted by cost, dispatched fairly between users, and cancelled
+inside the session loops (threads and worker processes alike).
+"""
+
+import threading
+import time
+
+import pytest
+
+from engine import batch
+from engine.cancellation import Cancelled
+from utils.scheduler import Scheduler, AdmissionError, estimate_cost, report_progress, CANCELLED, DONE
+
+SAVED = {'Wheel': {'tac_bet': 'Red', 'tac_safety': 25, 'tac_base_bet': 5.0, 'sim_years': 1, 'sim_freq': 12}}
+
+
+def test_admission_control():
+    print("\n" + "="*60)
+    print("TEST: Admission by estimated cost")
+    print("="*60)
+    assert estimate_cost(1000, 120, 10 / 12) == 100000
+    scheduler = Scheduler(slots=1, max_task_cost=100, max_owner_cost=150)
+    gate = threading.Event()
+    try:
+        with pytest.raises(AdmissionError):
+            scheduler.submit('alice', gate.wait, cost=101)
+        first = scheduler.submit('alice', gate.wait, cost=100)
+        with pytest.raises(AdmissionError):
+            scheduler.submit('alice', gate.wait, cost=60)  # 160 > 150 queued/running for alice
+        other = scheduler.submit('bob', gate.wait, cost=100)  # Limits are per user
+        gate.set()
+        assert first.future.result(timeout=10) and other.future.result(timeout=10)
+        scheduler.submit('alice', gate.wait, cost=100).future.result(timeout=10)  # Budget freed once done
+    finally:
+        scheduler.shutdown()
+    print("✅ Admission OK")
+
+
+def test_fair_share():
+    print("\n" + "="*60)
+    print("TEST: Fair share between users")
+    print("="*60)
+    scheduler = Scheduler(slots=1)
+    gate = threading.Event()
+    order = []
+    try:
+        blocker = scheduler.submit('alice', gate.wait)
+        while blocker.status != 'running':
+            time.sleep(0.01)
+        tasks = [scheduler.submit('alice', order.append, (f'alice{i}',)) for i in range(3)]
+        tasks += [scheduler.submit('bob', order.append, (f'bob{i}',)) for i in range(2)]
+        assert scheduler.queue_position(tasks[-1]) == 4
+        gate.set()
+        for t in tasks:
+            t.future.result(timeout=10)
+        print(f"Order: {order}")
+        assert order == ['bob0', 'alice0', 'bob1', 'alice1', 'alice2']
+    finally:
+        scheduler.shutdown()
+    print("✅ Fair share OK")
+
+
+def test_cancel_running_and_queued():
+    print("\n" + "="*60)
+    print("TEST: Cancellation inside the session loops")
+    print("="*60)
+    scheduler = Scheduler(slots=1)
+    try:
+        for workers in (1, 2):  # In the slot thread, then in worker processes
+            task = scheduler.submit('alice', batch.run_lab, ('Roulette', SAVED['Wheel'], 5000),
+                                    dict(max_workers=workers, on_chunk=report_progress), client='tab-1')
+            queued = scheduler.submit('alice', batch.run_lab, ('Roulette', SAVED['Wheel'], 10), client='tab-1')
+            while task.status != 'running':
+                time.sleep(0.01)
+            time.sleep(0.3)
+            start = time.perf_counter()
+            assert scheduler.cancel_client('tab-1') == 2  # The tab went away
+            with pytest.raises(Cancelled):
+                task.future.result(timeout=30)
+            print(f"workers={workers}: stopped after {time.perf_counter() - start:.2f}s at chunk {task.done}/{task.total}")
+            assert task.status == CANCELLED and queued.status == CANCELLED
+            assert task.done < task.total
+        done = scheduler.submit('alice', batch.run_lab, ('Roulette', SAVED['Wheel'], 10), dict(max_workers=1))
+        assert len(done.future.result(timeout=30)[0]) == 10 and done.status == DONE
+    finally:
+        scheduler.shutdown()
+    print("✅ Cancellation OK")
+
+
+if __name__ == '__main__':
+    test_admission_control()
+    test_fair_share()
+    test_cancel_running_and_queued()
@@ -0,0 +1,81 @@
+"""
+TEST: Session Histograms
+Every session of every lab universe lands in its tier's fixed-bin histograms,
+the counts agree with the Year 1 per-session log, and they merge the same
+whatever the chunking, processes or result cache round trip.
+"""
+
+from collections import Counter
+
+import numpy as np
+
+from engine import batch
+from engine import session_histograms as sh
+from engine.strategy_compiler import compile_strategy
+from utils.result_cache import pack_results, unpack_results
+
+BAC = {'tac_bet': 'BANKER', 'tac_safety': 25, 'tac_mode': 'Standard', 'tac_base_bet': 10.0, 'tac_shoes': 1,
+       'tac_tie_bet': True, 'years': 1, 'freq': 12}
+ROU = {'tac_bet': 'Red', 'tac_safety': 25, 'tac_mode': 'Standard', 'tac_base_bet': 5.0, 'sim_years': 1, 'sim_freq': 12,
+       'recovery_en': True}
+
+
+def test_bins():
+    print("\n" + "="*60)
+    print("TEST: Fixed bins")
+    print("="*60)
+    h = sh.SessionHistograms()
+    h.add(2, 'STOP_LOSS', 0, 0.0, 0)
+    h.add(2, 'TARGET', 250, 7.5, 12, ties=3, tie_bets=2)
+    h.add(9, 'TIME_LIMIT', 45, 40, 1)  # Deeper tiers count in the last one
+    summary = sh.summarize(h.to_array())
+    assert summary['sessions'] == 3 and summary['tiers'] == {2: 2, 6: 1}
+    assert summary['exit'][2] == [0, 1, 1, 0, 0]
+    assert summary['length'][2][0] == 1 and summary['length'][2][-1] == 1
+    assert summary['peak_units']['labels'][summary['peak_units'][2].index(1, 1)] == '6-7'
+    assert summary['press_streak']['labels'][-1] == '10+' and summary['press_streak'][2][-1] == 1
+    assert summary['ties'][2][3] == 1 and summary['tie_bets'][2][2] == 1
+    assert sh.merge([h.to_array(), h.to_array()]).sum() == 2 * h.to_array().sum()
+    print("✅ Bins OK")
+
+
+def test_histograms_match_year1_log():
+    print("\n" + "="*60)
+    print("TEST: One-year universe histograms == its per-session Year 1 log")
+    print("="*60)
+    for game, strat, length_key in (('Baccarat', BAC, 'hands'), ('Roulette', ROU, 'spins')):
+        config = batch.lab_settings(strat, game)
+        universe = batch.run_lab_universes(game, config, compile_strategy(strat, game_type=game), 11, 0, 1)[0]
+        played = [e for e in universe['y1_log'] if e['exit'] != 'INSOLVENT']
+        summary = sh.summarize(universe['session_hist'])
+        assert summary['sessions'] == len(played) > 0
+        exits = Counter((e['tier'], e['exit']) for e in played)
+        for (tier, reason), n in exits.items():
+            assert summary['exit'][tier][sh.EXIT_REASONS.index(reason)] == n, (game, tier, reason)
+        from_log = sh.SessionHistograms()
+        for e in played:
+            from_log.add(e['tier'], e['exit'], e[length_key], 0, 0, e.get('tie_count', 0), e.get('tie_bets', 0))
+        expected = sh.summarize(from_log.to_array())
+        for metric in ('length', 'ties', 'tie_bets'):
+            assert expected[metric] == summary[metric], (game, metric)
+        print(f"{game}: {summary['sessions']} sessions, exits {dict(zip(sh.EXIT_REASONS, summary['exit']['all']))}")
+
+
+def test_merge_independent_of_chunking():
+    print("\n" + "="*60)
+    print("TEST: Merged histograms independent of processes and cache round trip")
+    print("="*60)
+    one, settings = batch.run_lab('Roulette', ROU, 30, seed=5, max_workers=1)
+    two, _ = batch.run_lab('Roulette', ROU, 30, seed=5, max_workers=2)
+    assert np.array_equal(sh.results_hist(one), sh.results_hist(two))
+    back = unpack_results(pack_results(one))
+    assert np.array_equal(sh.results_hist(back), sh.results_hist(one))
+    summary = batch.lab_stats('Roulette', one, settings)['session_shape']
+    assert summary['sessions'] == int(sh.results_hist(one).sum() // len(sh.METRICS))
+    print(f"✅ {summary['sessions']} sessions merged")
+
+
+if __name__ == '__main__':
+    test_bins()
+    test_histograms_match_year1_log()
+    test_merge_independent_of_chunking()
@@ -0,0 +1,128 @@
+"""
+TEST: Session Log Store
+Verifies the append-only session log: newest-first pages, tombstone
+deletion, compaction, legacy JSON import and recovery from an interrupted
+append.
+"""
+
+import json
+import os
+import tempfile
+
+from utils import session_log_store
+from utils.session_log_store import SessionLogStore
+
+
+def new_store(legacy=None):
+    tmp = tempfile.mkdtemp()
+    legacy_path = None
+    if legacy is not None:
+        legacy_path = os.path.join(tmp, 'session_logs.json')
+        with open(legacy_path, 'w') as f:
+            json.dump(legacy, f)
+    return SessionLogStore(os.path.join(tmp, 'session_logs.jsonl'), legacy_path)
+
+
+def test_pages_newest_first():
+    """Pages come newest first and skip deleted entries"""
+    print("\n" + "="*60)
+    print("TEST: Newest-First Pages")
+    print("="*60)
+
+    store = new_store()
+    ids = [store.append({'date': f'2025-01-{d:02d}', 'pnl': d}) for d in range(1, 26)]
+    assert ids == list(range(1, 26))
+    assert [r['pnl'] for r in store.page(0, 10)] == list(range(25, 15, -1))
+    assert [r['pnl'] for r in store.page(2, 10)] == [5, 4, 3, 2, 1]
+    assert store.page(3, 10) == []
+
+    assert store.delete(25) and store.delete(20)
+    assert not store.delete(20), "Already deleted"
+    print(f"Live: {store.count()}, first page: {[r['pnl'] for r in store.page(0, 5)]}")
+    assert store.count() == 23
+    assert [r['pnl'] for r in store.page(0, 5)] == [24, 23, 22, 21, 19]
+    print("✓ Pagination correct")
+
+
+def test_compaction():
+    """Enough tombstones trigger a rewrite without deleted records"""
+    print("\n" + "="*60)
+    print("TEST: Compaction")
+    print("="*60)
+
+    store = new_store()
+    for d in range(8):
+        store.append({'pnl': d})
+    size_before = os.path.getsize(store.data_path)
+    old_min = session_log_store.COMPACT_MIN_TOMBSTONES
+    session_log_store.COMPACT_MIN_TOMBSTONES = 2
+    try:
+        store.delete(1)
+        store.delete(2)
+    finally:
+        session_log_store.COMPACT_MIN_TOMBSTONES = old_min
+
+    print(f"Data file: {size_before} -> {os.path.getsize(store.data_path)} bytes")
+    assert not os.path.exists(store.tomb_path)
+    assert os.path.getsize(store.data_path) < size_before
+    assert [r['id'] for r in store.all()] == [3, 4, 5, 6, 7, 8]
+    assert store.append({'pnl': 99}) == 9, "Ids keep increasing after compaction"
+    print("✓ Compacted")
+
+
+def test_ids_never_reused():
+    """Compacting away the newest records does not hand their ids out again"""
+    print("\n" + "="*60)
+    print("TEST: Ids Never Reused")
+    print("="*60)
+
+    store = new_store()
+    for d in range(4):
+        store.append({'pnl': d})
+    store.delete(4)
+    store.delete(3)
+    store.compact()
+    assert [r['id'] for r in store.all()] == [1, 2]
+    assert store.append({'pnl': 99}) == 5, "Ids 3 and 4 were deleted, not free"
+    assert SessionLogStore(store.data_path).append({'pnl': 100}) == 6, "The sequence survives a reopen"
+    assert not store.delete(3), "A stale delete of a compacted record finds nothing"
+    print("✓ Ids strictly increasing")
+
+
+def test_legacy_import_and_recovery():
+    """session_logs.json is imported; a torn append is repaired"""
+    print("\n" + "="*60)
+    print("TEST: Legacy Import + Recovery")
+    print("="*60)
+
+    store = new_store([{'date': 'a', 'pnl': 1}, {'date': 'b', 'pnl': -2}])
+    assert [r['date'] for r in store.page(0, 10)] == ['b', 'a']
+
+    # Simulate a crash after the data line was written but before the index
+    with open(store.data_path, 'ab') as f:
+        f.write(b'{"date": "c", "pnl": 3, "id": 3}\n{"date": "d", "pn')
+    fresh = SessionLogStore(store.data_path)
+    print(f"Recovered: {[r['date'] for r in fresh.page(0, 10)]}")
+    assert [r['date'] for r in fresh.page(0, 10)] == ['c', 'b', 'a']
+    assert fresh.append({'date': 'e'}) == 4
+    print("✓ Imported and recovered")
+
+
+if __name__ == '__main__':
+    print("\n" + "="*70)
+    print("SESSION LOG STORE TEST SUITE")
+    print("="*70)
+
+    try:
+        test_pages_newest_first()
+        test_compaction()
+        test_ids_never_reused()
+        test_legacy_import_and_recovery()
+
+        print("\n" + "="*70)
+        print("✓ ALL TESTS PASSED")
+        print("="*70)
+
+    except AssertionError as e:
+        print(f"\n✗ TEST FAILED: {e}")
+        raise
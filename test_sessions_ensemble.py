@@ -0,0 +1,117 @@
+"""
+TEST: Sessions Sim Ensemble Mode
+Verifies the multi-path ensemble: compiled legs are reused, chunks are
+deterministic per seed, and percentile bands come out ordered.
+"""
+
+import random
+
+import numpy as np
+from ui.sessions_sim import SessionsWorker, calculate_ensemble_stats
+
+SAVED = {
+    'bac': {'tac_bet': 'BANKER', 'tac_safety': 25, 'tac_mode': 'Standard', 'tac_base_bet': 10.0, 'tac_shoes': 1},
+    'rou': {'tac_bet': 'Red', 'tac_safety': 25, 'tac_mode': 'Standard', 'tac_base_bet': 5.0},
+}
+SEQUENCE = [
+    {'game': 'Roulette', 'strategy': 'rou', 'params': {}},
+    {'game': 'Baccarat', 'strategy': 'bac', 'params': {}},
+]
+
+
+def test_compile_legs():
+    """Legs are compiled once, missing strategies are flagged"""
+    print("\n" + "="*60)
+    print("TEST: Compile Legs")
+    print("="*60)
+
+    legs = SessionsWorker.compile_legs(SEQUENCE + [{'game': 'Baccarat', 'strategy': 'ghost', 'params': {}}], SAVED)
+    print(f"Legs: {[(l['game'], l['strategy'], l['compiled'] is None) for l in legs]}")
+    assert len(legs) == 3
+    assert legs[0]['compiled'] is not None and legs[1]['compiled'] is not None
+    assert legs[2]['compiled'] is None, "Unknown strategy should be flagged as missing"
+    print("✓ Legs compiled")
+
+
+def test_ensemble_chunk_deterministic():
+    """Same seed gives the same compact store"""
+    print("\n" + "="*60)
+    print("TEST: Ensemble Chunk Determinism")
+    print("="*60)
+
+    legs = SessionsWorker.compile_legs(SEQUENCE, SAVED)
+    a = SessionsWorker.run_ensemble_chunk(legs, 20, 42, 10, 1000.0, True, 300, 300)
+    b = SessionsWorker.run_ensemble_chunk(legs, 20, 42, 10, 1000.0, True, 300, 300)
+    print(f"Bankroll store shape: {a['bankrolls'].shape}, dtype: {a['bankrolls'].dtype}")
+    assert a['bankrolls'].shape == (20, 10)
+    assert a['bankrolls'].dtype == np.float32
+    assert np.array_equal(a['bankrolls'], b['bankrolls'])
+    assert np.array_equal(a['accounts'], b['accounts'])
+
+    # GA = start + contributions + game profit for every path
+    expected = 1000.0 + a['contributions'] + a['game_profit']
+    assert np.allclose(a['accounts'][:, -1], expected, atol=0.01)
+    print("✓ Chunks are reproducible and GA formula holds")
+
+
+def test_chunk_seeds_are_isolated():
+    """Chunks leave the caller's RNG alone and adjacent base seeds share no chunk"""
+    print("\n" + "="*60)
+    print("TEST: Ensemble Chunk Seeds")
+    print("="*60)
+
+    legs = SessionsWorker.compile_legs(SEQUENCE, SAVED)
+    random.seed(123)
+    expected = random.random()
+    random.seed(123)
+    SessionsWorker.run_ensemble_chunk(legs, 5, 42, 5, 1000.0, False, 0, 0)
+    assert random.random() == expected, "In-process chunk must not clobber the caller's RNG state"
+
+    seeds_42 = [s for _, s in SessionsWorker.plan_chunks(1000, 42)]
+    seeds_43 = [s for _, s in SessionsWorker.plan_chunks(1000, 43)]
+    assert len(set(seeds_42)) == 4 and not set(seeds_42) & set(seeds_43)
+    a = SessionsWorker.run_ensemble(legs, 500, 6, 1000.0, False, 0, 0, seed=42, max_workers=1)
+    b = SessionsWorker.run_ensemble(legs, 500, 6, 1000.0, False, 0, 0, seed=43, max_workers=1)
+    assert not np.array_equal(a['bankrolls'][250:], b['bankrolls'][:250])
+    print("✓ Caller RNG untouched, no shared chunks between seeds 42 and 43")
+
+
+def test_ensemble_bands():
+    """Ensemble merges chunks and produces ordered percentile bands"""
+    print("\n" + "="*60)
+    print("TEST: Ensemble Percentile Bands")
+    print("="*60)
+
+    legs = SessionsWorker.compile_legs(SEQUENCE, SAVED)
+    store = SessionsWorker.run_ensemble(legs, 300, 8, 1000.0, False, 0, 0, seed=7, max_workers=1)
+    assert store['bankrolls'].shape == (300, 8)
+
+    stats = calculate_ensemble_stats(store, 1000.0)
+    for key in ('bankroll_bands', 'account_bands'):
+        bands = stats[key]
+        assert np.all(bands[5] <= bands[25]) and np.all(bands[25] <= bands[50])
+        assert np.all(bands[50] <= bands[75]) and np.all(bands[75] <= bands[95])
+    print(f"Median final GA: €{stats['final_ga_median']:,.0f}")
+    print(f"Insolvency rate: {stats['insolvency_rate']:.1f}%")
+    assert 0 <= stats['insolvency_rate'] <= 100
+    print("✓ Bands ordered")
+
+
+if __name__ == '__main__':
+    print("\n" + "="*70)
+    print("SESSIONS SIM ENSEMBLE TEST SUITE")
+    print("="*70)
+
+    try:
+        test_compile_legs()
+        test_ensemble_chunk_deterministic()
+        test_chunk_seeds_are_isolated()
+        test_ensemble_bands()
+
+        print("\n" + "="*70)
+        print("✓ ALL TESTS PASSED")
+        print("="*70)
+
+    except AssertionError as e:
+        print(f"\n✗ TEST FAILED: {e}")
+        raise
@@ -0,0 +1,130 @@
+"""
+TEST: Strategy Compiler Cache
+Verifies that saved-strategy configs compile once, are shared through the
+content-hash cache, and that shared overrides are never mutated by a run.
+"""
+
+from engine.strategy_compiler import compile_strategy, clear_compile_cache, config_hash
+from engine.strategy_rules import BetStrategy, StrategyOverrides
+from ui.simulator import BaccaratWorker
+from ui.roulette_sim import RouletteWorker
+
+
+def test_cache_hit_on_same_content():
+    """Equal configs (even different dict objects / key order) share one compiled strategy"""
+    print("\n" + "="*60)
+    print("TEST: Cache Hit On Same Content")
+    print("="*60)
+
+    clear_compile_cache()
+    a = compile_strategy({'tac_bet': 'PLAYER', 'tac_safety': 25, 'risk_stop': 12})
+    b = compile_strategy({'risk_stop': 12, 'tac_safety': 25, 'tac_bet': 'PLAYER'})
+    c = compile_strategy({'tac_bet': 'PLAYER', 'tac_safety': 25, 'risk_stop': 14})
+    print(f"Key A: {a.key[:12]} | Key C: {c.key[:12]}")
+    assert a is b, "Same content should hit the cache"
+    assert a is not c, "Different content must compile separately"
+    assert a.game_type == 'Baccarat' and a.overrides.bet_strategy == BetStrategy.PLAYER
+    assert a.overrides.stop_loss_units == 12
+    assert config_hash({'x': 1}) == config_hash({'x': 1})
+    print("✓ Cache keyed on content")
+
+
+def test_roulette_lab_keys():
+    """Roulette lab key names (smart_*, spice_*, doctrine_en) are translated"""
+    print("\n" + "="*60)
+    print("TEST: Roulette Lab Keys")
+    print("="*60)
+
+    compiled = compile_strategy({
+        'tac_bet': 'Red', 'tac_bet_2': 'Black', 'smart_exit_en': False, 'smart_window': 120,
+        'spice_zero_en': True, 'spice_zero_trig': 5, 'doctrine_en': True, 'recovery_enabled': True
+    })
+    o = compiled.overrides
+    print(f"Game: {compiled.game_type} | Smart Exit: {o.smart_exit_enabled} | Window: {o.smart_window_start}")
+    assert compiled.game_type == 'Roulette'
+    assert o.bet_strategy == 'Red' and o.bet_strategy_2 == 'Black'
+    assert o.smart_exit_enabled is False and o.smart_window_start == 120
+    assert o.spice_zero_leger_enabled and o.spice_zero_leger_trigger == 5
+    assert o.doctrine_enabled and o.recovery_enabled
+    print("✓ Roulette keys translated")
+
+
+def test_shared_overrides_not_mutated():
+    """Ratchet sessions and fresh_overrides() never touch the shared compiled object"""
+    print("\n" + "="*60)
+    print("TEST: Shared Overrides Not Mutated")
+    print("="*60)
+
+    bac = compile_strategy({'tac_bet': 'BANKER', 'risk_prof': 0, 'risk_ratch': False, 'tac_penalty': False})
+    rou = compile_strategy({'tac_bet': 'Red', 'risk_prof': 0, 'risk_ratch': False, 'tac_penalty': False, 'tac_base_bet': 5.0})
+
+    for _ in range(5):
+        BaccaratWorker.run_session(2000, bac.overrides, bac.tier_map, True, False, 1, bac.mode, bac.base_bet)
+        RouletteWorker.run_session(2000, rou.overrides, rou.tier_map, True, False, 1, rou.mode, rou.base_bet)
+
+    print(f"Baccarat ratchet: {bac.overrides.ratchet_enabled} | TP: {bac.overrides.profit_lock_units}")
+    assert bac.overrides.ratchet_enabled is False and bac.overrides.profit_lock_units == 0
+    assert rou.overrides.ratchet_enabled is False and rou.overrides.profit_lock_units == 0
+
+    private = bac.fresh_overrides()
+    private.stop_loss_units = 99
+    assert bac.overrides.stop_loss_units != 99
+    print("✓ Shared overrides untouched")
+
+
+def test_career_profile_keeps_core_settings_only():
+    """Career Sim legs play the core settings; spices, fib, smart exit and recovery stay at their defaults"""
+    print("\n" + "="*60)
+    print("TEST: Career Compile Profile")
+    print("="*60)
+
+    config = {'tac_bet': 'Red', 'tac_iron': 5, 'risk_stop': 8, 'smart_exit_en': False, 'smart_window': 120,
+              'spice_zero_en': True, 'tac_press': 11, 'recovery_enabled': True, 'doctrine_pl_stop': 3}
+    lab = compile_strategy(config)
+    career = compile_strategy(config, profile='career')
+    d = StrategyOverrides()
+    print(f"Lab spice: {lab.overrides.spice_zero_leger_enabled} | Career spice: {career.overrides.spice_zero_leger_enabled}")
+    assert lab is not career and lab.key != career.key
+    assert career.overrides.iron_gate_limit == 5 and career.overrides.stop_loss_units == 8
+    assert lab.overrides.spice_zero_leger_enabled and not career.overrides.spice_zero_leger_enabled
+    assert lab.overrides.recovery_enabled and not career.overrides.recovery_enabled
+    assert lab.overrides.fibonacci_hunter_enabled and not career.overrides.fibonacci_hunter_enabled
+    assert career.overrides.smart_exit_enabled == d.smart_exit_enabled and career.overrides.smart_window_start == d.smart_window_start
+    assert career.overrides.doctrine_pl_stop == d.doctrine_pl_stop and career.overrides.ratchet_lock_pct == d.ratchet_lock_pct
+    assert career.base_bet == 10.0
+    print("✓ Career legs compile as before the shared compiler")
+
+
+def test_lab_defaults_match_the_pages():
+    """Keys missing from a saved config default like the lab page loading it"""
+    print("\n" + "="*60)
+    print("TEST: Game-Aware Lab Defaults")
+    print("="*60)
+
+    bac = compile_strategy({'tac_bet': 'BANKER'}, game_type='Baccarat')
+    rou = compile_strategy({'tac_bet': 'Red'}, game_type='Roulette')
+    print(f"Smart window: Baccarat {bac.overrides.smart_window_start} | Roulette {rou.overrides.smart_window_start}")
+    assert bac.overrides.smart_window_start == 190 and rou.overrides.smart_window_start == 90
+    assert bac.base_bet == 5.0 and rou.base_bet == 5.0
+    print("✓ Defaults match the pages")
+
+
+if __name__ == '__main__':
+    print("\n" + "="*70)
+    print("STRATEGY COMPILER TEST SUITE")
+    print("="*70)
+
+    try:
+        test_cache_hit_on_same_content()
+        test_roulette_lab_keys()
+        test_shared_overrides_not_mutated()
+        test_career_profile_keeps_core_settings_only()
+        test_lab_defaults_match_the_pages()
+
+        print("\n" + "="*70)
+        print("✓ ALL TESTS PASSED")
+        print("="*70)
+
+    except AssertionError as e:
+        print(f"\n✗ TEST FAILED: {e}")
+        raise
@@ -0,0 +1,94 @@
+"""
+TEST: Parameter Sweep
+Grid and random points over the strategy sliders, played on the same
+streams across the cores, with every point cached on its own.
+"""
+
+import tempfile
+
+import numpy as np
+
+from engine import batch
+from engine.strategy_compiler import compile_strategy
+from engine.sweep import (SWEEP_METRICS, grid_points, heatmap_grid, params_for, point_config, point_summary,
+                          random_points, run_sweep, value_range)
+from engine.comparison import compare_settings
+from ui.sweep import cached_sweep
+from utils import result_cache
+
+BAC = {'tac_bet': 'BANKER', 'tac_safety': 25, 'tac_mode': 'Standard', 'tac_base_bet': 10.0, 'tac_shoes': 1, 'years': 2, 'freq': 12}
+COMMON = {'years': 2, 'freq': 12, 'start_ga': 2000}
+RANGES = {'stop_loss_units': [5, 10, 15], 'iron_gate_limit': [2, 4]}
+
+
+def test_points():
+    print("\n" + "="*60)
+    print("TEST: Grid, random sample and point configs")
+    print("="*60)
+    assert value_range(5, 30, 5) == [5, 10, 15, 20, 25, 30]
+    assert value_range(0.1, 0.4, 0.05) == [0.1, 0.15, 0.2, 0.25, 0.3, 0.35, 0.4]
+    grid = grid_points(RANGES)
+    assert len(grid) == 6 and grid[1] == {'stop_loss_units': 5, 'iron_gate_limit': 4}
+    sample = random_points(RANGES, 4, seed=1)
+    assert len(sample) == 4 and all(p in grid for p in sample)
+    assert sorted(grid.index(p) for p in sample) == [grid.index(p) for p in sample]  # Grid order, no repeats
+    assert sample == random_points(RANGES, 4, seed=1) and random_points(RANGES, 50) == grid
+    big = {'stop_loss_units': value_range(1, 100, 1), 'profit_lock_units': value_range(1, 100, 1),
+           'smart_window_start': value_range(10, 240, 10)}
+    assert len(random_points(big, 500)) == 500  # 230,000-point grid, never built
+
+    config = point_config(BAC, {'smart_window_start': 120.0, 'trailing_drop_pct': 0.3, 'stop_loss_units': 7})
+    assert config['smart_window_start'] == config['smart_window'] == 120 and config['smart_trail_pct'] == 0.3
+    assert config['risk_stop'] == 7 and BAC.get('risk_stop') is None
+    overrides = compile_strategy(config, game_type='Baccarat').overrides
+    assert overrides.smart_window_start == 120 and overrides.trailing_drop_pct == 0.3 and overrides.stop_loss_units == 7
+    assert 'spice_voisins_trigger' in params_for('Roulette') and 'spice_voisins_trigger' not in params_for('Baccarat')
+    tier_maps = {id(compile_strategy(point_config(BAC, p), game_type='Baccarat').tier_map) for p in grid}
+    assert len(tier_maps) == 1  # Every point shares the base strategy's tier map
+    print("✅ Points OK")
+
+
+def test_sweep_matches_lab_runs():
+    print("\n" + "="*60)
+    print("TEST: Sweep points == lab runs of the point configs on the same streams")
+    print("="*60)
+    points = grid_points(RANGES)
+    rows = run_sweep('Baccarat', BAC, points, 20, seed=6, common=COMMON, max_workers=2)
+    assert [{k: r[k] for k in RANGES} for r in rows] == points
+    inline = run_sweep('Baccarat', BAC, points, 20, seed=6, common=COMMON, max_workers=1)
+    assert all(a[m] == b[m] for a, b in zip(rows, inline) for m in SWEEP_METRICS)
+
+    config = point_config(BAC, points[3])
+    settings = compare_settings([{'game': 'Baccarat', 'config': config}], COMMON)[0]
+    results = batch.run_lab_universes('Baccarat', settings, compile_strategy(config, game_type='Baccarat'), 6, 0, 20, crn=True)
+    direct = point_summary(results, settings)
+    assert all(rows[3][m] == direct[m] for m in SWEEP_METRICS) and np.array_equal(rows[3]['trajectory'], direct['trajectory'])
+    assert len({r['final_ga_mean'] for r in rows}) > 1
+
+    xs, ys, z = heatmap_grid(rows, 'stop_loss_units', 'iron_gate_limit', 'final_ga_mean')
+    assert xs == [5, 10, 15] and ys == [2, 4] and z[1, 0] == rows[1]['final_ga_mean']
+    print(f"{len(rows)} points, mean final GA €{min(z.flat):,.0f} .. €{max(z.flat):,.0f}")
+
+
+def test_points_are_cached():
+    print("\n" + "="*60)
+    print("TEST: A wider sweep only plays its new points")
+    print("="*60)
+    result_cache.CACHE_DIRNAME = tempfile.mkdtemp(prefix='msbl_cache_')
+    points = grid_points(RANGES)
+    first, hits = cached_sweep('Baccarat', BAC, points, 10, seed=2, common=COMMON, max_workers=1)
+    assert hits == 0
+    wider = grid_points(dict(RANGES, stop_loss_units=[5, 10, 15, 20]))
+    played = []
+    second, hits = cached_sweep('Baccarat', BAC, wider, 10, seed=2, common=COMMON, max_workers=1,
+                                on_chunk=lambda done, total: played.append(total))
+    assert hits == 6 and played[-1] == 2
+    for a, b in zip(first, second):
+        assert a['stop_loss_units'] == b['stop_loss_units'] and abs(a['final_ga_mean'] - b['final_ga_mean']) < 1e-6
+    print(f"✅ {hits} cached points reused, {played[-1]} played")
+
+
+if __name__ == '__main__':
+    test_points()
+    test_sweep_matches_lab_runs()
+    test_points_are_cached()
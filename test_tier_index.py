@@ -0,0 +1,119 @@
+"""
+TEST: TierIndex Lookup
+Verifies that the bisect/searchsorted TierIndex returns exactly the same
+tiers as the dict-based get_tier_for_ga scan, including Titan hysteresis,
+and that generate_tier_map hands out shared, frozen maps.
+"""
+
+import random
+from dataclasses import FrozenInstanceError
+import numpy as np
+from engine.tier_params import TierIndex, generate_tier_map, get_tier_for_ga
+
+CASES = [
+    ('Standard', 'Baccarat', 25, 10.0),
+    ('Standard', 'Roulette', 40, 5.0),
+    ('Titan', 'Baccarat', 25, None),
+    ('Titan', 'Roulette', 25, 10.0),
+    ('Safe Titan', 'Baccarat', 25, None),
+    ('Fortress', 'Roulette', 25, 5.0),
+]
+
+
+def test_scalar_lookup_matches_scan():
+    """TierIndex.lookup agrees with the dict scan for every mode"""
+    print("\n" + "="*60)
+    print("TEST: Scalar Lookup Matches Scan")
+    print("="*60)
+
+    rng = random.Random(7)
+    for mode, game, safety, base in CASES:
+        index = generate_tier_map(safety, mode=mode, game_type=game, base_bet=base)
+        tier_map = dict(index)  # Plain dict takes the legacy scan path
+        for _ in range(500):
+            ga = rng.uniform(-500, 150000)
+            active = rng.choice(list(tier_map.keys()))
+            expected = get_tier_for_ga(ga, tier_map, active, mode, game_type=game)
+            actual = get_tier_for_ga(ga, index, active, mode, game_type=game)
+            assert actual.level == expected.level, f"{mode}/{game} GA {ga:.0f}: {actual.level} != {expected.level}"
+        # Exact threshold hits
+        for t in tier_map.values():
+            if t.min_ga != float('inf'):
+                assert index.lookup(t.min_ga, 1, mode).level == get_tier_for_ga(t.min_ga, tier_map, 1, mode, game).level
+        print(f"✓ {mode} / {game}")
+
+
+def test_vectorized_lookup():
+    """lookup_levels matches scalar lookup element-wise, with hysteresis"""
+    print("\n" + "="*60)
+    print("TEST: Vectorized Lookup")
+    print("="*60)
+
+    rng = np.random.default_rng(11)
+    for mode, game, safety, base in CASES:
+        index = TierIndex(generate_tier_map(safety, mode=mode, game_type=game, base_bet=base))
+        ga = rng.uniform(-500, 150000, size=2000)
+        active = rng.choice(np.array(index.levels), size=2000)
+        levels = index.lookup_levels(ga, active, mode)
+        expected = [index.lookup(g, int(a), mode).level for g, a in zip(ga, active)]
+        assert np.array_equal(levels, expected), f"Vectorized mismatch for {mode}/{game}"
+        print(f"✓ {mode} / {game}")
+
+    # Titan hysteresis: at 95% of the Tier 3 threshold, Tier 3 holds, others stay at Tier 2
+    index = TierIndex(generate_tier_map(25, mode='Titan', game_type='Baccarat'))
+    th_high = index[3].min_ga
+    levels = index.lookup_levels([th_high * 0.95] * 2, [3, 2], 'Titan')
+    print(f"Hysteresis levels: {levels.tolist()}")
+    assert levels.tolist() == [3, 2]
+
+
+def test_index_behaves_like_mapping():
+    """TierIndex can stand in for the tier_map dict"""
+    tier_map = dict(generate_tier_map(25))
+    index = TierIndex(tier_map)
+    assert len(index) == len(tier_map)
+    assert list(index.keys()) == sorted(tier_map.keys())
+    assert index.get(2) == tier_map[2]
+    assert get_tier_for_ga(5000, None).level == get_tier_for_ga(5000, generate_tier_map()).level
+
+
+def test_tier_map_memoized():
+    """Same parameters return the same frozen object"""
+    print("\n" + "="*60)
+    print("TEST: Memoized Tier Maps")
+    print("="*60)
+
+    a = generate_tier_map(25, mode='Standard', game_type='Roulette', base_bet=5.0)
+    b = generate_tier_map(25, mode='Standard', game_type='Roulette', base_bet=5)
+    c = generate_tier_map(30, mode='Standard', game_type='Roulette', base_bet=5.0)
+    assert a is b, "Equal keys must share one map"
+    assert a is not c
+    assert generate_tier_map(25, base_bet=0) is generate_tier_map(25, base_bet=None)
+
+    try:
+        a[1].base_unit = 999
+        assert False, "TierConfig should be frozen"
+    except FrozenInstanceError:
+        pass
+    assert not hasattr(a, '__setitem__')
+    print("✓ Shared and frozen")
+
+
+if __name__ == '__main__':
+    print("\n" + "="*70)
+    print("TIER INDEX TEST SUITE")
+    print("="*70)
+
+    try:
+        test_scalar_lookup_matches_scan()
+        test_vectorized_lookup()
+        test_index_behaves_like_mapping()
+        test_tier_map_memoized()
+
+        print("\n" + "="*70)
+        print("✓ ALL TESTS PASSED")
+        print("="*70)
+
+    except AssertionError as e:
+        print(f"\n✗ TEST FAILED: {e}")
+        raise
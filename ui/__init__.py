@@ -1,5 +1,15 @@
-from .dashboard import show_dashboard
-from .scorecard import show_scorecard  # Changed from Scorecard to show_scorecard
-from .simulator import show_simulator
-from .career_mode import show_career_mode
-from .session_log import show_session_log
+# Page functions are resolved on first access so that importing one UI module
+# (e.g. ui.tracker) does not drag in every lab and its dependencies.
+_EXPORTS = {
+    'show_dashboard': '.dashboard',
+    'show_scorecard': '.scorecard',  # Changed from Scorecard to show_scorecard
+    'show_simulator': '.simulator',
+    'show_career_mode': '.career_mode',
+    'show_session_log': '.session_log',
+}
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        from importlib import import_module
+        return getattr(import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
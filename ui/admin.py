@@ -0,0 +1,182 @@
+"""
+Admin panel: scheduler load, engine instrumentation and profiles.
+
+Shows the runs on the server-wide scheduler, switches per-phase timing of the
+lab runs on or off (ui/scheduling.py), and lists the reports of the last
+instrumented runs, lab pages and API jobs alike (engine/instrumentation.py).
+The profiler card profiles a sample of a saved strategy's universes and
+shows the last profiles (this page's and profiled API jobs') grouped by
+module, with JSON/CSV/pstats downloads (engine/profiling.py).
+"""
+
+import json
+import time
+
+from nicegui import ui
+
+from engine import batch, profiling
+from engine.instrumentation import recent_reports
+from engine.seeding import DEFAULT_SEED
+from ui.scheduling import page_runs_instrumented, set_page_runs_instrumented, submit_page_run, wait_for_run
+from ui.tables import download_button, paged_table
+from utils.exports import csv_chunks
+from utils.persistence import get_saved_strategies, get_strategy_names
+from utils.scheduler import AdmissionError, estimate_cost, get_scheduler
+
+PHASE_COLUMNS = [
+    {'name': 'phase', 'label': 'Phase', 'field': 'phase', 'align': 'left'},
+    {'name': 'calls', 'label': 'Calls', 'field': 'calls'},
+    {'name': 'total_ms', 'label': 'Total ms', 'field': 'total_ms'},
+    {'name': 'mean_us', 'label': 'Mean µs', 'field': 'mean_us'},
+    {'name': 'share', 'label': 'Share', 'field': 'share'},
+]
+TASK_COLUMNS = [
+    {'name': 'name', 'label': 'Run', 'field': 'name', 'align': 'left'},
+    {'name': 'status', 'label': 'Status', 'field': 'status'},
+    {'name': 'cost', 'label': 'Cost', 'field': 'cost'},
+    {'name': 'progress', 'label': 'Progress', 'field': 'progress'},
+]
+MODULE_COLUMNS = [
+    {'name': 'module', 'label': 'Module', 'field': 'module', 'align': 'left'},
+    {'name': 'self_ms', 'label': 'Self ms', 'field': 'self_ms'},
+    {'name': 'share', 'label': 'Share', 'field': 'share'},
+    {'name': 'functions', 'label': 'Functions', 'field': 'functions'},
+]
+FUNCTION_COLUMNS = [
+    {'name': 'module', 'label': 'Module', 'field': 'module', 'align': 'left'},
+    {'name': 'function', 'label': 'Function', 'field': 'function', 'align': 'left'},
+    {'name': 'line', 'label': 'Line', 'field': 'line'},
+    {'name': 'calls', 'label': 'Calls', 'field': 'calls'},
+    {'name': 'self_ms', 'label': 'Self ms', 'field': 'self_ms'},
+    {'name': 'cum_ms', 'label': 'Cum ms', 'field': 'cum_ms'},
+    {'name': 'self_share', 'label': 'Share', 'field': 'self_share'},
+]
+
+
+def run_profile(game_type, name, config, universes, seed, sample):
+    """Scheduler entry point: profiles a saved strategy and keeps the profile for the panel."""
+    report, stats = profiling.profile_lab(game_type, config, universes, seed, sample=sample)
+    return profiling.record_profile(f'{game_type} lab: {name}', report, stats)
+
+
+def grouped_functions(report: dict) -> list:
+    """Function rows grouped by module (modules by self time, then functions by self time)."""
+    order = {m['module']: i for i, m in enumerate(report['modules'])}
+    return sorted(report['functions'], key=lambda f: (order.get(f['module'], len(order)), -f['self_ms']))
+
+
+def show_profile(entry: dict):
+    report, name = entry['report'], entry['name']
+    slug = f"profile_{report['lab']}_{time.strftime('%Y%m%d_%H%M%S', time.localtime(entry['finished']))}"
+    exports = [
+        ('JSON', 'data_object', f'{slug}.json', lambda: iter([json.dumps(report, indent=1)])),
+        ('CSV', 'download', f'{slug}.csv', lambda: csv_chunks(profiling.FUNCTION_FIELDS, grouped_functions(report))),
+        ('PSTATS', 'insights', f'{slug}.prof', lambda: iter([profiling.profile_stats_bytes(entry['stats'])])),
+    ]
+    with ui.expansion(f"{name} · {len(report['universes'])} universes · {report['total_ms']:,.0f} ms profiled") \
+            .classes('w-full text-cyan-300'):
+        ui.table(columns=MODULE_COLUMNS, rows=[dict(m, share=f"{m['share']:.1%}") for m in report['modules']],
+                 row_key='module').props('dense flat').classes('w-full')
+        paged_table(FUNCTION_COLUMNS, grouped_functions(report),
+                    lambda f: dict(f, self_share=f"{f['self_share']:.1%}")).classes('w-full mt-2')
+        with ui.row().classes('w-full gap-2 mt-2'):
+            for label, icon, filename, make_chunks in exports:
+                download_button(f'DOWNLOAD {label}', filename, make_chunks) \
+                    .props(f'icon={icon} outline color=cyan').classes('flex-grow')
+
+
+def show_admin():
+    with ui.column().classes('w-full max-w-6xl mx-auto gap-6 p-4'):
+        ui.label('ADMIN').classes('text-3xl font-light text-slate-200')
+
+        with ui.card().classes('w-full bg-slate-900 p-4'):
+            ui.label('SCHEDULER').classes('text-sm font-bold text-slate-400 mb-2')
+            tasks_table = ui.table(columns=TASK_COLUMNS, rows=[], row_key='id').props('dense flat').classes('w-full')
+
+        with ui.card().classes('w-full bg-slate-900 p-4'):
+            ui.label('INSTRUMENTATION').classes('text-sm font-bold text-slate-400 mb-2')
+            ui.switch('Time engine phases of lab runs', value=page_runs_instrumented(),
+                      on_change=lambda e: set_page_runs_instrumented(e.value)).classes('text-slate-300')
+            ui.label('Adds a few percent to the runs while on. API jobs opt in with "instrument": true.') \
+                .classes('text-xs text-slate-500')
+            reports_col = ui.column().classes('w-full gap-4 mt-2')
+
+        with ui.card().classes('w-full bg-slate-900 p-4'):
+            ui.label('PROFILER').classes('text-sm font-bold text-slate-400 mb-2')
+            ui.label('Replays a sample of the universes under cProfile and reports where the time goes, by module.') \
+                .classes('text-xs text-slate-500')
+            with ui.row().classes('w-full gap-4 items-end'):
+                game_select = ui.select(['Baccarat', 'Roulette'], value='Baccarat', label='Lab').classes('w-32')
+                strategy_select = ui.select(get_strategy_names(), label='Saved strategy').classes('w-64')
+                universes_input = ui.number('Run universes', value=1000, min=1, format='%d').classes('w-32')
+                sample_input = ui.number('Profiled universes', value=profiling.PROFILE_SAMPLE, min=1, max=200,
+                                         format='%d').classes('w-32')
+                seed_input = ui.number('Seed', value=DEFAULT_SEED, format='%d').classes('w-32')
+                profile_btn = ui.button('PROFILE', icon='speed').props('color=cyan')
+            profile_status = ui.label('').classes('text-xs text-slate-400')
+            profiles_col = ui.column().classes('w-full gap-2 mt-2')
+
+        async def start_profile():
+            name = strategy_select.value
+            if not name:
+                ui.notify('Pick a saved strategy', type='warning')
+                return
+            config = get_saved_strategies()[name]
+            universes, sample = int(universes_input.value or 1), int(sample_input.value or 1)
+            settings = batch.lab_settings(config, game_select.value)
+            try:
+                task = submit_page_run(run_profile, (game_select.value, name, config, universes, int(seed_input.value or 0),
+                                                     sample),
+                                       cost=estimate_cost(min(sample, universes), settings['years'] * 12, settings['freq'] / 12),
+                                       name=f'Profile {name} ({min(sample, universes)} universes)')
+            except AdmissionError as e:
+                ui.notify(str(e), type='warning')
+                return
+            profile_btn.disable()
+            try:
+                await wait_for_run(task, profile_status, lambda t: profile_status.set_text('Profiling...'))
+                profile_status.set_text('')
+            except Exception as e:
+                profile_status.set_text(f'Profile failed: {e}')
+            finally:
+                profile_btn.enable()
+            refresh()
+
+        profile_btn.on_click(start_profile)
+
+        shown = {'reports': None, 'profiles': None}
+
+        def refresh():
+            show_profiles()
+            tasks_table.rows = [dict(t.to_dict(), progress=f"{t.progress:.0%}") for t in get_scheduler().tasks()]
+            reports = recent_reports()
+            key = [(r['name'], r['finished']) for r in reports]
+            if key == shown['reports']:
+                return
+            shown['reports'] = key
+            reports_col.clear()
+            with reports_col:
+                if not reports:
+                    ui.label('No instrumented runs yet.').classes('text-slate-500 italic')
+                for r in reports:
+                    when = time.strftime('%H:%M:%S', time.localtime(r['finished']))
+                    elapsed = f" · {r['elapsed_sec']:.2f}s" if r.get('elapsed_sec') is not None else ''
+                    ui.label(f"{r['name']} · {when}{elapsed}").classes('text-sm text-cyan-300')
+                    rows = [dict(p, share=f"{p['share']:.1%}") for p in r['phases']]
+                    ui.table(columns=PHASE_COLUMNS, rows=rows, row_key='phase').props('dense flat').classes('w-full')
+
+        def show_profiles():
+            profiles = profiling.recent_profiles()
+            key = [id(p) for p in profiles]
+            if key == shown['profiles']:
+                return
+            shown['profiles'] = key
+            profiles_col.clear()
+            with profiles_col:
+                if not profiles:
+                    ui.label('No profiles yet.').classes('text-slate-500 italic')
+                for entry in profiles:
+                    show_profile(entry)
+
+        refresh()
+        ui.timer(1.0, refresh)
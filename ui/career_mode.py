@@ -2,473 +2,46 @@ from nicegui import ui
 import plotly.graph_objects as go
 import numpy as np
 import asyncio
+import itertools
 import traceback
-from copy import deepcopy
-
-# --- CRITICAL FIX: IMPORT BACCARAT WORKER ---
-from ui.simulator import BaccaratWorker # Changed from SimulationWorker
-from ui.roulette_sim import RouletteWorker
-from engine.strategy_rules import StrategyOverrides, BetStrategy, PlayMode, build_doctrine_configs_from_overrides
-from engine.tier_params import get_tier_for_ga, generate_tier_map
-from engine.doctrine_engine import (
-    DoctrineContext, choose_state_for_next_session, update_after_session,
-    update_after_month, get_doctrine_config, log_state_transition
-)
-from utils.persistence import load_profile
-
-# List of Roulette-specific bets to detect Game Type
-ROULETTE_BETS = {'Red', 'Black', 'Even', 'Odd', '1-18', '19-36'}
-
-class CareerManager:
-    @staticmethod
-    def run_compound_career(sequence_config, start_ga, total_years, sessions_per_year, fallback_threshold_pct=0.80, promotion_buffer_pct=1.20, trailing_fallback_pct=0.90):
-        current_ga = start_ga
-        current_leg_idx = 0
-        
-        # Load Initial Strategy
-        active_config = sequence_config[0]['config']
-        active_strategy_name = sequence_config[0]['strategy_name']
-        active_target = sequence_config[0]['target_ga']
-        
-        # Extract Params & Detect Game Type
-        overrides, tier_map, safety, mode, use_ratch, use_penalty, game_type, base_bet = CareerManager._extract_params(active_config)
-        
-        # === DOCTRINE ENGINE INITIALIZATION ===
-        doctrine_enabled = active_config.get('doctrine_en', False)
-        doctrine_ctx = None
-        platinum_cfg = None
-        tight_cfg = None
-        state_rules = None
-        
-        if doctrine_enabled:
-            # Build doctrine configurations from overrides
-            platinum_cfg, tight_cfg, state_rules = build_doctrine_configs_from_overrides(overrides)
-            
-            # Initialize doctrine context
-            doctrine_ctx = DoctrineContext(
-                state="PLATINUM",
-                GA_current=current_ga,
-                GA_peak=current_ga,
-                last_result_u=0.0,
-                tight_sessions_done=0,
-                cooloff_months_done=0
-            )
-        
-        trajectory = []
-        log = []
-        months = total_years * 12
-        active_level = 1
-        last_session_won = False
-        
-        total_input = start_ga
-        
-        # Track thresholds for fallback mechanism
-        promotion_thresholds = [0]  # Track threshold that triggered each leg promotion
-        trailing_active = [False] * len(sequence_config)  # Track if trailing fallback is active for each leg
-        trailing_peak = [start_ga]  # Track peak GA reached in each leg for trailing calculation
-        
-        for m in range(months):
-            # 1. CHECK FOR DEMOTION (Fallback to previous strategy if bankroll drops too low)
-            if current_leg_idx > 0:
-                # Update trailing peak if we've reached new high in current leg
-                old_peak = trailing_peak[current_leg_idx]
-                if current_ga > trailing_peak[current_leg_idx]:
-                    trailing_peak[current_leg_idx] = current_ga
-                    trailing_active[current_leg_idx] = True  # Activate trailing once we exceed promotion threshold
-                    
-                    # Log peak update
-                    new_threshold = current_ga * trailing_fallback_pct
-                    log.append({
-                        'month': m+1,
-                        'event': 'PEAK_UPDATE',
-                        'details': f"New Peak: €{current_ga:,.0f} (was €{old_peak:,.0f}), Trailing FB @ €{new_threshold:,.0f}"
-                    })
-                
-                # Standard fallback check
-                fallback_threshold = promotion_thresholds[current_leg_idx] * fallback_threshold_pct
-                
-                # Trailing fallback check - if enabled and we drop X% from peak
-                trailing_threshold = trailing_peak[current_leg_idx] * trailing_fallback_pct if trailing_active[current_leg_idx] else 0
-                
-                # Use MAX to trigger on whichever threshold is MORE protective (higher)
-                if current_ga < max(fallback_threshold, trailing_threshold):
-                    # Determine which mechanism triggered
-                    mechanism = "STANDARD"
-                    threshold_value = fallback_threshold
-                    if trailing_active[current_leg_idx] and trailing_threshold > fallback_threshold:
-                        mechanism = "🔄 TRAILING"
-                        threshold_value = trailing_threshold
-                    
-                    # Demote to previous strategy
-                    current_leg_idx -= 1
-                    prev_leg = sequence_config[current_leg_idx]
-                    
-                    # Reset trailing for demoted leg (we're dropping back)
-                    if current_leg_idx + 1 < len(trailing_active):
-                        trailing_active[current_leg_idx + 1] = False
-                    if current_leg_idx + 1 < len(trailing_peak):
-                        trailing_peak[current_leg_idx + 1] = 0
-                    
-                    log.append({
-                        'month': m+1, 
-                        'event': 'FALLBACK', 
-                        'details': f"{mechanism} DEMOTED: {active_strategy_name} -> {prev_leg['strategy_name']} (Bal: €{current_ga:,.0f}, fell below €{threshold_value:,.0f})"
-                    })
-                    
-                    active_strategy_name = prev_leg['strategy_name']
-                    active_config = prev_leg['config']
-                    active_target = prev_leg['target_ga']
-                    
-                    # Refresh Params for previous Leg
-                    overrides, tier_map, safety, mode, use_ratch, use_penalty, game_type, base_bet = CareerManager._extract_params(active_config)
-                    
-                    # Reset Tier Level based on old map
-                    temp_tier = get_tier_for_ga(current_ga, tier_map, 1, mode, game_type=game_type)
-                    active_level = temp_tier.level
-            
-            # 2. CHECK FOR PROMOTION (with buffer to avoid flip-flopping)
-            if current_leg_idx < len(sequence_config) - 1:
-                promotion_target = active_target * promotion_buffer_pct
-                if current_ga >= promotion_target:
-                    current_leg_idx += 1
-                    new_leg = sequence_config[current_leg_idx]
-                    
-                    # Store the threshold that triggered this promotion
-                    promotion_thresholds.append(promotion_target)
-                    
-                    # Initialize trailing tracking for this new leg
-                    while len(trailing_peak) <= current_leg_idx:
-                        trailing_peak.append(0)
-                        trailing_active.append(False)
-                    trailing_peak[current_leg_idx] = current_ga
-                    trailing_active[current_leg_idx] = True
-                    
-                    # Calculate what the trailing threshold will be
-                    trailing_threshold_value = current_ga * trailing_fallback_pct
-                    
-                    log.append({
-                        'month': m+1, 
-                        'event': 'PROMOTION', 
-                        'details': f"GRADUATED: {active_strategy_name} -> {new_leg['strategy_name']} (Bal: €{current_ga:,.0f}, Trailing FB will trigger @ €{trailing_threshold_value:,.0f})"
-                    })
-                    
-                    active_strategy_name = new_leg['strategy_name']
-                    active_config = new_leg['config']
-                    active_target = new_leg['target_ga']
-                    
-                    # Refresh Params for new Leg
-                    overrides, tier_map, safety, mode, use_ratch, use_penalty, game_type, base_bet = CareerManager._extract_params(active_config)
-                    
-                    # Reset Tier Level based on new map
-                    temp_tier = get_tier_for_ga(current_ga, tier_map, 1, mode, game_type=game_type)
-                    active_level = temp_tier.level
-
-            # 3. ECOSYSTEM (Tax/Contrib)
-            tax_rate = active_config.get('eco_tax_rate', 25)
-            tax_thresh = active_config.get('eco_tax_thresh', 12500)
-            use_tax = active_config.get('eco_tax', False)
-            
-            if use_tax and current_ga > tax_thresh:
-                tax = (current_ga - tax_thresh) * (tax_rate / 100.0)
-                current_ga -= tax
-
-            contrib_win = active_config.get('eco_win', 300)
-            contrib_loss = active_config.get('eco_loss', 300)
-            hol_ceil = active_config.get('eco_hol_ceil', 10000)
-            use_hol = active_config.get('eco_hol', False)
-            
-            should_contribute = True
-            if use_hol and current_ga >= hol_ceil:
-                should_contribute = False
-            
-            if should_contribute:
-                amount = contrib_win if last_session_won else contrib_loss
-                current_ga += amount
-                total_input += amount 
-            
-            # 4. INSOLVENCY CHECK
-            insolvency_floor = active_config.get('eco_insolvency', 1000)
-            if current_ga < insolvency_floor:
-                if len(log) == 0 or log[-1]['event'] != 'INSOLVENT':
-                    log.append({'month': m+1, 'event': 'INSOLVENT', 'details': f'Bankroll < €{insolvency_floor}. Game Over.'})
-                trajectory.append(current_ga)
-                continue 
-
-            # === DOCTRINE STATE MACHINE ===
-            if doctrine_enabled and doctrine_ctx:
-                # Update context with current GA
-                doctrine_ctx.GA_current = current_ga
-                
-                # Determine next state
-                old_state = doctrine_ctx.state
-                new_state = choose_state_for_next_session(doctrine_ctx, state_rules)
-                
-                # Log state transition if changed
-                if new_state != old_state:
-                    reason = "Unknown"
-                    if new_state == "TIGHT":
-                        if doctrine_ctx.last_result_u <= -state_rules.loss_trigger_pl_u:
-                            reason = f"Big loss: -{abs(doctrine_ctx.last_result_u):.1f}u"
-                        else:
-                            dd_pct = (doctrine_ctx.GA_peak - current_ga) / doctrine_ctx.GA_peak if doctrine_ctx.GA_peak > 0 else 0
-                            reason = f"Drawdown: {dd_pct*100:.1f}%"
-                    elif new_state == "COOL_OFF":
-                        if current_ga < state_rules.cooloff_ga_floor:
-                            reason = f"Insolvency: €{current_ga:,.0f} < €{state_rules.cooloff_ga_floor:,.0f}"
-                        else:
-                            reason = "Max TIGHT sessions exhausted"
-                    elif new_state == "PLATINUM":
-                        reason = "Recovered from drawdown"
-                    
-                    log_state_transition(doctrine_ctx, old_state, new_state, reason)
-                    log.append({
-                        'month': m+1,
-                        'event': 'DOCTRINE',
-                        'details': f"Doctrine: {old_state} → {new_state} ({reason})"
-                    })
-                    doctrine_ctx.state = new_state
-                
-                # Get active doctrine config
-                active_doctrine_cfg = get_doctrine_config(doctrine_ctx.state, platinum_cfg, tight_cfg)
-                
-                # Override session parameters with doctrine config
-                overrides.stop_loss_units = int(active_doctrine_cfg.stop_loss_u)
-                overrides.profit_lock_units = int(active_doctrine_cfg.target_u)
-                overrides.press_trigger_wins = active_doctrine_cfg.press_wins
-                overrides.press_depth = active_doctrine_cfg.press_depth
-                overrides.iron_gate_limit = active_doctrine_cfg.iron_gate
-
-            # 5. PLAY SESSIONS (DYNAMIC ENGINE SELECTION)
-            sessions_this_month = sessions_per_year // 12
-            if m % 12 < (sessions_per_year % 12): 
-                sessions_this_month += 1
-            
-            month_pnl = 0.0  # Track monthly P&L for doctrine
-            for _ in range(sessions_this_month):
-                # === PRE-SESSION TRAILING FALLBACK CHECK ===
-                # Check BEFORE playing to prevent entering a session already below threshold
-                if current_leg_idx > 0:
-                    # Update trailing peak if we've reached new high
-                    if current_ga > trailing_peak[current_leg_idx]:
-                        trailing_peak[current_leg_idx] = current_ga
-                        trailing_active[current_leg_idx] = True
-                    
-                    # Check both fallback mechanisms BEFORE session starts
-                    fallback_threshold = promotion_thresholds[current_leg_idx] * fallback_threshold_pct
-                    trailing_threshold = trailing_peak[current_leg_idx] * trailing_fallback_pct if trailing_active[current_leg_idx] else 0
-                    
-                    # Use MAX to trigger on whichever threshold is MORE protective (higher)
-                    if current_ga < max(fallback_threshold, trailing_threshold):
-                        # Determine which mechanism triggered
-                        mechanism = "STANDARD"
-                        threshold_value = fallback_threshold
-                        if trailing_active[current_leg_idx] and trailing_threshold > fallback_threshold:
-                            mechanism = "🔄 TRAILING"
-                            threshold_value = trailing_threshold
-                        
-                        # Demote to previous strategy
-                        current_leg_idx -= 1
-                        prev_leg = sequence_config[current_leg_idx]
-                        
-                        # Reset trailing for demoted leg
-                        if current_leg_idx + 1 < len(trailing_active):
-                            trailing_active[current_leg_idx + 1] = False
-                        if current_leg_idx + 1 < len(trailing_peak):
-                            trailing_peak[current_leg_idx + 1] = 0
-                        
-                        log.append({
-                            'month': m+1, 
-                            'event': 'FALLBACK', 
-                            'details': f"{mechanism} DEMOTED (pre-session): {active_strategy_name} -> {prev_leg['strategy_name']} (Bal: €{current_ga:,.0f}, fell below €{threshold_value:,.0f})"
-                        })
-                        
-                        active_strategy_name = prev_leg['strategy_name']
-                        active_config = prev_leg['config']
-                        active_target = prev_leg['target_ga']
-                        
-                        # Refresh Params for previous Leg
-                        overrides, tier_map, safety, mode, use_ratch, use_penalty, game_type, base_bet = CareerManager._extract_params(active_config)
-                        
-                        # Reset Tier Level based on old map
-                        temp_tier = get_tier_for_ga(current_ga, tier_map, 1, mode, game_type=game_type)
-                        active_level = temp_tier.level
-                        
-                        # Break out of remaining sessions this month to apply new strategy
-                        break
-                
-                session_ga_before = current_ga
-                
-                if game_type == 'Roulette':
-                    # --- ROULETTE ENGINE (returns 10 values) ---
-                    pnl, vol, used_lvl, spins, spice_stats, exit_reason, max_caroline, max_dalembert, press_streak, peak_profit = RouletteWorker.run_session(
-                        current_ga, overrides, tier_map, use_ratch, use_penalty, active_level, mode, base_bet
-                    )
-                else:
-                    # --- BACCARAT ENGINE (returns 9 values) ---
-                    pnl, vol, used_lvl, hands, exit_reason, press_streak, tie_count, tie_bets, tie_pnl, _, _ = BaccaratWorker.run_session(
-                        current_ga, overrides, tier_map, use_ratch, use_penalty, active_level, mode, base_bet
-                    )
-                
-                current_ga += pnl
-                month_pnl += pnl
-                active_level = used_lvl 
-                last_session_won = (pnl > 0)
-                
-                # === INTRA-SESSION TRAILING FALLBACK CHECK ===
-                # Check after each session to prevent large drawdowns within a month
-                if current_leg_idx > 0:
-                    # Update trailing peak if we've reached new high
-                    if current_ga > trailing_peak[current_leg_idx]:
-                        old_peak = trailing_peak[current_leg_idx]
-                        trailing_peak[current_leg_idx] = current_ga
-                        trailing_active[current_leg_idx] = True
-                        
-                        # Log significant peak updates (only if increase is meaningful, e.g., >1%)
-                        if (current_ga - old_peak) / old_peak > 0.01:
-                            new_threshold = current_ga * trailing_fallback_pct
-                            log.append({
-                                'month': m+1,
-                                'event': 'PEAK_UPDATE',
-                                'details': f"New Peak: €{current_ga:,.0f} (was €{old_peak:,.0f}), Trailing FB @ €{new_threshold:,.0f}"
-                            })
-                    
-                    # Check both fallback mechanisms
-                    fallback_threshold = promotion_thresholds[current_leg_idx] * fallback_threshold_pct
-                    trailing_threshold = trailing_peak[current_leg_idx] * trailing_fallback_pct if trailing_active[current_leg_idx] else 0
-                    
-                    # Use MAX to trigger on whichever threshold is MORE protective (higher)
-                    if current_ga < max(fallback_threshold, trailing_threshold):
-                        # Determine which mechanism triggered
-                        mechanism = "STANDARD"
-                        threshold_value = fallback_threshold
-                        if trailing_active[current_leg_idx] and trailing_threshold > fallback_threshold:
-                            mechanism = "🔄 TRAILING"
-                            threshold_value = trailing_threshold
-                        
-                        # Demote to previous strategy
-                        current_leg_idx -= 1
-                        prev_leg = sequence_config[current_leg_idx]
-                        
-                        # Reset trailing for demoted leg
-                        if current_leg_idx + 1 < len(trailing_active):
-                            trailing_active[current_leg_idx + 1] = False
-                        if current_leg_idx + 1 < len(trailing_peak):
-                            trailing_peak[current_leg_idx + 1] = 0
-                        
-                        log.append({
-                            'month': m+1, 
-                            'event': 'FALLBACK', 
-                            'details': f"{mechanism} DEMOTED (intra-month): {active_strategy_name} -> {prev_leg['strategy_name']} (Bal: €{current_ga:,.0f}, fell below €{threshold_value:,.0f})"
-                        })
-                        
-                        active_strategy_name = prev_leg['strategy_name']
-                        active_config = prev_leg['config']
-                        active_target = prev_leg['target_ga']
-                        
-                        # Refresh Params for previous Leg
-                        overrides, tier_map, safety, mode, use_ratch, use_penalty, game_type, base_bet = CareerManager._extract_params(active_config)
-                        
-                        # Reset Tier Level based on old map
-                        temp_tier = get_tier_for_ga(current_ga, tier_map, 1, mode, game_type=game_type)
-                        active_level = temp_tier.level
-                        
-                        # Break out of remaining sessions this month to apply new strategy
-                        break
-                
-                # Update doctrine after each session
-                if doctrine_enabled and doctrine_ctx:
-                    result_u = pnl / base_bet
-                    update_after_session(doctrine_ctx, result_u, current_ga, doctrine_ctx.state)
-            
-            # Update doctrine after month (for cool-off tracking)
-            if doctrine_enabled and doctrine_ctx:
-                update_after_month(doctrine_ctx)
-            
-            trajectory.append(current_ga)
-            
-            if m % 12 == 0:
-                year_num = (m // 12) + 1
-                status_detail = f"Year {year_num} | €{current_ga:,.0f} | {active_strategy_name} ({game_type})"
-                
-                # Add doctrine state to status if enabled
-                if doctrine_enabled and doctrine_ctx:
-                    status_detail += f" | Doctrine: {doctrine_ctx.state}"
-                
-                log.append({
-                    'month': m+1, 
-                    'event': 'STATUS', 
-                    'details': status_detail
-                })
-
-        # Prepare doctrine summary if enabled
-        doctrine_summary = None
-        if doctrine_enabled and doctrine_ctx:
-            doctrine_summary = {
-                'final_state': doctrine_ctx.state,
-                'platinum_sessions': doctrine_ctx.platinum_sessions,
-                'tight_sessions': doctrine_ctx.tight_sessions,
-                'cooloff_months': doctrine_ctx.cooloff_months,
-                'transitions': doctrine_ctx.transitions,
-                'peak_ga': doctrine_ctx.GA_peak
-            }
-
-        return trajectory, log, current_ga, total_input, doctrine_summary
-
-    @staticmethod
-    def _extract_params(config):
-        mode = config.get('tac_mode', 'Standard')
-        safety = config.get('tac_safety', 25)
-        base_bet = config.get('tac_base_bet', 10.0)
-        
-        # 1. Detect Game Type
-        bet_val = config.get('tac_bet', 'Banker')
-        game_type = 'Roulette' if bet_val in ROULETTE_BETS else 'Baccarat'
-        
-        # 2. Generate appropriate Tier Map
-        tier_map = generate_tier_map(safety, mode=mode, game_type=game_type, base_bet=base_bet)
-        
-        # 3. Handle Bet Strategy Object
-        if game_type == 'Baccarat':
-            if bet_val == 'BANKER':
-                bet_strat_obj = BetStrategy.BANKER
-            elif bet_val == 'PLAYER':
-                bet_strat_obj = BetStrategy.PLAYER
-            elif bet_val == 'FOLLOW_WINNER':
-                bet_strat_obj = BetStrategy.FOLLOW_WINNER
-            else:
-                bet_strat_obj = BetStrategy.BANKER  # Default fallback
-        else:
-            bet_strat_obj = bet_val 
-
-        overrides = StrategyOverrides(
-            iron_gate_limit=config.get('tac_iron', 3),
-            stop_loss_units=config.get('risk_stop', 10),
-            profit_lock_units=config.get('risk_prof', 10),
-            press_trigger_wins=config.get('tac_press', 1),
-            press_depth=config.get('tac_depth', 3),
-            ratchet_enabled=config.get('risk_ratch', False),
-            ratchet_mode=config.get('risk_ratch_mode', 'Standard'),
-            shoes_per_session=config.get('tac_shoes', 3),
-            bet_strategy=bet_strat_obj,
-            penalty_box_enabled=config.get('tac_penalty', True),
-            tie_bet_enabled=config.get('tie_bet_enabled', False),  # Respect user's saved setting
-            
-            # SPICE v5.0 Configs - Use defaults (all disabled) for career mode
-            # Individual spice types can be configured in the UI if needed
-            spice_global_max_per_session=config.get('spice_global_max_session', 3),
-            spice_global_max_per_spin=config.get('spice_global_max_spin', 1),
-            spice_disable_if_caroline_step4=config.get('spice_disable_caroline', True),
-            spice_disable_if_pl_below_zero=config.get('spice_disable_below_zero', True),
-            spice_unit_ratio=0.5 if config.get('spice_hybrid_mode', False) else 1.0
-        )
-        use_ratchet = config.get('risk_ratch', False)
-        penalty_mode = config.get('tac_penalty', True)
-        
-        return overrides, tier_map, safety, mode, use_ratchet, penalty_mode, game_type, base_bet
+
+from engine.career_manager import CareerManager
+from engine import career_log as clog
+from engine.career_log import CareerEventLog
+from engine.seeding import DEFAULT_SEED
+from engine.batch import run_career
+from engine.replay import replay_career_universe
+from engine.cancellation import Cancelled
+from ui.chart_data import zoomable_plotly
+from ui.live_preview import LivePreview, CAREER_KPIS, career_summary
+from ui.scheduling import submit_page_run, wait_for_run
+from ui.tables import paged_table, download_button, download_buttons
+from ui.universe_replay import universe_picker
+from utils.scheduler import AdmissionError, estimate_cost, get_scheduler, report_progress
+from utils.persistence import get_saved_strategies, get_strategy_names
+from utils.result_cache import result_key, pack_results, unpack_results, load_result, save_result
+from utils.exports import batched
+
+CSV_PREVIEW_LINES = 40  # Lines of the career CSV shown on the page (the download has all of it)
+
+def event_color(l):
+    """Text classes of an event log entry."""
+    if l['event'] == 'FALLBACK':
+        # Distinguish between trailing and standard fallback
+        return "text-orange-400 font-bold" if '🔄 TRAILING' in l['details'] else "text-red-400 font-bold"
+    return {
+        'PROMOTION': "text-yellow-400",
+        'INSOLVENT': "text-red-500 font-bold",
+        'ERROR': "text-red-600 font-bold",
+        'DOCTRINE': "text-purple-400 font-bold",
+        'PEAK_UPDATE': "text-green-400",
+    }.get(l['event'], "text-slate-400")
 
 def show_career_mode():
     
     legs = [] 
+    last_run = {}  # Latest multiverse (family key + per-universe results), reused by ADD UNIVERSES
+    active_task = None  # Scheduled run in progress (STOP cancels it)
     
     def refresh_leg_ui():
         legs_container.clear()
@@ -499,6 +72,18 @@ def show_career_mode():
         refresh_leg_ui()
 
     async def run_simulation():
+        await run_career_multiverse(int(slider_num_sims.value))
+
+    async def add_universes():
+        if not last_run:
+            ui.notify('Run the career first', type='warning'); return
+        await run_career_multiverse(len(last_run['results']) + int(number_add_sims.value or 0))
+
+    def stop_simulation():
+        if active_task: get_scheduler().cancel(active_task)
+
+    async def run_career_multiverse(num_sims):
+        nonlocal active_task
         try:
             if not legs:
                 ui.notify('Add at least one Strategy Leg!', type='negative')
@@ -507,8 +92,7 @@ def show_career_mode():
             progress.set_visibility(True)
             results_area.clear()
 
-            profile = load_profile()
-            saved_strats = profile.get('saved_strategies', {})
+            saved_strats = get_saved_strategies()
             sequence_config = []
             for leg in legs:
                 cfg = saved_strats.get(leg['strategy'])
@@ -520,58 +104,61 @@ def show_career_mode():
             start_ga = slider_start_ga.value
             years = slider_years.value
             sessions = slider_freq.value
-            num_sims = slider_num_sims.value
-
-
-            async def run_batch_with_progress():
-                batch_results = []
-                error_details = []
-                for i in range(num_sims):
-                    try:
-                        traj, log, final_ga, total_in, doctrine_summary = CareerManager.run_compound_career(
-                            sequence_config, start_ga, years, sessions,
-                            slider_fallback.value / 100.0, slider_promotion_buffer.value / 100.0,
-                            slider_trailing_fallback.value / 100.0
-                        )
-                        net_cost = total_in - final_ga
-                        monthly_cost = net_cost / (years * 12)
-                        batch_results.append({
-                            'trajectory': traj,
-                            'log': log,
-                            'final': final_ga,
-                            'monthly_cost': monthly_cost,
-                            'doctrine_summary': doctrine_summary
-                        })
-                    except Exception as e:
-                        error_msg = f"Sim {i+1} error: {str(e)}"
-                        error_details.append(error_msg)
-                        print(f"Simulation error: {e}")
-                        import traceback
-                        traceback.print_exc()
-                        batch_results.append({
-                            'trajectory': [],
-                            'log': [
-                                {'month': 0, 'event': 'ERROR', 'details': str(e)}
-                            ],
-                            'final': 0,
-                            'monthly_cost': 0,
-                            'doctrine_summary': None,
-                            'error': str(e)
-                        })
-                    # Update progress bar (simulate progress)
-                    progress.value = (i + 1) / num_sims
-                    await asyncio.sleep(0)  # Yield to event loop for UI update
+            retention = select_log_retention.value
+            seed = int(number_seed.value or 0)
+            settings = {'start_ga': start_ga, 'years': years, 'sessions': sessions,
+                        'fallback': slider_fallback.value, 'promotion_buffer': slider_promotion_buffer.value,
+                        'trailing_fallback': slider_trailing_fallback.value, 'retention': retention}
+            family = result_key('career', sequence=sequence_config, settings=settings, seed=seed)
+            cache_key = result_key('career', family=family, universes=num_sims)
+
+            async def run_batch_with_progress(batch_results):
+                nonlocal active_task
+                played, todo = len(batch_results), num_sims - len(batch_results)
+                if todo > 0:
+                    # Bands and KPIs refresh as chunks finish, so a bad ladder can be stopped early
+                    preview = LivePreview(results_area, 'Live Multiverse (Career)', CAREER_KPIS, career_summary)
+                    if played: preview.collect(0, batch_results)
+                    # Queued on the server-wide scheduler (fair share with other users, cancelled if this tab closes)
+                    active_task = submit_page_run(
+                        run_career, (sequence_config, num_sims),
+                        dict(seed=seed, settings=settings, start=played, max_workers=get_scheduler().processes_per_task,
+                             on_chunk=report_progress, on_results=preview.collect),
+                        cost=estimate_cost(todo, years*12, sessions/12), name=f"Career sim ({todo} universes)")
+                    btn_stop.set_visibility(True)
+                    async def show_progress(task):
+                        n = played + int(task.progress * todo)
+                        progress.value = n / num_sims
+                        label_status.set_text(f"Simulating Universe {n}/{num_sims}")
+                        await preview.refresh()
+                    new_results, _ = await wait_for_run(active_task, label_status, show_progress)
+                    batch_results.extend(new_results)
+                error_details = [f"Sim {i+1} error: {r['error']}" for i, r in enumerate(batch_results) if 'error' in r]
                 return batch_results, error_details
 
             # Set progress bar to determinate mode
             progress.props('color=purple')
             progress.value = 0
             progress.set_visibility(True)
-            results, error_details = await run_batch_with_progress()
+            cached = await asyncio.to_thread(load_result, cache_key)
+            if cached:
+                results, error_details = unpack_results(cached[0]), []
+                for r in results:
+                    r['log'] = CareerEventLog.from_dict(r['log'])
+                ui.notify(f'Loaded {len(results)} universes from cache', type='info')
+            else:
+                # Same settings as the previous run: universe i is seeded from (seed, i), so only the extra universes are played
+                reused = list(last_run['results'][:num_sims]) if last_run.get('family') == family else []
+                results, error_details = await run_batch_with_progress(reused)
+                if not error_details and not any('error' in r for r in results):
+                    packed = pack_results([dict(r, log=r['log'].to_dict()) for r in results])
+                    await asyncio.to_thread(save_result, cache_key, packed, {'seed': seed})
+            if last_run.get('family') != family or len(results) > len(last_run['results']):
+                last_run.update(family=family, results=results)
             progress.set_visibility(False)
 
             # Filter out failed runs
-            valid_results = [r for r in results if r['trajectory']]
+            valid_results = [r for r in results if len(r['trajectory'])]
             if not valid_results:
                 error_msg = 'All simulations failed. Check logs for details.'
                 if error_details:
@@ -596,6 +183,7 @@ def show_career_mode():
             avg_cost = np.mean(costs)
             med_cost = np.median(costs)
 
+            results_area.clear()  # Replaces the live preview
             with results_area:
                 with ui.row().classes('w-full justify-between mb-4'):
                     with ui.card().classes('bg-slate-800 p-2'):
@@ -675,14 +263,74 @@ def show_career_mode():
                                 ))
 
                     fig_single.update_layout(height=400, margin=dict(l=20, r=20, t=20, b=20), paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)', font=dict(color='#94a3b8'))
-                    ui.plotly(fig_single).classes('w-full border border-slate-700 rounded')
+                    zoomable_plotly(fig_single).classes('w-full border border-slate-700 rounded')
+
+                # Renders one universe in the single sim container (a fresh random one, or a replayed universe of this run)
+                def render_single(traj, log, final, monthly_cost, doctrine_summary, title=None):
+                    single_sim_chart.clear()
+                    with single_sim_chart:
+                        if title:
+                            ui.label(title).classes('text-xs text-cyan-400 font-bold mb-1')
+                        res_color = "text-green-400" if final >= slider_start_ga.value else "text-red-400"
+                        ui.label(f"Result: €{final:,.0f}").classes(f'text-xl font-bold {res_color} mb-2')
+                            
+                        # Display monthly cost
+                        cost_color = "text-red-400" if monthly_cost > 0 else "text-green-400"
+                        ui.label(f"Average Monthly Cost: €{monthly_cost:,.2f}").classes(f'text-sm font-semibold {cost_color} mb-2')
+                            
+                        # Add doctrine stats if available
+                        if doctrine_summary:
+                            ui.label(f"Doctrine: {doctrine_summary['final_state']} | "
+                                    f"Platinum: {doctrine_summary['platinum_sessions']}s | "
+                                    f"Tight: {doctrine_summary['tight_sessions']}s | "
+                                    f"Cool-Off: {doctrine_summary['cooloff_months']}m").classes('text-xs text-purple-400 mb-2')
+                            
+                        fig = go.Figure()
+                        fig.add_trace(go.Scatter(y=traj, mode='lines', name='Balance', line=dict(color='#38bdf8', width=2)))
+                        for leg in legs[:-1]:
+                            fig.add_hline(y=leg['target'], line_dash="dash", line_color="yellow")
+                            
+                        # Add visual markers for FALLBACK events
+                        for event in log:
+                            if event['event'] == 'FALLBACK':
+                                month_idx = event['month'] - 1
+                                if 0 <= month_idx < len(traj):
+                                    # Determine marker color based on fallback type
+                                    is_trailing = '🔄 TRAILING' in event['details']
+                                    marker_color = 'orange' if is_trailing else 'red'
+                                    marker_symbol = 'triangle-down' if is_trailing else 'circle'
+                                    label = 'Trailing FB' if is_trailing else 'Standard FB'
+                                        
+                                    # Add a marker at the fallback point
+                                    fig.add_trace(go.Scatter(
+                                        x=[month_idx],
+                                        y=[traj[month_idx]],
+                                        mode='markers',
+                                        marker=dict(size=12, color=marker_color, symbol=marker_symbol, line=dict(width=2, color='white')),
+                                        name=label,
+                                        showlegend=True,
+                                        hovertext=event['details'],
+                                        hoverinfo='text'
+                                    ))
+                            
+                        fig.update_layout(height=400, margin=dict(l=20, r=20, t=20, b=20), paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)', font=dict(color='#94a3b8'))
+                        zoomable_plotly(fig).classes('w-full border border-slate-700 rounded')
+
+                        if title:  # Replayed universe: its event log is kept in full
+                            with ui.expansion(f'Event Log ({len(log):,} events)', icon='history').classes('w-full bg-slate-800 mt-2'):
+                                paged_table([
+                                    {'name': 'month', 'label': 'Month', 'field': 'month', 'align': 'left'},
+                                    {'name': 'event', 'label': 'Event', 'field': 'event', 'align': 'left'},
+                                    {'name': 'details', 'label': 'Details', 'field': 'details', 'align': 'left'},
+                                ], log, lambda l: dict(l, _class=f'text-xs {event_color(l)}')).classes('w-full bg-slate-800')
+                                download_buttons('career_universe_event_log', ['Month', 'Event', 'Details'], log,
+                                                 lambda l: {'Month': l['month'], 'Event': l['event'], 'Details': l['details']})
 
                 # Refresh function that updates the single sim chart
                 async def refresh_single():
                     if not legs: return
                     try:
-                        profile = load_profile()
-                        saved_strats = profile.get('saved_strategies', {})
+                        saved_strats = get_saved_strategies()
                         refresh_config = []
                         for leg in legs:
                             cfg = saved_strats.get(leg['strategy'])
@@ -698,59 +346,27 @@ def show_career_mode():
                         net_cost = total_in - final
                         monthly_cost = net_cost / (slider_years.value * 12)
                         
-                        single_sim_chart.clear()
-                        with single_sim_chart:
-                            res_color = "text-green-400" if final >= slider_start_ga.value else "text-red-400"
-                            ui.label(f"Result: €{final:,.0f}").classes(f'text-xl font-bold {res_color} mb-2')
-                            
-                            # Display monthly cost
-                            cost_color = "text-red-400" if monthly_cost > 0 else "text-green-400"
-                            ui.label(f"Average Monthly Cost: €{monthly_cost:,.2f}").classes(f'text-sm font-semibold {cost_color} mb-2')
-                            
-                            # Add doctrine stats if available
-                            if doctrine_summary:
-                                ui.label(f"Doctrine: {doctrine_summary['final_state']} | "
-                                        f"Platinum: {doctrine_summary['platinum_sessions']}s | "
-                                        f"Tight: {doctrine_summary['tight_sessions']}s | "
-                                        f"Cool-Off: {doctrine_summary['cooloff_months']}m").classes('text-xs text-purple-400 mb-2')
-                            
-                            fig = go.Figure()
-                            fig.add_trace(go.Scatter(y=traj, mode='lines', name='Balance', line=dict(color='#38bdf8', width=2)))
-                            for leg in legs[:-1]:
-                                fig.add_hline(y=leg['target'], line_dash="dash", line_color="yellow")
-                            
-                            # Add visual markers for FALLBACK events
-                            for event in log:
-                                if event['event'] == 'FALLBACK':
-                                    month_idx = event['month'] - 1
-                                    if 0 <= month_idx < len(traj):
-                                        # Determine marker color based on fallback type
-                                        is_trailing = '🔄 TRAILING' in event['details']
-                                        marker_color = 'orange' if is_trailing else 'red'
-                                        marker_symbol = 'triangle-down' if is_trailing else 'circle'
-                                        label = 'Trailing FB' if is_trailing else 'Standard FB'
-                                        
-                                        # Add a marker at the fallback point
-                                        fig.add_trace(go.Scatter(
-                                            x=[month_idx],
-                                            y=[traj[month_idx]],
-                                            mode='markers',
-                                            marker=dict(size=12, color=marker_color, symbol=marker_symbol, line=dict(width=2, color='white')),
-                                            name=label,
-                                            showlegend=True,
-                                            hovertext=event['details'],
-                                            hoverinfo='text'
-                                        ))
-                            
-                            fig.update_layout(height=400, margin=dict(l=20, r=20, t=20, b=20), paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)', font=dict(color='#94a3b8'))
-                            ui.plotly(fig).classes('w-full border border-slate-700 rounded')
+                        render_single(traj, log, final, monthly_cost, doctrine_summary)
 
                     except Exception as e:
                         ui.notify(str(e), type='negative')
                         print(traceback.format_exc())
                 
+                async def replay_single(index, label=None):
+                    """Replays universe #index of this run from its seed, with its full event log."""
+                    try:
+                        res = await asyncio.to_thread(replay_career_universe, sequence_config, index, seed, settings)
+                    except Exception as e:
+                        ui.notify(str(e), type='negative'); return
+                    if 'error' in res:
+                        ui.notify(f"Universe #{index + 1} failed: {res['error']}", type='negative'); return
+                    name = f"UNIVERSE #{index + 1}" + (f" ({label})" if label else '')
+                    render_single(res['trajectory'], res['log'], res['final'], res['monthly_cost'], res['doctrine_summary'],
+                                  title=f"{name} - REPLAYED FROM ITS SEED")
+
                 # REFRESH BUTTON right below the chart (placed after function definition)
-                ui.button('⚡ REFRESH SINGLE', on_click=refresh_single).props('flat color=cyan dense').classes('mt-2 mb-4')
+                ui.button('⚡ REFRESH SINGLE', on_click=refresh_single).props('flat color=cyan dense').classes('mt-2')
+                universe_picker(results, replay_single, key='final')
 
                 # CSV Export for AI Analysis
                 with ui.card().classes('w-full bg-slate-900 p-4 mt-4 mb-4'):
@@ -763,76 +379,72 @@ def show_career_mode():
                     contrib_win = first_leg_cfg.get('eco_win', 300)
                     contrib_loss = first_leg_cfg.get('eco_loss', 300)
                     
-                    csv_lines = []
-                    csv_lines.append('# CAREER SETTINGS')
-                    csv_lines.append(f'Start_GA,{start_ga:.2f}')
-                    csv_lines.append(f'Monthly_Contrib_Win,{contrib_win:.2f}')
-                    csv_lines.append(f'Monthly_Contrib_Loss,{contrib_loss:.2f}')
-                    csv_lines.append(f'Years,{years}')
-                    csv_lines.append(f'Sessions_Per_Year,{sessions}')
-                    csv_lines.append('')
-                    
-                    # Add Doctrine Engine Settings
-                    if first_leg_cfg.get('doctrine_enabled', False):
-                        csv_lines.append('# DOCTRINE ENGINE SETTINGS')
-                        csv_lines.append('Doctrine_Enabled,True')
-                        csv_lines.append(f"Platinum_StopLoss,{first_leg_cfg.get('doctrine_pl_stop', 10)}")
-                        csv_lines.append(f"Platinum_Target,{first_leg_cfg.get('doctrine_pl_target', 10)}")
-                        csv_lines.append(f"Platinum_PressWins,{first_leg_cfg.get('doctrine_pl_press_wins', 3)}")
-                        csv_lines.append(f"Platinum_PressDepth,{first_leg_cfg.get('doctrine_pl_press_depth', 3)}")
-                        csv_lines.append(f"Platinum_IronGate,{first_leg_cfg.get('doctrine_pl_iron', 3)}")
-                        csv_lines.append(f"Tight_StopLoss,{first_leg_cfg.get('doctrine_ti_stop', 5)}")
-                        csv_lines.append(f"Tight_Target,{first_leg_cfg.get('doctrine_ti_target', 5)}")
-                        csv_lines.append(f"Tight_PressWins,{first_leg_cfg.get('doctrine_ti_press_wins', 5)}")
-                        csv_lines.append(f"Tight_PressDepth,{first_leg_cfg.get('doctrine_ti_press_depth', 1)}")
-                        csv_lines.append(f"Tight_IronGate,{first_leg_cfg.get('doctrine_ti_iron', 2)}")
-                        csv_lines.append(f"Trigger_BigLoss,{first_leg_cfg.get('doctrine_loss_trigger', 8)}")
-                        csv_lines.append(f"Trigger_DrawdownPct,{first_leg_cfg.get('doctrine_dd_pct', 0.15)}")
-                        csv_lines.append(f"Trigger_DrawdownEur,{first_leg_cfg.get('doctrine_dd_eur', 3000)}")
-                        csv_lines.append(f"Tight_MinSessions,{first_leg_cfg.get('doctrine_tight_min', 1)}")
-                        csv_lines.append(f"Tight_MaxSessions,{first_leg_cfg.get('doctrine_tight_max', 2)}")
-                        csv_lines.append(f"CoolOff_Enabled,{first_leg_cfg.get('doctrine_cooloff_enabled', True)}")
-                        csv_lines.append(f"CoolOff_Floor,{first_leg_cfg.get('doctrine_cooloff_floor', 3000)}")
-                        csv_lines.append(f"CoolOff_MinMonths,{first_leg_cfg.get('doctrine_cooloff_months', 1)}")
-                        csv_lines.append(f"CoolOff_RecoveryPct,{first_leg_cfg.get('doctrine_recovery_pct', 0.07)}")
-                        csv_lines.append('')
-                    else:
-                        csv_lines.append('# DOCTRINE ENGINE SETTINGS')
-                        csv_lines.append('Doctrine_Enabled,False')
-                        csv_lines.append('')
-                    csv_lines.append('')
-                    csv_lines.append('# SIM #1 MONTHLY TRAJECTORY')
-                    csv_lines.append('Month,Bankroll')
-                    for month_idx, bankroll in enumerate(sim1_traj, 1):
-                        csv_lines.append(f"{month_idx},{bankroll:.2f}")
-                    
-                    # Add all simulations final results
-                    csv_lines.append('')
-                    csv_lines.append('# ALL SIMULATIONS FINAL RESULTS')
-                    csv_lines.append('Simulation,Final_Bankroll,Net_Profit,Success')
-                    for sim_idx, res in enumerate(valid_results, 1):
-                        final = res['final']
-                        net = final - start_ga
-                        success = 1 if final > start_ga else 0
-                        csv_lines.append(f"{sim_idx},{final:.2f},{net:.2f},{success}")
-                    
-                    # Add yearly milestones from Sim #1
-                    csv_lines.append('')
-                    csv_lines.append('# SIM #1 YEARLY MILESTONES')
-                    csv_lines.append('Year,Bankroll')
-                    for year in range(years):
-                        month_idx = (year + 1) * 12 - 1
-                        if month_idx < len(sim1_traj):
-                            csv_lines.append(f"{year+1},{sim1_traj[month_idx]:.2f}")
-                    
-                    csv_text = '\n'.join(csv_lines)
-                    csv_area = ui.textarea(value=csv_text).classes('w-full font-mono text-xs').props('rows=10 readonly')
-                    
-                    def copy_career_csv():
-                        ui.run_javascript(f'navigator.clipboard.writeText(`{csv_text}`)')
-                        ui.notify('Career CSV copied to clipboard!', type='positive')
-                    
-                    ui.button('COPY CSV', on_click=copy_career_csv).props('icon=content_copy color=yellow').classes('w-full mt-2')
+                    def career_csv_lines():
+                        # Streamed line by line: the trajectory and final results grow with years and universes
+                        yield '# CAREER SETTINGS'
+                        yield f'Start_GA,{start_ga:.2f}'
+                        yield f'Monthly_Contrib_Win,{contrib_win:.2f}'
+                        yield f'Monthly_Contrib_Loss,{contrib_loss:.2f}'
+                        yield f'Years,{years}'
+                        yield f'Sessions_Per_Year,{sessions}'
+                        yield ''
+                    
+                        # Add Doctrine Engine Settings
+                        if first_leg_cfg.get('doctrine_enabled', False):
+                            yield '# DOCTRINE ENGINE SETTINGS'
+                            yield 'Doctrine_Enabled,True'
+                            yield f"Platinum_StopLoss,{first_leg_cfg.get('doctrine_pl_stop', 10)}"
+                            yield f"Platinum_Target,{first_leg_cfg.get('doctrine_pl_target', 10)}"
+                            yield f"Platinum_PressWins,{first_leg_cfg.get('doctrine_pl_press_wins', 3)}"
+                            yield f"Platinum_PressDepth,{first_leg_cfg.get('doctrine_pl_press_depth', 3)}"
+                            yield f"Platinum_IronGate,{first_leg_cfg.get('doctrine_pl_iron', 3)}"
+                            yield f"Tight_StopLoss,{first_leg_cfg.get('doctrine_ti_stop', 5)}"
+                            yield f"Tight_Target,{first_leg_cfg.get('doctrine_ti_target', 5)}"
+                            yield f"Tight_PressWins,{first_leg_cfg.get('doctrine_ti_press_wins', 5)}"
+                            yield f"Tight_PressDepth,{first_leg_cfg.get('doctrine_ti_press_depth', 1)}"
+                            yield f"Tight_IronGate,{first_leg_cfg.get('doctrine_ti_iron', 2)}"
+                            yield f"Trigger_BigLoss,{first_leg_cfg.get('doctrine_loss_trigger', 8)}"
+                            yield f"Trigger_DrawdownPct,{first_leg_cfg.get('doctrine_dd_pct', 0.15)}"
+                            yield f"Trigger_DrawdownEur,{first_leg_cfg.get('doctrine_dd_eur', 3000)}"
+                            yield f"Tight_MinSessions,{first_leg_cfg.get('doctrine_tight_min', 1)}"
+                            yield f"Tight_MaxSessions,{first_leg_cfg.get('doctrine_tight_max', 2)}"
+                            yield f"CoolOff_Enabled,{first_leg_cfg.get('doctrine_cooloff_enabled', True)}"
+                            yield f"CoolOff_Floor,{first_leg_cfg.get('doctrine_cooloff_floor', 3000)}"
+                            yield f"CoolOff_MinMonths,{first_leg_cfg.get('doctrine_cooloff_months', 1)}"
+                            yield f"CoolOff_RecoveryPct,{first_leg_cfg.get('doctrine_recovery_pct', 0.07)}"
+                            yield ''
+                        else:
+                            yield '# DOCTRINE ENGINE SETTINGS'
+                            yield 'Doctrine_Enabled,False'
+                            yield ''
+                        yield ''
+                        yield '# SIM #1 MONTHLY TRAJECTORY'
+                        yield 'Month,Bankroll'
+                        for month_idx, bankroll in enumerate(sim1_traj, 1):
+                            yield f"{month_idx},{bankroll:.2f}"
+                    
+                        # Add all simulations final results
+                        yield ''
+                        yield '# ALL SIMULATIONS FINAL RESULTS'
+                        yield 'Simulation,Final_Bankroll,Net_Profit,Success'
+                        for sim_idx, res in enumerate(valid_results, 1):
+                            final = res['final']
+                            net = final - start_ga
+                            success = 1 if final > start_ga else 0
+                            yield f"{sim_idx},{final:.2f},{net:.2f},{success}"
+                    
+                        # Add yearly milestones from Sim #1
+                        yield ''
+                        yield '# SIM #1 YEARLY MILESTONES'
+                        yield 'Year,Bankroll'
+                        for year in range(years):
+                            month_idx = (year + 1) * 12 - 1
+                            if month_idx < len(sim1_traj):
+                                yield f"{year+1},{sim1_traj[month_idx]:.2f}"
+
+                    ui.textarea(value='\n'.join(itertools.islice(career_csv_lines(), CSV_PREVIEW_LINES)) + '\n...') \
+                        .classes('w-full font-mono text-xs').props('rows=10 readonly')
+                    download_button('DOWNLOAD CSV', 'career_export.csv', lambda: batched(career_csv_lines())).props('icon=download color=yellow').classes('w-full mt-2')
                     
                     # Summary statistics CSV
                     ui.label('CAREER SUMMARY CSV').classes('text-xs font-bold text-slate-400 mt-4 mb-2')
@@ -869,35 +481,25 @@ Trailing_Fallback,{slider_trailing_fallback.value}"""
                     
                     # Event log CSV
                     ui.label('EVENT LOG CSV (Sim #1)').classes('text-xs font-bold text-slate-400 mt-4 mb-2')
-                    event_csv_lines = ['Month,Event,Details']
-                    for l in sim1_log:
-                        # Escape commas in details
-                        details = l['details'].replace(',', ';')
-                        event_csv_lines.append(f"{l['month']},{l['event']},{details}")
-                    event_csv = '\\n'.join(event_csv_lines)
-                    
-                    event_csv_area = ui.textarea(value=event_csv).classes('w-full font-mono text-xs').props('rows=8 readonly')
-                    
-                    def copy_event_log():
-                        ui.run_javascript(f'navigator.clipboard.writeText(`{event_csv}`)')
-                        ui.notify('Event log copied!', type='positive')
-                    
-                    ui.button('COPY EVENT LOG', on_click=copy_event_log).props('icon=content_copy color=purple').classes('w-full mt-2')
+                    download_buttons('career_event_log', ['Month', 'Event', 'Details'], sim1_log,
+                                     lambda l: {'Month': l['month'], 'Event': l['event'], 'Details': l['details']})
+
+                # Event counts across all universes (kept under every retention level)
+                event_totals = clog.merge_counts(r['log'] for r in valid_results)
+                with ui.row().classes('w-full gap-4 mt-4'):
+                    ui.label('EVENTS (all universes):').classes('text-xs font-bold text-slate-400')
+                    for name, total in event_totals.items():
+                        ui.label(f"{name}: {total:,} ({total / len(valid_results):.1f}/universe)").classes('text-xs text-slate-300')
 
                 with ui.expansion('Event Log (Sim #1)', icon='history').classes('w-full bg-slate-800 mt-4'):
-                    for l in sim1_log:
-                        color = "text-yellow-400" if l['event'] == 'PROMOTION' else "text-slate-400"
-                        if l['event'] == 'INSOLVENT': color = "text-red-500 font-bold"
-                        if l['event'] == 'ERROR': color = "text-red-600 font-bold"
-                        if l['event'] == 'DOCTRINE': color = "text-purple-400 font-bold"
-                        if l['event'] == 'PEAK_UPDATE': color = "text-green-400"
-                        if l['event'] == 'FALLBACK':
-                            # Distinguish between trailing and standard fallback
-                            if '🔄 TRAILING' in l['details']:
-                                color = "text-orange-400 font-bold"
-                            else:
-                                color = "text-red-400 font-bold"
-                        ui.label(f"M{l['month']} | {l['event']}: {l['details']}").classes(f'text-xs {color}')
+                    if not sim1_log.detail:
+                        ui.label('Event detail not retained (Counts only). Use REFRESH SINGLE or change Event Log retention.').classes('text-xs text-slate-500')
+                    else:
+                        paged_table([
+                            {'name': 'month', 'label': 'Month', 'field': 'month', 'align': 'left'},
+                            {'name': 'event', 'label': 'Event', 'field': 'event', 'align': 'left'},
+                            {'name': 'details', 'label': 'Details', 'field': 'details', 'align': 'left'},
+                        ], sim1_log, lambda l: dict(l, _class=f'text-xs {event_color(l)}')).classes('w-full bg-slate-800')
                 
                 # Doctrine Summary for Sim #1
                 if sim1_doctrine := valid_results[0].get('doctrine_summary'):
@@ -912,10 +514,15 @@ Trailing_Fallback,{slider_trailing_fallback.value}"""
                             ui.label('State Transitions:').classes('text-xs text-purple-300 font-bold mt-2')
                             for trans in sim1_doctrine['transitions'][:10]:  # Show first 10 transitions
                                 ui.label(f"Session {trans['session']}: {trans['from']} → {trans['to']} ({trans['reason']})").classes('text-xs text-slate-400')
+        except Cancelled:
+            ui.notify('Career simulation cancelled', type='info')
+        except AdmissionError as e:
+            ui.notify(str(e), type='warning')
         except Exception as e:
             ui.notify(f'Critical error: {e}', type='negative')
             import traceback; traceback.print_exc()
         finally:
+            active_task = None; btn_stop.set_visibility(False); label_status.set_text('')
             progress.set_visibility(False)
 
     # --- UI LAYOUT ---
@@ -930,8 +537,7 @@ Trailing_Fallback,{slider_trailing_fallback.value}"""
                 with ui.column().classes('w-full'):
                     ui.label('1. BUILD SEQUENCE').classes('font-bold text-white mb-2')
                     
-                    profile = load_profile()
-                    saved = list(profile.get('saved_strategies', {}).keys())
+                    saved = get_strategy_names()
                     
                     select_strat = ui.select(saved, label='Select Strategy').classes('w-full')
                     ui.label('Target Bankroll to Upgrade').classes('text-xs text-slate-500 mt-2')
@@ -950,6 +556,13 @@ Trailing_Fallback,{slider_trailing_fallback.value}"""
                     ui.label('Universes (Simulations)').classes('text-xs text-slate-400 mt-2')
                     slider_num_sims = ui.slider(min=10, max=1000, value=20).props('color=cyan')
                     ui.label().bind_text_from(slider_num_sims, 'value', lambda v: f'{v} Universes')
+                    number_seed = ui.number('Seed', value=DEFAULT_SEED, format='%d').props('dense').classes('w-full')
+                    select_log_retention = ui.select(
+                        {clog.RETAIN_COUNTS: 'Counts only',
+                         clog.RETAIN_SAMPLED: f'Sampled (first {clog.DEFAULT_SAMPLE_SIZE} universes)',
+                         clog.RETAIN_FULL: 'Full detail'},
+                        value=clog.RETAIN_SAMPLED, label='Event Log Retention'
+                    ).classes('w-full')
                     
                     ui.separator().classes('bg-slate-700 my-4')
                     ui.label('🔄 FALLBACK MECHANISM').classes('font-bold text-orange-400 mb-2')
@@ -974,6 +587,11 @@ Trailing_Fallback,{slider_trailing_fallback.value}"""
             
             ui.separator().classes('bg-slate-700 my-4')
             ui.button('RUN CAREER', on_click=run_simulation).props('icon=play_arrow color=green size=lg').classes('w-full')
+            with ui.row().classes('w-full items-center justify-end gap-2'):
+                label_status = ui.label('').classes('text-xs text-slate-500')
+                btn_stop = ui.button('STOP', on_click=stop_simulation).props('icon=stop flat color=red dense'); btn_stop.set_visibility(False)
+                number_add_sims = ui.number('Extra Universes', value=500, min=10, step=100, format='%d').props('dense').classes('w-32')
+                ui.button('ADD UNIVERSES', on_click=add_universes).props('icon=add flat color=cyan dense')
         
         # RESULTS AREA BELOW SETTINGS
         progress = ui.linear_progress().props('indeterminate color=purple').classes('w-full'); progress.set_visibility(False)
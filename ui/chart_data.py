@@ -0,0 +1,62 @@
+"""
+Chart data layer for long line charts (session bankroll, single-universe
+trajectories).
+
+zoomable_plotly(fig) is a drop-in for ui.plotly(fig): line traces longer than
+CHART_POINT_BUDGET are downsampled server-side with LTTB (utils/downsample.py)
+before the figure goes over the websocket. The full series stays on the
+server; when the user zooms or pans, the visible window is re-sent at full
+resolution (or LTTB'd to the budget if it is still too long), and
+double-click / autoscale brings back the overview.
+"""
+
+import numpy as np
+
+from nicegui import ui
+
+from utils.downsample import downsample
+
+CHART_POINT_BUDGET = 500  # About one point per pixel column of a tablet-width chart
+
+
+def _x_window(args: dict):
+    """Visible x range from a plotly_relayout event: (x0, x1), (None, None) for autorange, or None if x did not change."""
+    if 'xaxis.range[0]' in args and 'xaxis.range[1]' in args:
+        return float(args['xaxis.range[0]']), float(args['xaxis.range[1]'])
+    if isinstance(args.get('xaxis.range'), list):
+        return float(args['xaxis.range'][0]), float(args['xaxis.range'][1])
+    if args.get('xaxis.autorange'):
+        return None, None
+    return None
+
+
+def zoomable_plotly(fig, budget: int = CHART_POINT_BUDGET):
+    """ui.plotly(fig) with long line traces downsampled, and full resolution on zoom."""
+    full = {}  # trace index -> (x, y) at full resolution
+    for i, trace in enumerate(fig.data):
+        if trace.y is None or len(trace.y) <= budget or 'lines' not in (trace.mode or 'lines'):
+            continue
+        try:
+            y = np.asarray(trace.y, dtype=np.float64)
+            x = np.asarray(trace.x, dtype=np.float64) if trace.x is not None else np.arange(len(y))
+        except (TypeError, ValueError):
+            continue  # Non-numeric axis: sent as is
+        full[i] = (x, y)
+        trace.x, trace.y = downsample(x, y, budget)
+
+    plot = ui.plotly(fig)
+    if not full:
+        return plot
+
+    def on_relayout(e):
+        window = _x_window(e.args or {})
+        if window is None:
+            return
+        xs, ys = [], []
+        for x, y in full.values():
+            wx, wy = downsample(x, y, budget, *window)
+            xs.append(wx.tolist()); ys.append(wy.tolist())
+        plot.run_plot_method('restyle', {'x': xs, 'y': ys}, list(full))
+
+    plot.on('plotly_relayout', on_relayout)
+    return plot
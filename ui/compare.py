@@ -0,0 +1,199 @@
+"""
+Strategy comparison page: K saved strategies (Baccarat, Roulette or both)
+over the same universes with common random numbers (engine/comparison.py),
+with paired differences and their 95% intervals against a baseline strategy.
+"""
+
+import plotly.graph_objects as go
+from nicegui import ui
+
+from engine import batch
+from engine.cancellation import Cancelled
+from engine.comparison import COMPARE_METRICS, compare_stats, run_comparison
+from engine.seeding import DEFAULT_SEED
+from ui.scheduling import submit_page_run, wait_for_run
+from ui.tables import download_buttons
+from utils.persistence import get_saved_strategies, get_strategy_names
+from utils.scheduler import AdmissionError, estimate_cost, get_scheduler, report_progress
+
+MAX_STRATEGIES = 6
+
+MEANS_COLUMNS = [{'name': 'name', 'label': 'Strategy', 'field': 'name', 'align': 'left'}] + [
+    {'name': m, 'label': label, 'field': m} for m, label in COMPARE_METRICS.items()]
+DIFF_COLUMNS = [
+    {'name': 'strategy', 'label': 'Strategy', 'field': 'strategy', 'align': 'left'},
+    {'name': 'metric', 'label': 'Metric', 'field': 'metric', 'align': 'left'},
+    {'name': 'mean_diff', 'label': 'Δ vs baseline', 'field': 'mean_diff'},
+    {'name': 'ci', 'label': 'Paired 95% CI', 'field': 'ci'},
+    {'name': 'unpaired', 'label': 'Independent runs 95% CI', 'field': 'unpaired'},
+    {'name': 'efficiency', 'label': 'Universes saved', 'field': 'efficiency'},
+    {'name': 'verdict', 'label': 'Verdict', 'field': 'verdict'},
+]
+DIFF_FIELDS = ['strategy', 'metric', 'mean_diff', 'ci_low', 'ci_high', 'unpaired_low', 'unpaired_high', 'efficiency',
+               'significant']
+
+
+def _fmt(metric, v, sign='+'):
+    if metric in ('final_ga', 'monthly_cost'):
+        return ('-' if v < 0 else sign) + f"€{abs(v):,.0f}"
+    return f"{v:{sign}.2f}"
+
+
+def diff_row(d):
+    m = d['metric']
+    return {
+        'strategy': d['strategy'], 'metric': COMPARE_METRICS[m], 'mean_diff': _fmt(m, d['mean_diff']),
+        'ci': f"[{_fmt(m, d['ci_low'])}, {_fmt(m, d['ci_high'])}]",
+        'unpaired': f"[{_fmt(m, d['unpaired_low'])}, {_fmt(m, d['unpaired_high'])}]",
+        'efficiency': f"×{d['efficiency']:.1f}" if d['efficiency'] != float('inf') else '∞',
+        'verdict': 'SIGNIFICANT' if d['significant'] else 'not significant',
+        '_class': 'text-green-300' if d['significant'] else 'text-slate-400',
+    }
+
+
+def interval_figure(stats, metric) -> go.Figure:
+    """Paired (solid) and independent-runs (faint) 95% intervals of each strategy's difference to the baseline."""
+    diffs = [d for d in stats['diffs'] if d['metric'] == metric]
+    names = [d['strategy'] for d in diffs]
+    means = [d['mean_diff'] for d in diffs]
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=means, y=names, mode='markers', name='Independent runs', marker=dict(color='rgba(148,163,184,0.5)', size=6),
+                             error_x=dict(type='data', symmetric=False, color='rgba(148,163,184,0.5)', thickness=6,
+                                          array=[d['unpaired_high'] - d['mean_diff'] for d in diffs],
+                                          arrayminus=[d['mean_diff'] - d['unpaired_low'] for d in diffs])))
+    fig.add_trace(go.Scatter(x=means, y=names, mode='markers', name='Paired (same streams)', marker=dict(color='#22d3ee', size=9),
+                             error_x=dict(type='data', symmetric=False, color='#22d3ee', thickness=2,
+                                          array=[d['ci_high'] - d['mean_diff'] for d in diffs],
+                                          arrayminus=[d['mean_diff'] - d['ci_low'] for d in diffs])))
+    fig.add_vline(x=0, line_dash='dash', line_color='white', opacity=0.4)
+    fig.update_layout(title=f"{COMPARE_METRICS[metric]}: Δ vs {stats['baseline']}", height=120 + 40 * len(diffs),
+                      margin=dict(l=20, r=20, t=40, b=20), showlegend=False,
+                      paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)', font=dict(color='#94a3b8'))
+    return fig
+
+
+def show_compare():
+    entries = []  # {'game', 'name', 'config'}
+    active_task = None
+
+    def refresh_entries():
+        entries_col.clear()
+        with entries_col:
+            for i, e in enumerate(entries):
+                with ui.row().classes('items-center gap-2'):
+                    ui.label(f"{i + 1}. {e['game']} - {e['name']}").classes('text-white')
+                    ui.button(icon='delete', on_click=lambda idx=i: remove_entry(idx)).props('flat color=red dense')
+
+    def add_entry():
+        game, name = select_game.value, select_strat.value
+        if not game or not name:
+            ui.notify('Select game and strategy', type='warning'); return
+        if len(entries) >= MAX_STRATEGIES:
+            ui.notify(f'At most {MAX_STRATEGIES} strategies', type='warning'); return
+        config = get_saved_strategies()[name]
+        if not entries:
+            # The first strategy's horizon and bankroll are the default common settings
+            settings = batch.lab_settings(config, game)
+            number_years.value, number_freq.value, number_start.value = settings['years'], settings['freq'], settings['start_ga']
+        entries.append({'game': game, 'name': name, 'config': config})
+        refresh_entries()
+
+    def remove_entry(idx):
+        entries.pop(idx)
+        refresh_entries()
+
+    def stop_run():
+        if active_task: get_scheduler().cancel(active_task)
+
+    async def run_compare():
+        nonlocal active_task
+        if len(entries) < 2:
+            ui.notify('Add at least two strategies', type='warning'); return
+        n = int(number_universes.value or 1)
+        common = {'years': int(number_years.value or 1), 'freq': int(number_freq.value or 1), 'start_ga': int(number_start.value or 0)}
+        names = [f"{e['name']} ({e['game'][0]})" if [x['name'] for x in entries].count(e['name']) > 1 else e['name'] for e in entries]
+        try:
+            active_task = submit_page_run(
+                run_comparison, (list(entries), n),
+                dict(seed=int(number_seed.value or 0), common=common, max_workers=get_scheduler().processes_per_task,
+                     on_chunk=report_progress),
+                cost=estimate_cost(n * len(entries), common['years'] * 12, common['freq'] / 12),
+                name=f'Compare {len(entries)} strategies ({n} universes)')
+        except AdmissionError as e:
+            ui.notify(str(e), type='warning'); return
+        btn_run.disable(); btn_stop.set_visibility(True); progress.set_visibility(True)
+        try:
+            def show_progress(task):
+                progress.set_value(task.progress)
+                status.set_text(f"Simulating Universe {int(task.progress * n)}/{n} × {len(entries)} strategies")
+            rows, _ = await wait_for_run(active_task, status, show_progress)
+            status.set_text(f"{n:,} universes, every strategy on the same hands and spins")
+            render_results(rows, names)
+        except Cancelled:
+            status.set_text('Comparison Cancelled')
+        except Exception as e:
+            status.set_text(f'Comparison failed: {e}')
+        finally:
+            active_task = None; btn_run.enable(); btn_stop.set_visibility(False); progress.set_visibility(False)
+
+    def render_results(rows, names):
+        results_area.clear()
+        with results_area:
+            with ui.row().classes('w-full items-center justify-between'):
+                ui.label('PAIRED DIFFERENCES').classes('text-sm font-bold text-slate-400')
+                baseline_select = ui.select({i: name for i, name in enumerate(names)}, value=0, label='Baseline') \
+                    .props('dense dark').classes('w-64')
+            view = ui.column().classes('w-full gap-4')
+
+        def show(baseline):
+            stats = compare_stats(rows, names, baseline)
+            view.clear()
+            with view:
+                means = [dict({m: _fmt(m, s[m], '') for m in COMPARE_METRICS}, name=s['name']) for s in stats['strategies']]
+                ui.table(columns=MEANS_COLUMNS, rows=means, row_key='name').props('dense flat').classes('w-full')
+                table = ui.table(columns=DIFF_COLUMNS, rows=[dict(diff_row(d), _key=i) for i, d in enumerate(stats['diffs'])],
+                                 row_key='_key').props('dense flat').classes('w-full')
+                table.add_slot('body', '''
+                    <q-tr :props="props" :class="props.row._class">
+                        <q-td v-for="col in props.cols" :key="col.name" :props="props">{{ col.value }}</q-td>
+                    </q-tr>
+                ''')
+                ui.label('Universes saved: how many times more universes two independent lab runs would need '
+                         'for the paired interval\'s width.').classes('text-xs text-slate-500')
+                with ui.grid(columns=2).classes('w-full gap-2'):
+                    for metric in COMPARE_METRICS:
+                        ui.plotly(interval_figure(stats, metric)).classes('w-full')
+                download_buttons('strategy_comparison', DIFF_FIELDS, stats['diffs'], lambda d: {k: d[k] for k in DIFF_FIELDS})
+
+        baseline_select.on_value_change(lambda e: show(e.value))
+        show(0)
+
+    with ui.column().classes('w-full max-w-5xl mx-auto gap-6 p-4'):
+        ui.label('STRATEGY COMPARE').classes('text-2xl font-light text-cyan-300')
+        ui.label('Saved strategies played over the same universes, every session on the same hands and spins '
+                 '(common random numbers): luck they share cancels out of their differences.').classes('text-sm text-slate-500 -mt-4')
+
+        with ui.card().classes('w-full bg-slate-900 p-4'):
+            ui.label('1. STRATEGIES').classes('font-bold text-white mb-2')
+            with ui.row().classes('w-full items-end gap-4'):
+                select_game = ui.select(['Baccarat', 'Roulette'], value='Baccarat', label='Lab').classes('w-32')
+                select_strat = ui.select(get_strategy_names(), label='Saved strategy').classes('w-64')
+                ui.button('ADD', on_click=add_entry).props('icon=add color=cyan')
+            entries_col = ui.column().classes('w-full mt-2')
+
+        with ui.card().classes('w-full bg-slate-900 p-4'):
+            ui.label('2. COMMON SETTINGS').classes('font-bold text-white mb-2')
+            with ui.row().classes('w-full items-end gap-4'):
+                number_years = ui.number('Years', value=10, min=1, max=50, format='%d').classes('w-24')
+                number_freq = ui.number('Sessions / year', value=10, min=1, max=365, format='%d').classes('w-32')
+                number_start = ui.number('Start GA (€)', value=2000, min=0, step=100, format='%d').classes('w-32')
+                number_universes = ui.number('Universes', value=500, min=10, step=100, format='%d').classes('w-28')
+                number_seed = ui.number('Seed', value=DEFAULT_SEED, format='%d').classes('w-28')
+                btn_run = ui.button('COMPARE', on_click=run_compare).props('icon=compare_arrows color=cyan')
+                btn_stop = ui.button('STOP', on_click=stop_run).props('icon=stop flat color=red dense')
+                btn_stop.set_visibility(False)
+            status = ui.label('').classes('text-sm text-slate-400')
+            progress = ui.linear_progress(show_value=False).props('color=cyan')
+            progress.set_visibility(False)
+
+        results_area = ui.column().classes('w-full')
@@ -1,11 +1,10 @@
 from nicegui import ui
 import plotly.graph_objects as go
-from utils.persistence import load_profile, save_profile, get_session_logs
+from utils.persistence import get_bankroll, set_bankroll, get_session_logs
 
 def show_dashboard():
     # 1. Load Data
-    profile = load_profile()
-    current_ga = profile.get('ga', 1700.0)
+    current_ga = get_bankroll(1700.0)
     
     # 2. Setup Data for Chart
     logs = get_session_logs()
@@ -35,8 +34,7 @@ def show_dashboard():
         def commit_wallet_change():
             val = new_balance_input.value
             if val is not None:
-                profile['ga'] = float(val)
-                save_profile(profile)
+                set_bankroll(val)
                 ui.notify(f'Wallet updated to €{val:,.0f}', type='positive')
                 # Refresh page to update chart and label
                 ui.navigate.to('/') 
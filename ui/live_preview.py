@@ -0,0 +1,187 @@
+"""
+Live preview of a multiverse while it plays.
+
+The labs and Career Sim feed finished chunks into a LivePreview (batch
+on_results callback). At most once per PREVIEW_INTERVAL the preview recomputes
+the confidence bands and headline KPIs over the universes played so far and
+pushes them to the browser: the figure is sent once, later refreshes restyle
+only the traces whose data changed, and KPI labels are only touched when
+their text changes. The full analysis replaces the preview when the run ends.
+"""
+
+import asyncio
+import threading
+import time
+
+import numpy as np
+
+from nicegui import ui
+
+PREVIEW_INTERVAL = 1.0  # Seconds between refreshes
+
+# (name, fill colour or None for a line, line style)
+BAND_TRACES = (
+    ('Best/Worst', 'rgba(148, 163, 184, 0.3)', None),
+    ('Likely', 'rgba(0, 255, 136, 0.2)', None),
+    ('Average', None, dict(color='white', width=2)),
+    ('Median', None, dict(color='yellow', width=2, dash='dot')),
+)
+
+
+def trajectory_bands(trajectories) -> dict:
+    """Band arrays of a (universes x months) trajectory matrix, as the labs' calculate_stats returns them."""
+    t = np.asarray(trajectories, dtype=np.float64)
+    return {
+        'months': list(range(t.shape[1])),
+        'min_band': np.min(t, axis=0), 'max_band': np.max(t, axis=0),
+        'p25_band': np.percentile(t, 25, axis=0), 'p75_band': np.percentile(t, 75, axis=0),
+        'mean_line': np.mean(t, axis=0), 'median_line': np.median(t, axis=0),
+    }
+
+
+def lab_grade(stats: dict, total_months: int, universes: int) -> dict:
+    """Headline figures of the labs' scoreboard (grade, score, real monthly cost, survival)."""
+    total_output = stats['avg_final_ga'] + stats['avg_tax']
+    real_monthly_cost = (stats['total_input'] - total_output) / total_months
+    score_survival = (stats['survivor_count'] / universes) * 100
+    active_pct = 100 - ((stats['avg_insolvent'] / total_months) * 100)
+    total_score = (score_survival * 0.70) + (active_pct * 0.30)
+    if total_score >= 90: grade, g_col = "A", "text-green-400"
+    elif total_score >= 80: grade, g_col = "B", "text-blue-400"
+    elif total_score >= 70: grade, g_col = "C", "text-yellow-400"
+    elif total_score >= 60: grade, g_col = "D", "text-orange-400"
+    else: grade, g_col = "F", "text-red-600"
+    return {'grade': grade, 'grade_class': g_col, 'score': total_score, 'real_monthly_cost': real_monthly_cost,
+            'survival': score_survival, 'active_pct': active_pct, 'total_output': total_output}
+
+
+LAB_KPIS = ('GRADE', 'REAL MONTHLY COST', 'SURVIVAL')
+
+
+def lab_kpis(stats: dict, total_months: int, universes: int) -> dict:
+    """LivePreview KPIs of the Baccarat/Roulette labs."""
+    g = lab_grade(stats, total_months, universes)
+    cost = g['real_monthly_cost']
+    return {
+        'GRADE': (f"{g['grade']} ({g['score']:.0f}%)", g['grade_class']),
+        'REAL MONTHLY COST': (f"€{cost:,.0f}" if cost > 0 else f"+€{abs(cost):,.0f}", 'text-red-400' if cost > 0 else 'text-green-400'),
+        'SURVIVAL': (f"{g['survival']:.1f}%", 'text-green-400' if g['survival'] > 90 else 'text-red-400'),
+    }
+
+
+CAREER_KPIS = ('SURVIVAL RATE', 'MEDIAN MONTHLY COST', 'AVG MONTHLY COST')
+
+
+def career_summary(results):
+    """LivePreview summarize() of Career Sim: bands and KPIs over the universes that ran without error."""
+    valid = [r for r in results if len(r['trajectory'])]
+    if not valid:
+        return None, {}
+    survival_rate = len([r for r in valid if r['final'] > 100]) / len(valid) * 100
+    costs = [r['monthly_cost'] for r in valid]
+    kpis = {'SURVIVAL RATE': (f"{survival_rate:.1f}%", 'text-green-400' if survival_rate > 90 else 'text-red-400')}
+    for name, cost in (('MEDIAN MONTHLY COST', np.median(costs)), ('AVG MONTHLY COST', np.mean(costs))):
+        kpis[name] = (f"€{cost:,.0f}" if cost > 0 else f"+€{abs(cost):,.0f}", 'text-red-400' if cost > 0 else 'text-green-400')
+    return trajectory_bands([r['trajectory'] for r in valid]), kpis
+
+
+def _band_ys(stats: dict) -> list:
+    rounded = {k: np.round(np.asarray(stats[k], dtype=np.float64), 0) for k in
+               ('min_band', 'max_band', 'p25_band', 'p75_band', 'mean_line', 'median_line')}
+    return [
+        np.concatenate([rounded['max_band'], rounded['min_band'][::-1]]),
+        np.concatenate([rounded['p75_band'], rounded['p25_band'][::-1]]),
+        rounded['mean_line'],
+        rounded['median_line'],
+    ]
+
+
+class LivePreview:
+    """
+    Band chart + KPI row refreshed in place while a run plays.
+
+    summarize(results) runs off the event loop and returns (stats, kpis):
+    stats holds the band arrays (see trajectory_bands), or None when there is
+    nothing to show yet; kpis maps each KPI name to (text, css classes).
+    """
+
+    def __init__(self, container, title: str, kpi_names, summarize, interval: float = PREVIEW_INTERVAL):
+        self.summarize = summarize
+        self.interval = interval
+        self._chunks = {}  # first universe -> results of that chunk
+        self._lock = threading.Lock()
+        self._version = 0
+        self._shown = 0
+        self._next = 0.0
+        self._busy = False
+        self._sent = None  # Trace y arrays the browser has
+        self._kpi_text = {}
+        self.title = title
+        with container:
+            with ui.row().classes('w-full items-center gap-6'):
+                self.label = ui.label('LIVE PREVIEW').classes('text-xs text-slate-500 font-bold tracking-widest')
+                self._kpis = {}
+                for name in kpi_names:
+                    with ui.column().classes('items-center gap-0'):
+                        ui.label(name).classes('text-[10px] text-slate-500 font-bold tracking-widest')
+                        self._kpis[name] = ui.label('-').classes('text-2xl font-black text-slate-400')
+            self.plot = ui.plotly({'data': [], 'layout': self._layout()}).classes('w-full h-96')
+
+    def _layout(self) -> dict:
+        return {'title': {'text': self.title}, 'paper_bgcolor': 'rgba(0,0,0,0)', 'plot_bgcolor': 'rgba(0,0,0,0)',
+                'font': {'color': '#94a3b8'}, 'margin': {'l': 20, 'r': 20, 't': 40, 'b': 20}}
+
+    def collect(self, start: int, results: list):
+        """batch on_results callback (called on the scheduler thread as chunks finish)."""
+        with self._lock:
+            self._chunks[start] = results
+            self._version += 1
+
+    def _snapshot(self):
+        with self._lock:
+            return self._version, [r for start in sorted(self._chunks) for r in self._chunks[start]]
+
+    async def refresh(self):
+        """Pushes new bands and KPIs if chunks arrived and the rate limit allows."""
+        now = time.monotonic()
+        if self._busy or self._version == self._shown or now < self._next:
+            return
+        self._busy, self._next = True, now + self.interval
+        try:
+            version, results = self._snapshot()
+            stats, kpis = await asyncio.to_thread(self.summarize, results)
+            ys = await asyncio.to_thread(_band_ys, stats) if stats is not None else None
+        finally:
+            self._busy = False
+        self._shown = version
+        if ys is None:
+            return
+        self.label.set_text(f'LIVE PREVIEW ({len(results):,} universes)')
+        self._push_traces(stats['months'], ys)
+        for name, (text, classes) in kpis.items():
+            if self._kpi_text.get(name) != (text, classes):
+                self._kpi_text[name] = (text, classes)
+                self._kpis[name].set_text(text)
+                self._kpis[name].classes(replace=f'text-2xl font-black {classes}')
+
+    def _push_traces(self, months, ys):
+        data = self.plot.figure['data']
+        if self._sent is None:
+            x_band = months + months[::-1]
+            for (name, fill, line), y in zip(BAND_TRACES, ys):
+                trace = {'type': 'scatter', 'name': name, 'y': y.tolist()}
+                if fill:
+                    trace.update(x=x_band, fill='toself', fillcolor=fill, line={'color': 'rgba(255,255,255,0)'})
+                else:
+                    trace.update(x=months, mode='lines', line=line)
+                data.append(trace)
+            self.plot.update()
+        else:
+            changed = [i for i, y in enumerate(ys) if not np.array_equal(y, self._sent[i])]
+            if not changed:
+                return
+            for i in changed:
+                data[i]['y'] = ys[i].tolist()  # Keeps the element's figure current (reconnects)
+            self.plot.run_plot_method('restyle', {'y': [data[i]['y'] for i in changed]}, changed)
+        self._sent = ys
+
@@ -0,0 +1,67 @@
+"""
+Lazy registry of the sidebar modules.
+
+main.py only knows each module's import path; a lab (and its plotly/numpy/
+engine imports) is imported the first time its button is clicked. After the
+first page has been served, prewarm_in_background() can import the rest on a
+worker thread so later clicks are instant.
+"""
+
+import importlib
+import threading
+import time
+
+# key -> (module path, page function)
+MODULES = {
+    'tracker': ('ui.tracker', 'render_page'),
+    'baccarat': ('ui.simulator', 'show_simulator'),
+    'roulette': ('ui.roulette_sim', 'show_roulette_sim'),
+    'career': ('ui.career_mode', 'show_career_mode'),
+    'sessions': ('ui.sessions_sim', 'show_sessions_sim'),
+    'compare': ('ui.compare', 'show_compare'),
+    'sweep': ('ui.sweep', 'show_sweep'),
+    'docs': ('ui.docs_viewer', 'show_docs_viewer'),
+    'admin': ('ui.admin', 'show_admin'),
+}
+
+_loaded = {}
+_lock = threading.Lock()
+_prewarm_started = False
+
+
+def get_page(key):
+    """Page function for a sidebar module, importing it on first use."""
+    page = _loaded.get(key)
+    if page is None:
+        with _lock:
+            page = _loaded.get(key)
+            if page is None:
+                module_path, func_name = MODULES[key]
+                page = getattr(importlib.import_module(module_path), func_name)
+                _loaded[key] = page
+    return page
+
+
+def is_loaded(key) -> bool:
+    return key in _loaded
+
+
+def prewarm(keys=None, delay: float = 0.0):
+    """Import the given (default: all) modules, ignoring failures."""
+    if delay:
+        time.sleep(delay)
+    for key in keys or MODULES:
+        try:
+            get_page(key)
+        except Exception as e:
+            print(f"Pre-warm of {key} failed: {e}")
+
+
+def prewarm_in_background(keys=None, delay: float = 2.0):
+    """Start pre-warming once per process on a daemon thread."""
+    global _prewarm_started
+    with _lock:
+        if _prewarm_started:
+            return
+        _prewarm_started = True
+    threading.Thread(target=prewarm, args=(keys, delay), name='module-prewarm', daemon=True).start()
@@ -1,723 +1,166 @@
 from nicegui import ui
 import plotly.graph_objects as go
-import random
 import asyncio
 import traceback
 import numpy as np
 
 # Import Physics
-from engine.roulette_rules import (
-    RouletteSessionState, RouletteStrategist, RouletteBet,
-    create_spice_engine_from_overrides
-)
-from engine.spice_system import SpiceType, SPICE_PATTERNS, SpiceFamily
-from engine.tier_params import TierConfig, generate_tier_map, get_tier_for_ga
-from utils.persistence import load_profile, save_profile
-from engine.strategy_rules import StrategyOverrides
+from engine.roulette_worker import RouletteWorker, calculate_stats, SBM_TIERS, BET_MAP
+from engine.spice_system import SpiceFamily
+from engine.tier_params import generate_tier_map
+from utils.persistence import get_saved_strategies, get_strategy_names, save_strategy, delete_strategy
+from engine.strategy_compiler import compile_strategy
+from engine.seeding import DEFAULT_SEED
+from engine.batch import run_lab
+from engine.replay import pick_universes, replay_lab_universe
+from engine.cancellation import Cancelled
+from ui.chart_data import zoomable_plotly
+from ui.live_preview import LivePreview, LAB_KPIS, lab_grade, lab_kpis
+from ui.scheduling import submit_page_run, wait_for_run
+from ui.session_shape import show_session_shape
+from ui.tables import paged_table, download_buttons
+from ui.universe_replay import universe_picker, trace_picker
+from utils.scheduler import AdmissionError, estimate_cost, get_scheduler, report_progress
+from utils.result_cache import result_key, pack_results, unpack_results, load_result, save_result
 
-# SBM LOYALTY TIERS
-SBM_TIERS = {'Silver': 5000, 'Gold': 22500, 'Platinum': 175000}
+# Year 1 export columns (see CSV_DATA_DICTIONARY.md)
+Y1_EXPORT_FIELDS = ['Month', 'Session', 'Result', 'Peak_Profit', 'Total_Bal', 'Game_Bal', 'Spins', 'Volume', 'Tier',
+                    'Exit_Reason', 'Spice_Count', 'Spice_PL', 'TP_Boosts', 'Caroline_Max', 'DAlembert_Max', 'Streak_Max']
 
-# MAP
-BET_MAP = {
-    'Red': RouletteBet.RED,
-    'Black': RouletteBet.BLACK,
-    'Even': RouletteBet.EVEN,
-    'Odd': RouletteBet.ODD,
-    '1-18': RouletteBet.LOW,
-    '19-36': RouletteBet.HIGH,
-    'Column 1': RouletteBet.COLUMN1,
-    'Strategy 1: Salon Privé Lite': RouletteBet.STRAT_SALON_LITE,
-    'Strategy 2: French Main Game': RouletteBet.STRAT_FRENCH_LITE
-}
+def y1_export_record(e):
+    return dict(zip(Y1_EXPORT_FIELDS, (
+        e['month'], e['session'], round(e['result']), round(e.get('peak_profit', 0)), round(e['balance']),
+        round(e['game_bal']), e['spins'], round(e['volume']), e['tier'], e['exit'], e['spice_cnt'],
+        round(e['spice_pl']), e['tp_boosts'], e['caroline_max'], e['dalembert_max'], e['streak_max'])))
 
-class RouletteWorker:
-    @staticmethod
-    def run_session(current_ga: float, overrides: StrategyOverrides, tier_map: dict, use_ratchet: bool, penalty_mode: bool, active_level: int, mode: str, base_bet: float = 5.0, track_spins: bool = False):
-        tier = get_tier_for_ga(current_ga, tier_map, active_level, mode, game_type='Roulette')
-        
-        is_active_penalty = penalty_mode and overrides.penalty_box_enabled
-        if is_active_penalty:
-            flat_bet = base_bet 
-            tier = TierConfig(level=tier.level, min_ga=0, max_ga=9999999, base_unit=flat_bet, press_unit=flat_bet, stop_loss=tier.stop_loss, profit_lock=tier.profit_lock, catastrophic_cap=tier.catastrophic_cap)
-            session_overrides = overrides  # Copy over all overrides including spice config
-        else:
-            session_overrides = overrides
-
-        if use_ratchet and not is_active_penalty:
-            session_overrides.ratchet_enabled = True
-            session_overrides.profit_lock_units = 1000 if session_overrides.profit_lock_units <= 0 else session_overrides.profit_lock_units
-
-        # === SPICE ENGINE v5.0 INITIALIZATION ===
-        spice_engine = create_spice_engine_from_overrides(session_overrides, base_bet)
-        spice_engine.reset_session()
-        
-        state = RouletteSessionState(tier=tier, overrides=session_overrides)
-        state.spice_engine = spice_engine
-        state.session_start_bankroll = current_ga
-        state.current_spin = 1
-        spins_limit = overrides.shoes_per_session * 60 
-        volume = 0
-        
-        # Smart Trailing Stop tracking
-        session_peak_profit = 0.0
-        
-        # Initialize dynamic TP (can be boosted by spice wins during session)
-        original_tp_units = session_overrides.profit_lock_units
-        state.dynamic_tp_eur = original_tp_units * base_bet if original_tp_units > 0 else 0
-        
-        # Spin-by-spin tracking for detailed session analysis
-        spin_log = [] if track_spins else None
-        
-        active_main_bets = []
-        b1 = BET_MAP.get(overrides.bet_strategy, RouletteBet.RED)
-        active_main_bets.append(b1)
-        if overrides.bet_strategy_2 and overrides.bet_strategy_2 in BET_MAP:
-            b2 = BET_MAP.get(overrides.bet_strategy_2)
-            active_main_bets.append(b2)
-        
-        # For Negatif Snap-Back and The Gentle Surgeon: track individual bet results
-        use_snapback_halt = (session_overrides.press_trigger_wins in [7, 8] and len(active_main_bets) == 2)
-        
-        while state.current_spin <= spins_limit and state.mode != 'STOPPED':
-            decision = RouletteStrategist.get_next_decision(state)
-            if decision['mode'] == 'STOPPED':
-                break
-
-            unit_amt = decision['bet']
-            current_bets = active_main_bets.copy()
-
-            # === NEGATIF SNAP-BACK: HALT SECOND BET WHEN FIRST IS IN PROGRESSION ===
-            if use_snapback_halt:
-                if state.bet_in_progression >= 0:
-                    current_bets = [active_main_bets[state.bet_in_progression]]
-
-            # === SPICE SYSTEM v5.0: EVALUATE AND FIRE ===
-            spice_engine.reset_spin()
-
-            session_pl_units = state.session_pnl / base_bet
-            caroline_at_step4 = (state.caroline_level >= 4)
-            stop_loss_eur = session_overrides.stop_loss_units * base_bet if session_overrides.stop_loss_units > 0 else 999999
-
-            fired_spice_type = spice_engine.evaluate_and_fire_spice(
-                session_pl_units=session_pl_units,
-                spin_index=state.current_spin,
-                caroline_at_step4=caroline_at_step4,
-                session_start_bankroll=state.session_start_bankroll,
-                current_bankroll=state.session_start_bankroll + state.session_pnl,
-                stop_loss=stop_loss_eur
-            )
-
-            if fired_spice_type:
-                pattern = SPICE_PATTERNS[spice_engine.spice_config[fired_spice_type].pattern_id]
-                spice_cost = pattern.unit_cost * base_bet * spice_engine.unit_ratio
-                volume += spice_cost
-
-            total_main_units = 0
-            for b in active_main_bets:
-                if b == RouletteBet.STRAT_SALON_LITE:
-                    total_main_units += 5
-                elif b == RouletteBet.STRAT_FRENCH_LITE:
-                    total_main_units += 7
-                else:
-                    total_main_units += 1
-
-            volume += (unit_amt * total_main_units)
-
-            if use_snapback_halt:
-                number, won_main, pnl_main, individual_results = RouletteStrategist.resolve_spin_with_individual_tracking(state, current_bets, unit_amt)
-                prog_type = session_overrides.press_trigger_wins
-                if prog_type == 7:
-                    max_level = 3
-                    level_attr = 'neg_snapback_level'
-                elif prog_type == 8:
-                    max_level = 2
-                    level_attr = 'gentle_surgeon_level'
-                if state.bet_in_progression == -1:
-                    for idx, (bet_type, pnl, won) in enumerate(individual_results):
-                        if not won:
-                            for j, active_bet in enumerate(active_main_bets):
-                                if active_bet == bet_type:
-                                    state.bet_in_progression = j
-                                    setattr(state, level_attr, 1)
-                                    break
-                            break
-                else:
-                    if individual_results:
-                        bet_result = individual_results[0]
-                        if bet_result[2]:
-                            setattr(state, level_attr, 0)
-                            state.bet_in_progression = -1
-                        else:
-                            current_level = getattr(state, level_attr)
-                            current_level += 1
-                            if current_level > max_level:
-                                setattr(state, level_attr, 0)
-                                state.bet_in_progression = -1
-                            else:
-                                setattr(state, level_attr, current_level)
-            else:
-                number, won_main, pnl_main = RouletteStrategist.resolve_spin(state, current_bets, unit_amt)
-
-            spice_pnl = 0
-            spice_won = False
-            if fired_spice_type:
-                spice_pnl, spice_won = spice_engine.resolve_spice(fired_spice_type, number, base_bet)
-                state.session_pnl += spice_pnl
-                if spice_won and state.dynamic_tp_eur > 0:
-                    state.dynamic_tp_eur = spice_engine.apply_momentum_tp_boost(fired_spice_type, state.dynamic_tp_eur, base_bet)
-
-            if track_spins:
-                spin_log.append({
-                    'spin': state.current_spin,
-                    'bankroll': current_ga + state.session_pnl,
-                    'session_pl': state.session_pnl,
-                    'bet_size': unit_amt,
-                    'spice_fired': fired_spice_type.value if fired_spice_type else None,
-                    'spice_won': spice_won,
-                    'caroline_level': state.caroline_level,
-                    'dalembert_level': state.dalembert_level
-                })
-
-            # === ENFORCE STOP LOSS IMMEDIATELY AFTER SPIN ===
-            if state.session_pnl <= -(session_overrides.stop_loss_units * base_bet):
-                state.mode = 'STOPPED'
-                exit_reason = 'STOP_LOSS'
-                break
-
-            # === SMART TRAILING STOP LOGIC ===
-            current_profit = state.session_pnl
-            if current_profit > session_peak_profit:
-                session_peak_profit = current_profit
-            if (session_overrides.smart_exit_enabled and state.current_spin >= session_overrides.smart_window_start):
-                min_lock_threshold = session_overrides.min_profit_to_lock * base_bet
-                if current_profit >= min_lock_threshold:
-                    dynamic_floor = session_peak_profit * (1.0 - session_overrides.trailing_drop_pct)
-                    if current_profit <= dynamic_floor:
-                        state.mode = 'STOPPED'
-                        exit_reason = 'SMART_TRAILING'
-                        break
-
-            state.current_spin += 1
-
-        # Get comprehensive spice statistics
-        spice_stats = spice_engine.get_statistics()
-        
-        # Determine exit reason (check if already set by Smart Trailing)
-        if 'exit_reason' not in locals():
-            exit_reason = 'TIME_LIMIT'
-            if state.mode == 'STOPPED':
-                if state.session_pnl <= -(session_overrides.stop_loss_units * base_bet):
-                    exit_reason = 'STOP_LOSS'
-                elif state.session_pnl >= (session_overrides.profit_lock_units * base_bet):
-                    exit_reason = 'TARGET'
-                elif state.session_pnl <= state.locked_profit:
-                    exit_reason = 'RATCHET'
-        
-        # Calculate peak progression levels
-        max_caroline = state.caroline_level
-        max_dalembert = state.dalembert_level
-        
-        # Return session results + spice stats + detailed tracking + peak profit + spin log
-        result = (
-            state.session_pnl, 
-            volume, 
-            tier.level, 
-            state.current_spin, 
-            spice_stats,
-            exit_reason,
-            max_caroline,
-            max_dalembert,
-            state.current_press_streak,
-            session_peak_profit
-        )
-        
-        # If tracking spins, return as dict with spin_log
-        if track_spins:
-            return {
-                'pnl': result[0],
-                'volume': result[1],
-                'tier': result[2],
-                'spins': result[3],
-                'spice_stats': result[4],
-                'exit_reason': result[5],
-                'max_caroline': result[6],
-                'max_dalembert': result[7],
-                'press_streak': result[8],
-                'peak_profit': result[9],
-                'spin_log': spin_log
-            }
-        else:
-            return result
-
-    @staticmethod
-    def run_full_career(start_ga, total_months, sessions_per_year, 
-                        contrib_win, contrib_loss, overrides, use_ratchet,
-                        use_tax, use_holiday, safety_factor, target_points, earn_rate,
-                        holiday_ceiling, insolvency_floor, strategy_mode,
-                        base_bet_val,
-                        track_y1_details=False):
-        
-        tier_map = generate_tier_map(safety_factor, mode=strategy_mode, game_type='Roulette', base_bet=base_bet_val)
-        trajectory = []
-        current_ga = start_ga
-        running_play_pnl = 0  
-        
-        initial_tier = get_tier_for_ga(current_ga, tier_map, 1, strategy_mode, game_type='Roulette')
-        active_level = initial_tier.level
-
-        m_insolvent_months = 0; failed_year_one = False
-        m_tax = 0 
-        m_contrib = 0
-        gold_hit_year = -1
-        current_year_points = 0
-        
-        y1_log = []
-        last_session_won = False
-        
-        # Tracking Spice v5.0 - Comprehensive Statistics
-        all_spice_stats = {
-            'total_spices_used': 0,
-            'spice_wins': 0,
-            'spice_losses': 0,
-            'total_cost': 0.0,
-            'total_payout': 0.0,
-            'momentum_tp_gains': 0.0,
-            'distribution': {st.value: 0 for st in SpiceType},
-            'sessions_with_spices': 0
-        }
-        
-        # Enhanced Y1 tracking
-        y1_session_counter = 0
-
-        for m in range(total_months):
-            if m > 0 and m % 12 == 0:
-                current_year_points = 0
-
-            if use_tax and current_ga > overrides.tax_threshold:
-                surplus = current_ga - overrides.tax_threshold
-                tax_amt = surplus * (overrides.tax_rate / 100.0)
-                current_ga -= tax_amt
-                m_tax += tax_amt
-
-            should_contribute = True
-            if use_holiday and current_ga >= holiday_ceiling: should_contribute = False
-            
-            if should_contribute:
-                amount = contrib_win if last_session_won else contrib_loss
-                current_ga += amount
-                m_contrib += amount
-            
-            can_play = (current_ga >= insolvency_floor)
-            if not can_play:
-                m_insolvent_months += 1
-                if m < 12: failed_year_one = True
-            
-            if can_play:
-                sessions_this_month = sessions_per_year // 12
-                if m % 12 < (sessions_per_year % 12): sessions_this_month += 1
-
-                for sess_idx in range(sessions_this_month):
-                    pnl, vol, used_level, spins, spice_stats, exit_reason, max_caroline, max_dalembert, final_streak, peak_profit = RouletteWorker.run_session(
-                        current_ga, overrides, tier_map, use_ratchet, 
-                        False, active_level, strategy_mode, base_bet_val
-                    )
-                    active_level = used_level 
-                    current_ga += pnl
-                    running_play_pnl += pnl 
-                    current_year_points += vol * (earn_rate / 100)
-                    last_session_won = (pnl > 0)
-                    
-                    # Aggregate spice statistics
-                    all_spice_stats['total_spices_used'] += spice_stats['total_spices_used']
-                    all_spice_stats['spice_wins'] += spice_stats['spice_wins']
-                    all_spice_stats['spice_losses'] += spice_stats['spice_losses']
-                    all_spice_stats['total_cost'] += spice_stats['total_cost']
-                    all_spice_stats['total_payout'] += spice_stats['total_payout']
-                    all_spice_stats['momentum_tp_gains'] += spice_stats['momentum_tp_gains']
-                    
-                    # Aggregate distribution
-                    for spice_name, count in spice_stats['distribution'].items():
-                        all_spice_stats['distribution'][spice_name] += count
-                    
-                    if spice_stats['total_spices_used'] > 0:
-                        all_spice_stats['sessions_with_spices'] += 1
-                    
-                    # Enhanced Year 1 tracking with comprehensive data
-                    if track_y1_details and m < 12:
-                        y1_session_counter += 1
-                        spice_net = spice_stats['total_payout'] - spice_stats['total_cost']
-                        tp_boosts = int(spice_stats['momentum_tp_gains'] / (20 * base_bet_val)) if spice_stats['momentum_tp_gains'] > 0 else 0
-                        
-                        y1_log.append({
-                            'month': m + 1,
-                            'session': y1_session_counter,
-                            'result': pnl,
-                            'balance': current_ga,
-                            'game_bal': start_ga + running_play_pnl,
-                            'spins': spins,
-                            'volume': vol,
-                            'tier': used_level,
-                            'exit': exit_reason,
-                            'spice_cnt': spice_stats['total_spices_used'],
-                            'spice_pl': spice_net,
-                            'tp_boosts': tp_boosts,
-                            'caroline_max': max_caroline,
-                            'dalembert_max': max_dalembert,
-                            'streak_max': final_streak,
-                            'peak_profit': peak_profit,
-                            'is_recovery': False
-                        })
-                    
-                    # === RECOVERY SESSION SYSTEM ===
-                    # If session was negative and recovery is enabled, play a recovery "bis" session
-                    if overrides.recovery_enabled and pnl < 0 and current_ga >= insolvency_floor:
-                        # Create modified overrides with recovery stop loss
-                        recovery_overrides = StrategyOverrides(
-                            iron_gate_limit=overrides.iron_gate_limit,
-                            stop_loss_units=overrides.recovery_stop_loss,  # Use recovery stop loss
-                            profit_lock_units=overrides.profit_lock_units,
-                            press_trigger_wins=overrides.press_trigger_wins,
-                            press_depth=overrides.press_depth,
-                            ratchet_lock_pct=overrides.ratchet_lock_pct,
-                            tax_threshold=overrides.tax_threshold,
-                            tax_rate=overrides.tax_rate,
-                            bet_strategy=overrides.bet_strategy,
-                            bet_strategy_2=overrides.bet_strategy_2,
-                            shoes_per_session=overrides.shoes_per_session,
-                            penalty_box_enabled=overrides.penalty_box_enabled,
-                            ratchet_enabled=overrides.ratchet_enabled,
-                            ratchet_mode=overrides.ratchet_mode,
-                            smart_exit_enabled=overrides.smart_exit_enabled,
-                            smart_window_start=overrides.smart_window_start,
-                            min_profit_to_lock=overrides.min_profit_to_lock,
-                            trailing_drop_pct=overrides.trailing_drop_pct,
-                            # Copy all spice settings
-                            spice_global_max_per_session=overrides.spice_global_max_per_session,
-                            spice_global_max_per_spin=overrides.spice_global_max_per_spin,
-                            spice_disable_if_caroline_step4=overrides.spice_disable_if_caroline_step4,
-                            spice_disable_if_pl_below_zero=overrides.spice_disable_if_pl_below_zero,
-                            spice_unit_ratio=overrides.spice_unit_ratio,
-                            spice_zero_leger_enabled=overrides.spice_zero_leger_enabled,
-                            spice_zero_leger_trigger=overrides.spice_zero_leger_trigger,
-                            spice_zero_leger_max=overrides.spice_zero_leger_max,
-                            spice_zero_leger_cooldown=overrides.spice_zero_leger_cooldown,
-                            spice_zero_leger_min_pl=overrides.spice_zero_leger_min_pl,
-                            spice_zero_leger_max_pl=overrides.spice_zero_leger_max_pl,
-                            spice_jeu_zero_enabled=overrides.spice_jeu_zero_enabled,
-                            spice_jeu_zero_trigger=overrides.spice_jeu_zero_trigger,
-                            spice_jeu_zero_max=overrides.spice_jeu_zero_max,
-                            spice_jeu_zero_cooldown=overrides.spice_jeu_zero_cooldown,
-                            spice_jeu_zero_min_pl=overrides.spice_jeu_zero_min_pl,
-                            spice_jeu_zero_max_pl=overrides.spice_jeu_zero_max_pl,
-                            spice_zero_crown_enabled=overrides.spice_zero_crown_enabled,
-                            spice_zero_crown_trigger=overrides.spice_zero_crown_trigger,
-                            spice_zero_crown_max=overrides.spice_zero_crown_max,
-                            spice_zero_crown_cooldown=overrides.spice_zero_crown_cooldown,
-                            spice_zero_crown_min_pl=overrides.spice_zero_crown_min_pl,
-                            spice_zero_crown_max_pl=overrides.spice_zero_crown_max_pl,
-                            spice_tiers_enabled=overrides.spice_tiers_enabled,
-                            spice_tiers_trigger=overrides.spice_tiers_trigger,
-                            spice_tiers_max=overrides.spice_tiers_max,
-                            spice_tiers_cooldown=overrides.spice_tiers_cooldown,
-                            spice_tiers_min_pl=overrides.spice_tiers_min_pl,
-                            spice_tiers_max_pl=overrides.spice_tiers_max_pl,
-                            spice_orphelins_enabled=overrides.spice_orphelins_enabled,
-                            spice_orphelins_trigger=overrides.spice_orphelins_trigger,
-                            spice_orphelins_max=overrides.spice_orphelins_max,
-                            spice_orphelins_cooldown=overrides.spice_orphelins_cooldown,
-                            spice_orphelins_min_pl=overrides.spice_orphelins_min_pl,
-                            spice_orphelins_max_pl=overrides.spice_orphelins_max_pl,
-                            spice_orphelins_plein_enabled=overrides.spice_orphelins_plein_enabled,
-                            spice_orphelins_plein_trigger=overrides.spice_orphelins_plein_trigger,
-                            spice_orphelins_plein_max=overrides.spice_orphelins_plein_max,
-                            spice_orphelins_plein_cooldown=overrides.spice_orphelins_plein_cooldown,
-                            spice_orphelins_plein_min_pl=overrides.spice_orphelins_plein_min_pl,
-                            spice_orphelins_plein_max_pl=overrides.spice_orphelins_plein_max_pl,
-                            spice_voisins_enabled=overrides.spice_voisins_enabled,
-                            spice_voisins_trigger=overrides.spice_voisins_trigger,
-                            spice_voisins_max=overrides.spice_voisins_max,
-                            spice_voisins_cooldown=overrides.spice_voisins_cooldown,
-                            spice_voisins_min_pl=overrides.spice_voisins_min_pl,
-                            spice_voisins_max_pl=overrides.spice_voisins_max_pl,
-                            # Copy doctrine settings
-                            doctrine_enabled=overrides.doctrine_enabled,
-                            doctrine_pl_stop=overrides.doctrine_pl_stop,
-                            doctrine_pl_target=overrides.doctrine_pl_target,
-                            doctrine_pl_press_wins=overrides.doctrine_pl_press_wins,
-                            doctrine_pl_press_depth=overrides.doctrine_pl_press_depth,
-                            doctrine_pl_iron=overrides.doctrine_pl_iron,
-                            doctrine_ti_stop=overrides.doctrine_ti_stop,
-                            doctrine_ti_target=overrides.doctrine_ti_target,
-                            doctrine_ti_press_wins=overrides.doctrine_ti_press_wins,
-                            doctrine_ti_press_depth=overrides.doctrine_ti_press_depth,
-                            doctrine_ti_iron=overrides.doctrine_ti_iron,
-                            doctrine_loss_trigger=overrides.doctrine_loss_trigger,
-                            doctrine_dd_pct_trigger=overrides.doctrine_dd_pct_trigger,
-                            doctrine_dd_eur_trigger=overrides.doctrine_dd_eur_trigger,
-                            doctrine_tight_min=overrides.doctrine_tight_min,
-                            doctrine_tight_max=overrides.doctrine_tight_max,
-                            doctrine_cooloff_enabled=overrides.doctrine_cooloff_enabled,
-                            doctrine_cooloff_floor=overrides.doctrine_cooloff_floor,
-                            doctrine_cooloff_min_months=overrides.doctrine_cooloff_min_months,
-                            doctrine_cooloff_recovery_pct=overrides.doctrine_cooloff_recovery_pct,
-                            doctrine_link_roulette=overrides.doctrine_link_roulette,
-                            doctrine_roulette_pl=overrides.doctrine_roulette_pl,
-                            doctrine_roulette_ti=overrides.doctrine_roulette_ti,
-                            doctrine_roulette_co=overrides.doctrine_roulette_co,
-                            recovery_enabled=False,  # Prevent recursive recovery sessions
-                            recovery_stop_loss=overrides.recovery_stop_loss
-                        )
-                        
-                        # Play recovery session
-                        rec_pnl, rec_vol, rec_level, rec_spins, rec_spice_stats, rec_exit, rec_caroline, rec_dalembert, rec_streak, rec_peak = RouletteWorker.run_session(
-                            current_ga, recovery_overrides, tier_map, use_ratchet,
-                            False, active_level, strategy_mode, base_bet_val
-                        )
-                        active_level = rec_level
-                        current_ga += rec_pnl
-                        running_play_pnl += rec_pnl
-                        current_year_points += rec_vol * (earn_rate / 100)
-                        last_session_won = (rec_pnl > 0)
-                        
-                        # Aggregate recovery session spice statistics
-                        all_spice_stats['total_spices_used'] += rec_spice_stats['total_spices_used']
-                        all_spice_stats['spice_wins'] += rec_spice_stats['spice_wins']
-                        all_spice_stats['spice_losses'] += rec_spice_stats['spice_losses']
-                        all_spice_stats['total_cost'] += rec_spice_stats['total_cost']
-                        all_spice_stats['total_payout'] += rec_spice_stats['total_payout']
-                        all_spice_stats['momentum_tp_gains'] += rec_spice_stats['momentum_tp_gains']
-                        
-                        for spice_name, count in rec_spice_stats['distribution'].items():
-                            all_spice_stats['distribution'][spice_name] += count
-                        
-                        if rec_spice_stats['total_spices_used'] > 0:
-                            all_spice_stats['sessions_with_spices'] += 1
-                        
-                        # Track recovery session in Y1 log with "bis" marker
-                        if track_y1_details and m < 12:
-                            y1_session_counter += 1
-                            rec_spice_net = rec_spice_stats['total_payout'] - rec_spice_stats['total_cost']
-                            rec_tp_boosts = int(rec_spice_stats['momentum_tp_gains'] / (20 * base_bet_val)) if rec_spice_stats['momentum_tp_gains'] > 0 else 0
-                            
-                            y1_log.append({
-                                'month': m + 1,
-                                'session': y1_session_counter,
-                                'result': rec_pnl,
-                                'balance': current_ga,
-                                'game_bal': start_ga + running_play_pnl,
-                                'spins': rec_spins,
-                                'volume': rec_vol,
-                                'tier': rec_level,
-                                'exit': rec_exit,
-                                'spice_cnt': rec_spice_stats['total_spices_used'],
-                                'spice_pl': rec_spice_net,
-                                'tp_boosts': rec_tp_boosts,
-                                'caroline_max': rec_caroline,
-                                'dalembert_max': rec_dalembert,
-                                'streak_max': rec_streak,
-                                'peak_profit': rec_peak,
-                                'is_recovery': True  # Mark as recovery session
-                            })
-            else:
-                 if track_y1_details and m < 12:
-                        y1_log.append({
-                            'month': m + 1, 
-                            'session': 0,
-                            'result': 0, 
-                            'balance': current_ga, 
-                            'game_bal': start_ga + running_play_pnl, 
-                            'spins': 0,
-                            'volume': 0,
-                            'tier': 0,
-                            'exit': 'INSOLVENT',
-                            'spice_cnt': 0,
-                            'spice_pl': 0,
-                            'tp_boosts': 0,
-                            'caroline_max': 0,
-                            'dalembert_max': 0,
-                            'streak_max': 0,
-                            'peak_profit': 0
-                        })
-
-            if gold_hit_year == -1 and current_year_points >= target_points:
-                gold_hit_year = (m // 12) + 1
-
-            trajectory.append(current_ga)
-            
-        return {
-            'trajectory': trajectory, 'final_ga': current_ga, 'insolvent_months': m_insolvent_months, 
-            'failed_y1': failed_year_one, 'y1_log': y1_log, 'tax': m_tax, 'contrib': m_contrib, 
-            'gold_year': gold_hit_year, 
-            # Spice v5.0 comprehensive stats
-            'spice_stats': all_spice_stats
-        }
+# Session log table (Year 1 log of universe #1, full log of a replayed universe)
+LOG_COLUMNS = [
+    {'name': 'Month', 'label': 'Mo', 'field': 'Month', 'align': 'left'},
+    {'name': 'Session', 'label': 'Sess', 'field': 'Session', 'align': 'left'},
+    {'name': 'Result', 'label': 'PnL', 'field': 'Result'},
+    {'name': 'Balance', 'label': 'Tot. Bal', 'field': 'Balance'},
+    {'name': 'Game Bal', 'label': 'Game Bal', 'field': 'Game Bal'},
+    {'name': 'Spins', 'label': 'Spins', 'field': 'Spins'}
+]
 
-# --- STATS CALCULATOR ---
-def calculate_stats(results, config, start_ga, total_months):
-    if not results: return None
-    trajectories = np.array([r['trajectory'] for r in results])
-    months = list(range(trajectories.shape[1]))
-    
-    total_sims = len(results)
-    total_sessions_per_career = config['years'] * config['freq']
-    
-    # Aggregate spice stats across all runs
-    avg_spice_stats = {
-        'total_spices_used': np.mean([r['spice_stats']['total_spices_used'] for r in results]),
-        'sessions_with_spices': np.mean([r['spice_stats']['sessions_with_spices'] for r in results]),
-        'spice_wins': np.mean([r['spice_stats']['spice_wins'] for r in results]),
-        'spice_losses': np.mean([r['spice_stats']['spice_losses'] for r in results]),
-        'hit_rate': 0.0,
-        'total_cost': np.mean([r['spice_stats']['total_cost'] for r in results]),
-        'total_payout': np.mean([r['spice_stats']['total_payout'] for r in results]),
-        'net_pl': 0.0,
-        'momentum_tp_gains': np.mean([r['spice_stats']['momentum_tp_gains'] for r in results]),
-        'distribution': {}
+def log_row(entry):
+    # "bis" marks a recovery session
+    session_label = f"S{entry.get('session', 0)} bis" if entry.get('is_recovery', False) else f"S{entry.get('session', 0)}"
+    return {
+        'Month': f"M{entry.get('month', '?')}",
+        'Session': session_label,
+        'Result': f"€{entry.get('result', 0):+,.0f}",
+        'Balance': f"€{entry.get('balance', 0):,.0f}",
+        'Game Bal': f"€{entry.get('game_bal', 0):,.0f}",
+        'Spins': f"{entry.get('spins', 0)}"
     }
-    
-    # Calculate hit rate
-    total_wins = sum([r['spice_stats']['spice_wins'] for r in results])
-    total_losses = sum([r['spice_stats']['spice_losses'] for r in results])
-    if (total_wins + total_losses) > 0:
-        avg_spice_stats['hit_rate'] = total_wins / (total_wins + total_losses)
-    
-    avg_spice_stats['net_pl'] = avg_spice_stats['total_payout'] - avg_spice_stats['total_cost']
-    
-    # Aggregate distribution
-    for spice_type in SpiceType:
-        spice_name = spice_type.value
-        avg_spice_stats['distribution'][spice_name] = np.mean([
-            r['spice_stats']['distribution'].get(spice_name, 0) for r in results
-        ])
-    
-    stats = {
-        'months': months,
-        'min_band': np.min(trajectories, axis=0),
-        'max_band': np.max(trajectories, axis=0),
-        'p25_band': np.percentile(trajectories, 25, axis=0),
-        'p75_band': np.percentile(trajectories, 75, axis=0),
-        'mean_line': np.mean(trajectories, axis=0),
-        'median_line': np.median(trajectories, axis=0),
-        'avg_final_ga': np.mean([r['final_ga'] for r in results]),
-        'avg_tax': np.mean([r['tax'] for r in results]),
-        'avg_insolvent': np.mean([r['insolvent_months'] for r in results]),
-        'gold_hits': [r['gold_year'] for r in results if r['gold_year'] != -1],
-        'y1_failures': len([r for r in results if r['failed_y1']]),
-        'total_input': start_ga + np.mean([r['contrib'] for r in results]),
-        'survivor_count': len([r for r in results if r['final_ga'] >= 100]),
-        
-        # Spice v5.0 comprehensive statistics
-        'spice_stats': avg_spice_stats
-    }
-    return stats
 
 def show_roulette_sim():
     running = False 
+    active_task = None  # Scheduled run in progress (STOP cancels it)
+    last_run = {}  # Latest multiverse (family key + per-universe results), reused by ADD UNIVERSES
+    shown_run = {}  # Multiverse on screen (strategy, config, seed, results), for universe replays
     
     def load_saved_strategies():
         try:
-            profile = load_profile()
-            return profile.get('saved_strategies', {})
+            return get_saved_strategies()
         except: return {}
 
     def update_strategy_list():
         try:
-            saved = load_saved_strategies()
-            select_saved.options = list(saved.keys())
+            select_saved.options = get_strategy_names()
             select_saved.update()
         except: pass
 
+    def current_strategy_config():
+        """Snapshot of every strategy slider in the saved-config schema."""
+        return {
+            'sim_num': slider_num_sims.value, 'sim_years': slider_years.value, 'sim_freq': slider_frequency.value,
+            'eco_win': slider_contrib_win.value, 'eco_loss': slider_contrib_loss.value, 'eco_tax': switch_luxury_tax.value,
+            'eco_hol': switch_holiday.value, 'eco_hol_ceil': slider_holiday_ceil.value, 'eco_insolvency': slider_insolvency.value,
+            'eco_tax_thresh': slider_tax_thresh.value, 'eco_tax_rate': slider_tax_rate.value,
+            'tac_safety': slider_safety.value, 'tac_iron': slider_iron_gate.value, 'tac_press': select_press.value,
+            'tac_depth': slider_press_depth.value, 'tac_shoes': slider_shoes.value, 'tac_bet': select_bet_strat.value,
+            'tac_bet_2': select_bet_strat_2.value,
+            'tac_penalty': switch_penalty.value, 'tac_mode': select_engine_mode.value, 
+            'risk_stop': slider_stop_loss.value, 'risk_prof': slider_profit.value,
+            'risk_ratch': switch_ratchet.value, 'risk_ratch_mode': select_ratchet_mode.value, 
+            'gold_stat': select_status.value, 'gold_earn': slider_earn_rate.value, 'start_ga': slider_start_ga.value,
+            'tac_base_bet': slider_base_bet.value,
+            
+            # Smart Trailing Stop
+            'smart_exit_en': switch_smart_exit.value, 'smart_window': slider_smart_window.value,
+            'smart_min_lock': slider_min_lock.value, 'smart_trail_pct': slider_trail_pct.value,
+            
+            # SPICE FIELDS - Global
+            'spice_global_max_session': slider_spice_global_max_session.value,
+            'spice_global_max_spin': slider_spice_global_max_spin.value,
+            'spice_disable_caroline': switch_spice_disable_caroline.value,
+            'spice_disable_neg_pl': switch_spice_disable_neg_pl.value,
+            'spice_hybrid_mode': switch_spice_hybrid_mode.value,
+            
+            # SPICE FIELDS - Zéro Léger
+            'spice_zero_en': switch_spice_zero.value, 'spice_zero_trig': slider_spice_zero_trig.value,
+            'spice_zero_max': slider_spice_zero_max.value, 'spice_zero_cool': slider_spice_zero_cool.value,
+            'spice_zero_min_pl': slider_spice_zero_min_pl.value, 'spice_zero_max_pl': slider_spice_zero_max_pl.value,
+            
+            # SPICE FIELDS - Jeu Zéro
+            'spice_jeu_zero_en': switch_spice_jeu_zero.value, 'spice_jeu_zero_trig': slider_spice_jeu_zero_trig.value,
+            'spice_jeu_zero_max': slider_spice_jeu_zero_max.value, 'spice_jeu_zero_cool': slider_spice_jeu_zero_cool.value,
+            'spice_jeu_zero_min_pl': slider_spice_jeu_zero_min_pl.value, 'spice_jeu_zero_max_pl': slider_spice_jeu_zero_max_pl.value,
+            
+            # SPICE FIELDS - Zéro Crown
+            'spice_zero_crown_en': switch_spice_zero_crown.value, 'spice_zero_crown_trig': slider_spice_zero_crown_trig.value,
+            'spice_zero_crown_max': slider_spice_zero_crown_max.value, 'spice_zero_crown_cool': slider_spice_zero_crown_cool.value,
+            'spice_zero_crown_min_pl': slider_spice_zero_crown_min_pl.value, 'spice_zero_crown_max_pl': slider_spice_zero_crown_max_pl.value,
+            
+            # SPICE FIELDS - Tiers
+            'spice_tiers_en': switch_spice_tiers.value, 'spice_tiers_trig': slider_spice_tiers_trig.value,
+            'spice_tiers_max': slider_spice_tiers_max.value, 'spice_tiers_cool': slider_spice_tiers_cool.value,
+            'spice_tiers_min_pl': slider_spice_tiers_min_pl.value, 'spice_tiers_max_pl': slider_spice_tiers_max_pl.value,
+            
+            # SPICE FIELDS - Orphelins
+            'spice_orphelins_en': switch_spice_orphelins.value, 'spice_orphelins_trig': slider_spice_orphelins_trig.value,
+            'spice_orphelins_max': slider_spice_orphelins_max.value, 'spice_orphelins_cool': slider_spice_orphelins_cool.value,
+            'spice_orphelins_min_pl': slider_spice_orphelins_min_pl.value, 'spice_orphelins_max_pl': slider_spice_orphelins_max_pl.value,
+            
+            # SPICE FIELDS - Orphelins en Plein
+            'spice_orphelins_plein_en': switch_spice_orphelins_plein.value, 'spice_orphelins_plein_trig': slider_spice_orphelins_plein_trig.value,
+            'spice_orphelins_plein_max': slider_spice_orphelins_plein_max.value, 'spice_orphelins_plein_cool': slider_spice_orphelins_plein_cool.value,
+            'spice_orphelins_plein_min_pl': slider_spice_orphelins_plein_min_pl.value, 'spice_orphelins_plein_max_pl': slider_spice_orphelins_plein_max_pl.value,
+            
+            # SPICE FIELDS - Voisins
+            'spice_voisins_en': switch_spice_voisins.value, 'spice_voisins_trig': slider_spice_voisins_trig.value,
+            'spice_voisins_max': slider_spice_voisins_max.value, 'spice_voisins_cool': slider_spice_voisins_cool.value,
+            'spice_voisins_min_pl': slider_spice_voisins_min_pl.value, 'spice_voisins_max_pl': slider_spice_voisins_max_pl.value,
+            
+            # DOCTRINE FIELDS
+            'doctrine_en': switch_doctrine_enabled.value,
+            'doctrine_pl_stop': slider_doctrine_pl_stop.value, 'doctrine_pl_target': slider_doctrine_pl_target.value,
+            'doctrine_pl_press_wins': slider_doctrine_pl_press_wins.value, 'doctrine_pl_press_depth': slider_doctrine_pl_press_depth.value,
+            'doctrine_pl_iron': slider_doctrine_pl_iron.value,
+            'doctrine_ti_stop': slider_doctrine_ti_stop.value, 'doctrine_ti_target': slider_doctrine_ti_target.value,
+            'doctrine_ti_press_wins': slider_doctrine_ti_press_wins.value, 'doctrine_ti_press_depth': slider_doctrine_ti_press_depth.value,
+            'doctrine_ti_iron': slider_doctrine_ti_iron.value,
+            'doctrine_loss_trig': slider_doctrine_loss_trigger.value,
+            'doctrine_dd_pct': slider_doctrine_dd_pct.value, 'doctrine_dd_eur': slider_doctrine_dd_eur.value,
+            'doctrine_tight_min': slider_doctrine_tight_min.value, 'doctrine_tight_max': slider_doctrine_tight_max.value,
+            'doctrine_cooloff_en': switch_doctrine_cooloff.value, 'doctrine_cooloff_floor': slider_doctrine_cooloff_floor.value,
+            'doctrine_cooloff_months': slider_doctrine_cooloff_months.value, 'doctrine_recovery_pct': slider_doctrine_recovery_pct.value,
+            'doctrine_link_roulette': switch_doctrine_link_roulette.value,
+            'doctrine_roulette_pl': slider_doctrine_roulette_pl.value, 'doctrine_roulette_ti': slider_doctrine_roulette_ti.value,
+            'doctrine_roulette_co': slider_doctrine_roulette_co.value,
+            
+            # RECOVERY SESSION FIELDS
+            'recovery_enabled': switch_recovery_enabled.value,
+            'recovery_stop_loss': slider_recovery_stop_loss.value
+        }
+
     def save_current_strategy():
         try:
             name = input_name.value
             if not name: return
-            profile = load_profile()
-            if 'saved_strategies' not in profile: profile['saved_strategies'] = {}
-            
-            config = {
-                'sim_num': slider_num_sims.value, 'sim_years': slider_years.value, 'sim_freq': slider_frequency.value,
-                'eco_win': slider_contrib_win.value, 'eco_loss': slider_contrib_loss.value, 'eco_tax': switch_luxury_tax.value,
-                'eco_hol': switch_holiday.value, 'eco_hol_ceil': slider_holiday_ceil.value, 'eco_insolvency': slider_insolvency.value,
-                'eco_tax_thresh': slider_tax_thresh.value, 'eco_tax_rate': slider_tax_rate.value,
-                'tac_safety': slider_safety.value, 'tac_iron': slider_iron_gate.value, 'tac_press': select_press.value,
-                'tac_depth': slider_press_depth.value, 'tac_shoes': slider_shoes.value, 'tac_bet': select_bet_strat.value,
-                'tac_bet_2': select_bet_strat_2.value,
-                'tac_penalty': switch_penalty.value, 'tac_mode': select_engine_mode.value, 
-                'risk_stop': slider_stop_loss.value, 'risk_prof': slider_profit.value,
-                'risk_ratch': switch_ratchet.value, 'risk_ratch_mode': select_ratchet_mode.value, 
-                'gold_stat': select_status.value, 'gold_earn': slider_earn_rate.value, 'start_ga': slider_start_ga.value,
-                'tac_base_bet': slider_base_bet.value,
-                
-                # Smart Trailing Stop
-                'smart_exit_en': switch_smart_exit.value, 'smart_window': slider_smart_window.value,
-                'smart_min_lock': slider_min_lock.value, 'smart_trail_pct': slider_trail_pct.value,
-                
-                # SPICE FIELDS - Global
-                'spice_global_max_session': slider_spice_global_max_session.value,
-                'spice_global_max_spin': slider_spice_global_max_spin.value,
-                'spice_disable_caroline': switch_spice_disable_caroline.value,
-                'spice_disable_neg_pl': switch_spice_disable_neg_pl.value,
-                'spice_hybrid_mode': switch_spice_hybrid_mode.value,
-                
-                # SPICE FIELDS - Zéro Léger
-                'spice_zero_en': switch_spice_zero.value, 'spice_zero_trig': slider_spice_zero_trig.value,
-                'spice_zero_max': slider_spice_zero_max.value, 'spice_zero_cool': slider_spice_zero_cool.value,
-                'spice_zero_min_pl': slider_spice_zero_min_pl.value, 'spice_zero_max_pl': slider_spice_zero_max_pl.value,
-                
-                # SPICE FIELDS - Jeu Zéro
-                'spice_jeu_zero_en': switch_spice_jeu_zero.value, 'spice_jeu_zero_trig': slider_spice_jeu_zero_trig.value,
-                'spice_jeu_zero_max': slider_spice_jeu_zero_max.value, 'spice_jeu_zero_cool': slider_spice_jeu_zero_cool.value,
-                'spice_jeu_zero_min_pl': slider_spice_jeu_zero_min_pl.value, 'spice_jeu_zero_max_pl': slider_spice_jeu_zero_max_pl.value,
-                
-                # SPICE FIELDS - Zéro Crown
-                'spice_zero_crown_en': switch_spice_zero_crown.value, 'spice_zero_crown_trig': slider_spice_zero_crown_trig.value,
-                'spice_zero_crown_max': slider_spice_zero_crown_max.value, 'spice_zero_crown_cool': slider_spice_zero_crown_cool.value,
-                'spice_zero_crown_min_pl': slider_spice_zero_crown_min_pl.value, 'spice_zero_crown_max_pl': slider_spice_zero_crown_max_pl.value,
-                
-                # SPICE FIELDS - Tiers
-                'spice_tiers_en': switch_spice_tiers.value, 'spice_tiers_trig': slider_spice_tiers_trig.value,
-                'spice_tiers_max': slider_spice_tiers_max.value, 'spice_tiers_cool': slider_spice_tiers_cool.value,
-                'spice_tiers_min_pl': slider_spice_tiers_min_pl.value, 'spice_tiers_max_pl': slider_spice_tiers_max_pl.value,
-                
-                # SPICE FIELDS - Orphelins
-                'spice_orphelins_en': switch_spice_orphelins.value, 'spice_orphelins_trig': slider_spice_orphelins_trig.value,
-                'spice_orphelins_max': slider_spice_orphelins_max.value, 'spice_orphelins_cool': slider_spice_orphelins_cool.value,
-                'spice_orphelins_min_pl': slider_spice_orphelins_min_pl.value, 'spice_orphelins_max_pl': slider_spice_orphelins_max_pl.value,
-                
-                # SPICE FIELDS - Orphelins en Plein
-                'spice_orphelins_plein_en': switch_spice_orphelins_plein.value, 'spice_orphelins_plein_trig': slider_spice_orphelins_plein_trig.value,
-                'spice_orphelins_plein_max': slider_spice_orphelins_plein_max.value, 'spice_orphelins_plein_cool': slider_spice_orphelins_plein_cool.value,
-                'spice_orphelins_plein_min_pl': slider_spice_orphelins_plein_min_pl.value, 'spice_orphelins_plein_max_pl': slider_spice_orphelins_plein_max_pl.value,
-                
-                # SPICE FIELDS - Voisins
-                'spice_voisins_en': switch_spice_voisins.value, 'spice_voisins_trig': slider_spice_voisins_trig.value,
-                'spice_voisins_max': slider_spice_voisins_max.value, 'spice_voisins_cool': slider_spice_voisins_cool.value,
-                'spice_voisins_min_pl': slider_spice_voisins_min_pl.value, 'spice_voisins_max_pl': slider_spice_voisins_max_pl.value,
-                
-                # DOCTRINE FIELDS
-                'doctrine_en': switch_doctrine_enabled.value,
-                'doctrine_pl_stop': slider_doctrine_pl_stop.value, 'doctrine_pl_target': slider_doctrine_pl_target.value,
-                'doctrine_pl_press_wins': slider_doctrine_pl_press_wins.value, 'doctrine_pl_press_depth': slider_doctrine_pl_press_depth.value,
-                'doctrine_pl_iron': slider_doctrine_pl_iron.value,
-                'doctrine_ti_stop': slider_doctrine_ti_stop.value, 'doctrine_ti_target': slider_doctrine_ti_target.value,
-                'doctrine_ti_press_wins': slider_doctrine_ti_press_wins.value, 'doctrine_ti_press_depth': slider_doctrine_ti_press_depth.value,
-                'doctrine_ti_iron': slider_doctrine_ti_iron.value,
-                'doctrine_loss_trig': slider_doctrine_loss_trigger.value,
-                'doctrine_dd_pct': slider_doctrine_dd_pct.value, 'doctrine_dd_eur': slider_doctrine_dd_eur.value,
-                'doctrine_tight_min': slider_doctrine_tight_min.value, 'doctrine_tight_max': slider_doctrine_tight_max.value,
-                'doctrine_cooloff_en': switch_doctrine_cooloff.value, 'doctrine_cooloff_floor': slider_doctrine_cooloff_floor.value,
-                'doctrine_cooloff_months': slider_doctrine_cooloff_months.value, 'doctrine_recovery_pct': slider_doctrine_recovery_pct.value,
-                'doctrine_link_roulette': switch_doctrine_link_roulette.value,
-                'doctrine_roulette_pl': slider_doctrine_roulette_pl.value, 'doctrine_roulette_ti': slider_doctrine_roulette_ti.value,
-                'doctrine_roulette_co': slider_doctrine_roulette_co.value,
-                
-                # RECOVERY SESSION FIELDS
-                'recovery_enabled': switch_recovery_enabled.value,
-                'recovery_stop_loss': slider_recovery_stop_loss.value
-            }
-            profile['saved_strategies'][name] = config
-            save_profile(profile)
+            save_strategy(name, current_strategy_config())
             ui.notify(f'Saved: {name}', type='positive')
             update_strategy_list()
         except Exception as e: ui.notify(str(e), type='negative')
@@ -871,10 +314,7 @@ def show_roulette_sim():
         try:
             name = select_saved.value
             if not name: return
-            profile = load_profile()
-            if 'saved_strategies' in profile and name in profile['saved_strategies']:
-                del profile['saved_strategies'][name]
-                save_profile(profile)
+            if delete_strategy(name):
                 ui.notify(f'Deleted: {name}', type='negative')
                 select_saved.value = None
                 update_strategy_list()
@@ -912,33 +352,8 @@ def show_roulette_sim():
                 'status_target_pts': 0, 'earn_rate': 0,
                 'base_bet': float(slider_base_bet.value) 
             }
-            overrides = StrategyOverrides(
-                iron_gate_limit=int(slider_iron_gate.value), stop_loss_units=int(slider_stop_loss.value),
-                profit_lock_units=int(slider_profit.value), press_trigger_wins=int(select_press.value),
-                press_depth=int(slider_press_depth.value), ratchet_lock_pct=0.0, tax_threshold=config['tax_thresh'],
-                tax_rate=config['tax_rate'], bet_strategy=select_bet_strat.value,
-                bet_strategy_2=select_bet_strat_2.value,
-                shoes_per_session=float(slider_shoes.value), penalty_box_enabled=switch_penalty.value,
-                ratchet_enabled=switch_ratchet.value, ratchet_mode=select_ratchet_mode.value,
-                
-                # Smart Trailing Stop
-                smart_exit_enabled=switch_smart_exit.value,
-                smart_window_start=int(slider_smart_window.value),
-                min_profit_to_lock=int(slider_min_lock.value),
-                trailing_drop_pct=float(slider_trail_pct.value),
-                
-                # SPICE v5.0 - Map old UI controls to Zéro Léger (for backward compat)
-                spice_zero_leger_enabled=switch_spice_zero.value,
-                spice_zero_leger_trigger=slider_spice_zero_trig.value,
-                spice_zero_leger_max=slider_spice_zero_max.value,
-                spice_zero_leger_cooldown=slider_spice_zero_cool.value,
-                
-                # Tiers mapped as well
-                spice_tiers_enabled=switch_spice_tiers.value,
-                spice_tiers_trigger=slider_spice_tiers_trig.value,
-                spice_tiers_max=slider_spice_tiers_max.value,
-                spice_tiers_cooldown=slider_spice_tiers_cool.value
-            )
+            compiled = compile_strategy(current_strategy_config(), game_type='Roulette')
+            overrides = compiled.overrides
             
             res = await asyncio.to_thread(RouletteWorker.run_full_career, 
                 config['start_ga'], config['years']*12, config['freq'],
@@ -946,7 +361,7 @@ def show_roulette_sim():
                 config['use_ratchet'], config['use_tax'], config['use_holiday'], 
                 config['safety'], config['status_target_pts'], config['earn_rate'],
                 config['hol_ceil'], config['insolvency'], config['strategy_mode'],
-                config['base_bet']
+                config['base_bet'], tier_map=compiled.tier_map
             )
             
             chart_single_container.clear()
@@ -956,20 +371,68 @@ def show_roulette_sim():
                 fig.add_trace(go.Scatter(y=res['trajectory'], mode='lines', name='Balance', line=dict(color='#ef4444', width=2)))
                 fig.add_hline(y=config['insolvency'], line_dash="dash", line_color="red")
                 fig.update_layout(height=250, margin=dict(l=20, r=20, t=20, b=20), paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)', font=dict(color='#94a3b8'))
-                ui.plotly(fig).classes('w-full border border-slate-700 rounded')
+                zoomable_plotly(fig).classes('w-full border border-slate-700 rounded')
 
         except Exception as e:
             ui.notify(str(e), type='negative')
 
+    # --- UNIVERSE REPLAY (drill-down into the run on screen) ---
+    def render_universe_picker():
+        universe_picker_container.clear()
+        with universe_picker_container:
+            universe_picker(shown_run['results'], replay_universe)
+
+    async def replay_universe(index, label=None, session=1):
+        """Replays universe #index of the run on screen from its seed, tracing its session #session."""
+        if not shown_run: return
+        try:
+            res = await asyncio.to_thread(replay_lab_universe, 'Roulette', shown_run['strategy'], index,
+                                          shown_run['seed'], shown_run['config'], session)
+        except Exception as e:
+            ui.notify(str(e), type='negative'); return
+        config = shown_run['config']
+        log = res['y1_log']
+        sessions = max((e['session'] for e in log), default=0)
+        chart_single_container.clear()
+        with chart_single_container:
+            name = f"UNIVERSE #{index + 1}" + (f" ({label})" if label else '')
+            ui.label(f"{name} - REPLAYED FROM ITS SEED · Final €{res['final_ga']:,.0f}").classes('text-xs text-red-400 font-bold mb-1')
+            fig = go.Figure()
+            fig.add_trace(go.Scatter(y=res['trajectory'], mode='lines', name='Balance', line=dict(color='#ef4444', width=2)))
+            fig.add_hline(y=config['insolvency'], line_dash="dash", line_color="red")
+            fig.update_layout(height=250, margin=dict(l=20, r=20, t=20, b=20), paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)', font=dict(color='#94a3b8'))
+            zoomable_plotly(fig).classes('w-full border border-slate-700 rounded')
+            with ui.expansion(f'SESSION LOG ({sessions} sessions)', icon='history_edu').classes('w-full bg-slate-800 text-slate-300'):
+                paged_table(LOG_COLUMNS, log, log_row).classes('w-full bg-slate-800 text-slate-300')
+                download_buttons(f'roulette_universe{index + 1}_log', Y1_EXPORT_FIELDS, log, y1_export_record)
+            if sessions:
+                trace_picker(sessions, session, lambda n: replay_universe(index, label, n))
+        trace = res['session_trace']
+        session_detail_container.clear()
+        if trace:
+            title = f"Universe #{index + 1}, Session {trace['session']}{' bis' if trace.get('is_recovery') else ''}, Month {trace['month']}"
+            render_session_detail(trace, trace['start_ga'], config['base_bet'], None, title=title, replay=True)
+
     async def run_sim():
-        nonlocal running
+        await run_multiverse(int(slider_num_sims.value))
+
+    async def add_universes():
+        if not last_run:
+            ui.notify('Run the simulation first', type='warning'); return
+        await run_multiverse(len(last_run['results']) + int(number_add_sims.value or 0))
+
+    def stop_sim():
+        if active_task: get_scheduler().cancel(active_task)
+
+    async def run_multiverse(num_sims):
+        nonlocal running, active_task
         if running: return
         try:
-            running = True; btn_sim.disable(); progress.set_value(0); progress.set_visibility(True)
+            running = True; btn_sim.disable(); btn_add_sims.disable(); btn_stop.set_visibility(True); progress.set_value(0); progress.set_visibility(True)
             label_stats.set_text("Spinning the Wheel (Multiverse)...")
             
             config = {
-                'num_sims': int(slider_num_sims.value), 'years': int(slider_years.value), 'freq': int(slider_frequency.value),
+                'num_sims': num_sims, 'years': int(slider_years.value), 'freq': int(slider_frequency.value),
                 'contrib_win': int(slider_contrib_win.value), 'contrib_loss': int(slider_contrib_loss.value),
                 'status_target_pts': SBM_TIERS[select_status.value], 'earn_rate': float(slider_earn_rate.value),
                 'use_ratchet': switch_ratchet.value, 'ratchet_mode': select_ratchet_mode.value, 
@@ -981,138 +444,49 @@ def show_roulette_sim():
                 'base_bet': float(slider_base_bet.value)
             }
             
-            overrides = StrategyOverrides(
-                iron_gate_limit=int(slider_iron_gate.value), stop_loss_units=int(slider_stop_loss.value),
-                profit_lock_units=int(slider_profit.value), press_trigger_wins=int(select_press.value),
-                press_depth=config['press_depth'], ratchet_lock_pct=0.0, tax_threshold=config['tax_thresh'],
-                tax_rate=config['tax_rate'], bet_strategy=select_bet_strat.value,
-                bet_strategy_2=select_bet_strat_2.value,
-                shoes_per_session=float(slider_shoes.value), penalty_box_enabled=switch_penalty.value,
-                ratchet_enabled=switch_ratchet.value, ratchet_mode=select_ratchet_mode.value,
-                
-                # Smart Trailing Stop
-                smart_exit_enabled=switch_smart_exit.value,
-                smart_window_start=int(slider_smart_window.value),
-                min_profit_to_lock=int(slider_min_lock.value),
-                trailing_drop_pct=float(slider_trail_pct.value),
-                
-                # === SPICE SYSTEM v5.0 - COMPLETE CONFIGURATION ===
-                # Global Constraints
-                spice_global_max_per_session=int(slider_spice_global_max_session.value),
-                spice_global_max_per_spin=int(slider_spice_global_max_spin.value),
-                spice_disable_if_caroline_step4=switch_spice_disable_caroline.value,
-                spice_disable_if_pl_below_zero=switch_spice_disable_neg_pl.value,
-                spice_unit_ratio=0.5 if switch_spice_hybrid_mode.value else 1.0,
-                
-                # Family A - Light Spices
-                spice_zero_leger_enabled=switch_spice_zero.value,
-                spice_zero_leger_trigger=int(slider_spice_zero_trig.value),
-                spice_zero_leger_max=int(slider_spice_zero_max.value),
-                spice_zero_leger_cooldown=int(slider_spice_zero_cool.value),
-                spice_zero_leger_min_pl=int(slider_spice_zero_min_pl.value),
-                spice_zero_leger_max_pl=int(slider_spice_zero_max_pl.value),
-                
-                spice_jeu_zero_enabled=switch_spice_jeu_zero.value,
-                spice_jeu_zero_trigger=int(slider_spice_jeu_zero_trig.value),
-                spice_jeu_zero_max=int(slider_spice_jeu_zero_max.value),
-                spice_jeu_zero_cooldown=int(slider_spice_jeu_zero_cool.value),
-                spice_jeu_zero_min_pl=int(slider_spice_jeu_zero_min_pl.value),
-                spice_jeu_zero_max_pl=int(slider_spice_jeu_zero_max_pl.value),
-                
-                spice_zero_crown_enabled=switch_spice_zero_crown.value,
-                spice_zero_crown_trigger=int(slider_spice_zero_crown_trig.value),
-                spice_zero_crown_max=int(slider_spice_zero_crown_max.value),
-                spice_zero_crown_cooldown=int(slider_spice_zero_crown_cool.value),
-                spice_zero_crown_min_pl=int(slider_spice_zero_crown_min_pl.value),
-                spice_zero_crown_max_pl=int(slider_spice_zero_crown_max_pl.value),
-                
-                # Family B - Medium Spices
-                spice_tiers_enabled=switch_spice_tiers.value,
-                spice_tiers_trigger=int(slider_spice_tiers_trig.value),
-                spice_tiers_max=int(slider_spice_tiers_max.value),
-                spice_tiers_cooldown=int(slider_spice_tiers_cool.value),
-                spice_tiers_min_pl=int(slider_spice_tiers_min_pl.value),
-                spice_tiers_max_pl=int(slider_spice_tiers_max_pl.value),
-                
-                spice_orphelins_enabled=switch_spice_orphelins.value,
-                spice_orphelins_trigger=int(slider_spice_orphelins_trig.value),
-                spice_orphelins_max=int(slider_spice_orphelins_max.value),
-                spice_orphelins_cooldown=int(slider_spice_orphelins_cool.value),
-                spice_orphelins_min_pl=int(slider_spice_orphelins_min_pl.value),
-                spice_orphelins_max_pl=int(slider_spice_orphelins_max_pl.value),
-                
-                # Family C - Prestige Spices
-                spice_orphelins_plein_enabled=switch_spice_orphelins_plein.value,
-                spice_orphelins_plein_trigger=int(slider_spice_orphelins_plein_trig.value),
-                spice_orphelins_plein_max=int(slider_spice_orphelins_plein_max.value),
-                spice_orphelins_plein_cooldown=int(slider_spice_orphelins_plein_cool.value),
-                spice_orphelins_plein_min_pl=int(slider_spice_orphelins_plein_min_pl.value),
-                spice_orphelins_plein_max_pl=int(slider_spice_orphelins_plein_max_pl.value),
-                
-                spice_voisins_enabled=switch_spice_voisins.value,
-                spice_voisins_trigger=int(slider_spice_voisins_trig.value),
-                spice_voisins_max=int(slider_spice_voisins_max.value),
-                spice_voisins_cooldown=int(slider_spice_voisins_cool.value),
-                spice_voisins_min_pl=int(slider_spice_voisins_min_pl.value),
-                spice_voisins_max_pl=int(slider_spice_voisins_max_pl.value),
-                
-                # === DOCTRINE ENGINE v1.0 ===
-                doctrine_enabled=switch_doctrine_enabled.value,
-                doctrine_pl_stop=float(slider_doctrine_pl_stop.value),
-                doctrine_pl_target=float(slider_doctrine_pl_target.value),
-                doctrine_pl_press_wins=int(slider_doctrine_pl_press_wins.value),
-                doctrine_pl_press_depth=int(slider_doctrine_pl_press_depth.value),
-                doctrine_pl_iron=int(slider_doctrine_pl_iron.value),
-                doctrine_ti_stop=float(slider_doctrine_ti_stop.value),
-                doctrine_ti_target=float(slider_doctrine_ti_target.value),
-                doctrine_ti_press_wins=int(slider_doctrine_ti_press_wins.value),
-                doctrine_ti_press_depth=int(slider_doctrine_ti_press_depth.value),
-                doctrine_ti_iron=int(slider_doctrine_ti_iron.value),
-                doctrine_loss_trigger=float(slider_doctrine_loss_trigger.value),
-                doctrine_dd_pct_trigger=float(slider_doctrine_dd_pct.value),
-                doctrine_dd_eur_trigger=float(slider_doctrine_dd_eur.value),
-                doctrine_tight_min=int(slider_doctrine_tight_min.value),
-                doctrine_tight_max=int(slider_doctrine_tight_max.value),
-                doctrine_cooloff_enabled=switch_doctrine_cooloff.value,
-                doctrine_cooloff_floor=float(slider_doctrine_cooloff_floor.value),
-                doctrine_cooloff_min_months=int(slider_doctrine_cooloff_months.value),
-                doctrine_cooloff_recovery_pct=float(slider_doctrine_recovery_pct.value),
-                doctrine_link_roulette=switch_doctrine_link_roulette.value,
-                doctrine_roulette_pl=float(slider_doctrine_roulette_pl.value),
-                doctrine_roulette_ti=float(slider_doctrine_roulette_ti.value),
-                doctrine_roulette_co=float(slider_doctrine_roulette_co.value),
-                
-                # === RECOVERY SESSION SYSTEM ===
-                recovery_enabled=switch_recovery_enabled.value,
-                recovery_stop_loss=int(slider_recovery_stop_loss.value),
-            )
+            strategy_config = current_strategy_config()
+            compiled = compile_strategy(strategy_config, game_type='Roulette')
+            overrides = compiled.overrides
 
             start_ga = config['start_ga']
-            all_results = []
-            batch_size = 10
-            for i in range(0, config['num_sims'], batch_size):
-                count = min(batch_size, config['num_sims'] - i)
-                def run_batch():
-                    batch_data = []
-                    for k in range(count):
-                        should_track = (i == 0 and k == 0)
-                        res = RouletteWorker.run_full_career(
-                            start_ga, config['years']*12, config['freq'],
-                            config['contrib_win'], config['contrib_loss'], overrides, 
-                            config['use_ratchet'], config['use_tax'], config['use_holiday'], 
-                            config['safety'], config['status_target_pts'], config['earn_rate'],
-                            config['hol_ceil'], config['insolvency'], config['strategy_mode'],
-                            config['base_bet'], 
-                            track_y1_details=should_track
-                        )
-                        batch_data.append(res)
-                    return batch_data
-
-                batch_res = await asyncio.to_thread(run_batch)
-                all_results.extend(batch_res)
-                progress.set_value(len(all_results) / config['num_sims'])
-                label_stats.set_text(f"Simulating Universe {len(all_results)}/{config['num_sims']}")
-                await asyncio.sleep(0.01)
+            seed = int(number_seed.value or 0)
+            family = result_key('roulette', strategy={k: v for k, v in strategy_config.items() if k != 'sim_num'},
+                                config={k: v for k, v in config.items() if k != 'num_sims'}, seed=seed)
+            cache_key = result_key('roulette', family=family, universes=num_sims)
+            cached = await asyncio.to_thread(load_result, cache_key)
+            all_results = unpack_results(cached[0]) if cached else []
+            if cached:
+                label_stats.set_text(f"Loaded {len(all_results)} Universes from Cache")
+            elif last_run.get('family') == family:
+                # Same settings as the previous run: universe i is seeded from (seed, i), so keep its results and only play the extra universes
+                all_results = list(last_run['results'][:num_sims])
+                label_stats.set_text(f"Extending {len(all_results)} Universes to {num_sims}...")
+            played, todo = len(all_results), config['num_sims'] - len(all_results)
+            if todo > 0:
+                # Bands and KPIs refresh as chunks finish, so a bad config can be stopped early
+                scoreboard_container.clear(); chart_container.clear()
+                def summarize(results):
+                    partial = calculate_stats(results, config, start_ga, config['years']*12)
+                    return partial, lab_kpis(partial, config['years']*12, len(results))
+                preview = LivePreview(chart_container, 'Live Confidence Bands (Roulette)', LAB_KPIS, summarize)
+                if played: preview.collect(0, all_results)
+                # Queued on the server-wide scheduler (fair share with other users, cancelled if this tab closes)
+                active_task = submit_page_run(
+                    run_lab, ('Roulette', strategy_config, config['num_sims']),
+                    dict(seed=seed, config=config, start=played, max_workers=get_scheduler().processes_per_task,
+                         on_chunk=report_progress, on_results=preview.collect),
+                    cost=estimate_cost(todo, config['years']*12, config['freq']/12), name=f"Roulette lab ({todo} universes)")
+                async def show_progress(task):
+                    n = played + int(task.progress * todo)
+                    progress.set_value(n / config['num_sims'])
+                    label_stats.set_text(f"Simulating Universe {n}/{config['num_sims']}")
+                    await preview.refresh()
+                new_results, _ = await wait_for_run(active_task, label_stats, show_progress)
+                all_results.extend(new_results)
+            if not cached:
+                await asyncio.to_thread(save_result, cache_key, pack_results(all_results), {'seed': seed})
+            if last_run.get('family') != family or len(all_results) > len(last_run['results']):
+                last_run.update(family=family, results=all_results)
 
             label_stats.set_text("Analyzing Data (Please Wait)...")
             stats = await asyncio.to_thread(calculate_stats, all_results, config, start_ga, config['years']*12)
@@ -1121,16 +495,21 @@ def show_roulette_sim():
             render_analysis_ui(stats, config, start_ga, overrides, all_results) 
             label_stats.set_text("Simulation Complete")
             
-            # Refresh session detail to show a sample evening
-            await refresh_session_detail()
-            
-            await refresh_single_universe()
+            # Drill-down: the median universe of this run, replayed from its seed with full tracing
+            shown_run.update(strategy=strategy_config, config=config, seed=seed, results=all_results)
+            render_universe_picker()
+            await replay_universe(pick_universes(all_results)['MEDIAN'], 'MEDIAN')
 
+        except Cancelled:
+            label_stats.set_text("Simulation Cancelled")
+        except AdmissionError as e:
+            label_stats.set_text("Ready...")
+            ui.notify(str(e), type='warning')
         except Exception as e:
             print(traceback.format_exc())
             ui.notify(f"Error: {str(e)}", type='negative')
         finally:
-            running = False; btn_sim.enable(); progress.set_visibility(False)
+            running = False; active_task = None; btn_sim.enable(); btn_add_sims.enable(); btn_stop.set_visibility(False); progress.set_visibility(False)
 
     def render_analysis_ui(stats, config, start_ga, overrides, all_results):
         if not stats: return
@@ -1152,12 +531,8 @@ def show_roulette_sim():
         if real_monthly_cost <= 0: score_cost = 100
         else: score_cost = max(0, 100 - (real_monthly_cost / 3)) 
         
-        total_score = (score_survival * 0.70) + (active_pct * 0.30)
-        if total_score >= 90: grade, g_col = "A", "text-green-400"
-        elif total_score >= 80: grade, g_col = "B", "text-blue-400"
-        elif total_score >= 70: grade, g_col = "C", "text-yellow-400"
-        elif total_score >= 60: grade, g_col = "D", "text-orange-400"
-        else: grade, g_col = "F", "text-red-600"
+        g = lab_grade(stats, config['years']*12, config['num_sims'])
+        total_score, grade, g_col = g['score'], g['grade'], g['grade_class']
 
         with scoreboard_container:
             scoreboard_container.clear()
@@ -1198,45 +573,15 @@ def show_roulette_sim():
             if config['use_holiday']: fig.add_hline(y=config['hol_ceil'], line_dash="dash", line_color="yellow", annotation_text="Holiday")
             fig.update_layout(title='Monte Carlo Confidence Bands (Roulette)', paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)', font=dict(color='#94a3b8'), margin=dict(l=20, r=20, t=40, b=20))
             ui.plotly(fig).classes('w-full h-96')
+            show_session_shape(stats['session_hist'], 'Roulette')
 
         with flight_recorder_container:
             flight_recorder_container.clear()
             y1_log = all_results[0].get('y1_log', [])
             with ui.expansion('OUR LOG (Year 1 - Sim #1)', icon='history_edu', value=True).classes('w-full bg-slate-800 text-slate-300 border-2 border-slate-600'):
                 if y1_log:
-                    table_rows = []
-                    for entry in y1_log:
-                        res_val = entry.get('result', 0)
-                        session_num = entry.get('session', 0)
-                        is_recovery = entry.get('is_recovery', False)
-                        
-                        # Format session label with "bis" indicator for recovery sessions
-                        if is_recovery:
-                            # Find the original session number (the one before this recovery)
-                            session_label = f"S{session_num} bis"
-                        else:
-                            session_label = f"S{session_num}"
-                        
-                        table_rows.append({
-                            'Month': f"M{entry.get('month', '?')}", 
-                            'Session': session_label,
-                            'Result': f"€{res_val:+,.0f}", 
-                            'Balance': f"€{entry.get('balance', 0):,.0f}", 
-                            'Game Bal': f"€{entry.get('game_bal', 0):,.0f}", 
-                            'Spins': f"{entry.get('spins', 0)}"
-                        })
-                    ui.aggrid({
-                        'columnDefs': [
-                            {'headerName': 'Mo', 'field': 'Month', 'width': 60}, 
-                            {'headerName': 'Sess', 'field': 'Session', 'width': 80}, 
-                            {'headerName': 'PnL', 'field': 'Result', 'width': 90}, 
-                            {'headerName': 'Tot. Bal', 'field': 'Balance', 'width': 100}, 
-                            {'headerName': 'Game Bal', 'field': 'Game Bal', 'width': 100}, 
-                            {'headerName': 'Spins', 'field': 'Spins', 'width': 80}
-                        ], 
-                        'rowData': table_rows, 
-                        'domLayout': 'autoHeight'
-                    }).classes('w-full theme-balham-dark')
+                    paged_table(LOG_COLUMNS, y1_log, log_row).classes('w-full bg-slate-800 text-slate-300')
+                    download_buttons('roulette_year1_log', Y1_EXPORT_FIELDS, y1_log, y1_export_record)
 
         with report_container:
             report_container.clear()
@@ -1333,33 +678,13 @@ def show_roulette_sim():
         """Generate and display a new random session with spin-by-spin detail"""
         try:
             # Get current config
-            overrides = StrategyOverrides(
-                bet_strategy=select_bet_strat.value, bet_strategy_2=select_bet_strat_2.value,
-                tax_rate=slider_tax_rate.value, tax_threshold=int(slider_tax_thresh.value),
-                stop_loss_units=int(slider_stop_loss.value), profit_lock_units=int(slider_profit.value),
-                press_trigger_wins=int(select_press.value), press_depth=int(slider_press_depth.value),
-                iron_gate_limit=int(slider_iron_gate.value), shoes_per_session=float(slider_shoes.value),
-                penalty_box_enabled=switch_penalty.value, ratchet_enabled=switch_ratchet.value,
-                ratchet_mode=select_ratchet_mode.value,
-                smart_exit_enabled=switch_smart_exit.value,
-                smart_window_start=int(slider_smart_window.value),
-                min_profit_to_lock=int(slider_min_lock.value),
-                trailing_drop_pct=float(slider_trail_pct.value),
-                # Add all spice configurations (simplified for brevity)
-                spice_global_max_per_session=int(slider_spice_global_max_session.value),
-                spice_global_max_per_spin=int(slider_spice_global_max_spin.value),
-                spice_disable_if_caroline_step4=switch_spice_disable_caroline.value,
-                spice_disable_if_pl_below_zero=switch_spice_disable_neg_pl.value,
-                spice_unit_ratio=0.5 if switch_spice_hybrid_mode.value else 1.0,
-            )
+            compiled = compile_strategy(current_strategy_config(), game_type='Roulette')
+            overrides = compiled.overrides
             
             start_ga = float(slider_start_ga.value)
             base_bet = float(slider_base_bet.value)
             strategy_mode = select_engine_mode.value
-            safety_factor = float(slider_safety.value)
-            
-            # Generate tier map
-            tier_map = generate_tier_map(safety_factor, mode=strategy_mode, game_type='Roulette', base_bet=base_bet)
+            tier_map = compiled.tier_map
             
             # Run a single session with spin tracking
             def run_tracked_session():
@@ -1375,7 +700,7 @@ def show_roulette_sim():
             ui.notify(f"Error: {str(e)}", type='negative')
             print(traceback.format_exc())
 
-    def render_session_detail(session_data, start_bankroll, base_bet, overrides):
+    def render_session_detail(session_data, start_bankroll, base_bet, overrides, title='Session 1', replay=False):
         """Render the session detail UI with bankroll evolution graph"""
         with session_detail_container:
             session_detail_container.clear()
@@ -1384,7 +709,7 @@ def show_roulette_sim():
             if not spin_log:
                 return
             
-            with ui.expansion('OUR LOG (Session 1) - Bankroll Evolution', icon='show_chart', value=False).classes('w-full bg-slate-800 text-slate-300 border-2 border-slate-600'):
+            with ui.expansion(f'OUR LOG ({title}) - Bankroll Evolution', icon='show_chart', value=False).classes('w-full bg-slate-800 text-slate-300 border-2 border-slate-600'):
                 with ui.column().classes('w-full gap-2 p-2'):
                     # Session Summary
                     with ui.row().classes('w-full gap-4 items-center'):
@@ -1392,7 +717,8 @@ def show_roulette_sim():
                         ui.label(f"Exit: {session_data['exit_reason']}").classes('text-sm text-slate-400')
                         ui.label(f"Spins: {session_data['spins']}").classes('text-sm text-slate-400')
                         ui.label(f"Peak Profit: €{session_data['peak_profit']:+,.0f}").classes('text-sm text-cyan-400')
-                        ui.button('↻ REFRESH SESSION', on_click=refresh_session_detail).props('flat color=cyan dense size=sm')
+                        if not replay:
+                            ui.button('↻ REFRESH SESSION', on_click=refresh_session_detail).props('flat color=cyan dense size=sm')
                     
                     # Create bankroll evolution graph
                     fig = go.Figure()
@@ -1452,7 +778,7 @@ def show_roulette_sim():
                         )
                     )
                     
-                    ui.plotly(fig).classes('w-full h-80')
+                    zoomable_plotly(fig).classes('w-full h-80')
                     
                     # Optional: Add a compact stats table
                     with ui.row().classes('w-full gap-4 text-xs text-slate-400 justify-around'):
@@ -1484,6 +810,7 @@ def show_roulette_sim():
                     ui.label('SIMULATION').classes('font-bold text-white mb-2')
                     with ui.row().classes('w-full justify-between'): ui.label('Universes').classes('text-xs text-slate-400'); lbl_num_sims = ui.label()
                     slider_num_sims = ui.slider(min=10, max=1000, value=20).props('color=cyan'); lbl_num_sims.bind_text_from(slider_num_sims, 'value', lambda v: f'{v}')
+                    number_seed = ui.number('Seed', value=DEFAULT_SEED, format='%d').props('dense').classes('w-full')
                     with ui.row().classes('w-full justify-between'): ui.label('Years').classes('text-xs text-slate-400'); lbl_years = ui.label()
                     slider_years = ui.slider(min=1, max=10, value=10).props('color=blue'); lbl_years.bind_text_from(slider_years, 'value', lambda v: f'{v}')
                     with ui.row().classes('w-full justify-between'): ui.label('Sessions/Year').classes('text-xs text-slate-400'); lbl_freq = ui.label()
@@ -1870,13 +1197,20 @@ def show_roulette_sim():
                      # UPDATED RANGE: 0 to 100,000 to match Baccarat
                      slider_start_ga = ui.slider(min=0, max=100000, value=2000, step=100).props('color=green'); ui.label().bind_text_from(slider_start_ga, 'value', lambda v: f'€{v}')
                      with ui.row().classes('gap-4 mt-2'): select_status = ui.select(list(SBM_TIERS.keys()), value='Gold').props('dense'); slider_earn_rate = ui.slider(min=1, max=20, value=10).props('color=yellow').classes('w-32')
-                btn_sim = ui.button('RUN SIM', on_click=run_sim).props('icon=play_arrow color=yellow text-color=black size=lg')
+                with ui.column().classes('items-end gap-1'):
+                    with ui.row().classes('items-center gap-1'):
+                        btn_stop = ui.button('STOP', on_click=stop_sim).props('icon=stop flat color=red dense'); btn_stop.set_visibility(False)
+                        btn_sim = ui.button('RUN SIM', on_click=run_sim).props('icon=play_arrow color=yellow text-color=black size=lg')
+                    with ui.row().classes('items-center gap-1'):
+                        number_add_sims = ui.number('Extra', value=500, min=10, step=100, format='%d').props('dense').classes('w-24')
+                        btn_add_sims = ui.button('ADD UNIVERSES', on_click=add_universes).props('icon=add flat color=cyan dense')
 
         label_stats = ui.label('Ready...').classes('text-sm text-slate-500'); progress = ui.linear_progress().props('color=green').classes('mt-0'); progress.set_visibility(False)
         scoreboard_container = ui.column().classes('w-full mb-4')
         chart_container = ui.card().classes('w-full bg-slate-900 p-4')
         
         ui.button('⚡ REFRESH SINGLE', on_click=refresh_single_universe).props('flat color=cyan dense').classes('mt-4')
+        universe_picker_container = ui.column().classes('w-full mt-2')
         chart_single_container = ui.column().classes('w-full mt-2')
         
         flight_recorder_container = ui.column().classes('w-full mb-4')
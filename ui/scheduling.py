@@ -0,0 +1,72 @@
+"""
+Page side of the simulation scheduler (utils/scheduler.py).
+
+The labs queue their runs with submit_page_run() instead of starting threads
+of their own. Runs belong to the browser session (fair share is per user, not
+per tab) and are cancelled when the tab that started them goes away.
+
+While instrumentation is switched on (admin panel), runs whose function takes
+an instrument= accumulator (batch.run_lab / run_career) are timed per engine
+phase and their reports kept for the admin panel (engine/instrumentation.py).
+"""
+
+import inspect
+
+from nicegui import app, ui
+
+from engine import instrumentation
+from utils.scheduler import get_scheduler, wait_for
+
+_watched_clients = set()
+_page_runs = {'instrumented': False}  # Server-wide, set from the admin panel
+
+
+def page_runs_instrumented() -> bool:
+    return _page_runs['instrumented']
+
+
+def set_page_runs_instrumented(enabled: bool):
+    _page_runs['instrumented'] = bool(enabled)
+
+
+def _instrument(fn, kwargs):
+    """kwargs with a fresh accumulator when page runs are instrumented and fn accepts one, else None."""
+    if not _page_runs['instrumented'] or 'instrument' not in inspect.signature(fn).parameters:
+        return None
+    acc = instrumentation.Accumulator()
+    kwargs['instrument'] = acc
+    return acc
+
+
+def submit_page_run(fn, args=(), kwargs=None, cost=0, name=''):
+    """Queues fn on the scheduler for the current tab. Raises AdmissionError if refused."""
+    scheduler = get_scheduler()
+    client = ui.context.client
+    kwargs = dict(kwargs or {})
+    acc = _instrument(fn, kwargs)
+    task = scheduler.submit(app.storage.browser['id'], fn, args, kwargs, cost=cost, name=name, client=client.id)
+    if acc is not None:
+        def run_done(future):
+            if not future.cancelled() and future.exception() is None:
+                instrumentation.record_report(name, acc, elapsed_sec=round(task.finished - task.started, 3))
+        task.future.add_done_callback(run_done)
+    if client.id not in _watched_clients:
+        _watched_clients.add(client.id)
+        def client_gone():
+            _watched_clients.discard(client.id)
+            scheduler.cancel_client(client.id)
+        client.on_delete(client_gone)
+    return task
+
+
+async def wait_for_run(task, label, on_progress):
+    """Awaits a run: shows its queue position while it waits, then calls on_progress(task) (sync or async) as it plays."""
+    scheduler = get_scheduler()
+    def tick(t):
+        if t.status == 'queued':
+            ahead = scheduler.queue_position(t)
+            label.set_text(f"Queued: waiting for a free simulation slot ({ahead} ahead)" if ahead else
+                           "Queued: waiting for a free simulation slot")
+        else:
+            return on_progress(t)
+    return await wait_for(task, tick)
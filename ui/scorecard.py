@@ -1,7 +1,7 @@
 from nicegui import ui
 from engine.strategy_rules import SessionState, BaccaratStrategist, PlayMode, BetStrategy, StrategyOverrides
 from engine.tier_params import get_tier_for_ga, generate_tier_map
-from utils.persistence import load_profile, save_profile, log_session_result
+from utils.persistence import get_bankroll, set_bankroll, get_strategy, get_strategy_names, log_session_result
 
 # --- LIVE SESSION MANAGER ---
 class LiveSessionManager:
@@ -96,9 +96,7 @@ class LiveSessionManager:
     def save_and_quit(self):
         if not self.state: return
         # Update Profile
-        profile = load_profile()
-        profile['ga'] = self.current_ga
-        save_profile(profile)
+        set_bankroll(self.current_ga)
         # Log Session
         log_session_result(self.start_ga, self.current_ga, shoes_played=1)
 
@@ -142,10 +140,9 @@ def show_scorecard():
     def start_selected_strategy():
         strat_name = select_strat.value
         if not strat_name: return
-        profile = load_profile()
-        config = profile.get('saved_strategies', {}).get(strat_name)
+        config = get_strategy(strat_name)
         if not config: ui.notify('Strategy config error', type='negative'); return
-        session.start_session(strat_name, config, profile.get('ga', 2000))
+        session.start_session(strat_name, config, get_bankroll(2000))
         refresh_advice()
         dialog_strat.close()
         ui.notify(f'Session Started: {strat_name}', type='positive')
@@ -182,7 +179,6 @@ def show_scorecard():
 
     with ui.dialog() as dialog_strat, ui.card().classes('bg-slate-800 text-white min-w-[300px]'):
         ui.label('Choose Protocol').classes('text-lg font-bold mb-4')
-        prof = load_profile()
-        strats = list(prof.get('saved_strategies', {}).keys())
+        strats = get_strategy_names()
         select_strat = ui.select(strats, label='Strategy').classes('w-full mb-6')
         ui.button('INITIALIZE', on_click=start_selected_strategy).props('color=green w-full')
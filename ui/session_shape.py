@@ -0,0 +1,67 @@
+"""
+Session shape panel of the labs: how the sessions of every universe ended and
+what they looked like (exit reason mix, session length, peak profit, max
+press streak, Baccarat ties), per tier, from the merged session histograms
+(engine/session_histograms.py). Counts come with the results, so the panel
+costs no extra simulation and no per-session records.
+"""
+
+import plotly.graph_objects as go
+from nicegui import ui
+
+from engine.session_histograms import summarize
+
+# metric -> chart title ({unit} is hands or spins)
+CHARTS = {
+    'exit': 'Exit Reason Mix',
+    'length': '{unit} per Session',
+    'peak_units': 'Session Peak Profit (stop-loss units)',
+    'press_streak': 'Max Press Streak',
+    'ties': 'Ties per Session',
+    'tie_bets': 'Tie Bets per Session',
+}
+GAME_CHARTS = {
+    'Baccarat': ('exit', 'length', 'peak_units', 'press_streak', 'ties', 'tie_bets'),
+    'Roulette': ('exit', 'length', 'peak_units', 'press_streak'),
+}
+BAR_COLORS = {'exit': '#f87171', 'length': '#38bdf8', 'peak_units': '#4ade80', 'press_streak': '#facc15',
+              'ties': '#c084fc', 'tie_bets': '#a78bfa'}
+
+
+def _figure(summary: dict, metric: str, tier, title: str) -> go.Figure:
+    entry = summary[metric]
+    counts = entry['all' if tier == 'all' else tier]
+    total = sum(counts) or 1
+    fig = go.Figure(go.Bar(x=entry['labels'], y=[100 * c / total for c in counts], customdata=counts,
+                           marker_color=BAR_COLORS[metric],
+                           hovertemplate='%{x}: %{y:.1f}% (%{customdata:,} sessions)<extra></extra>'))
+    fig.update_layout(title=title, height=260, margin=dict(l=20, r=20, t=40, b=20), yaxis_title='% of sessions',
+                      paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)', font=dict(color='#94a3b8'))
+    return fig
+
+
+def show_session_shape(merged, game_type: str):
+    """Card with per-tier session distributions from a merged histogram (stats['session_hist'])."""
+    summary = summarize(merged)
+    with ui.card().classes('w-full bg-slate-900 p-4'):
+        if not summary['sessions']:
+            ui.label('No sessions were played in these universes.').classes('text-slate-500 italic')
+            return
+        unit = 'Hands' if game_type == 'Baccarat' else 'Spins'
+        tier_options = {'all': f"All tiers ({summary['sessions']:,} sessions)"}
+        tier_options.update({t: f'Tier {t} ({n:,})' for t, n in summary['tiers'].items()})
+        with ui.row().classes('w-full items-center justify-between'):
+            ui.label('SESSION SHAPE (every session, every universe)').classes('text-sm font-bold text-slate-400')
+            tier_select = ui.select(tier_options, value='all').props('dense dark').classes('w-56')
+        plots = {}
+        with ui.grid(columns=2).classes('w-full gap-2'):
+            for metric in GAME_CHARTS[game_type]:
+                title = CHARTS[metric].format(unit=unit)
+                plots[metric] = (ui.plotly(_figure(summary, metric, 'all', title)).classes('w-full'), title)
+
+        def show_tier(e):
+            for metric, (plot, title) in plots.items():
+                plot.figure = _figure(summary, metric, e.value, title)
+                plot.update()
+
+        tier_select.on_value_change(show_tier)
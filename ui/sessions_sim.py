@@ -1,13 +1,24 @@
 from nicegui import ui
-from utils.persistence import load_profile
-from engine.strategy_rules import StrategyOverrides
-from engine.tier_params import generate_tier_map, get_tier_for_ga
-from ui.roulette_sim import RouletteWorker
-from ui.simulator import BaccaratWorker
+from utils.persistence import get_saved_strategies, get_strategy_names
+from engine.sessions_worker import SessionsWorker, calculate_ensemble_stats
+from engine.batch import run_tasks
+from engine.cancellation import Cancelled
+from engine.seeding import fresh_seed
+from ui.scheduling import submit_page_run, wait_for_run
+from ui.tables import paged_table, download_buttons
+from utils.scheduler import AdmissionError, estimate_cost, get_scheduler, report_progress
 import numpy as np
 import asyncio
 import plotly.graph_objects as go
 
+SESSIONS_EXPORT_FIELDS = ['Session', 'Game', 'Strategy', 'Pure_PNL', 'Bankroll_After', 'Contribution', 'Game_Bankroll']
+
+def sessions_export_record(res, entry):
+    """Export row of one strategy played in a session (pure game PnL separated from contributions)."""
+    return dict(zip(SESSIONS_EXPORT_FIELDS, (
+        res['session'], entry['game'], entry['strategy'], round(entry['result'], 2), round(entry['bankroll'], 2),
+        round(res['contribution'], 2), round(res['game_bankroll'], 2))))
+
 # --- SESSIONS SIM PAGE ---
 def show_sessions_sim():
     session_strategies = []  # List of dicts: { 'game': 'Roulette'/'Baccarat', 'strategy': str, 'params': dict }
@@ -40,8 +51,7 @@ def show_sessions_sim():
 
         with ui.card().classes('w-full bg-slate-900 p-4'):
             ui.label('1. BUILD SESSION SEQUENCE').classes('font-bold text-white mb-2')
-            profile = load_profile()
-            saved = list(profile.get('saved_strategies', {}).keys())
+            saved = get_strategy_names()
             select_game = ui.select(['Roulette', 'Baccarat'], label='Game').classes('w-32')
             select_strat = ui.select(saved, label='Select Strategy').classes('w-full')
             ui.button('ADD TO SESSION', on_click=add_strategy).props('icon=add color=purple').classes('w-full mt-2')
@@ -65,12 +75,100 @@ def show_sessions_sim():
             slider_contrib_loss = ui.slider(min=0, max=1000, value=300, step=50).props('color=green')
             ui.label().bind_text_from(slider_contrib_loss, 'value', lambda v: f'After Loss: +€{v:,.0f}')
 
+            ui.separator().classes('bg-slate-700 my-4')
+            ui.label('🎲 ENSEMBLE MODE (Multi-Path)').classes('text-xs font-bold text-purple-400 mb-2')
+            ui.label('Runs many independent paths of the same evening and shows percentile bands').classes('text-xs text-slate-400 mb-2')
+            switch_ensemble = ui.switch('Enable Ensemble').props('color=purple')
+            switch_ensemble.value = False
+            slider_num_paths = ui.slider(min=100, max=10000, value=1000, step=100).props('color=purple')
+            ui.label().bind_text_from(slider_num_paths, 'value', lambda v: f'{v:,} Paths')
+
         # Results area placeholder
         results_area = ui.column().classes('w-full mt-8')
         progress_bar = ui.linear_progress().props('color=green').classes('mt-4')
         progress_bar.set_visibility(False)
         status_label = ui.label('').classes('text-sm text-slate-400 mt-2')
 
+        def add_band_traces(fig, bands, color, name):
+            x = list(range(1, len(bands[50]) + 1))
+            fig.add_trace(go.Scatter(x=x + x[::-1], y=np.concatenate([bands[95], bands[5][::-1]]), fill='toself', fillcolor=f'rgba({color}, 0.15)', line=dict(color='rgba(255,255,255,0)'), name=f'{name} P5-P95'))
+            fig.add_trace(go.Scatter(x=x + x[::-1], y=np.concatenate([bands[75], bands[25][::-1]]), fill='toself', fillcolor=f'rgba({color}, 0.35)', line=dict(color='rgba(255,255,255,0)'), name=f'{name} P25-P75'))
+            fig.add_trace(go.Scatter(x=x, y=bands[50], mode='lines', name=f'{name} Median', line=dict(color=f'rgb({color})', width=2)))
+
+        def render_ensemble(stats, start_bankroll):
+            results_area.clear()
+            with results_area:
+                ui.label(f"📊 ENSEMBLE RESULTS ({stats['num_paths']:,} PATHS)").classes('text-2xl text-orange-300 font-bold mb-4')
+
+                with ui.row().classes('w-full gap-4 mb-4'):
+                    with ui.card().classes('flex-1 bg-slate-800 p-4'):
+                        ui.label('MEDIAN FINAL GA').classes('text-xs text-slate-500 font-bold')
+                        ga_color = 'text-green-400' if stats['final_ga_median'] > start_bankroll else 'text-red-400'
+                        ui.label(f"€{stats['final_ga_median']:,.0f}").classes(f'text-3xl font-bold {ga_color}')
+                        ui.label(f"P5 €{stats['final_ga_p5']:,.0f} | P95 €{stats['final_ga_p95']:,.0f}").classes('text-xs text-slate-500')
+
+                    with ui.card().classes('flex-1 bg-slate-800 p-4'):
+                        ui.label('AVG GAME PROFIT').classes('text-xs text-slate-500 font-bold')
+                        color = 'text-green-400' if stats['avg_game_profit'] > 0 else 'text-red-400'
+                        ui.label(f"€{stats['avg_game_profit']:,.0f}").classes(f'text-3xl font-bold {color}')
+                        ui.label(f"Win Rate: {stats['win_rate']:.1f}% of sessions").classes('text-xs text-slate-500')
+
+                    with ui.card().classes('flex-1 bg-slate-800 p-4'):
+                        ui.label('INSOLVENCY').classes('text-xs text-slate-500 font-bold')
+                        color = 'text-red-400' if stats['insolvency_rate'] > 0 else 'text-green-400'
+                        ui.label(f"{stats['insolvency_rate']:.1f}%").classes(f'text-3xl font-bold {color}')
+                        ui.label('Paths with an insolvent session').classes('text-xs text-slate-500')
+
+                    with ui.card().classes('flex-1 bg-slate-800 p-4'):
+                        ui.label('MONTHLY COST').classes('text-xs text-slate-500 font-bold')
+                        cost_color = 'text-red-400' if stats['monthly_cost'] > 0 else 'text-green-400'
+                        ui.label(f"€{stats['monthly_cost']:,.0f}").classes(f'text-3xl font-bold {cost_color}')
+                        ui.label('Mean pure EV/month').classes('text-xs text-slate-500')
+
+                for title, key, color in [('GAME BANKROLL BANDS', 'bankroll_bands', '34, 211, 238'), ('GAME ACCOUNT BANDS', 'account_bands', '74, 222, 128')]:
+                    with ui.card().classes('w-full bg-slate-900 p-4 mb-4'):
+                        ui.label(title).classes('text-sm font-bold text-yellow-400 mb-2')
+                        fig = go.Figure()
+                        add_band_traces(fig, stats[key], color, 'Bankroll' if key == 'bankroll_bands' else 'GA')
+                        fig.add_hline(y=start_bankroll, line_dash="dash", line_color="yellow", annotation_text=f"Start: €{start_bankroll:,.0f}", annotation_position="right")
+                        fig.update_layout(
+                            xaxis_title='Session #',
+                            yaxis_title='€',
+                            paper_bgcolor='rgba(0,0,0,0)',
+                            plot_bgcolor='rgba(0,0,0,0)',
+                            font=dict(color='#94a3b8'),
+                            margin=dict(l=20, r=20, t=40, b=20),
+                            height=350
+                        )
+                        ui.plotly(fig).classes('w-full')
+
+        async def run_ensemble_sim(num_sessions, start_bankroll, saved_strats):
+            num_paths = int(slider_num_paths.value)
+            legs = SessionsWorker.compile_legs(session_strategies, saved_strats)
+            plan = SessionsWorker.plan_chunks(num_paths, fresh_seed())
+            args = (num_sessions, start_bankroll, switch_contributions.value, slider_contrib_win.value, slider_contrib_loss.value)
+            tasks = [(SessionsWorker.run_ensemble_chunk, (legs, n, seed, *args)) for n, seed in plan]
+
+            def run_ensemble():
+                done = [0]
+                def chunk_done(j, chunk):
+                    done[0] += chunk['bankrolls'].shape[0]
+                    report_progress(done[0], num_paths)
+                return SessionsWorker.merge_chunks(run_tasks(tasks, get_scheduler().processes_per_task, chunk_done))
+
+            def show_progress(task):
+                progress_bar.set_value(task.progress)
+                status_label.set_text(f'Simulating Path {task.done:,}/{num_paths:,}')
+
+            # Queued on the server-wide scheduler (fair share with other users, cancelled if this tab closes)
+            task = submit_page_run(run_ensemble, cost=estimate_cost(num_paths, num_sessions, 1),
+                                   name=f'Sessions ensemble ({num_paths} paths)')
+            store = await wait_for_run(task, status_label, show_progress)
+            stats = await asyncio.to_thread(calculate_ensemble_stats, store, start_bankroll)
+            progress_bar.set_visibility(False)
+            status_label.set_text('Ensemble complete!')
+            render_ensemble(stats, start_bankroll)
+
         async def run_sessions_sim():
             if not session_strategies:
                 ui.notify('Add at least one strategy to the session.', type='warning')
@@ -83,132 +181,18 @@ def show_sessions_sim():
                 
                 num_sessions = int(slider_num_sessions.value)
                 start_bankroll = float(slider_start_bankroll.value)
-                profile = load_profile()
-                saved_strats = profile.get('saved_strategies', {})
+                saved_strats = get_saved_strategies()
+                
+                if switch_ensemble.value:
+                    await run_ensemble_sim(num_sessions, start_bankroll, saved_strats)
+                    return
                 
                 def run_all_sessions():
-                    all_results = []
-                    game_bankroll = start_bankroll  # Money in casino wallet
-                    game_account = start_bankroll   # GA = total wealth (savings + casino wallet)
-                    total_contributions = 0
-                    use_contributions = switch_contributions.value
-                    contrib_win = slider_contrib_win.value
-                    contrib_loss = slider_contrib_loss.value
-                    insolvency_floor = 0  # Cannot go below zero
-                    target_bankroll = start_bankroll  # Target to maintain in casino wallet
-                    
-                    for s in range(num_sessions):
-                        # STEP 1: Add contribution to GA (total wealth increases)
-                        contribution_this_session = 0
-                        if use_contributions:
-                            # Determine contribution based on PREVIOUS session result
-                            if s == 0 or all_results[-1]['pure_session_pnl'] > 0:
-                                contribution_this_session = contrib_win
-                            else:
-                                contribution_this_session = contrib_loss
-                            game_account += contribution_this_session
-                            total_contributions += contribution_this_session
-                        
-                        # STEP 2: Top-up game_bankroll from GA savings if needed
-                        available_savings = game_account - game_bankroll  # Money not in casino
-                        if game_bankroll < target_bankroll and available_savings > 0:
-                            # Transfer from savings to casino wallet
-                            needed = target_bankroll - game_bankroll
-                            topup = min(needed, available_savings)
-                            game_bankroll += topup
-                            # Note: GA total doesn't change (just moving money between accounts)
-                        
-                        # STEP 3: INSOLVENCY CHECK - Cannot play if bankroll is at/below floor
-                        if game_bankroll <= insolvency_floor:
-                            # Record insolvent session
-                            all_results.append({
-                                'session': s+1, 
-                                'game_bankroll': game_bankroll,
-                                'pure_session_pnl': 0,
-                                'game_account': game_account,
-                                'contribution': contribution_this_session,
-                                'log': [{'game': 'INSOLVENT', 'strategy': 'NO PLAY', 'result': 0, 'bankroll': game_bankroll}],
-                                'total_contributions_so_far': total_contributions,
-                                'is_insolvent': True
-                            })
-                            continue
-                        
-                        session_log = []
-                        starting_bankroll_this_session = game_bankroll
-                        
-                        for strat in session_strategies:
-                            strat_cfg = saved_strats.get(strat['strategy'])
-                            if not strat_cfg:
-                                session_log.append({'game': strat['game'], 'strategy': strat['strategy'], 'result': 'NOT FOUND', 'bankroll': game_bankroll})
-                                continue
-                            
-                            # Create overrides from saved config
-                            from engine.strategy_rules import BetStrategy
-                            
-                            # Get bet strategy
-                            raw_bet = strat_cfg.get('tac_bet', 'BANKER')
-                            if strat['game'] == 'Baccarat':
-                                bet_strat = getattr(BetStrategy, raw_bet, BetStrategy.BANKER)
-                            else:
-                                bet_strat = raw_bet  # For roulette it's a string
-                            
-                            overrides = StrategyOverrides(
-                                iron_gate_limit=strat_cfg.get('tac_iron', 3),
-                                stop_loss_units=strat_cfg.get('risk_stop', 10),
-                                profit_lock_units=strat_cfg.get('risk_prof', 10),
-                                press_trigger_wins=strat_cfg.get('tac_press', 1),
-                                press_depth=strat_cfg.get('tac_depth', 3),
-                                bet_strategy=bet_strat,
-                                shoes_per_session=strat_cfg.get('tac_shoes', 3),
-                                penalty_box_enabled=strat_cfg.get('tac_penalty', True),
-                                ratchet_enabled=strat_cfg.get('risk_ratch', False),
-                                ratchet_mode=strat_cfg.get('risk_ratch_mode', 'Standard'),
-                                smart_exit_enabled=strat_cfg.get('smart_exit_enabled', True),
-                                smart_window_start=strat_cfg.get('smart_window_start', 90),
-                                min_profit_to_lock=strat_cfg.get('min_profit_to_lock', 20),
-                                trailing_drop_pct=strat_cfg.get('trailing_drop_pct', 0.20)
-                            )
-                            
-                            tier_map = generate_tier_map(
-                                strat_cfg.get('tac_safety', 25), 
-                                mode=strat_cfg.get('tac_mode', 'Standard'), 
-                                game_type=strat['game'], 
-                                base_bet=strat_cfg.get('tac_base_bet', 10.0)
-                            )
-                            active_level = 1
-                            mode = strat_cfg.get('tac_mode', 'Standard')
-                            base_bet = strat_cfg.get('tac_base_bet', 10.0)
-                            
-                            # Simulate
-                            if strat['game'] == 'Roulette':
-                                pnl, *_ = RouletteWorker.run_session(game_bankroll, overrides, tier_map, overrides.ratchet_enabled, overrides.penalty_box_enabled, active_level, mode, base_bet)
-                            else:
-                                pnl, *_ = BaccaratWorker.run_session(game_bankroll, overrides, tier_map, overrides.ratchet_enabled, overrides.penalty_box_enabled, active_level, mode, base_bet)
-                            
-                            # Update game bankroll with pure PnL
-                            game_bankroll += pnl
-                            # ENFORCE INSOLVENCY FLOOR - clamp at minimum
-                            game_bankroll = max(game_bankroll, insolvency_floor)
-                            session_log.append({'game': strat['game'], 'strategy': strat['strategy'], 'result': pnl, 'bankroll': game_bankroll})
-                        
-                        # Calculate pure session PnL (no contributions)
-                        session_pnl = game_bankroll - starting_bankroll_this_session
-                        
-                        # STEP 4: Update GA with game profit/loss (total wealth changed due to casino results)
-                        game_account += session_pnl
-                        # Note: contribution was already added at start of session
-                        
-                        all_results.append({
-                            'session': s+1, 
-                            'game_bankroll': game_bankroll,  # Money in casino wallet (clamped at floor)
-                            'pure_session_pnl': session_pnl,  # Pure game result
-                            'game_account': game_account,  # GA = total wealth (SB + C + P)
-                            'contribution': contribution_this_session,
-                            'log': session_log,
-                            'total_contributions_so_far': total_contributions,
-                            'is_insolvent': False
-                        })
-                    return all_results, total_contributions
+                    legs = SessionsWorker.compile_legs(session_strategies, saved_strats)
+                    return SessionsWorker.run_path(
+                        legs, num_sessions, start_bankroll,
+                        switch_contributions.value, slider_contrib_win.value, slider_contrib_loss.value
+                    )
                 
                 # Run in thread
                 all_results, total_contributions = await asyncio.to_thread(run_all_sessions)
@@ -323,56 +307,32 @@ def show_sessions_sim():
                     # Detailed results table
                     with ui.card().classes('w-full bg-slate-900 p-4 mb-4'):
                         ui.label('DETAILED SESSION RESULTS').classes('text-sm font-bold text-white mb-2')
-                        table_rows = []
-                        for res in all_results:
+                        def result_row(res):
                             session_pnl = res['pure_session_pnl']
-                            pnl_str = f"+€{session_pnl:,.0f}" if session_pnl >= 0 else f"€{session_pnl:,.0f}"
-                            result = '✅ WIN' if session_pnl > 0 else ('➖ BREAK-EVEN' if session_pnl == 0 else '❌ LOSS')
-                            contrib_str = f"+€{res['contribution']:,.0f}" if res['contribution'] > 0 else "-"
-                            table_rows.append({
+                            return {
                                 'Session': res['session'],
-                                'Pure PnL': pnl_str,
-                                'Contribution': contrib_str,
+                                'Pure PnL': f"+€{session_pnl:,.0f}" if session_pnl >= 0 else f"€{session_pnl:,.0f}",
+                                'Contribution': f"+€{res['contribution']:,.0f}" if res['contribution'] > 0 else "-",
                                 'Final Bankroll': f"€{res['game_bankroll']:,.0f}",
-                                'Result': result
-                            })
+                                'Result': '✅ WIN' if session_pnl > 0 else ('➖ BREAK-EVEN' if session_pnl == 0 else '❌ LOSS')
+                            }
                         
-                        ui.aggrid({
-                            'columnDefs': [
-                                {'headerName': '#', 'field': 'Session', 'width': 60},
-                                {'headerName': 'Pure PnL', 'field': 'Pure PnL', 'width': 100},
-                                {'headerName': 'Contribution', 'field': 'Contribution', 'width': 110},
-                                {'headerName': 'Final Bankroll', 'field': 'Final Bankroll', 'width': 140},
-                                {'headerName': 'Result', 'field': 'Result', 'width': 100}
-                            ],
-                            'rowData': table_rows,
-                            'domLayout': 'autoHeight'
-                        }).classes('w-full theme-balham-dark')
+                        paged_table([
+                            {'name': 'Session', 'label': '#', 'field': 'Session', 'align': 'left'},
+                            {'name': 'Pure PnL', 'label': 'Pure PnL', 'field': 'Pure PnL'},
+                            {'name': 'Contribution', 'label': 'Contribution', 'field': 'Contribution'},
+                            {'name': 'Final Bankroll', 'label': 'Final Bankroll', 'field': 'Final Bankroll'},
+                            {'name': 'Result', 'label': 'Result', 'field': 'Result'}
+                        ], all_results, result_row).classes('w-full bg-slate-800 text-slate-300')
                     
                     # CSV Export for AI Analysis
                     with ui.card().classes('w-full bg-slate-900 p-4 mb-4'):
                         ui.label('📋 CSV EXPORT FOR AI ANALYSIS').classes('text-sm font-bold text-yellow-400 mb-2')
                         ui.label('Pure game PnL separated from contributions').classes('text-xs text-slate-500 mb-2')
                         
-                        # Generate detailed CSV
-                        csv_lines = []
-                        csv_lines.append('Session,Game,Strategy,Pure_PNL,Bankroll_After,Contribution,Game_Bankroll')
-                        for res in all_results:
-                            session_num = res['session']
-                            contribution = res['contribution']
-                            game_bankroll = res['game_bankroll']
-                            
-                            for entry in res['log']:
-                                csv_lines.append(f"{session_num},{entry['game']},{entry['strategy']},{entry['result']:.2f},{entry['bankroll']:.2f},{contribution:.2f},{game_bankroll:.2f}")
-                        
-                        csv_text = '\n'.join(csv_lines)
-                        csv_area = ui.textarea(value=csv_text).classes('w-full font-mono text-xs').props('rows=10 readonly')
-                        
-                        def copy_csv():
-                            ui.run_javascript(f'navigator.clipboard.writeText(`{csv_text}`)')
-                            ui.notify('CSV copied to clipboard!', type='positive')
-                        
-                        ui.button('COPY CSV', on_click=copy_csv).props('icon=content_copy color=yellow').classes('w-full mt-2')
+                        # One row per strategy played, streamed as a download
+                        entry_rows = [(res, entry) for res in all_results for entry in res['log']]
+                        download_buttons('sessions_export', SESSIONS_EXPORT_FIELDS, entry_rows, lambda item: sessions_export_record(*item))
                         
                         # Summary statistics CSV
                         ui.label('SUMMARY STATISTICS CSV').classes('text-xs font-bold text-slate-400 mt-4 mb-2')
@@ -401,25 +361,29 @@ Formula_Check,GA={start_bankroll:.2f}+{total_contributions:.2f}+{total_game_prof
                         
                         ui.button('COPY SUMMARY', on_click=copy_summary).props('icon=content_copy color=cyan').classes('w-full mt-2')
                     
-                    # Strategy breakdown per session (expandable)
+                    # Strategy breakdown per session (one row per strategy played)
                     with ui.card().classes('w-full bg-slate-900 p-4'):
                         ui.label('STRATEGY BREAKDOWN BY SESSION').classes('text-sm font-bold text-white mb-2')
-                        for res in all_results:
-                            pure_pnl = res['pure_session_pnl']
-                            contribution = res['contribution']
-                            pnl_color = 'text-green-400' if pure_pnl > 0 else 'text-red-400'
-                            contrib_str = f" + €{contribution:,.0f} contrib" if contribution > 0 else ""
-                            with ui.expansion(
-                                f"Session {res['session']}: Pure PnL €{pure_pnl:+,.0f}{contrib_str}",
-                                icon='receipt_long'
-                            ).classes('w-full bg-slate-800 text-white'):
-                                for entry in res['log']:
-                                    with ui.row().classes('w-full justify-between items-center p-2 border-b border-slate-700'):
-                                        ui.label(f"{entry['game']} - {entry['strategy']}").classes('text-sm text-slate-300')
-                                        result_color = 'text-green-400' if entry['result'] > 0 else 'text-red-400'
-                                        ui.label(f"€{entry['result']:+,.2f}").classes(f'text-sm font-bold {result_color}')
-                                        ui.label(f"→ €{entry['bankroll']:,.0f}").classes('text-xs text-slate-500')
+                        paged_table([
+                            {'name': 'session', 'label': 'Session', 'field': 'session', 'align': 'left'},
+                            {'name': 'strategy', 'label': 'Strategy', 'field': 'strategy', 'align': 'left'},
+                            {'name': 'result', 'label': 'PnL', 'field': 'result'},
+                            {'name': 'bankroll', 'label': 'Bankroll After', 'field': 'bankroll'},
+                        ], entry_rows, lambda item: {
+                            'session': item[0]['session'],
+                            'strategy': f"{item[1]['game']} - {item[1]['strategy']}",
+                            'result': f"€{item[1]['result']:+,.2f}",
+                            'bankroll': f"→ €{item[1]['bankroll']:,.0f}",
+                            '_class': 'text-green-400' if item[1]['result'] > 0 else 'text-red-400',
+                        }).classes('w-full bg-slate-800 text-slate-300')
             
+            except Cancelled:
+                progress_bar.set_visibility(False)
+                status_label.set_text('Simulation cancelled')
+            except AdmissionError as e:
+                progress_bar.set_visibility(False)
+                status_label.set_text('')
+                ui.notify(str(e), type='warning')
             except Exception as e:
                 progress_bar.set_visibility(False)
                 status_label.set_text(f'Error: {str(e)}')
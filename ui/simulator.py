@@ -1,335 +1,110 @@
 from nicegui import ui
 import plotly.graph_objects as go
-import random
 import asyncio
 import traceback
 import numpy as np
 import json
 
 # IMPORT RULES
-from engine.baccarat_rules import BaccaratSessionState, BaccaratStrategist
-from engine.strategy_rules import StrategyOverrides, BetStrategy
-from engine.tier_params import TierConfig, generate_tier_map, get_tier_for_ga
-from utils.persistence import load_profile, save_profile
-
-SBM_TIERS = {'Silver': 5000, 'Gold': 22500, 'Platinum': 175000}
-
-class BaccaratWorker:
-    @staticmethod
-    def run_session(current_ga: float, overrides: StrategyOverrides, tier_map: dict, use_ratchet: bool, penalty_mode: bool, active_level: int, mode: str, base_bet: float = 10.0, track_hands: bool = False):
-        tier = get_tier_for_ga(current_ga, tier_map, active_level, mode, game_type='Baccarat')
-        
-        hand_log = []
-        session_peak_profit = 0
-        
-        is_active_penalty = penalty_mode and overrides.penalty_box_enabled
-        if is_active_penalty:
-            flat_bet = base_bet 
-            tier = TierConfig(level=tier.level, min_ga=0, max_ga=9999999, base_unit=flat_bet, press_unit=flat_bet, stop_loss=tier.stop_loss, profit_lock=tier.profit_lock, catastrophic_cap=tier.catastrophic_cap)
-            session_overrides = StrategyOverrides(
-                iron_gate_limit=overrides.iron_gate_limit, stop_loss_units=overrides.stop_loss_units,
-                profit_lock_units=overrides.profit_lock_units, shoes_per_session=overrides.shoes_per_session,
-                bet_strategy=overrides.bet_strategy, press_trigger_wins=999, press_depth=0, ratchet_enabled=False 
-            )
-        else:
-            session_overrides = overrides
-
-        if use_ratchet and not is_active_penalty:
-            session_overrides.ratchet_enabled = True
-            session_overrides.profit_lock_units = 1000 if session_overrides.profit_lock_units <= 0 else session_overrides.profit_lock_units
-
-        state = BaccaratSessionState(tier=tier, overrides=session_overrides)
-        state.current_shoe = 1
-        volume = 0
-        
-        while state.current_shoe <= overrides.shoes_per_session and state.mode.name != 'STOPPED':
-            decision = BaccaratStrategist.get_next_decision(state)
-            if decision['mode'].name == 'STOPPED': break
-            
-            amt = decision['bet_amount']
-            volume += amt
-            
-            # Check if we should place a tie bet this hand (1 unit after a tie)
-            tie_bet_amt = 0
-            if state.place_tie_bet_this_hand and amt > 0 and session_overrides.tie_bet_enabled:
-                tie_bet_amt = tier.base_unit  # Always 1 base unit
-                volume += tie_bet_amt
-                state.tie_bets_placed += 1
-            
-            # Simulation Physics - Realistic Baccarat Probabilities
-            # Determine actual bet target from decision (handles FOLLOW_WINNER)
-            bet_target = decision.get('bet_target', 'BANKER')
-            is_banker = (bet_target == 'BANKER')
-            rng = random.random()
-            
-            # Probabilities: Banker 45.86%, Player 44.62%, Tie 9.52%
-            if rng < 0.4586:  # Banker wins
-                outcome = 'BANKER'
-            elif rng < 0.9048:  # Player wins (0.4586 + 0.4462)
-                outcome = 'PLAYER'
-            else:  # Tie
-                outcome = 'TIE'
-            
-            pnl = 0
-            is_tie = False
-            tie_bet_pnl = 0
-            
-            if outcome == 'TIE':
-                # Tie: Main bet pushes (no win/loss), tie bet wins 8:1
-                is_tie = True
-                state.tie_count += 1
-                if tie_bet_amt > 0:
-                    tie_bet_pnl = tie_bet_amt * 8  # Win 8:1 on tie bet
-                    pnl = tie_bet_pnl
-            else:
-                # Main bet resolution
-                main_bet_won = (outcome == 'BANKER' and is_banker) or (outcome == 'PLAYER' and not is_banker)
-                
-                if main_bet_won:
-                    pnl = amt * 0.95 if is_banker else amt
-                else:
-                    pnl = -amt
-                
-                # Tie bet loses if placed
-                if tie_bet_amt > 0:
-                    tie_bet_pnl = -tie_bet_amt
-                    pnl += tie_bet_pnl
-            
-            # Track tie bet P&L separately
-            state.tie_bets_pnl += tie_bet_pnl
-            
-            # Track hand-by-hand bankroll evolution
-            if track_hands:
-                hand_log.append({
-                    'hand': state.hands_played_total + 1,
-                    'shoe': state.current_shoe,
-                    'bankroll': current_ga + state.session_pnl + pnl,
-                    'session_pl': state.session_pnl + pnl,
-                    'bet_size': amt,
-                    'outcome': outcome,
-                    'won': main_bet_won if outcome != 'TIE' else None,
-                    'tie_bet_placed': tie_bet_amt > 0,
-                    'tie_bet_pnl': tie_bet_pnl,
-                    'press_level': state.current_press_streak,
-                    'in_virtual': state.is_in_virtual_mode
-                })
-            
-            # Update peak profit
-            if state.session_pnl + pnl > session_peak_profit:
-                session_peak_profit = state.session_pnl + pnl
-            
-            # Update state with outcome
-            main_bet_won = (outcome == 'BANKER' and is_banker) or (outcome == 'PLAYER' and not is_banker)
-            BaccaratStrategist.update_state_after_hand(state, main_bet_won, pnl, is_tie, outcome)
-            
-            if state.hands_played_in_shoe >= 70:
-                state.current_shoe += 1
-                state.hands_played_in_shoe = 0
-
-        # Determine exit reason
-        exit_reason = 'TIME_LIMIT'
-        if state.mode.name == 'STOPPED':
-            stop_val = -(overrides.stop_loss_units * tier.base_unit)
-            target_val = overrides.profit_lock_units * tier.base_unit
-            if state.session_pnl <= stop_val:
-                exit_reason = 'STOP_LOSS'
-            elif state.session_pnl >= target_val:
-                exit_reason = 'TARGET'
-            elif state.session_pnl <= state.locked_profit:
-                exit_reason = 'RATCHET'
-
-        return state.session_pnl, volume, tier.level, state.hands_played_total, exit_reason, state.current_press_streak, state.tie_count, state.tie_bets_placed, state.tie_bets_pnl, hand_log, session_peak_profit
-
-    @staticmethod
-    def run_full_career(start_ga, total_months, sessions_per_year, 
-                        contrib_win, contrib_loss, overrides, use_ratchet,
-                        use_tax, use_holiday, safety_factor, target_points, earn_rate,
-                        holiday_ceiling, insolvency_floor, strategy_mode, base_bet_val,
-                        track_y1_details=False):
-        
-        tier_map = generate_tier_map(safety_factor, mode=strategy_mode, game_type='Baccarat', base_bet=base_bet_val)
-        trajectory = []
-        current_ga = start_ga
-        running_play_pnl = 0
-        
-        initial_tier = get_tier_for_ga(current_ga, tier_map, 1, strategy_mode, game_type='Baccarat')
-        active_level = initial_tier.level
-
-        m_insolvent_months = 0; failed_year_one = False
-        m_tax = 0 
-        m_contrib = 0
-        gold_hit_year = -1
-        current_year_points = 0
-        
-        y1_log = []
-        last_session_won = False
-        y1_session_counter = 0
-
-        for m in range(total_months):
-            if m > 0 and m % 12 == 0: current_year_points = 0
-
-            if use_tax and current_ga > overrides.tax_threshold:
-                surplus = current_ga - overrides.tax_threshold
-                tax_amt = surplus * (overrides.tax_rate / 100.0)
-                current_ga -= tax_amt
-                m_tax += tax_amt
-
-            should_contribute = True
-            if use_holiday and current_ga >= holiday_ceiling: should_contribute = False
-            
-            if should_contribute:
-                amount = contrib_win if last_session_won else contrib_loss
-                current_ga += amount
-                m_contrib += amount
-            
-            can_play = (current_ga >= insolvency_floor)
-            if not can_play:
-                m_insolvent_months += 1
-                if m < 12: failed_year_one = True
-            
-            if can_play:
-                sessions_this_month = sessions_per_year // 12
-                if m % 12 < (sessions_per_year % 12): sessions_this_month += 1
-
-                for _ in range(sessions_this_month):
-                    pnl, vol, used_level, hands, exit_reason, final_streak, tie_count, tie_bets, tie_pnl, _, _ = BaccaratWorker.run_session(
-                        current_ga, overrides, tier_map, use_ratchet, 
-                        False, active_level, strategy_mode, base_bet_val
-                    )
-                    active_level = used_level 
-                    current_ga += pnl
-                    running_play_pnl += pnl
-                    current_year_points += vol * (earn_rate / 100)
-                    last_session_won = (pnl > 0)
-                    
-                    if track_y1_details and m < 12:
-                        y1_session_counter += 1
-                        y1_log.append({
-                            'month': m + 1,
-                            'session': y1_session_counter,
-                            'result': pnl,
-                            'balance': current_ga,
-                            'game_bal': start_ga + running_play_pnl,
-                            'hands': hands,
-                            'volume': vol,
-                            'tier': used_level,
-                            'exit': exit_reason,
-                            'streak_max': final_streak,
-                            'tie_count': tie_count,
-                            'tie_bets': tie_bets,
-                            'tie_pnl': tie_pnl
-                        })
-            else:
-                 if track_y1_details and m < 12:
-                        y1_log.append({
-                            'month': m + 1,
-                            'session': 0,
-                            'result': 0,
-                            'balance': current_ga,
-                            'game_bal': start_ga + running_play_pnl,
-                            'hands': 0,
-                            'volume': 0,
-                            'tier': 0,
-                            'exit': 'INSOLVENT',
-                            'streak_max': 0,
-                            'tie_count': 0,
-                            'tie_bets': 0,
-                            'tie_pnl': 0
-                        })
-
-            if gold_hit_year == -1 and current_year_points >= target_points:
-                gold_hit_year = (m // 12) + 1
-
-            trajectory.append(current_ga)
-            
-        return {
-            'trajectory': trajectory, 'final_ga': current_ga, 'insolvent_months': m_insolvent_months, 
-            'failed_y1': failed_year_one, 'tax': m_tax, 'contrib': m_contrib, 'gold_year': gold_hit_year,
-            'y1_log': y1_log
-        }
-
-def calculate_stats(results, config, start_ga, total_months):
-    if not results: return None
-    trajectories = np.array([r['trajectory'] for r in results])
-    months = list(range(trajectories.shape[1]))
-    
-    stats = {
-        'months': months,
-        'min_band': np.min(trajectories, axis=0),
-        'max_band': np.max(trajectories, axis=0),
-        'p25_band': np.percentile(trajectories, 25, axis=0),
-        'p75_band': np.percentile(trajectories, 75, axis=0),
-        'mean_line': np.mean(trajectories, axis=0),
-        'median_line': np.median(trajectories, axis=0),
-        'avg_final_ga': np.mean([r['final_ga'] for r in results]),
-        'avg_tax': np.mean([r['tax'] for r in results]),
-        'avg_insolvent': np.mean([r['insolvent_months'] for r in results]),
-        'gold_hits': [r['gold_year'] for r in results if r['gold_year'] != -1],
-        'y1_failures': len([r for r in results if r['failed_y1']]),
-        'total_input': start_ga + np.mean([r['contrib'] for r in results]),
-        'survivor_count': len([r for r in results if r['final_ga'] >= 100])
-    }
-    return stats
+from engine.baccarat_worker import BaccaratWorker, calculate_stats, SBM_TIERS
+from engine.tier_params import generate_tier_map
+from engine.strategy_compiler import compile_strategy
+from engine.seeding import DEFAULT_SEED
+from engine.batch import run_lab
+from engine.replay import pick_universes, replay_lab_universe
+from engine.cancellation import Cancelled
+from ui.chart_data import zoomable_plotly
+from ui.live_preview import LivePreview, LAB_KPIS, lab_grade, lab_kpis
+from ui.scheduling import submit_page_run, wait_for_run
+from ui.session_shape import show_session_shape
+from ui.tables import paged_table, download_buttons
+from ui.universe_replay import universe_picker, trace_picker
+from utils.scheduler import AdmissionError, estimate_cost, get_scheduler, report_progress
+from utils.result_cache import result_key, pack_results, unpack_results, load_result, save_result
+from utils.persistence import get_saved_strategies, get_strategy_names, save_strategy, delete_strategy
+
+# Year 1 export columns (see CSV_DATA_DICTIONARY.md)
+Y1_EXPORT_FIELDS = ['Month', 'Session', 'Result', 'Total_Bal', 'Game_Bal', 'Hands', 'Volume', 'Tier', 'Exit_Reason',
+                    'Streak_Max', 'Tie_Count', 'Tie_Bets', 'Tie_PL']
+
+def y1_export_record(e):
+    return dict(zip(Y1_EXPORT_FIELDS, (
+        e['month'], e['session'], round(e['result']), round(e['balance']), round(e['game_bal']), e['hands'],
+        round(e['volume']), e['tier'], e['exit'], e['streak_max'], e.get('tie_count', 0), e.get('tie_bets', 0),
+        round(e.get('tie_pnl', 0)))))
+
+# Session log table (Year 1 log of universe #1, full log of a replayed universe)
+LOG_COLUMNS = [{'name': 'Month', 'label': 'Mo', 'field': 'Month', 'align': 'left'}, {'name': 'Session', 'label': 'Sess', 'field': 'Session', 'align': 'left'}, {'name': 'Result', 'label': 'PnL', 'field': 'Result'}, {'name': 'Balance', 'label': 'Tot. Bal', 'field': 'Balance'}, {'name': 'Game Bal', 'label': 'Game Bal', 'field': 'Game Bal'}, {'name': 'Hands', 'label': 'Hands', 'field': 'Hands'}, {'name': 'Exit', 'label': 'Exit', 'field': 'Exit'}]
+
+def log_row(entry):
+    return {'Month': f"M{entry.get('month', '?')}", 'Session': f"S{entry.get('session', 0)}", 'Result': f"€{entry.get('result', 0):+,.0f}", 'Balance': f"€{entry.get('balance', 0):,.0f}", 'Game Bal': f"€{entry.get('game_bal', 0):,.0f}", 'Hands': f"{entry.get('hands', 0)}", 'Exit': entry.get('exit', '')}
 
 def show_simulator():
     running = False
+    active_task = None  # Scheduled run in progress (STOP cancels it)
+    last_run = {}  # Latest multiverse (family key + per-universe results), reused by ADD UNIVERSES
+    shown_run = {}  # Multiverse on screen (strategy, config, seed, results), for universe replays
     session_detail_data = {} 
     
     def load_saved_strategies():
-        try: return load_profile().get('saved_strategies', {})
+        try: return get_saved_strategies()
         except: return {}
     def update_strategy_list():
-        try: select_saved.options = list(load_saved_strategies().keys()); select_saved.update()
+        try: select_saved.options = get_strategy_names(); select_saved.update()
         except: pass
     
+    def current_strategy_config():
+        """Snapshot of every strategy slider in the saved-config schema."""
+        return {
+            'sim_num': slider_num_sims.value, 'years': slider_years.value, 'freq': slider_frequency.value,
+            'eco_win': slider_contrib_win.value, 'eco_loss': slider_contrib_loss.value, 'eco_tax': switch_luxury_tax.value,
+            'eco_hol': switch_holiday.value, 'eco_hol_ceil': slider_holiday_ceil.value, 'eco_insolvency': slider_insolvency.value,
+            'eco_tax_thresh': slider_tax_thresh.value, 'eco_tax_rate': slider_tax_rate.value,
+            'tac_safety': slider_safety.value, 'tac_iron': slider_iron_gate.value, 'tac_press': select_press.value,
+            'tac_depth': slider_press_depth.value, 'tac_shoes': slider_shoes.value, 'tac_bet': select_bet_strat.value,
+            'tac_penalty': switch_penalty.value, 'tac_mode': select_engine_mode.value, 
+            'risk_stop': slider_stop_loss.value, 'risk_prof': slider_profit.value,
+            'risk_ratch': switch_ratchet.value, 'risk_ratch_mode': select_ratchet_mode.value, 
+            'gold_stat': select_status.value, 'gold_earn': slider_earn_rate.value, 'start_ga': slider_start_ga.value,
+            'tac_base_bet': slider_base_bet.value,
+            'tie_bet_enabled': switch_tie_bet.value,
+            # Smart Trailing Stop
+            'smart_exit_enabled': switch_smart_exit.value,
+            'smart_window_start': slider_smart_window.value,
+            'min_profit_to_lock': slider_min_lock.value,
+            'trailing_drop_pct': slider_trail_pct.value,
+            # Doctrine Engine
+            'doctrine_enabled': switch_doctrine_enabled.value,
+            'doctrine_pl_stop': slider_doctrine_pl_stop.value,
+            'doctrine_pl_target': slider_doctrine_pl_target.value,
+            'doctrine_pl_press_wins': slider_doctrine_pl_press_wins.value,
+            'doctrine_pl_press_depth': slider_doctrine_pl_press_depth.value,
+            'doctrine_pl_iron': slider_doctrine_pl_iron.value,
+            'doctrine_ti_stop': slider_doctrine_ti_stop.value,
+            'doctrine_ti_target': slider_doctrine_ti_target.value,
+            'doctrine_ti_press_wins': slider_doctrine_ti_press_wins.value,
+            'doctrine_ti_press_depth': slider_doctrine_ti_press_depth.value,
+            'doctrine_ti_iron': slider_doctrine_ti_iron.value,
+            'doctrine_loss_trigger': slider_doctrine_loss_trigger.value,
+            'doctrine_dd_pct': slider_doctrine_dd_pct.value,
+            'doctrine_dd_eur': slider_doctrine_dd_eur.value,
+            'doctrine_tight_min': slider_doctrine_tight_min.value,
+            'doctrine_tight_max': slider_doctrine_tight_max.value,
+            'doctrine_cooloff_enabled': switch_doctrine_cooloff.value,
+            'doctrine_cooloff_floor': slider_doctrine_cooloff_floor.value,
+            'doctrine_cooloff_months': slider_doctrine_cooloff_months.value,
+            'doctrine_recovery_pct': slider_doctrine_recovery_pct.value,
+            # Fibonacci Hunter
+            'fib_enabled': switch_fibonacci.value,
+            'fib_base': slider_fib_base.value,
+            'fib_mode': select_fib_mode.value
+        }
+
     def save_current_strategy():
         try:
             name = input_name.value
             if not name: return
-            profile = load_profile()
-            if 'saved_strategies' not in profile: profile['saved_strategies'] = {}
-            config = {
-                'sim_num': slider_num_sims.value, 'years': slider_years.value, 'freq': slider_frequency.value,
-                'eco_win': slider_contrib_win.value, 'eco_loss': slider_contrib_loss.value, 'eco_tax': switch_luxury_tax.value,
-                'eco_hol': switch_holiday.value, 'eco_hol_ceil': slider_holiday_ceil.value, 'eco_insolvency': slider_insolvency.value,
-                'eco_tax_thresh': slider_tax_thresh.value, 'eco_tax_rate': slider_tax_rate.value,
-                'tac_safety': slider_safety.value, 'tac_iron': slider_iron_gate.value, 'tac_press': select_press.value,
-                'tac_depth': slider_press_depth.value, 'tac_shoes': slider_shoes.value, 'tac_bet': select_bet_strat.value,
-                'tac_penalty': switch_penalty.value, 'tac_mode': select_engine_mode.value, 
-                'risk_stop': slider_stop_loss.value, 'risk_prof': slider_profit.value,
-                'risk_ratch': switch_ratchet.value, 'risk_ratch_mode': select_ratchet_mode.value, 
-                'gold_stat': select_status.value, 'gold_earn': slider_earn_rate.value, 'start_ga': slider_start_ga.value,
-                'tac_base_bet': slider_base_bet.value,
-                'tie_bet_enabled': switch_tie_bet.value,
-                # Smart Trailing Stop
-                'smart_exit_enabled': switch_smart_exit.value,
-                'smart_window_start': slider_smart_window.value,
-                'min_profit_to_lock': slider_min_lock.value,
-                'trailing_drop_pct': slider_trail_pct.value,
-                # Doctrine Engine
-                'doctrine_enabled': switch_doctrine_enabled.value,
-                'doctrine_pl_stop': slider_doctrine_pl_stop.value,
-                'doctrine_pl_target': slider_doctrine_pl_target.value,
-                'doctrine_pl_press_wins': slider_doctrine_pl_press_wins.value,
-                'doctrine_pl_press_depth': slider_doctrine_pl_press_depth.value,
-                'doctrine_pl_iron': slider_doctrine_pl_iron.value,
-                'doctrine_ti_stop': slider_doctrine_ti_stop.value,
-                'doctrine_ti_target': slider_doctrine_ti_target.value,
-                'doctrine_ti_press_wins': slider_doctrine_ti_press_wins.value,
-                'doctrine_ti_press_depth': slider_doctrine_ti_press_depth.value,
-                'doctrine_ti_iron': slider_doctrine_ti_iron.value,
-                'doctrine_loss_trigger': slider_doctrine_loss_trigger.value,
-                'doctrine_dd_pct': slider_doctrine_dd_pct.value,
-                'doctrine_dd_eur': slider_doctrine_dd_eur.value,
-                'doctrine_tight_min': slider_doctrine_tight_min.value,
-                'doctrine_tight_max': slider_doctrine_tight_max.value,
-                'doctrine_cooloff_enabled': switch_doctrine_cooloff.value,
-                'doctrine_cooloff_floor': slider_doctrine_cooloff_floor.value,
-                'doctrine_cooloff_months': slider_doctrine_cooloff_months.value,
-                'doctrine_recovery_pct': slider_doctrine_recovery_pct.value
-            }
-            profile['saved_strategies'][name] = config
-            save_profile(profile)
+            save_strategy(name, current_strategy_config())
             ui.notify(f'Saved: {name}', type='positive')
             update_strategy_list()
         except Exception as e: ui.notify(str(e), type='negative')
@@ -409,10 +184,7 @@ def show_simulator():
         try:
             name = select_saved.value
             if not name: return
-            profile = load_profile()
-            if 'saved_strategies' in profile and name in profile['saved_strategies']:
-                del profile['saved_strategies'][name]
-                save_profile(profile)
+            if delete_strategy(name):
                 ui.notify(f'Deleted: {name}', type='negative')
                 select_saved.value = None
                 update_strategy_list()
@@ -450,44 +222,8 @@ def show_simulator():
                 'base_bet': float(slider_base_bet.value) 
             }
             
-            raw_bet = select_bet_strat.value
-            if not raw_bet: raw_bet = 'BANKER'
-            
-            overrides = StrategyOverrides(
-                iron_gate_limit=int(slider_iron_gate.value), stop_loss_units=int(slider_stop_loss.value),
-                profit_lock_units=int(slider_profit.value), press_trigger_wins=int(select_press.value),
-                press_depth=int(slider_press_depth.value), ratchet_lock_pct=0.0, tax_threshold=config['tax_thresh'],
-                tax_rate=config['tax_rate'], bet_strategy=getattr(BetStrategy, raw_bet),
-                shoes_per_session=int(slider_shoes.value), penalty_box_enabled=switch_penalty.value,
-                ratchet_enabled=switch_ratchet.value, ratchet_mode=select_ratchet_mode.value,
-                tie_bet_enabled=switch_tie_bet.value,
-                # Smart Trailing Stop
-                smart_exit_enabled=switch_smart_exit.value,
-                smart_window_start=int(slider_smart_window.value),
-                min_profit_to_lock=int(slider_min_lock.value),
-                trailing_drop_pct=float(slider_trail_pct.value),
-                # Doctrine Engine
-                doctrine_enabled=switch_doctrine_enabled.value,
-                doctrine_pl_stop=float(slider_doctrine_pl_stop.value),
-                doctrine_pl_target=float(slider_doctrine_pl_target.value),
-                doctrine_pl_press_wins=int(slider_doctrine_pl_press_wins.value),
-                doctrine_pl_press_depth=int(slider_doctrine_pl_press_depth.value),
-                doctrine_pl_iron=int(slider_doctrine_pl_iron.value),
-                doctrine_ti_stop=float(slider_doctrine_ti_stop.value),
-                doctrine_ti_target=float(slider_doctrine_ti_target.value),
-                doctrine_ti_press_wins=int(slider_doctrine_ti_press_wins.value),
-                doctrine_ti_press_depth=int(slider_doctrine_ti_press_depth.value),
-                doctrine_ti_iron=int(slider_doctrine_ti_iron.value),
-                doctrine_loss_trigger=float(slider_doctrine_loss_trigger.value),
-                doctrine_dd_pct_trigger=float(slider_doctrine_dd_pct.value),
-                doctrine_dd_eur_trigger=float(slider_doctrine_dd_eur.value),
-                doctrine_tight_min=int(slider_doctrine_tight_min.value),
-                doctrine_tight_max=int(slider_doctrine_tight_max.value),
-                doctrine_cooloff_enabled=switch_doctrine_cooloff.value,
-                doctrine_cooloff_floor=float(slider_doctrine_cooloff_floor.value),
-                doctrine_cooloff_min_months=int(slider_doctrine_cooloff_months.value),
-                doctrine_cooloff_recovery_pct=float(slider_doctrine_recovery_pct.value)
-            )
+            compiled = compile_strategy(current_strategy_config(), game_type='Baccarat')
+            overrides = compiled.overrides
             
             res = await asyncio.to_thread(BaccaratWorker.run_full_career, 
                 config['start_ga'], config['years']*12, config['freq'],
@@ -496,7 +232,7 @@ def show_simulator():
                 config['safety'], config['status_target_pts'], config['earn_rate'],
                 config['hol_ceil'], config['insolvency'], config['strategy_mode'],
                 config['base_bet'],
-                False 
+                False, compiled.tier_map
             )
             
             # Capture first session details for hand-by-hand analysis
@@ -512,6 +248,8 @@ def show_simulator():
             session_detail_data['peak_profit'] = peak_profit
             session_detail_data['hand_log'] = hand_log
             session_detail_data['start_bankroll'] = config['start_ga']
+            session_detail_data['title'] = 'Session 1'
+            session_detail_data['replay'] = False
             
             chart_single_container.clear()
             with chart_single_container:
@@ -520,12 +258,52 @@ def show_simulator():
                 fig.add_trace(go.Scatter(y=res['trajectory'], mode='lines', name='Balance', line=dict(color='#06b6d4', width=2)))
                 fig.add_hline(y=config['insolvency'], line_dash="dash", line_color="red")
                 fig.update_layout(height=250, margin=dict(l=20, r=20, t=20, b=20), paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)', font=dict(color='#94a3b8'))
-                ui.plotly(fig).classes('w-full border border-slate-700 rounded')
+                zoomable_plotly(fig).classes('w-full border border-slate-700 rounded')
             
             render_session_detail()
 
         except Exception as e:
             ui.notify(str(e), type='negative')
+
+    # --- UNIVERSE REPLAY (drill-down into the run on screen) ---
+    def render_universe_picker():
+        universe_picker_container.clear()
+        with universe_picker_container:
+            universe_picker(shown_run['results'], replay_universe)
+
+    async def replay_universe(index, label=None, session=1):
+        """Replays universe #index of the run on screen from its seed, tracing its session #session."""
+        if not shown_run: return
+        try:
+            res = await asyncio.to_thread(replay_lab_universe, 'Baccarat', shown_run['strategy'], index,
+                                          shown_run['seed'], shown_run['config'], session)
+        except Exception as e:
+            ui.notify(str(e), type='negative'); return
+        config = shown_run['config']
+        log = res['y1_log']
+        sessions = max((e['session'] for e in log), default=0)
+        chart_single_container.clear()
+        with chart_single_container:
+            name = f"UNIVERSE #{index + 1}" + (f" ({label})" if label else '')
+            ui.label(f"{name} - REPLAYED FROM ITS SEED · Final €{res['final_ga']:,.0f}").classes('text-xs text-cyan-400 font-bold mb-1')
+            fig = go.Figure()
+            fig.add_trace(go.Scatter(y=res['trajectory'], mode='lines', name='Balance', line=dict(color='#06b6d4', width=2)))
+            fig.add_hline(y=config['insolvency'], line_dash="dash", line_color="red")
+            fig.update_layout(height=250, margin=dict(l=20, r=20, t=20, b=20), paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)', font=dict(color='#94a3b8'))
+            zoomable_plotly(fig).classes('w-full border border-slate-700 rounded')
+            with ui.expansion(f'SESSION LOG ({sessions} sessions)', icon='history_edu').classes('w-full bg-slate-800 text-slate-300'):
+                paged_table(LOG_COLUMNS, log, log_row).classes('w-full bg-slate-800 text-slate-300')
+                download_buttons(f'baccarat_universe{index + 1}_log', Y1_EXPORT_FIELDS, log, y1_export_record)
+            if sessions:
+                trace_picker(sessions, session, lambda n: replay_universe(index, label, n))
+        trace = res['session_trace']
+        session_detail_data.clear()
+        if trace:
+            session_detail_data.update(pnl=trace['pnl'], hands=trace['hands'], exit_reason=trace['exit_reason'],
+                                       peak_profit=trace['peak_profit'], hand_log=trace['hand_log'], start_bankroll=trace['start_ga'],
+                                       title=f"Universe #{index + 1}, Session {trace['session']}, Month {trace['month']}", replay=True)
+        session_detail_container.clear()
+        render_session_detail()
     
     def render_session_detail():
         """Render the session detail UI with bankroll evolution graph"""
@@ -538,7 +316,7 @@ def show_simulator():
             hand_log = session_detail_data['hand_log']
             start_bankroll = session_detail_data['start_bankroll']
             
-            with ui.expansion('OUR LOG (Session 1) - Bankroll Evolution', icon='show_chart', value=False).classes('w-full bg-slate-800 text-slate-300 border-2 border-slate-600'):
+            with ui.expansion(f"OUR LOG ({session_detail_data.get('title', 'Session 1')}) - Bankroll Evolution", icon='show_chart', value=False).classes('w-full bg-slate-800 text-slate-300 border-2 border-slate-600'):
                 with ui.column().classes('w-full gap-2 p-2'):
                     # Session Summary
                     with ui.row().classes('w-full gap-4 items-center'):
@@ -546,7 +324,8 @@ def show_simulator():
                         ui.label(f"Exit: {session_detail_data['exit_reason']}").classes('text-sm text-slate-400')
                         ui.label(f"Hands: {session_detail_data['hands']}").classes('text-sm text-slate-400')
                         ui.label(f"Peak Profit: €{session_detail_data['peak_profit']:+,.0f}").classes('text-sm text-cyan-400')
-                        ui.button('↻ REFRESH SESSION', on_click=lambda: asyncio.create_task(refresh_single_universe())).props('flat color=cyan dense size=sm')
+                        if not session_detail_data.get('replay'):
+                            ui.button('↻ REFRESH SESSION', on_click=lambda: asyncio.create_task(refresh_single_universe())).props('flat color=cyan dense size=sm')
                     
                     # Create bankroll evolution graph
                     fig = go.Figure()
@@ -623,7 +402,7 @@ def show_simulator():
                         )
                     )
                     
-                    ui.plotly(fig).classes('w-full h-80')
+                    zoomable_plotly(fig).classes('w-full h-80')
                     
                     # Optional: Add a compact stats table
                     with ui.row().classes('w-full gap-4 text-xs text-slate-400 justify-around'):
@@ -635,14 +414,25 @@ def show_simulator():
                         ui.label(f"Virtual Mode Hands: {virtual_count}")
 
     async def run_sim():
-        nonlocal running
+        await run_multiverse(int(slider_num_sims.value))
+
+    async def add_universes():
+        if not last_run:
+            ui.notify('Run the simulation first', type='warning'); return
+        await run_multiverse(len(last_run['results']) + int(number_add_sims.value or 0))
+
+    def stop_sim():
+        if active_task: get_scheduler().cancel(active_task)
+
+    async def run_multiverse(num_sims):
+        nonlocal running, active_task
         if running: return
         try:
-            running = True; btn_sim.disable(); progress.set_value(0); progress.set_visibility(True)
+            running = True; btn_sim.disable(); btn_add_sims.disable(); btn_stop.set_visibility(True); progress.set_value(0); progress.set_visibility(True)
             label_stats.set_text("Dealing Cards (Multiverse)...")
             
             config = {
-                'num_sims': int(slider_num_sims.value), 'years': int(slider_years.value), 'freq': int(slider_frequency.value),
+                'num_sims': num_sims, 'years': int(slider_years.value), 'freq': int(slider_frequency.value),
                 'contrib_win': int(slider_contrib_win.value), 'contrib_loss': int(slider_contrib_loss.value),
                 'status_target_pts': SBM_TIERS[select_status.value], 'earn_rate': float(slider_earn_rate.value),
                 'use_ratchet': switch_ratchet.value, 'ratchet_mode': select_ratchet_mode.value, 
@@ -654,106 +444,79 @@ def show_simulator():
                 'base_bet': float(slider_base_bet.value)
             }
             
-            raw_bet = select_bet_strat.value
-            if not raw_bet: raw_bet = 'BANKER'
-            
-            # Fibonacci Hunter detection
-            fib_enabled = (int(select_press.value) == 11 or switch_fibonacci.value)
-            
-            overrides = StrategyOverrides(
-                iron_gate_limit=int(slider_iron_gate.value), stop_loss_units=int(slider_stop_loss.value),
-                profit_lock_units=int(slider_profit.value), press_trigger_wins=int(select_press.value),
-                press_depth=config['press_depth'], ratchet_lock_pct=0.0, tax_threshold=config['tax_thresh'],
-                tax_rate=config['tax_rate'], bet_strategy=getattr(BetStrategy, raw_bet),
-                shoes_per_session=int(slider_shoes.value), penalty_box_enabled=switch_penalty.value,
-                ratchet_enabled=switch_ratchet.value, ratchet_mode=select_ratchet_mode.value,
-                # Fibonacci Hunter
-                fibonacci_hunter_enabled=fib_enabled,
-                fibonacci_hunter_base_unit=int(slider_fib_base.value),
-                fibonacci_hunter_action_on_max_win=select_fib_mode.value,
-                # Smart Trailing Stop
-                smart_exit_enabled=switch_smart_exit.value,
-                smart_window_start=int(slider_smart_window.value),
-                min_profit_to_lock=int(slider_min_lock.value),
-                trailing_drop_pct=float(slider_trail_pct.value),
-                # Doctrine Engine
-                doctrine_enabled=switch_doctrine_enabled.value,
-                doctrine_pl_stop=float(slider_doctrine_pl_stop.value),
-                doctrine_pl_target=float(slider_doctrine_pl_target.value),
-                doctrine_pl_press_wins=int(slider_doctrine_pl_press_wins.value),
-                doctrine_pl_press_depth=int(slider_doctrine_pl_press_depth.value),
-                doctrine_pl_iron=int(slider_doctrine_pl_iron.value),
-                doctrine_ti_stop=float(slider_doctrine_ti_stop.value),
-                doctrine_ti_target=float(slider_doctrine_ti_target.value),
-                doctrine_ti_press_wins=int(slider_doctrine_ti_press_wins.value),
-                doctrine_ti_press_depth=int(slider_doctrine_ti_press_depth.value),
-                doctrine_ti_iron=int(slider_doctrine_ti_iron.value),
-                doctrine_loss_trigger=float(slider_doctrine_loss_trigger.value),
-                doctrine_dd_pct_trigger=float(slider_doctrine_dd_pct.value),
-                doctrine_dd_eur_trigger=float(slider_doctrine_dd_eur.value),
-                doctrine_tight_min=int(slider_doctrine_tight_min.value),
-                doctrine_tight_max=int(slider_doctrine_tight_max.value),
-                doctrine_cooloff_enabled=switch_doctrine_cooloff.value,
-                doctrine_cooloff_floor=float(slider_doctrine_cooloff_floor.value),
-                doctrine_cooloff_min_months=int(slider_doctrine_cooloff_months.value),
-                doctrine_cooloff_recovery_pct=float(slider_doctrine_recovery_pct.value)
-            )
+            strategy_config = current_strategy_config()
+            compiled = compile_strategy(strategy_config, game_type='Baccarat')
+            overrides = compiled.overrides
 
             start_ga = config['start_ga']
-            all_results = []
-            batch_size = 10
-            for i in range(0, config['num_sims'], batch_size):
-                count = min(batch_size, config['num_sims'] - i)
-                def run_batch():
-                    batch_data = []
-                    for k in range(count):
-                        should_track = (i == 0 and k == 0)
-                        res = BaccaratWorker.run_full_career(
-                            start_ga, config['years']*12, config['freq'],
-                            config['contrib_win'], config['contrib_loss'], overrides, 
-                            config['use_ratchet'], config['use_tax'], config['use_holiday'], 
-                            config['safety'], config['status_target_pts'], config['earn_rate'],
-                            config['hol_ceil'], config['insolvency'], config['strategy_mode'],
-                            config['base_bet'], 
-                            track_y1_details=should_track 
-                        )
-                        batch_data.append(res)
-                    return batch_data
-
-                batch_res = await asyncio.to_thread(run_batch)
-                all_results.extend(batch_res)
-                progress.set_value(len(all_results) / config['num_sims'])
-                label_stats.set_text(f"Simulating Universe {len(all_results)}/{config['num_sims']}")
-                await asyncio.sleep(0.01)
+            seed = int(number_seed.value or 0)
+            family = result_key('baccarat', strategy={k: v for k, v in strategy_config.items() if k != 'sim_num'},
+                                config={k: v for k, v in config.items() if k != 'num_sims'}, seed=seed)
+            cache_key = result_key('baccarat', family=family, universes=num_sims)
+            cached = await asyncio.to_thread(load_result, cache_key)
+            all_results = unpack_results(cached[0]) if cached else []
+            if cached:
+                label_stats.set_text(f"Loaded {len(all_results)} Universes from Cache")
+            elif last_run.get('family') == family:
+                # Same settings as the previous run: universe i is seeded from (seed, i), so keep its results and only play the extra universes
+                all_results = list(last_run['results'][:num_sims])
+                label_stats.set_text(f"Extending {len(all_results)} Universes to {num_sims}...")
+            played, todo = len(all_results), config['num_sims'] - len(all_results)
+            if todo > 0:
+                # Bands and KPIs refresh as chunks finish, so a bad config can be stopped early
+                scoreboard_container.clear(); chart_container.clear()
+                def summarize(results):
+                    partial = calculate_stats(results, config, start_ga, config['years']*12)
+                    return partial, lab_kpis(partial, config['years']*12, len(results))
+                preview = LivePreview(chart_container, 'Live Confidence Bands (Baccarat)', LAB_KPIS, summarize)
+                if played: preview.collect(0, all_results)
+                # Queued on the server-wide scheduler (fair share with other users, cancelled if this tab closes)
+                active_task = submit_page_run(
+                    run_lab, ('Baccarat', strategy_config, config['num_sims']),
+                    dict(seed=seed, config=config, start=played, max_workers=get_scheduler().processes_per_task,
+                         on_chunk=report_progress, on_results=preview.collect),
+                    cost=estimate_cost(todo, config['years']*12, config['freq']/12), name=f"Baccarat lab ({todo} universes)")
+                async def show_progress(task):
+                    n = played + int(task.progress * todo)
+                    progress.set_value(n / config['num_sims'])
+                    label_stats.set_text(f"Simulating Universe {n}/{config['num_sims']}")
+                    await preview.refresh()
+                new_results, _ = await wait_for_run(active_task, label_stats, show_progress)
+                all_results.extend(new_results)
+            if not cached:
+                await asyncio.to_thread(save_result, cache_key, pack_results(all_results), {'seed': seed})
+            if last_run.get('family') != family or len(all_results) > len(last_run['results']):
+                last_run.update(family=family, results=all_results)
 
             label_stats.set_text("Analyzing Data...")
             stats = await asyncio.to_thread(calculate_stats, all_results, config, start_ga, config['years']*12)
             render_analysis(stats, config, start_ga, overrides, all_results) 
             label_stats.set_text("Simulation Complete")
             
-            await refresh_single_universe()
+            # Drill-down: the median universe of this run, replayed from its seed with full tracing
+            shown_run.update(strategy=strategy_config, config=config, seed=seed, results=all_results)
+            render_universe_picker()
+            await replay_universe(pick_universes(all_results)['MEDIAN'], 'MEDIAN')
 
+        except Cancelled:
+            label_stats.set_text("Simulation Cancelled")
+        except AdmissionError as e:
+            label_stats.set_text("Ready...")
+            ui.notify(str(e), type='warning')
         except Exception as e:
             print(traceback.format_exc())
             ui.notify(f"Error: {str(e)}", type='negative')
         finally:
-            running = False; btn_sim.enable(); progress.set_visibility(False)
+            running = False; active_task = None; btn_sim.enable(); btn_add_sims.enable(); btn_stop.set_visibility(False); progress.set_visibility(False)
 
     def render_analysis(stats, config, start_ga, overrides, all_results):
         if not stats: return
         months = stats['months']
-        total_output = stats['avg_final_ga'] + stats['avg_tax']
+        g = lab_grade(stats, config['years']*12, config['num_sims'])
+        total_output, real_monthly_cost = g['total_output'], g['real_monthly_cost']
         grand_total_wealth = total_output 
-        real_monthly_cost = (stats['total_input'] - total_output) / (config['years']*12)
-        score_survival = (stats['survivor_count'] / config['num_sims']) * 100
-        active_pct = 100 - ((stats['avg_insolvent'] / (config['years']*12)) * 100)
-        
-        total_score = (score_survival * 0.70) + (active_pct * 0.30)
-        if total_score >= 90: grade, g_col = "A", "text-green-400"
-        elif total_score >= 80: grade, g_col = "B", "text-blue-400"
-        elif total_score >= 70: grade, g_col = "C", "text-yellow-400"
-        elif total_score >= 60: grade, g_col = "D", "text-orange-400"
-        else: grade, g_col = "F", "text-red-600"
+        score_survival, active_pct, total_score = g['survival'], g['active_pct'], g['score']
+        grade, g_col = g['grade'], g['grade_class']
 
         with scoreboard_container:
             scoreboard_container.clear()
@@ -789,17 +552,15 @@ def show_simulator():
             if config['use_holiday']: fig.add_hline(y=config['hol_ceil'], line_dash="dash", line_color="yellow", annotation_text="Holiday")
             fig.update_layout(title='Monte Carlo Confidence Bands (Baccarat)', paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)', font=dict(color='#94a3b8'), margin=dict(l=20, r=20, t=40, b=20))
             ui.plotly(fig).classes('w-full h-96')
+            show_session_shape(stats['session_hist'], 'Baccarat')
 
         with flight_recorder_container:
             flight_recorder_container.clear()
             y1_log = all_results[0].get('y1_log', [])
             with ui.expansion('OUR LOG (Year 1 - Sim #1)', icon='history_edu', value=True).classes('w-full bg-slate-800 text-slate-300 border-2 border-slate-600'):
                 if y1_log:
-                    table_rows = []
-                    for entry in y1_log:
-                        res_val = entry.get('result', 0)
-                        table_rows.append({'Month': f"M{entry.get('month', '?')}", 'Result': f"€{res_val:+,.0f}", 'Balance': f"€{entry.get('balance', 0):,.0f}", 'Game Bal': f"€{entry.get('game_bal', 0):,.0f}", 'Hands': f"{entry.get('hands', 0)}" })
-                    ui.aggrid({'columnDefs': [{'headerName': 'Mo', 'field': 'Month', 'width': 60}, {'headerName': 'PnL', 'field': 'Result', 'width': 90}, {'headerName': 'Tot. Bal', 'field': 'Balance', 'width': 100}, {'headerName': 'Game Bal', 'field': 'Game Bal', 'width': 100}, {'headerName': 'Spins', 'field': 'Hands', 'width': 80}], 'rowData': table_rows, 'domLayout': 'autoHeight'}).classes('w-full theme-balham-dark')
+                    paged_table(LOG_COLUMNS, y1_log, log_row).classes('w-full bg-slate-800 text-slate-300')
+                    download_buttons('baccarat_year1_log', Y1_EXPORT_FIELDS, y1_log, y1_export_record)
 
         with report_container:
             report_container.clear()
@@ -886,6 +647,7 @@ def show_simulator():
                     ui.label('SIMULATION').classes('font-bold text-white mb-2')
                     with ui.row().classes('w-full justify-between'): ui.label('Universes').classes('text-xs text-slate-400'); lbl_num_sims = ui.label()
                     slider_num_sims = ui.slider(min=10, max=1000, value=20).props('color=cyan'); lbl_num_sims.bind_text_from(slider_num_sims, 'value', lambda v: f'{v}')
+                    number_seed = ui.number('Seed', value=DEFAULT_SEED, format='%d').props('dense').classes('w-full')
                     with ui.row().classes('w-full justify-between'): ui.label('Years').classes('text-xs text-slate-400'); lbl_years = ui.label()
                     slider_years = ui.slider(min=1, max=10, value=10).props('color=blue'); lbl_years.bind_text_from(slider_years, 'value', lambda v: f'{v}')
                     with ui.row().classes('w-full justify-between'): ui.label('Sessions/Year').classes('text-xs text-slate-400'); lbl_freq = ui.label()
@@ -1101,7 +863,13 @@ def show_simulator():
                      ui.label('Starting Capital').classes('text-xs text-green-400')
                      slider_start_ga = ui.slider(min=0, max=100000, value=2000, step=100).props('color=green'); ui.label().bind_text_from(slider_start_ga, 'value', lambda v: f'€{v}')
                      with ui.row().classes('gap-4 mt-2'): select_status = ui.select(list(SBM_TIERS.keys()), value='Gold').props('dense'); slider_earn_rate = ui.slider(min=1, max=50, value=10).props('color=yellow').classes('w-32')
-                btn_sim = ui.button('RUN SIM', on_click=run_sim).props('icon=play_arrow color=yellow text-color=black size=lg')
+                with ui.column().classes('items-end gap-1'):
+                    with ui.row().classes('items-center gap-1'):
+                        btn_stop = ui.button('STOP', on_click=stop_sim).props('icon=stop flat color=red dense'); btn_stop.set_visibility(False)
+                        btn_sim = ui.button('RUN SIM', on_click=run_sim).props('icon=play_arrow color=yellow text-color=black size=lg')
+                    with ui.row().classes('items-center gap-1'):
+                        number_add_sims = ui.number('Extra', value=500, min=10, step=100, format='%d').props('dense').classes('w-24')
+                        btn_add_sims = ui.button('ADD UNIVERSES', on_click=add_universes).props('icon=add flat color=cyan dense')
 
         label_stats = ui.label('Ready...').classes('text-sm text-slate-500'); progress = ui.linear_progress().props('color=green').classes('mt-0'); progress.set_visibility(False)
         
@@ -1109,6 +877,7 @@ def show_simulator():
         chart_container = ui.card().classes('w-full bg-slate-900 p-4')
         
         ui.button('⚡ REFRESH SINGLE', on_click=refresh_single_universe).props('flat color=cyan dense').classes('mt-4')
+        universe_picker_container = ui.column().classes('w-full mt-2')
         chart_single_container = ui.column().classes('w-full mt-2')
         session_detail_container = ui.column().classes('w-full mt-2')
         
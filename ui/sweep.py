@@ -0,0 +1,258 @@
+"""
+Parameter sweep page: a saved strategy played over a grid (or a random
+sample of the grid) of slider settings (engine/sweep.py), with a sortable
+table of the points and 2-D heatmaps of any two swept settings.
+
+Every point is cached on its own (utils/result_cache.py): a sweep that
+widens a range, or is stopped and restarted, only plays the new points.
+"""
+
+import plotly.graph_objects as go
+from nicegui import ui
+
+from engine import batch
+from engine.cancellation import Cancelled
+from engine.seeding import DEFAULT_SEED
+from engine.sweep import (LOWER_IS_BETTER, SWEEP_METRICS, best_points, grid_points, grid_size, heatmap_grid, params_for,
+                          point_config, random_points, run_sweep, value_range)
+from ui.scheduling import submit_page_run, wait_for_run
+from ui.tables import download_buttons
+from utils.persistence import get_saved_strategies, get_strategy_names
+from utils.result_cache import load_result, pack_results, result_key, save_result, unpack_results
+from utils.scheduler import AdmissionError, estimate_cost, get_scheduler, report_progress
+
+MAX_PARAMS = 4
+MAX_POINTS = 2000
+
+
+def point_key(game_type, base_config, point, common, num_universes, seed) -> str:
+    """Cache key of one sweep point: the point's full strategy config, not the sweep it was part of."""
+    config = {k: v for k, v in point_config(base_config, point).items() if k != 'sim_num'}
+    return result_key('sweep', game=game_type, strategy=config, common=common, universes=num_universes, seed=seed)
+
+
+def cached_sweep(game_type, base_config, points, num_universes, seed=DEFAULT_SEED, common=None, max_workers=None,
+                 on_chunk=None, instrument=None):
+    """run_sweep() that loads the points already cached and caches the others as they finish. Returns (rows, cache hits)."""
+    keys = [point_key(game_type, base_config, p, common, num_universes, seed) for p in points]
+    rows = []
+    for key in keys:
+        cached = load_result(key)
+        rows.append(unpack_results(cached[0])[0] if cached else None)
+    pending = [j for j, row in enumerate(rows) if row is None]
+
+    def store(start, chunk):
+        for j, row in zip(pending[start:start + len(chunk)], chunk):
+            save_result(keys[j], pack_results([row]), {'seed': seed})
+
+    played = run_sweep(game_type, base_config, [points[j] for j in pending], num_universes, seed=seed, common=common,
+                       max_workers=max_workers, on_chunk=on_chunk, on_results=store, instrument=instrument)
+    for j, row in zip(pending, played):
+        rows[j] = row
+    return rows, len(points) - len(pending)
+
+
+def heatmap_figure(rows, x, y, metric, labels) -> go.Figure:
+    xs, ys, z = heatmap_grid(rows, x, y, metric)
+    fig = go.Figure(go.Heatmap(x=[str(v) for v in xs], y=[str(v) for v in ys], z=z, colorscale='Viridis',
+                               reversescale=metric in LOWER_IS_BETTER,
+                               hovertemplate=f"{labels[x]} %{{x}}<br>{labels[y]} %{{y}}<br>%{{z:,.1f}}<extra></extra>"))
+    fig.update_layout(title=SWEEP_METRICS[metric], height=420, margin=dict(l=20, r=20, t=40, b=20),
+                      xaxis_title=labels[x], yaxis_title=labels[y], xaxis_type='category', yaxis_type='category',
+                      paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)', font=dict(color='#94a3b8'))
+    return fig
+
+
+def best_trajectories_figure(rows, metric, names, labels) -> go.Figure:
+    fig = go.Figure()
+    for r in best_points(rows, metric):
+        name = ', '.join(f"{labels[n]} {r[n]}" for n in names)
+        fig.add_trace(go.Scatter(y=r['trajectory'], mode='lines', name=name))
+    fig.update_layout(title=f"Mean GA of the best points by {SWEEP_METRICS[metric]}", height=360,
+                      margin=dict(l=20, r=20, t=40, b=20), xaxis_title='Month', legend=dict(orientation='h', y=-0.2),
+                      paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)', font=dict(color='#94a3b8'))
+    return fig
+
+
+def show_sweep():
+    param_rows = []  # {'name', 'start', 'stop', 'step'} number inputs
+    active_task = None
+
+    def lab_params():
+        return params_for(select_game.value or 'Baccarat')
+
+    def ranges() -> dict:
+        out = {}
+        for p in param_rows:
+            name = p['name'].value
+            if name and name not in out:
+                out[name] = value_range(p['start'].value or 0, p['stop'].value or 0, p['step'].value or 0)
+        return out
+
+    def update_count():
+        r = ranges()
+        total = grid_size(r)
+        if mode.value == 'RANDOM':
+            total = min(total, int(number_random.value or 0))
+        sizes = ' × '.join(str(len(v)) for v in r.values())
+        label_count.set_text(f"{sizes} grid: {total:,} points" if r else 'Add parameters to sweep')
+
+    def set_default_range(p):
+        param = lab_params().get(p['name'].value)
+        if param:
+            p['start'].value, p['stop'].value, p['step'].value = param.default
+
+    def add_param():
+        if len(param_rows) >= MAX_PARAMS:
+            ui.notify(f'At most {MAX_PARAMS} parameters', type='warning'); return
+        options = {name: param.label for name, param in lab_params().items()}
+        taken = {p['name'].value for p in param_rows}
+        first = next(name for name in options if name not in taken)
+        with params_col:
+            with ui.row().classes('items-end gap-4') as row:
+                p = {'row': row, 'name': ui.select(options, value=first, label='Parameter').classes('w-56')}
+                p['start'] = ui.number('From', format='%g').classes('w-24')
+                p['stop'] = ui.number('To', format='%g').classes('w-24')
+                p['step'] = ui.number('Step', format='%g').classes('w-24')
+                ui.button(icon='delete', on_click=lambda: remove_param(p)).props('flat color=red dense')
+        set_default_range(p)
+        p['name'].on_value_change(lambda: (set_default_range(p), update_count()))
+        for field in ('start', 'stop', 'step'):
+            p[field].on_value_change(update_count)
+        param_rows.append(p)
+        update_count()
+
+    def remove_param(p):
+        param_rows.remove(p)
+        params_col.remove(p['row'])
+        update_count()
+
+    def reset_params():
+        param_rows.clear()
+        params_col.clear()
+        update_count()
+
+    def load_base():
+        name = select_strat.value
+        if not name:
+            return
+        settings = batch.lab_settings(get_saved_strategies()[name], select_game.value)
+        number_years.value, number_freq.value, number_start.value = settings['years'], settings['freq'], settings['start_ga']
+
+    def stop_run():
+        if active_task: get_scheduler().cancel(active_task)
+
+    async def run_sweep_page():
+        nonlocal active_task
+        game, name = select_game.value, select_strat.value
+        r = ranges()
+        if not game or not name:
+            ui.notify('Select game and strategy', type='warning'); return
+        if not r:
+            ui.notify('Add at least one parameter', type='warning'); return
+        seed = int(number_seed.value or 0)
+        size = min(grid_size(r), int(number_random.value or 1)) if mode.value == 'RANDOM' else grid_size(r)
+        if size > MAX_POINTS:
+            ui.notify(f'{size:,} points: at most {MAX_POINTS:,} per sweep (narrow the ranges or sample at random)',
+                      type='warning'); return
+        points = random_points(r, int(number_random.value or 1), seed) if mode.value == 'RANDOM' else grid_points(r)
+        n = int(number_universes.value or 1)
+        common = {'years': int(number_years.value or 1), 'freq': int(number_freq.value or 1), 'start_ga': int(number_start.value or 0)}
+        try:
+            active_task = submit_page_run(
+                cached_sweep, (game, get_saved_strategies()[name], points, n),
+                dict(seed=seed, common=common, max_workers=get_scheduler().processes_per_task, on_chunk=report_progress),
+                cost=estimate_cost(n * len(points), common['years'] * 12, common['freq'] / 12),
+                name=f'Sweep {name} ({len(points)} points × {n} universes)')
+        except AdmissionError as e:
+            ui.notify(str(e), type='warning'); return
+        btn_run.disable(); btn_stop.set_visibility(True); progress.set_visibility(True)
+        try:
+            def show_progress(task):
+                progress.set_value(task.progress)
+                status.set_text(f"Sweeping: {task.done}/{task.total} new points played")
+            rows, hits = await wait_for_run(active_task, status, show_progress)
+            status.set_text(f"{len(points):,} points × {n:,} universes ({hits:,} from cache), every point on the same hands and spins")
+            render_results(rows, list(r), {k: p.label for k, p in params_for(game).items()})
+        except Cancelled:
+            status.set_text('Sweep Cancelled (finished points are cached)')
+        except Exception as e:
+            status.set_text(f'Sweep failed: {e}')
+        finally:
+            active_task = None; btn_run.enable(); btn_stop.set_visibility(False); progress.set_visibility(False)
+
+    def render_results(rows, names, labels):
+        results_area.clear()
+        columns = [{'name': n, 'label': labels[n], 'field': n, 'sortable': True, 'align': 'left'} for n in names] + \
+                  [{'name': m, 'label': label, 'field': m, 'sortable': True} for m, label in SWEEP_METRICS.items()]
+        table_rows = [dict({n: r[n] for n in names}, **{m: round(r[m], 1) for m in SWEEP_METRICS}, _key=i)
+                      for i, r in enumerate(rows)]
+        with results_area:
+            ui.label('SWEEP RESULTS').classes('text-sm font-bold text-slate-400')
+            ui.table(columns=columns, rows=table_rows, row_key='_key',
+                     pagination={'rowsPerPage': 25, 'sortBy': 'final_ga_mean', 'descending': True}) \
+                .props('dense flat').classes('w-full')
+            download_buttons('parameter_sweep', names + list(SWEEP_METRICS), rows,
+                             lambda r: {k: r[k] for k in names + list(SWEEP_METRICS)})
+            with ui.row().classes('w-full items-end gap-4 mt-4'):
+                select_x = ui.select({n: labels[n] for n in names}, value=names[0], label='X').classes('w-56')
+                select_y = ui.select({n: labels[n] for n in names}, value=names[-1], label='Y').classes('w-56')
+                select_metric = ui.select(SWEEP_METRICS, value='final_ga_mean', label='Metric').classes('w-56')
+            if len(names) > 2:
+                ui.label('Cells average the points over the other parameters.').classes('text-xs text-slate-500')
+            charts = ui.column().classes('w-full')
+
+        def show():
+            charts.clear()
+            with charts:
+                if select_x.value != select_y.value:
+                    ui.plotly(heatmap_figure(rows, select_x.value, select_y.value, select_metric.value, labels)).classes('w-full')
+                else:
+                    ui.label('Pick two different parameters for the heatmap.').classes('text-sm text-slate-500')
+                ui.plotly(best_trajectories_figure(rows, select_metric.value, names, labels)).classes('w-full')
+
+        for select in (select_x, select_y, select_metric):
+            select.on_value_change(show)
+        show()
+
+    with ui.column().classes('w-full max-w-5xl mx-auto gap-6 p-4'):
+        ui.label('PARAMETER SWEEP').classes('text-2xl font-light text-cyan-300')
+        ui.label('A saved strategy over every combination (or a random sample) of slider settings, all points on the '
+                 'same hands and spins, spread over the cores and cached point by point.').classes('text-sm text-slate-500 -mt-4')
+
+        with ui.card().classes('w-full bg-slate-900 p-4'):
+            ui.label('1. BASE STRATEGY').classes('font-bold text-white mb-2')
+            with ui.row().classes('w-full items-end gap-4'):
+                select_game = ui.select(['Baccarat', 'Roulette'], value='Baccarat', label='Lab').classes('w-32')
+                select_strat = ui.select(get_strategy_names(), label='Saved strategy').classes('w-64')
+            with ui.row().classes('w-full items-end gap-4'):
+                number_years = ui.number('Years', value=10, min=1, max=50, format='%d').classes('w-24')
+                number_freq = ui.number('Sessions / year', value=10, min=1, max=365, format='%d').classes('w-32')
+                number_start = ui.number('Start GA (€)', value=2000, min=0, step=100, format='%d').classes('w-32')
+            select_strat.on_value_change(load_base)
+            select_game.on_value_change(lambda: (load_base(), reset_params()))
+
+        with ui.card().classes('w-full bg-slate-900 p-4'):
+            ui.label('2. PARAMETERS').classes('font-bold text-white mb-2')
+            params_col = ui.column().classes('w-full')
+            ui.button('ADD PARAMETER', on_click=add_param).props('icon=add color=cyan flat')
+            with ui.row().classes('w-full items-end gap-4'):
+                mode = ui.toggle(['GRID', 'RANDOM'], value='GRID', on_change=update_count)
+                number_random = ui.number('Random points', value=100, min=1, step=50, format='%d').classes('w-32')
+                number_random.bind_visibility_from(mode, 'value', value='RANDOM')
+                number_random.on_value_change(update_count)
+            label_count = ui.label('Add parameters to sweep').classes('text-sm text-slate-400')
+
+        with ui.card().classes('w-full bg-slate-900 p-4'):
+            ui.label('3. RUN').classes('font-bold text-white mb-2')
+            with ui.row().classes('w-full items-end gap-4'):
+                number_universes = ui.number('Universes / point', value=200, min=10, step=50, format='%d').classes('w-32')
+                number_seed = ui.number('Seed', value=DEFAULT_SEED, format='%d').classes('w-28')
+                btn_run = ui.button('SWEEP', on_click=run_sweep_page).props('icon=grid_on color=cyan')
+                btn_stop = ui.button('STOP', on_click=stop_run).props('icon=stop flat color=red dense')
+                btn_stop.set_visibility(False)
+            status = ui.label('').classes('text-sm text-slate-400')
+            progress = ui.linear_progress(show_value=False).props('color=cyan')
+            progress.set_visibility(False)
+
+        results_area = ui.column().classes('w-full')
@@ -0,0 +1,88 @@
+"""
+Server-side tables and streamed downloads for long logs.
+
+paged_table() shows a sequence that stays on the server (a list, or anything
+with len() and slicing, such as a CareerEventLog) one page at a time: the
+browser only ever holds the rows on screen, and each page change asks the
+server for the next slice (Quasar server-side pagination). Rows are turned
+into table rows by to_row() as their page is shown, so a 5,000-event log
+costs 25 formatted rows, not 5,000 labels.
+
+download_buttons() offers the same data as CSV/JSON file downloads streamed
+from /api/exports (utils/exports.py) instead of text pushed through the
+websocket. The export link is registered when the button is clicked
+(download_button), so a results page left open past EXPORT_TTL still
+downloads.
+"""
+
+from nicegui import app, ui
+
+from utils.exports import get_export_store, csv_chunks, json_chunks
+
+ROWS_PER_PAGE = 25
+ROW_CLASS = '_class'  # Optional row key with CSS classes for the whole row
+
+_watched_clients = set()
+
+
+def paged_table(columns: list, rows, to_row=None, rows_per_page: int = ROWS_PER_PAGE):
+    """ui.table over rows kept server-side. columns as for ui.table; to_row(item) -> row dict (default: item)."""
+    to_row = to_row or (lambda item: item)
+    total = len(rows)
+
+    def page_rows(page: int, per_page: int) -> list:
+        start = (page - 1) * per_page if per_page else 0
+        stop = start + per_page if per_page else total
+        return [dict(to_row(item), _key=i) for i, item in enumerate(rows[start:stop], start)]
+
+    table = ui.table(columns=columns, rows=page_rows(1, rows_per_page), row_key='_key',
+                     pagination={'page': 1, 'rowsPerPage': rows_per_page, 'rowsNumber': total})
+    table.props('dense flat :rows-per-page-options="[10, 25, 50, 100]"')
+    table.add_slot('body', f'''
+        <q-tr :props="props" :class="props.row.{ROW_CLASS}">
+            <q-td v-for="col in props.cols" :key="col.name" :props="props">{{{{ col.value }}}}</q-td>
+        </q-tr>
+    ''')
+
+    def on_request(e):
+        pagination = e.args
+        page, per_page = int(pagination.get('page', 1)), int(pagination.get('rowsPerPage', rows_per_page))
+        table.rows = page_rows(page, per_page)
+        table.pagination = {'page': page, 'rowsPerPage': per_page, 'rowsNumber': total}
+
+    table.on('request', on_request, js_handler='(props) => emit(props.pagination)')
+    return table
+
+
+def register_download(filename: str, make_chunks):
+    """Registers a streamed download for the current tab and returns its Export (export.url)."""
+    store = get_export_store()
+    client = ui.context.client
+    export = store.register(app.storage.browser['id'], filename, make_chunks, client=client.id)
+    if client.id not in _watched_clients:
+        _watched_clients.add(client.id)
+        def client_gone():
+            _watched_clients.discard(client.id)
+            store.forget_client(client.id)
+        client.on_delete(client_gone)
+    return export
+
+
+def download_button(label: str, filename: str, make_chunks):
+    """Button that registers a fresh streamed download on every click (links expire, the page may not)."""
+    return ui.button(label, on_click=lambda: ui.download.from_url(register_download(filename, make_chunks).url))
+
+
+def download_buttons(filename: str, header: list, records, to_record=None, json: bool = True):
+    """DOWNLOAD CSV (+ JSON) buttons streaming records as {header: value} rows; filename without extension."""
+    to_record = to_record or (lambda item: item)
+
+    def rows():
+        return (to_record(item) for item in records)
+
+    with ui.row().classes('w-full gap-2 mt-2'):
+        download_button('DOWNLOAD CSV', f'{filename}.csv', lambda: csv_chunks(header, rows())) \
+            .props('icon=download color=yellow').classes('flex-grow')
+        if json:
+            download_button('DOWNLOAD JSON', f'{filename}.json', lambda: json_chunks(rows())) \
+                .props('icon=data_object color=cyan').classes('flex-grow')
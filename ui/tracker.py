@@ -22,7 +22,10 @@ def init_db():
             writer = csv.writer(f)
             writer.writerow(CSV_HEADERS)
 
-def load_data():
+NUMERIC_COLS = ['contribution', 'roulette_in', 'roulette_out', 'baccarat_in', 'baccarat_out', 'points', 'total_wealth']
+
+def _read_ledger():
+    """Full parse of the CSV (only when the file changed behind the cache's back)."""
     init_db()
     try:
         df = pd.read_csv(DATA_FILE)
@@ -34,13 +37,15 @@ def load_data():
 
     # 1. CRITICAL FIX: Sanitize Data Types
     # Force numeric columns to be numbers, turn errors/blanks into 0
-    numeric_cols = ['contribution', 'roulette_in', 'roulette_out', 'baccarat_in', 'baccarat_out', 'points', 'total_wealth']
-    for col in numeric_cols:
+    for col in NUMERIC_COLS:
         df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0)
 
     # 2. Date Parsing
     df['date'] = pd.to_datetime(df['date'], errors='coerce').fillna(pd.Timestamp.now())
 
+    return _add_derived_columns(df)
+
+def _add_derived_columns(df):
     # 3. Calculate Session PnL
     df['roulette_pnl'] = df['roulette_out'] - df['roulette_in']
     df['baccarat_pnl'] = df['baccarat_out'] - df['baccarat_in']
@@ -54,8 +59,85 @@ def load_data():
     
     return df
 
+class LedgerCache:
+    """
+    In-memory ledger DataFrame, valid while the CSV's (mtime, size) is unchanged.
+    Appends and deletes made through this module update it in place, so the
+    landing page does not re-parse the whole ledger on every render.
+    """
+    def __init__(self):
+        self.df = None
+        self.stamp = None
+
+    def _file_stamp(self):
+        try:
+            st = os.stat(DATA_FILE)
+            return (st.st_mtime_ns, st.st_size)
+        except OSError:
+            return None
+
+    def get(self):
+        stamp = self._file_stamp()
+        if self.df is None or stamp != self.stamp:
+            self.df = _read_ledger()
+            self.stamp = self._file_stamp()
+        return self.df
+
+    def append(self, row, stamp_before):
+        """Add one just-written row; derived columns come from the previous row."""
+        if self.df is None or stamp_before != self.stamp:
+            self.df = None  # Somebody else touched the file: reload on next read
+            return
+        new = {col: row.get(col) for col in CSV_HEADERS}
+        for col in NUMERIC_COLS:
+            new[col] = pd.to_numeric(pd.Series([new[col]]), errors='coerce').fillna(0).iloc[0]
+        new['date'] = pd.to_datetime(pd.Series([new['date']]), errors='coerce').fillna(pd.Timestamp.now()).iloc[0]
+        if not new['notes']:
+            new['notes'] = np.nan  # Same as read_csv gives for an empty cell
+        new['roulette_pnl'] = new['roulette_out'] - new['roulette_in']
+        new['baccarat_pnl'] = new['baccarat_out'] - new['baccarat_in']
+        new['session_pnl'] = new['roulette_pnl'] + new['baccarat_pnl']
+
+        if self.df.empty:
+            self.df = _add_derived_columns(pd.DataFrame([new]))
+        else:
+            last = self.df.iloc[-1]
+            start_cap = last['invested_capital'] - last['cum_contrib']
+            new['cum_contrib'] = last['cum_contrib'] + new['contribution']
+            new['invested_capital'] = start_cap + new['cum_contrib']
+            self.df.loc[len(self.df)] = new
+        self.stamp = self._file_stamp()
+
+    def drop(self, row_index):
+        """
+        Remove one row: its line goes from the raw CSV (the other rows are written
+        back exactly as stored, not as the cleaned-up frame shows them) and the
+        cached frame loses it with no re-parse; cumulative columns are re-derived.
+        """
+        df = self.get()
+        if row_index not in df.index:
+            raise KeyError(f"No ledger row {row_index}")
+        with open(DATA_FILE, newline='') as f:
+            header, *rows = list(csv.reader(f))
+        rows = [r for r in rows if r]  # read_csv skips blank lines, so row_index counts the others
+        del rows[row_index]
+        with open(DATA_FILE, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(header)
+            writer.writerows(rows)
+        df = df.drop(index=row_index).reset_index(drop=True)
+        self.df = _add_derived_columns(df) if not df.empty else df
+        self.stamp = self._file_stamp()
+
+_ledger = LedgerCache()
+
+def load_data():
+    """Current ledger (cached). Treat the returned DataFrame as read-only."""
+    return _ledger.get()
+
 def save_session(date, contrib, r_in, r_out, b_in, b_out, points, notes):
     df = load_data()
+    stamp_before = _ledger.stamp
     
     if df.empty:
         prev_wealth = 0
@@ -66,20 +148,20 @@ def save_session(date, contrib, r_in, r_out, b_in, b_out, points, notes):
     baccarat_pnl = b_out - b_in
     new_wealth = prev_wealth + contrib + roulette_pnl + baccarat_pnl
     
+    row = [
+        date, contrib, 
+        r_in, r_out, 
+        b_in, b_out, 
+        points, new_wealth, notes
+    ]
     with open(DATA_FILE, 'a', newline='') as f:
         writer = csv.writer(f)
-        writer.writerow([
-            date, contrib, 
-            r_in, r_out, 
-            b_in, b_out, 
-            points, new_wealth, notes
-        ])
+        writer.writerow(row)
+    _ledger.append(dict(zip(CSV_HEADERS, row)), stamp_before)
 
 def delete_session(row_index):
     try:
-        df = pd.read_csv(DATA_FILE)
-        df = df.drop(index=row_index)
-        df.to_csv(DATA_FILE, index=False)
+        _ledger.drop(row_index)
     except Exception as e:
         ui.notify(f"Error deleting: {str(e)}", type='negative')
 
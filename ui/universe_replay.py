@@ -0,0 +1,38 @@
+"""
+Universe drill-down controls of the lab and Career Sim pages.
+
+universe_picker() offers the worst / P10 / median / P90 / best universe of
+the run on screen (or any universe by number); the page replays the picked
+universe from its seed with full tracing (engine/replay.py), so what is shown
+is a universe of that run, not a fresh random one. trace_picker() picks the
+session of a replayed universe to trace hand by hand / spin by spin.
+
+Universes and sessions are numbered from 1 on screen (universe #1 is index 0).
+"""
+
+from nicegui import ui
+
+from engine.replay import pick_universes
+
+
+def universe_picker(results, on_pick, key='final_ga'):
+    """Pick buttons and a universe number over a run's results; on_pick(index, label) may be async."""
+    picks = pick_universes(results, key)
+    with ui.row().classes('w-full items-center gap-2'):
+        ui.label('DRILL DOWN').classes('text-xs font-bold text-slate-400')
+        for label, index in picks.items():
+            ui.button(f'{label} #{index + 1}', on_click=lambda index=index, label=label: on_pick(index, label)) \
+                .props('flat dense color=cyan size=sm')
+        number = ui.number('Universe #', value=1, min=1, max=len(results), format='%d').props('dense').classes('w-24')
+        ui.button('REPLAY', icon='replay',
+                  on_click=lambda: on_pick(min(max(int(number.value or 1), 1), len(results)) - 1, None)) \
+            .props('flat dense color=cyan size=sm')
+
+
+def trace_picker(sessions: int, value: int, on_trace):
+    """Session number input with a TRACE button; on_trace(session) may be async."""
+    with ui.row().classes('items-center gap-2'):
+        number = ui.number('Session #', value=value, min=1, max=max(sessions, 1), format='%d').props('dense').classes('w-24')
+        ui.button('TRACE', icon='timeline',
+                  on_click=lambda: on_trace(min(max(int(number.value or 1), 1), max(sessions, 1)))) \
+            .props('flat dense color=cyan size=sm')
@@ -0,0 +1,50 @@
+"""
+Monaco Salle Blanche Lab - Downsampling
+=======================================
+Largest-Triangle-Three-Buckets (LTTB) downsampling of chart series.
+
+LTTB keeps the first and last points and, from each bucket in between, the
+point that forms the largest triangle with the point kept before it and the
+average of the next bucket. Peaks, troughs and sudden drops survive, which
+plain striding would skip, so a session or career line looks the same at a
+fraction of the points.
+"""
+
+import numpy as np
+
+
+def lttb_indices(x, y, n_out: int) -> np.ndarray:
+    """Indices of the n_out points LTTB keeps (every index if the series is already small enough)."""
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)  # n_out - 2 buckets between the end points
+    idx = np.empty(n_out, dtype=np.int64)
+    idx[0], idx[-1] = 0, n - 1
+    a = 0
+    for b in range(n_out - 2):
+        lo, hi = edges[b], edges[b + 1]
+        nlo, nhi = hi, (edges[b + 2] if b + 2 < len(edges) else n)
+        avg_x, avg_y = x[nlo:nhi].mean(), y[nlo:nhi].mean()
+        area = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a]))
+        a = lo + int(np.argmax(area))
+        idx[b + 1] = a
+    return idx
+
+
+def downsample(x, y, n_out: int, x0=None, x1=None):
+    """
+    (x, y) reduced to at most n_out points with LTTB. With x0/x1 only the
+    window x0..x1 is kept (plus one point either side, so the line reaches
+    the edges); x must be sorted.
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    if x0 is not None and x1 is not None:
+        i0 = max(0, int(np.searchsorted(x, x0, side='left')) - 1)
+        i1 = min(len(x), int(np.searchsorted(x, x1, side='right')) + 1)
+        x, y = x[i0:i1], y[i0:i1]
+    idx = lttb_indices(x, y, n_out)
+    return x[idx], y[idx]
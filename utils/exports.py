@@ -0,0 +1,138 @@
+"""
+Monaco Salle Blanche Lab - Streamed Exports
+===========================================
+CSV/JSON downloads of large logs (Career Sim event log, Sessions Sim entries,
+the labs' Year 1 log) without building the whole file in memory or pushing
+it through the websocket.
+
+A page registers an export with a factory that yields the file in text
+chunks, and gets back a one-off URL (GET /api/exports/{token}, see api.py)
+that streams it as a file download. Exports belong to the browser session
+that created them, expire after EXPORT_TTL seconds, and are dropped when the
+tab that created them goes away. Pages register the link when their download
+button is clicked (ui/tables.download_button), so it is always fresh.
+"""
+
+import csv
+import io
+import json
+import threading
+import time
+import uuid
+
+EXPORT_TTL = 3600              # Seconds an export link stays valid
+MAX_EXPORTS_PER_OWNER = 50     # Oldest links are dropped beyond this
+CHUNK_LINES = 1000             # Lines per streamed chunk
+
+MEDIA_TYPES = {'csv': 'text/csv', 'json': 'application/json'}
+
+
+def batched(lines, size: int = CHUNK_LINES):
+    """Joins an iterable of lines (without newlines) into text chunks of `size` lines."""
+    buf = []
+    for line in lines:
+        buf.append(line)
+        if len(buf) >= size:
+            yield '\n'.join(buf) + '\n'
+            buf = []
+    if buf:
+        yield '\n'.join(buf) + '\n'
+
+
+def csv_chunks(header, rows, size: int = CHUNK_LINES):
+    """CSV text chunks of rows (sequences, or dicts keyed by header), quoted as the csv module does."""
+    out = io.StringIO()
+    writer = csv.writer(out, lineterminator='\n')
+    writer.writerow(header)
+    n = 0
+    for row in rows:
+        writer.writerow([row.get(h, '') for h in header] if isinstance(row, dict) else row)
+        n += 1
+        if n >= size:
+            yield out.getvalue()
+            out.seek(0); out.truncate()
+            n = 0
+    if out.tell():
+        yield out.getvalue()
+
+
+def json_chunks(rows, size: int = CHUNK_LINES):
+    """JSON array of rows, one row per line, in text chunks."""
+    yield '[\n'
+    buf, first = [], True
+    for row in rows:
+        buf.append(('' if first else ',\n') + json.dumps(row, default=str))
+        first = False
+        if len(buf) >= size:
+            yield ''.join(buf)
+            buf = []
+    yield ''.join(buf) + '\n]\n'
+
+
+class Export:
+    def __init__(self, owner: str, filename: str, make_chunks, media_type: str, client: str = None):
+        self.token = uuid.uuid4().hex
+        self.owner = owner
+        self.client = client
+        self.filename = filename
+        self.make_chunks = make_chunks
+        self.media_type = media_type
+        self.created = time.time()
+
+    @property
+    def url(self) -> str:
+        return f'/api/exports/{self.token}'
+
+
+class ExportStore:
+    def __init__(self, ttl: float = EXPORT_TTL, max_per_owner: int = MAX_EXPORTS_PER_OWNER):
+        self.ttl = ttl
+        self.max_per_owner = max_per_owner
+        self._exports = {}  # token -> Export (insertion order = age)
+        self._lock = threading.Lock()
+
+    def register(self, owner: str, filename: str, make_chunks, media_type: str = None, client: str = None) -> Export:
+        """Registers make_chunks() (a callable returning an iterable of str) as a download."""
+        if media_type is None:
+            media_type = MEDIA_TYPES.get(filename.rsplit('.', 1)[-1], 'application/octet-stream')
+        export = Export(owner, filename, make_chunks, media_type, client)
+        with self._lock:
+            self._expire()
+            self._exports[export.token] = export
+            mine = [e for e in self._exports.values() if e.owner == owner]
+            for old in mine[:-self.max_per_owner]:
+                del self._exports[old.token]
+        return export
+
+    def get(self, token: str, owner: str = None):
+        with self._lock:
+            self._expire()
+            export = self._exports.get(token)
+        if export is None or (owner is not None and export.owner != owner):
+            return None
+        return export
+
+    def forget_client(self, client: str) -> int:
+        """Drops the exports of a browser tab (and the results they hold on to)."""
+        with self._lock:
+            tokens = [t for t, e in self._exports.items() if e.client == client]
+            for t in tokens:
+                del self._exports[t]
+        return len(tokens)
+
+    def _expire(self):
+        cutoff = time.time() - self.ttl
+        for t in [t for t, e in self._exports.items() if e.created < cutoff]:
+            del self._exports[t]
+
+
+_export_store = None
+_export_store_lock = threading.Lock()
+
+
+def get_export_store() -> ExportStore:
+    global _export_store
+    with _export_store_lock:
+        if _export_store is None:
+            _export_store = ExportStore()
+        return _export_store
@@ -0,0 +1,331 @@
+"""
+Monaco Salle Blanche Lab - Simulation Jobs
+==========================================
+Server-side simulation jobs for the HTTP job API (api.py).
+
+A job is a Baccarat/Roulette multiverse or a Career Sim run, described by a
+JSON request (saved strategy name or inline config, universes, seed). Jobs
+run on the server-wide scheduler (utils/scheduler.py, shared with the lab
+pages), each fanning its universe chunks out over its share of the cores with
+engine/batch.py, so they do not depend on any browser tab. Status and
+progress can be polled.
+
+A finished job keeps its results only in the packed columnar form of the
+result cache (float32 trajectories), built once when the run ends. Finished
+jobs are kept in memory until removed or evicted, oldest first, once there
+are more than MAX_FINISHED_JOBS of them or their results take more than
+MAX_FINISHED_BYTES. Results larger than MAX_JOB_RESULT_BYTES are not kept in
+memory at all: they are spilled to the on-disk result cache and read back
+when fetched (they can expire with the cache's own eviction).
+
+A request with "instrument": true also times the engine phases
+(engine/instrumentation.py); the per-phase report comes back with the job
+status and is listed on the admin panel. With "profile": true (or a number
+of universes) a sample of the universes is replayed under cProfile after the
+run (engine/profiling.py); the report is served by /api/jobs/{id}/profile.
+"""
+
+import logging
+import threading
+import time
+import uuid
+
+import numpy as np
+
+from engine import batch, instrumentation, profiling
+from engine.cancellation import Cancelled
+from engine.seeding import DEFAULT_SEED
+from utils.persistence import get_saved_strategies
+from utils.result_cache import load_result, pack_results, packed_bytes, packed_nbytes, result_key, save_result
+from utils.scheduler import get_scheduler, estimate_cost, CANCELLED as TASK_CANCELLED
+
+JOB_KINDS = ('baccarat', 'roulette', 'career')
+MAX_FINISHED_JOBS = 20
+MAX_FINISHED_BYTES = 512 * 1024 * 1024    # Packed results of the finished jobs kept in memory
+MAX_JOB_RESULT_BYTES = 64 * 1024 * 1024   # Larger results are spilled to the result cache
+MAX_UNIVERSES = 100000
+MAX_PROFILE_SAMPLE = 200
+
+QUEUED, RUNNING, DONE, FAILED, CANCELLED = 'queued', 'running', 'done', 'failed', 'cancelled'
+FINAL_STATES = (DONE, FAILED, CANCELLED)
+
+logger = logging.getLogger(__name__)
+
+
+def _resolve_config(item: dict, saved_strats: dict, where: str):
+    """(name, config) from {'strategy': name} or {'config': {...}}."""
+    if isinstance(item.get('config'), dict):
+        return item.get('name') or item.get('strategy') or 'inline', dict(item['config'])
+    name = item.get('strategy')
+    if not name:
+        raise ValueError(f"{where}: give 'strategy' (saved name) or 'config' (inline)")
+    if name not in saved_strats:
+        raise ValueError(f"{where}: unknown strategy '{name}'")
+    return name, dict(saved_strats[name])
+
+
+def parse_job_request(payload: dict, saved_strats: dict = None) -> dict:
+    """Validated job spec from an API request body. Raises ValueError."""
+    if not isinstance(payload, dict):
+        raise ValueError('Request body must be a JSON object')
+    kind = str(payload.get('lab', '')).lower()
+    if kind not in JOB_KINDS:
+        raise ValueError(f"'lab' must be one of {', '.join(JOB_KINDS)}")
+    try:
+        universes = int(payload.get('universes', 100))
+        seed = int(payload.get('seed', DEFAULT_SEED))
+    except (TypeError, ValueError):
+        raise ValueError("'universes' and 'seed' must be integers")
+    instrument = payload.get('instrument', False)
+    if not isinstance(instrument, bool):
+        raise ValueError("'instrument' must be true or false")
+    profile = payload.get('profile', False)
+    if profile is True:
+        profile = profiling.PROFILE_SAMPLE
+    elif profile is False:
+        profile = 0
+    elif not isinstance(profile, int) or not 1 <= profile <= MAX_PROFILE_SAMPLE:
+        raise ValueError(f"'profile' must be true, false or a number of universes (1-{MAX_PROFILE_SAMPLE})")
+    if not 1 <= universes <= MAX_UNIVERSES:
+        raise ValueError(f"'universes' must be between 1 and {MAX_UNIVERSES}")
+    settings = payload.get('settings') or {}
+    if not isinstance(settings, dict):
+        raise ValueError("'settings' must be an object")
+    saved_strats = get_saved_strategies() if saved_strats is None else saved_strats
+
+    if kind == 'career':
+        legs = payload.get('legs')
+        if not isinstance(legs, list) or not legs:
+            raise ValueError("career jobs need 'legs': [{'strategy' or 'config', 'target_ga'}, ...]")
+        sequence = []
+        for i, leg in enumerate(legs):
+            name, config = _resolve_config(leg, saved_strats, f'leg {i+1}')
+            sequence.append({'strategy_name': name, 'target_ga': float(leg.get('target_ga', 0)), 'config': config})
+        unknown = set(settings) - set(batch.CAREER_DEFAULTS)
+        if unknown:
+            raise ValueError(f"Unknown career settings: {', '.join(sorted(unknown))}")
+        return {'kind': kind, 'sequence': sequence, 'settings': dict(batch.CAREER_DEFAULTS, **settings),
+                'universes': universes, 'seed': seed, 'instrument': instrument, 'profile': profile}
+
+    game = kind.capitalize()
+    name, config = _resolve_config(payload, saved_strats, 'job')
+    lab = batch.lab_settings(config, game)
+    unknown = set(settings) - set(lab)
+    if unknown:
+        raise ValueError(f"Unknown lab settings: {', '.join(sorted(unknown))}")
+    lab.update(settings)
+    return {'kind': kind, 'game': game, 'strategy': name, 'config': config, 'settings': lab,
+            'universes': universes, 'seed': seed, 'instrument': instrument, 'profile': profile}
+
+
+def job_cost(spec: dict) -> int:
+    """Admission cost of a job, in sessions (see utils/scheduler.py)."""
+    s = spec['settings']
+    sessions_per_year = s['sessions'] if spec['kind'] == 'career' else s['freq']
+    universes = spec['universes'] + spec.get('profile', 0)  # Profiled universes are played again
+    return estimate_cost(universes, s['years'] * 12, sessions_per_year / 12)
+
+
+class Job:
+    def __init__(self, owner: str, spec: dict):
+        self.id = uuid.uuid4().hex[:12]
+        self.owner = owner
+        self.spec = spec
+        self.status = QUEUED
+        self.done = 0
+        self.total = 0
+        self.created = time.time()
+        self.started = None
+        self.finished = None
+        self.error = None
+        self.summary = None
+        self.result_bytes = 0        # Size of the packed results held in memory
+        self.instrumentation = None  # Per-phase report of an instrumented job
+        self.profile = None          # Profiling report of a profiled job (engine/profiling.py)
+        self.profile_stats = None    # Its raw cProfile stats
+        self.version = 0  # Bumped on every change (progress streaming)
+        self.task = None
+        self._packed = None
+        self._spill_key = None       # Result cache key of spilled results
+        self._lock = threading.Lock()
+
+    def _update(self, **fields):
+        with self._lock:
+            for k, v in fields.items():
+                setattr(self, k, v)
+            self.version += 1
+
+    @property
+    def is_final(self) -> bool:
+        return self.status in FINAL_STATES
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            out = {
+                'id': self.id, 'lab': self.spec['kind'], 'status': self.status,
+                'universes': self.spec['universes'], 'seed': self.spec['seed'], 'cost': job_cost(self.spec),
+                'progress': self.done / self.total if self.total else (1.0 if self.status == DONE else 0.0),
+                'chunks_done': self.done, 'chunks_total': self.total,
+                'created': self.created, 'started': self.started, 'finished': self.finished,
+                'elapsed_sec': round((self.finished or time.time()) - self.started, 3) if self.started else None,
+                'error': self.error, 'summary': self.summary
+            }
+            if self.instrumentation is not None:
+                out['instrumentation'] = self.instrumentation
+            if self.profile is not None:
+                out['profile'] = {k: v for k, v in self.profile.items() if k != 'functions'}
+            return out
+
+    # --- RESULTS ---
+
+    def store_results(self, results: list):
+        """Packs the run's results once; large ones go to the result cache instead of memory."""
+        if self.spec['kind'] == 'career':
+            results = [dict(r, log=r['log'].to_dict()) for r in results if 'error' not in r]
+        packed = pack_results(results)
+        size = packed_nbytes(packed)
+        if size > MAX_JOB_RESULT_BYTES:
+            self._spill_key = result_key('job', job=self.id, spec=self.spec)
+            save_result(self._spill_key, packed, {'job': self.id})
+            packed, size = None, 0
+        self._packed, self.result_bytes = packed, size
+
+    def packed(self) -> dict:
+        """Columnar results (read back from the result cache if they were spilled). Raises LookupError once expired."""
+        if self._packed is not None:
+            return self._packed
+        cached = load_result(self._spill_key) if self._spill_key else None
+        if cached is None:
+            raise LookupError(f'Results of job {self.id} are no longer available')
+        return cached[0]
+
+    def result_json(self, trajectories: bool = False) -> dict:
+        packed = self.packed()
+        out = {'job': self.to_dict(), 'columns': {name: col.tolist() for name, col in packed['columns'].items()}}
+        if trajectories:
+            out['trajectories'] = np.round(packed['trajectories'], 2).tolist()
+        return out
+
+    def result_npz(self) -> bytes:
+        return packed_bytes(self.packed(), {'job': self.to_dict(), 'spec': self.spec})
+
+
+def execute_job(job: Job, max_workers=None):
+    """Runs a job's simulation (called on a scheduler slot)."""
+    spec = job.spec
+    job._update(status=RUNNING, started=time.time(), total=len(batch.plan_universes(spec['universes'])))
+    on_chunk = lambda done, total: job._update(done=done, total=total)
+    acc = instrumentation.Accumulator() if spec.get('instrument') else None
+    try:
+        if spec['kind'] == 'career':
+            results, settings = batch.run_career(spec['sequence'], spec['universes'], seed=spec['seed'],
+                                                 settings=spec['settings'], max_workers=max_workers, on_chunk=on_chunk,
+                                                 instrument=acc)
+            with instrumentation.phase(acc, 'stats'):
+                summary = batch.career_stats(results, settings)
+        else:
+            results, settings = batch.run_lab(spec['game'], spec['config'], spec['universes'], seed=spec['seed'],
+                                              config=spec['settings'], max_workers=max_workers, on_chunk=on_chunk,
+                                              instrument=acc)
+            with instrumentation.phase(acc, 'stats'):
+                summary = batch.lab_stats(spec['game'], results, settings)
+        if spec.get('profile'):
+            if spec['kind'] == 'career':
+                report, stats = profiling.profile_career(spec['sequence'], spec['universes'], spec['seed'], settings,
+                                                         sample=spec['profile'])
+            else:
+                report, stats = profiling.profile_lab(spec['game'], spec['config'], spec['universes'], spec['seed'],
+                                                      settings, sample=spec['profile'])
+            profiling.record_profile(f"API {spec['kind']} job {job.id}", report, stats)
+            job.profile, job.profile_stats = report, stats
+        job.store_results(results)
+        if acc is not None:
+            report = instrumentation.record_report(f"API {spec['kind']} job {job.id}", acc, universes=spec['universes'],
+                                                   elapsed_sec=round(time.time() - job.started, 3))
+            job.instrumentation = report['phases']
+        job._update(status=DONE, summary=summary, finished=time.time())
+    except Cancelled:
+        job._update(status=CANCELLED, finished=time.time())
+    except Exception as e:
+        logger.exception("Job %s failed", job.id)
+        job._update(status=FAILED, error=str(e), finished=time.time())
+
+
+class JobManager:
+    def __init__(self, max_finished: int = MAX_FINISHED_JOBS, process_workers=None, scheduler=None,
+                 max_finished_bytes: int = MAX_FINISHED_BYTES):
+        self.max_finished = max_finished
+        self.max_finished_bytes = max_finished_bytes
+        self.scheduler = scheduler or get_scheduler()
+        self.process_workers = process_workers or self.scheduler.processes_per_task
+        self._jobs = {}
+        self._lock = threading.Lock()
+
+    def submit(self, owner: str, spec: dict) -> Job:
+        """Queues a job. Raises AdmissionError (a ValueError) if the scheduler refuses it."""
+        job = Job(owner, spec)
+        job.task = self.scheduler.submit(owner, self._execute, (job, self.process_workers), cost=job_cost(spec),
+                                         name=f"API {spec['kind']} job {job.id}")
+        with self._lock:
+            self._jobs[job.id] = job
+            self._prune()
+        return job
+
+    def _execute(self, job: Job, max_workers):
+        execute_job(job, max_workers)
+        with self._lock:
+            self._prune()
+
+    def get(self, job_id: str, owner: str = None):
+        job = self._jobs.get(job_id)
+        if job is None or (owner is not None and job.owner != owner):
+            return None
+        return job
+
+    def jobs(self, owner: str = None) -> list:
+        with self._lock:
+            return [j for j in self._jobs.values() if owner is None or j.owner == owner]
+
+    def cancel(self, job_id: str) -> bool:
+        """Cancels a queued job, or stops a running one at its next session."""
+        job = self._jobs.get(job_id)
+        if job is None or job.is_final or not self.scheduler.cancel(job.task):
+            return False
+        if job.task.status == TASK_CANCELLED:  # Never started
+            job._update(status=CANCELLED, finished=time.time())
+        return True
+
+    def remove(self, job_id: str) -> bool:
+        """Forgets a finished job (and frees its results)."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or not job.is_final:
+                return False
+            del self._jobs[job_id]
+            return True
+
+    def _prune(self):
+        """Evicts the oldest finished jobs until both the count and the bytes bounds hold."""
+        finished = sorted((j for j in self._jobs.values() if j.is_final), key=lambda j: j.finished)
+        total = sum(j.result_bytes for j in finished)
+        for i, job in enumerate(finished):
+            if len(finished) - i <= self.max_finished and total <= self.max_finished_bytes:
+                break
+            del self._jobs[job.id]
+            total -= job.result_bytes
+
+    def shutdown(self):
+        for job in self.jobs():
+            self.cancel(job.id)
+
+
+_job_manager = None
+_job_manager_lock = threading.Lock()
+
+
+def get_job_manager() -> JobManager:
+    global _job_manager
+    with _job_manager_lock:
+        if _job_manager is None:
+            _job_manager = JobManager()
+        return _job_manager
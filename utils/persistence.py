@@ -1,14 +1,19 @@
-import json
 import os
+import threading
 from datetime import datetime
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
+
+from utils.profile_store import ProfileStore
+from utils.session_log_store import SessionLogStore
 
 # RAILWAY PERSISTENCE CONFIGURATION
 # We mount the volume to '/app/data'.
 # If it exists, we read/write there. If not, we use the local folder.
 VOLUME_PATH = '/app/data'
-PROFILE_FILENAME = 'profile.json'
-LOGS_FILENAME = 'session_logs.json'
+PROFILE_FILENAME = 'profile.json'  # Legacy, imported once into PROFILE_DB_FILENAME
+PROFILE_DB_FILENAME = 'profile.db'
+LOGS_FILENAME = 'session_logs.json'  # Legacy, imported once into SESSION_LOG_FILENAME
+SESSION_LOG_FILENAME = 'session_logs.jsonl'
 
 def get_file_path(filename: str) -> str:
     """Returns the volume path if available, else local path."""
@@ -18,27 +23,83 @@ def get_file_path(filename: str) -> str:
 
 # --- PROFILE MANAGEMENT (Strategies & Bankroll) ---
 
+_profile_store = None
+_profile_store_lock = threading.Lock()
+
+def get_profile_store() -> ProfileStore:
+    """Process-wide SQLite profile store (migrates profile.json on first open)."""
+    global _profile_store
+    with _profile_store_lock:
+        if _profile_store is None:
+            _profile_store = ProfileStore(get_file_path(PROFILE_DB_FILENAME), get_file_path(PROFILE_FILENAME))
+        return _profile_store
+
 def load_profile() -> Dict[str, Any]:
-    path = get_file_path(PROFILE_FILENAME)
-    if not os.path.exists(path):
-        return {'saved_strategies': {}, 'ga': 2000.0} # Default basics
+    """Full profile snapshot ({'ga': ..., 'saved_strategies': {...}, ...})."""
     try:
-        with open(path, 'r') as f:
-            return json.load(f)
+        store = get_profile_store()
+        profile = store.get_settings()
+        profile['saved_strategies'] = store.get_strategies()
+        if len(profile) == 1 and not profile['saved_strategies']:
+            profile['ga'] = 2000.0  # Default basics
+        return profile
     except Exception as e:
         print(f"Error loading profile: {e}")
         return {}
 
 def save_profile(data: Dict[str, Any]):
-    path = get_file_path(PROFILE_FILENAME)
+    """Write a full profile snapshot. Prefer the per-strategy / bankroll functions below."""
     try:
-        with open(path, 'w') as f:
-            json.dump(data, f, indent=4)
+        get_profile_store().replace_profile(data)
     except Exception as e:
         print(f"Error saving profile: {e}")
 
+def get_saved_strategies() -> Dict[str, Dict]:
+    try: return get_profile_store().get_strategies()
+    except Exception as e:
+        print(f"Error loading strategies: {e}")
+        return {}
+
+def get_strategy_names() -> List[str]:
+    try: return get_profile_store().strategy_names()
+    except Exception as e:
+        print(f"Error loading strategies: {e}")
+        return []
+
+def get_strategy(name: str) -> Optional[Dict]:
+    try: return get_profile_store().get_strategy(name)
+    except Exception as e:
+        print(f"Error loading strategy: {e}")
+        return None
+
+def save_strategy(name: str, config: Dict[str, Any]):
+    """Insert or replace one saved strategy."""
+    get_profile_store().save_strategy(name, config)
+
+def delete_strategy(name: str) -> bool:
+    return get_profile_store().delete_strategy(name)
+
+def get_bankroll(default: float = 2000.0) -> float:
+    try: return get_profile_store().get_setting('ga', default)
+    except Exception as e:
+        print(f"Error loading bankroll: {e}")
+        return default
+
+def set_bankroll(ga: float):
+    get_profile_store().set_setting('ga', float(ga))
+
 # --- CAPTAIN'S LOG (Session History) ---
 
+_session_log_store = None
+
+def get_session_log_store() -> SessionLogStore:
+    """Process-wide append-only session log (imports session_logs.json on first use)."""
+    global _session_log_store
+    with _profile_store_lock:
+        if _session_log_store is None:
+            _session_log_store = SessionLogStore(get_file_path(SESSION_LOG_FILENAME), get_file_path(LOGS_FILENAME))
+        return _session_log_store
+
 def log_session_result(start_ga: float, end_ga: float, shoes_played: int, mode: str = "Unknown"):
     """Logs a completed session to the permanent drive."""
     log_entry = {
@@ -49,56 +110,45 @@ def log_session_result(start_ga: float, end_ga: float, shoes_played: int, mode:
         "pnl": end_ga - start_ga,
         "shoes": shoes_played
     }
-    
-    path = get_file_path(LOGS_FILENAME)
-    history = []
-    
-    # Load existing history
-    if os.path.exists(path):
-        try:
-            with open(path, 'r') as f:
-                history = json.load(f)
-        except:
-            history = []
-            
-    # Append new log
-    history.append(log_entry)
-    
-    # Save back to drive
     try:
-        with open(path, 'w') as f:
-            json.dump(history, f, indent=4)
+        get_session_log_store().append(log_entry)
     except Exception as e:
         print(f"Error saving logs: {e}")
 
 def get_session_logs() -> List[Dict]:
-    """Retrieves history from the permanent drive."""
-    path = get_file_path(LOGS_FILENAME)
-    if not os.path.exists(path):
+    """Retrieves history from the permanent drive (newest first)."""
+    try:
+        return get_session_log_store().all()[::-1]
+    except Exception:
         return []
+
+def get_session_logs_page(page: int = 0, page_size: int = 20) -> List[Dict]:
+    """One newest-first page of history; only that page is read from disk."""
     try:
-        with open(path, 'r') as f:
-            data = json.load(f)
-            # Return reversed so newest is first
-            return data[::-1]
-    except:
+        return get_session_log_store().page(page, page_size)
+    except Exception:
         return []
 
-def delete_session_log(log_date: str) -> bool:
-    """Deletes a specific log entry."""
-    path = get_file_path(LOGS_FILENAME)
-    if not os.path.exists(path):
+def count_session_logs() -> int:
+    try:
+        return get_session_log_store().count()
+    except Exception:
+        return 0
+
+def delete_session_log_entry(log_id: int) -> bool:
+    """Deletes one log entry by its id."""
+    try:
+        return get_session_log_store().delete(log_id)
+    except Exception:
         return False
-        
+
+def delete_session_log(log_date: str) -> bool:
+    """Deletes the log entries with this date."""
     try:
-        with open(path, 'r') as f:
-            history = json.load(f)
-        
-        # Filter out the item with the matching date
-        new_history = [h for h in history if h.get('date') != log_date]
-        
-        with open(path, 'w') as f:
-            json.dump(new_history, f, indent=4)
+        store = get_session_log_store()
+        ids = store.find_ids('date', log_date)
+        for log_id in ids:
+            store.delete(log_id)
         return True
-    except:
-        return False
\ No newline at end of file
+    except Exception:
+        return False
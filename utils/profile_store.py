@@ -0,0 +1,178 @@
+"""
+Monaco Salle Blanche Lab - Profile Store
+========================================
+Transactional SQLite store (WAL mode) for the bankroll and saved strategies.
+
+- One row per strategy, looked up by name through the primary-key index, so
+  saving or deleting a strategy no longer rewrites the whole profile.
+- Reads are served from an in-process cache; the cache is dropped whenever
+  another connection commits (PRAGMA data_version), so concurrent browser
+  sessions and other processes always see each other's writes.
+- The first open imports an existing profile.json (one-time migration).
+
+Use the functions in utils/persistence.py rather than this class directly.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS settings (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS strategies (
+    name TEXT PRIMARY KEY,
+    config TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+"""
+
+
+class ProfileStore:
+    def __init__(self, db_path: str, legacy_json_path: str = None):
+        self.db_path = db_path
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None, timeout=10.0)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript(SCHEMA)
+        self._data_version = None
+        self._settings = None    # key -> value
+        self._strategies = None  # name -> config dict
+        self._migrate(legacy_json_path)
+
+    # --- MIGRATION ---
+
+    def _migrate(self, legacy_json_path):
+        with self._lock:
+            version = self._conn.execute('PRAGMA user_version').fetchone()[0]
+            if version >= SCHEMA_VERSION:
+                return
+            data = {}
+            if legacy_json_path and os.path.exists(legacy_json_path):
+                try:
+                    with open(legacy_json_path, 'r') as f:
+                        data = json.load(f)
+                except Exception as e:
+                    print(f"Error migrating profile: {e}")
+                    data = {}
+            with self._transaction():
+                for name, config in (data.pop('saved_strategies', None) or {}).items():
+                    self._put_strategy(name, config)
+                for key, value in data.items():
+                    self._put_setting(key, value)
+                self._conn.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+
+    # --- INTERNALS ---
+
+    @contextmanager
+    def _transaction(self):
+        self._conn.execute('BEGIN IMMEDIATE')
+        try:
+            yield
+        except Exception:
+            self._conn.execute('ROLLBACK')
+            raise
+        self._conn.execute('COMMIT')
+
+    def _put_strategy(self, name, config):
+        self._conn.execute(
+            'INSERT INTO strategies (name, config, updated_at) VALUES (?, ?, ?) '
+            'ON CONFLICT(name) DO UPDATE SET config = excluded.config, updated_at = excluded.updated_at',
+            (name, json.dumps(config), datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
+
+    def _put_setting(self, key, value):
+        self._conn.execute(
+            'INSERT INTO settings (key, value) VALUES (?, ?) '
+            'ON CONFLICT(key) DO UPDATE SET value = excluded.value',
+            (key, json.dumps(value)))
+
+    def _refresh(self):
+        """Reload the read cache if anybody else committed since we last looked."""
+        version = self._conn.execute('PRAGMA data_version').fetchone()[0]
+        if self._strategies is not None and version == self._data_version:
+            return
+        self._settings = {k: json.loads(v) for k, v in self._conn.execute('SELECT key, value FROM settings')}
+        self._strategies = {n: json.loads(c) for n, c in self._conn.execute('SELECT name, config FROM strategies ORDER BY rowid')}
+        self._data_version = version
+
+    # --- READS ---
+
+    def strategy_names(self) -> list:
+        with self._lock:
+            self._refresh()
+            return list(self._strategies)
+
+    def get_strategy(self, name: str):
+        with self._lock:
+            self._refresh()
+            config = self._strategies.get(name)
+            return dict(config) if config is not None else None
+
+    def get_strategies(self) -> dict:
+        with self._lock:
+            self._refresh()
+            return {n: dict(c) for n, c in self._strategies.items()}
+
+    def get_setting(self, key: str, default=None):
+        with self._lock:
+            self._refresh()
+            return self._settings.get(key, default)
+
+    def get_settings(self) -> dict:
+        with self._lock:
+            self._refresh()
+            return dict(self._settings)
+
+    # --- WRITES (each one is its own transaction) ---
+
+    def save_strategy(self, name: str, config: dict):
+        with self._lock:
+            self._refresh()
+            with self._transaction():
+                self._put_strategy(name, config)
+            self._strategies[name] = dict(config)
+
+    def delete_strategy(self, name: str) -> bool:
+        with self._lock:
+            self._refresh()
+            with self._transaction():
+                deleted = self._conn.execute('DELETE FROM strategies WHERE name = ?', (name,)).rowcount > 0
+            self._strategies.pop(name, None)
+            return deleted
+
+    def set_setting(self, key: str, value):
+        with self._lock:
+            self._refresh()
+            with self._transaction():
+                self._put_setting(key, value)
+            self._settings[key] = value
+
+    def replace_profile(self, data: dict):
+        """Whole-profile write (legacy save_profile): only changed rows are touched."""
+        data = dict(data)
+        strategies = data.pop('saved_strategies', None)
+        with self._lock:
+            self._refresh()
+            with self._transaction():
+                for key, value in data.items():
+                    if self._settings.get(key, object()) != value:
+                        self._put_setting(key, value)
+                if strategies is not None:
+                    for name in set(self._strategies) - set(strategies):
+                        self._conn.execute('DELETE FROM strategies WHERE name = ?', (name,))
+                    for name, config in strategies.items():
+                        if self._strategies.get(name) != config:
+                            self._put_strategy(name, config)
+            self._strategies = None  # Rebuild the cache on next read
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
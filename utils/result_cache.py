@@ -0,0 +1,222 @@
+"""
+Monaco Salle Blanche Lab - Result Cache
+=======================================
+Content-addressed on-disk cache of multiverse results.
+
+A run is keyed on a canonical hash of everything that decides its outcome
+(strategy config, ecosystem params, number of universes, seed). The
+trajectory matrix (float32) and the per-universe scalar columns (plus
+fixed-shape array fields such as the session histograms, stacked) are stored
+as a compressed .npz under the persistence volume, so identical reruns, and
+reruns after a server restart, load instead of recomputing.
+
+Every key also carries RESULT_VERSION, the version of what the workers
+return: bump it whenever their output changes (new fields, different
+numbers for the same seed), so results played by older engine code are
+never served again.
+
+The cache directory is bounded in size; least recently used entries are
+evicted first (loading an entry refreshes its timestamp).
+"""
+
+import hashlib
+import io
+import json
+import os
+import threading
+from numbers import Number
+
+import numpy as np
+
+from utils.persistence import get_file_path
+
+CACHE_DIRNAME = 'result_cache'
+MAX_CACHE_BYTES = 256 * 1024 * 1024
+KEY_SEP = '/'  # Nested result dicts are flattened as 'spice_stats/total_cost'
+RESULT_VERSION = 1  # Bump whenever the workers' per-universe output changes
+
+_lock = threading.Lock()
+
+
+def cache_dir() -> str:
+    path = get_file_path(CACHE_DIRNAME)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def result_key(kind: str, **params) -> str:
+    """Canonical content hash of a run (kind = 'baccarat', 'roulette', 'career', ...) under the current RESULT_VERSION."""
+    payload = json.dumps({'kind': kind, 'version': RESULT_VERSION, 'params': params}, sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+def _entry_path(key: str) -> str:
+    return os.path.join(cache_dir(), f'{key}.npz')
+
+
+# --- PACKING (list of result dicts <-> columnar arrays) ---
+
+def _is_scalar(value) -> bool:
+    return isinstance(value, (Number, np.number, np.bool_)) and not isinstance(value, complex)
+
+
+def _flatten(d: dict, prefix: str = '') -> dict:
+    flat = {}
+    for k, v in d.items():
+        name = f'{prefix}{k}'
+        if isinstance(v, dict) and v:
+            flat.update(_flatten(v, name + KEY_SEP))
+        else:
+            flat[name] = v
+    return flat
+
+
+def _unflatten(flat: dict) -> dict:
+    out = {}
+    for name, v in flat.items():
+        parts = name.split(KEY_SEP)
+        node = out
+        for p in parts[:-1]:
+            node = node.setdefault(p, {})
+        node[parts[-1]] = v
+    return out
+
+
+def pack_results(results: list, trajectory_key: str = 'trajectory') -> dict:
+    """
+    Columnar form of per-universe result dicts:
+    trajectories (float32 matrix), numeric columns (a field holding arrays of one
+    shape in every universe becomes a stacked column), and JSON for everything else.
+    """
+    trajectories = np.array([r[trajectory_key] for r in results], dtype=np.float32)
+    flat_rows = [_flatten({k: v for k, v in r.items() if k != trajectory_key}) for r in results]
+
+    names = list(flat_rows[0].keys()) if flat_rows else []
+    columns, objects = {}, {}
+    for name in names:
+        values = [row.get(name) for row in flat_rows]
+        if all(_is_scalar(v) for v in values):
+            columns[name] = np.array(values)
+        elif all(isinstance(v, np.ndarray) and v.shape == values[0].shape for v in values):
+            columns[name] = np.stack(values)
+        else:
+            objects[name] = [v.tolist() if isinstance(v, np.ndarray) else v for v in values]
+    return {'trajectories': trajectories, 'columns': columns, 'objects': objects,
+            'trajectory_key': trajectory_key}
+
+
+def packed_nbytes(packed: dict) -> int:
+    """Approximate in-memory size of packed results (arrays plus the JSON of the object fields)."""
+    arrays = packed['trajectories'].nbytes + sum(col.nbytes for col in packed['columns'].values())
+    return arrays + len(json.dumps(packed['objects'], default=str))
+
+
+def unpack_results(packed: dict) -> list:
+    """Rebuild the per-universe result dicts (trajectories come back as float64 arrays)."""
+    trajectories = packed['trajectories'].astype(np.float64)
+    columns, objects = packed['columns'], packed['objects']
+    results = []
+    for i in range(trajectories.shape[0]):
+        flat = {name: col[i].item() if col.ndim == 1 else col[i] for name, col in columns.items()}
+        flat.update({name: values[i] for name, values in objects.items()})
+        row = _unflatten(flat)
+        row[packed['trajectory_key']] = trajectories[i]
+        results.append(row)
+    return results
+
+
+# --- STORE ---
+
+def _savez(f, packed: dict, meta: dict = None):
+    arrays = {'trajectories': packed['trajectories']}
+    for name, col in packed['columns'].items():
+        arrays[f'col{KEY_SEP}{name}'] = col
+    header = {'trajectory_key': packed['trajectory_key'], 'objects': packed['objects'], 'meta': meta or {}}
+    arrays['header'] = np.frombuffer(json.dumps(header, default=str).encode('utf-8'), dtype=np.uint8)
+    np.savez_compressed(f, **arrays)
+
+
+def packed_bytes(packed: dict, meta: dict = None) -> bytes:
+    """The .npz file write_packed would write, in memory (job API downloads)."""
+    buf = io.BytesIO()
+    _savez(buf, packed, meta)
+    return buf.getvalue()
+
+
+def write_packed(path: str, packed: dict, meta: dict = None):
+    """Write packed results as a compressed .npz (atomic replace). Also used by the batch runner."""
+    tmp = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+    try:
+        with open(tmp, 'wb') as f:
+            _savez(f, packed, meta)
+        os.replace(tmp, path)
+    except Exception:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def read_packed(path):
+    """(packed, meta) from a file (path or file object) written by write_packed."""
+    with np.load(path, allow_pickle=False) as data:
+        header = json.loads(data['header'].tobytes().decode('utf-8'))
+        columns = {name.split(KEY_SEP, 1)[1]: data[name] for name in data.files if name.startswith(f'col{KEY_SEP}')}
+        packed = {'trajectories': data['trajectories'], 'columns': columns,
+                  'objects': header['objects'], 'trajectory_key': header['trajectory_key']}
+    return packed, header['meta']
+
+
+def save_result(key: str, packed: dict, meta: dict = None):
+    """Write one run to the cache (atomic replace), then enforce the size bound."""
+    try:
+        write_packed(_entry_path(key), packed, meta)
+    except Exception as e:
+        print(f"Error saving result cache: {e}")
+        return
+    evict()
+
+
+def load_result(key: str):
+    """(packed, meta) for a cached run, or None."""
+    path = _entry_path(key)
+    if not os.path.exists(path):
+        return None
+    try:
+        result = read_packed(path)
+        os.utime(path)  # Mark as recently used
+        return result
+    except Exception as e:
+        print(f"Error loading result cache: {e}")
+        return None
+
+
+def evict(max_bytes: int = None):
+    """Drop least recently used entries until the cache fits in max_bytes."""
+    max_bytes = MAX_CACHE_BYTES if max_bytes is None else max_bytes
+    with _lock:
+        entries = []
+        for name in os.listdir(cache_dir()):
+            if not name.endswith('.npz'):
+                continue
+            path = os.path.join(cache_dir(), name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= max_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+
+
+def clear_cache():
+    with _lock:
+        for name in os.listdir(cache_dir()):
+            if name.endswith('.npz'):
+                os.remove(os.path.join(cache_dir(), name))
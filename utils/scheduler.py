@@ -0,0 +1,236 @@
+"""
+Monaco Salle Blanche Lab - Simulation Scheduler
+===============================================
+One server-wide queue for every simulation run: the lab pages, Career Sim,
+Sessions Sim and the job API (utils/jobs.py) all submit their runs here
+instead of starting threads of their own.
+
+- Bounded pool: SCHEDULER_SLOTS runs at a time, each spreading its chunks
+  over cpu_count // SCHEDULER_SLOTS processes, so the server never runs more
+  simulation processes than it has cores.
+- Fair share: when a slot frees up, the next run comes from the user with
+  the fewest runs in progress (ties go to whoever was served longest ago),
+  so one user's long queue cannot starve everyone else.
+- Admission control: runs are costed in sessions (universes x months x
+  sessions per month). A run over MAX_TASK_COST, or one that would take a
+  user's queued + running cost over MAX_OWNER_COST, is refused upfront.
+- Cancellation: every run gets a CancelToken (engine/cancellation.py) that
+  the session loops check, so cancelling (or closing the tab that started
+  the run) stops it within one session.
+"""
+
+import asyncio
+import itertools
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import Future
+
+from engine.cancellation import CancelToken, Cancelled, cancel_scope
+
+SCHEDULER_SLOTS = 2
+MAX_TASK_COST = 20_000_000   # Sessions (e.g. 20,000 universes x 10 years x 100 sessions/year)
+MAX_OWNER_COST = 40_000_000  # Queued + running, per user
+
+QUEUED, RUNNING, DONE, FAILED, CANCELLED = 'queued', 'running', 'done', 'failed', 'cancelled'
+FINAL_STATES = (DONE, FAILED, CANCELLED)
+
+
+class AdmissionError(ValueError):
+    """A run was refused by admission control."""
+
+
+def estimate_cost(universes: int, months: int, sessions_per_month: float) -> int:
+    """Cost of a run, in sessions played."""
+    return int(round(universes * months * sessions_per_month))
+
+
+class Task:
+    def __init__(self, owner: str, fn, args, kwargs, cost: int, name: str, client: str = None):
+        self.id = uuid.uuid4().hex[:12]
+        self.owner = owner
+        self.client = client
+        self.name = name
+        self.cost = cost
+        self.fn, self.args, self.kwargs = fn, args, kwargs
+        self.token = CancelToken()
+        self.future = Future()
+        self.status = QUEUED
+        self.done = 0
+        self.total = 0
+        self.submitted = time.time()
+        self.started = None
+        self.finished = None
+
+    @property
+    def is_final(self) -> bool:
+        return self.status in FINAL_STATES
+
+    @property
+    def progress(self) -> float:
+        return self.done / self.total if self.total else 0.0
+
+    def to_dict(self) -> dict:
+        return {'id': self.id, 'name': self.name, 'status': self.status, 'cost': self.cost,
+                'progress': self.progress, 'submitted': self.submitted, 'started': self.started,
+                'finished': self.finished}
+
+
+_local = threading.local()
+
+
+def report_progress(done: int, total: int):
+    """Progress callback for code running inside a scheduled task (e.g. batch on_chunk)."""
+    task = getattr(_local, 'task', None)
+    if task is not None:
+        task.done, task.total = done, total
+
+
+class Scheduler:
+    def __init__(self, slots: int = SCHEDULER_SLOTS, max_task_cost: int = MAX_TASK_COST, max_owner_cost: int = MAX_OWNER_COST):
+        self.slots = slots
+        self.max_task_cost = max_task_cost
+        self.max_owner_cost = max_owner_cost
+        self._queues = {}    # owner -> [Task] (FIFO)
+        self._running = {}   # owner -> number of running tasks
+        self._served = {}    # owner -> dispatch counter when last served
+        self._tasks = {}     # id -> Task (queued and running)
+        self._counter = itertools.count()
+        self._cond = threading.Condition()
+        self._closed = False
+        self._threads = [threading.Thread(target=self._worker, name=f'sim-slot-{i}', daemon=True) for i in range(slots)]
+        for t in self._threads:
+            t.start()
+
+    @property
+    def processes_per_task(self) -> int:
+        """Processes each run may use, so that all slots together fill the cores once."""
+        return max(1, (os.cpu_count() or 1) // self.slots)
+
+    # --- SUBMISSION ---
+
+    def submit(self, owner: str, fn, args=(), kwargs=None, cost: int = 0, name: str = '', client: str = None) -> Task:
+        """Queues fn(*args, **kwargs). Raises AdmissionError if the run is refused."""
+        if cost > self.max_task_cost:
+            raise AdmissionError(f'Run too large: {cost:,} sessions (limit {self.max_task_cost:,}). '
+                                 f'Use fewer universes or years.')
+        with self._cond:
+            if self._closed:
+                raise AdmissionError('Scheduler is shut down')
+            pending = sum(t.cost for t in self._tasks.values() if t.owner == owner)
+            if pending + cost > self.max_owner_cost:
+                raise AdmissionError(f'Too much work queued: {pending:,} sessions already queued or running '
+                                     f'(limit {self.max_owner_cost:,}). Wait for your runs to finish.')
+            task = Task(owner, fn, args, kwargs or {}, cost, name, client)
+            self._tasks[task.id] = task
+            self._queues.setdefault(owner, []).append(task)
+            self._cond.notify()
+        return task
+
+    def cancel(self, task: Task) -> bool:
+        """Cancels a queued or running task. Running tasks stop at their next session."""
+        with self._cond:
+            if task.is_final:
+                return False
+            task.token.cancel()
+            if task.status == QUEUED:
+                self._queues[task.owner].remove(task)
+                self._finish(task, CANCELLED, error=Cancelled())
+        return True
+
+    def cancel_client(self, client: str) -> int:
+        """Cancels every task started from a browser tab (called when the tab goes away)."""
+        with self._cond:
+            tasks = [t for t in self._tasks.values() if t.client == client]
+        return sum(self.cancel(t) for t in tasks)
+
+    def tasks(self, owner: str = None) -> list:
+        with self._cond:
+            return [t for t in self._tasks.values() if owner is None or t.owner == owner]
+
+    def queue_position(self, task: Task) -> int:
+        """Runs that will start before this queued task (0 once it is running)."""
+        with self._cond:
+            if task.status != QUEUED:
+                return 0
+            return sum(1 for t in self._tasks.values() if t.status == QUEUED and t.submitted < task.submitted)
+
+    # --- DISPATCH ---
+
+    def _next_task(self):
+        """Fair-share pick: the owner with the fewest running tasks, least recently served first."""
+        owners = [o for o, q in self._queues.items() if q]
+        if not owners:
+            return None
+        owner = min(owners, key=lambda o: (self._running.get(o, 0), self._served.get(o, -1)))
+        task = self._queues[owner].pop(0)
+        self._running[owner] = self._running.get(owner, 0) + 1
+        self._served[owner] = next(self._counter)
+        task.status, task.started = RUNNING, time.time()
+        return task
+
+    def _finish(self, task: Task, status: str, result=None, error=None):
+        task.status, task.finished = status, time.time()
+        self._tasks.pop(task.id, None)
+        if error is not None:
+            task.future.set_exception(error)
+        else:
+            task.future.set_result(result)
+
+    def _worker(self):
+        while True:
+            with self._cond:
+                task = self._next_task()
+                while task is None and not self._closed:
+                    self._cond.wait()
+                    task = self._next_task()
+                if task is None:
+                    return
+            _local.task = task
+            try:
+                with cancel_scope(task.token):
+                    result = task.fn(*task.args, **task.kwargs)
+                status, error = DONE, None
+            except Cancelled as e:
+                status, result, error = CANCELLED, None, e
+            except Exception as e:
+                print(f"Scheduled run '{task.name}' failed: {e}")
+                status, result, error = FAILED, None, e
+            finally:
+                _local.task = None
+            with self._cond:
+                self._running[task.owner] -= 1
+                self._finish(task, status, result, error)
+
+    def shutdown(self):
+        """Cancels everything and stops the slot threads."""
+        with self._cond:
+            self._closed = True
+            tasks = list(self._tasks.values())
+            self._cond.notify_all()
+        for task in tasks:
+            self.cancel(task)
+
+
+async def wait_for(task: Task, on_tick=None, interval: float = 0.1):
+    """Awaits a task from the event loop, calling on_tick(task) (sync or async) while it is queued or running."""
+    while not task.future.done():
+        if on_tick:
+            tick = on_tick(task)
+            if asyncio.iscoroutine(tick):
+                await tick
+        await asyncio.sleep(interval)
+    return task.future.result()
+
+
+_scheduler = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler() -> Scheduler:
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = Scheduler()
+        return _scheduler
@@ -0,0 +1,220 @@
+"""
+Monaco Salle Blanche Lab - Session Log Store
+============================================
+Append-only JSON-lines log of played sessions.
+
+Files (all under the persistence volume):
+- session_logs.jsonl  one JSON record per line, never rewritten on append
+- session_logs.idx    sidecar index, one (byte offset, record id) uint64 pair per line
+- session_logs.del    tombstones: ids of deleted records (uint64)
+- session_logs.seq    last id handed out (uint64)
+
+Ids are never reused: the sequence file outlives compaction, so a page still
+showing a deleted record can never delete a newer one by its id.
+
+Appending costs one line + 16 index bytes. Deleting appends a tombstone.
+Newest-first pages are found from the index and only those records are read.
+Once tombstones make up a quarter of the log it is compacted (rewritten
+without the deleted records). The legacy session_logs.json is imported on
+first use.
+"""
+
+import json
+import os
+import threading
+
+import numpy as np
+
+COMPACT_MIN_TOMBSTONES = 32
+COMPACT_RATIO = 0.25
+
+
+class SessionLogStore:
+    def __init__(self, data_path: str, legacy_json_path: str = None):
+        self.data_path = data_path
+        base = data_path[:-len('.jsonl')] if data_path.endswith('.jsonl') else data_path
+        self.index_path = base + '.idx'
+        self.tomb_path = base + '.del'
+        self.seq_path = base + '.seq'
+        self._lock = threading.RLock()
+        self._index = None    # (n, 2) uint64: offset, id
+        self._deleted = None  # set of ids
+        self._stamp = None    # (data size, index size, tombstone size) the caches belong to
+        with self._lock:
+            self._import_legacy(legacy_json_path)
+
+    # --- FILES ---
+
+    def _sizes(self):
+        return tuple(os.path.getsize(p) if os.path.exists(p) else 0
+                     for p in (self.data_path, self.index_path, self.tomb_path))
+
+    def _load(self):
+        """(Re)load index and tombstones if any file changed since last time."""
+        stamp = self._sizes()
+        if stamp == self._stamp:
+            return
+        index = np.fromfile(self.index_path, dtype=np.uint64).reshape(-1, 2) if stamp[1] else np.zeros((0, 2), dtype=np.uint64)
+        if not self._index_is_consistent(index, stamp[0]):
+            index = self._rebuild_index()
+            stamp = self._sizes()
+        self._index = index
+        self._deleted = set(np.fromfile(self.tomb_path, dtype=np.uint64).tolist()) if stamp[2] else set()
+        self._stamp = stamp
+
+    def _index_is_consistent(self, index, data_size):
+        """The last indexed record must end exactly at the end of the data file."""
+        if len(index) == 0:
+            return data_size == 0
+        with open(self.data_path, 'rb') as f:
+            f.seek(int(index[-1, 0]))
+            f.readline()
+            return f.tell() == data_size
+
+    def _rebuild_index(self):
+        """Recover from an interrupted append: rescan the data file (and drop a torn last line)."""
+        rows, good_end = [], 0
+        with open(self.data_path, 'rb') as f:
+            while True:
+                offset = f.tell()
+                line = f.readline()
+                if not line:
+                    break
+                try:
+                    rows.append((offset, int(json.loads(line)['id'])))
+                    good_end = f.tell()
+                except (ValueError, KeyError):
+                    break
+        with open(self.data_path, 'r+b') as f:
+            f.truncate(good_end)
+        index = np.array(rows, dtype=np.uint64).reshape(-1, 2)
+        index.tofile(self.index_path)
+        return index
+
+    def _last_id(self) -> int:
+        """Highest id ever handed out (stores older than the sequence file fall back to the ids still on disk)."""
+        last = int(self._index[:, 1].max()) if len(self._index) else 0
+        if self._deleted:
+            last = max(last, max(self._deleted))
+        if os.path.exists(self.seq_path):
+            seq = np.fromfile(self.seq_path, dtype=np.uint64)
+            if len(seq):
+                last = max(last, int(seq[0]))
+        return last
+
+    def _write_seq(self, last_id: int):
+        tmp = self.seq_path + '.tmp'
+        np.array([last_id], dtype=np.uint64).tofile(tmp)
+        os.replace(tmp, self.seq_path)
+
+    def _import_legacy(self, legacy_json_path):
+        if os.path.exists(self.data_path) or not legacy_json_path or not os.path.exists(legacy_json_path):
+            return
+        try:
+            with open(legacy_json_path, 'r') as f:
+                history = json.load(f)
+        except Exception as e:
+            print(f"Error importing session logs: {e}")
+            return
+        self._write_all([dict(entry, id=i + 1) for i, entry in enumerate(history)])
+        self._write_seq(len(history))
+
+    def _write_all(self, records):
+        """Rewrite log + index from scratch (import and compaction); tombstones are cleared."""
+        rows = []
+        tmp_data, tmp_index = self.data_path + '.tmp', self.index_path + '.tmp'
+        with open(tmp_data, 'wb') as f:
+            for rec in records:
+                rows.append((f.tell(), int(rec['id'])))
+                f.write((json.dumps(rec) + '\n').encode('utf-8'))
+        np.array(rows, dtype=np.uint64).reshape(-1, 2).tofile(tmp_index)
+        os.replace(tmp_data, self.data_path)
+        os.replace(tmp_index, self.index_path)
+        if os.path.exists(self.tomb_path):
+            os.remove(self.tomb_path)
+        self._stamp = None
+
+    def _read_at(self, offsets):
+        records = []
+        with open(self.data_path, 'rb') as f:
+            for off in offsets:
+                f.seek(int(off))
+                records.append(json.loads(f.readline()))
+        return records
+
+    def _live_rows(self):
+        """Index rows that are not tombstoned, oldest first."""
+        if not self._deleted:
+            return self._index
+        mask = ~np.isin(self._index[:, 1], np.fromiter(self._deleted, dtype=np.uint64, count=len(self._deleted)))
+        return self._index[mask]
+
+    # --- API ---
+
+    def append(self, record: dict) -> int:
+        """Append one record, returns its id."""
+        with self._lock:
+            self._load()
+            new_id = self._last_id() + 1
+            self._write_seq(new_id)  # Before the record: a crash in between skips an id, never reuses one
+            record = dict(record, id=new_id)
+            with open(self.data_path, 'ab') as f:
+                offset = f.tell()
+                f.write((json.dumps(record) + '\n').encode('utf-8'))
+            with open(self.index_path, 'ab') as f:
+                np.array([offset, new_id], dtype=np.uint64).tofile(f)
+            self._index = np.vstack([self._index, np.array([[offset, new_id]], dtype=np.uint64)])
+            self._stamp = self._sizes()
+            return new_id
+
+    def count(self) -> int:
+        with self._lock:
+            self._load()
+            return len(self._index) - len(self._deleted)
+
+    def page(self, page: int = 0, page_size: int = 20) -> list:
+        """Newest-first page of records; only those records are read from disk."""
+        with self._lock:
+            self._load()
+            live = self._live_rows()
+            end = len(live) - page * page_size
+            start = max(0, end - page_size)
+            if end <= 0:
+                return []
+            return self._read_at(live[start:end, 0][::-1])
+
+    def all(self) -> list:
+        """Every live record, oldest first."""
+        with self._lock:
+            self._load()
+            if not os.path.exists(self.data_path):
+                return []
+            with open(self.data_path, 'rb') as f:
+                records = [json.loads(line) for line in f if line.strip()]
+            return [r for r in records if r.get('id') not in self._deleted]
+
+    def delete(self, record_id: int) -> bool:
+        """Tombstone one record (compacts once enough records are deleted)."""
+        with self._lock:
+            self._load()
+            record_id = int(record_id)
+            if record_id in self._deleted or not np.any(self._index[:, 1] == record_id):
+                return False
+            with open(self.tomb_path, 'ab') as f:
+                np.array([record_id], dtype=np.uint64).tofile(f)
+            self._deleted.add(record_id)
+            self._stamp = self._sizes()
+            if len(self._deleted) >= COMPACT_MIN_TOMBSTONES and len(self._deleted) >= COMPACT_RATIO * len(self._index):
+                self.compact()
+            return True
+
+    def find_ids(self, field: str, value) -> list:
+        """Ids of live records with record[field] == value (scans the log)."""
+        return [r['id'] for r in self.all() if r.get(field) == value]
+
+    def compact(self):
+        """Rewrite the log without tombstoned records."""
+        with self._lock:
+            self._load()
+            self._write_seq(self._last_id())  # The newest records may be among the dropped ones
+            self._write_all(self.all())